@@ -25,7 +25,10 @@ function partsToText(parts: unknown): string {
 /**
  * Transform AI SDK request body to daemon ChatStreamRequest format.
  */
-function toDaemonBody(body: Record<string, unknown>): Record<string, unknown> {
+function toDaemonBody(
+  body: Record<string, unknown>,
+  lastEventId: string | null,
+): Record<string, unknown> {
   const result: Record<string, unknown> = {
     sessionId: body.sessionId,
   };
@@ -34,6 +37,15 @@ function toDaemonBody(body: Record<string, unknown>): Record<string, unknown> {
     result.since_timestamp = body.since_timestamp;
   }
 
+  const cursor = body.cursor ?? lastEventId;
+  if (cursor) {
+    result.cursor = cursor;
+  }
+
+  if (body.pageSize) {
+    result.pageSize = body.pageSize;
+  }
+
   if (Array.isArray(body.messages) && body.messages.length > 0) {
     result.messages = body.messages.map(
       (msg: { role?: string; content?: unknown; parts?: unknown }) => {
@@ -111,7 +123,7 @@ export async function POST(request: NextRequest) {
     const res = await daemonStream({
       method: "POST",
       path: "/api/chat/stream",
-      body: toDaemonBody(body),
+      body: toDaemonBody(body, request.headers.get("last-event-id")),
       headers: buildIdentityHeaders(session),
     });
 
@@ -0,0 +1,68 @@
+"""Agent hook event intake over the daemon API socket.
+
+The hook receiver posts events here instead of opening its own SQLite
+connection. Events are still written to the hook outbox, so ordering and
+restart-safety are unchanged; the outbox worker is woken immediately instead
+of waiting for its next poll.
+
+The receiver still writes a few session columns itself (native ids, transcript
+path, checkpoint time); it reports those here so the daemon's session cache
+drops the stale copy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter
+from instrukt_ai_logging import get_logger
+from pydantic import BaseModel, ConfigDict
+
+from teleclaude.core.db import db
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/hooks", tags=["hooks"])
+
+_on_enqueued: Callable[[], None] | None = None
+
+
+def configure(on_enqueued: Callable[[], None] | None) -> None:
+    """Wire the hook outbox wakeup; called by the daemon when its worker starts."""
+    global _on_enqueued
+    _on_enqueued = on_enqueued
+
+
+class HookEventRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    session_id: str
+    event_type: str
+    payload: dict[str, Any]  # guard: loose-dict - Hook payload is dynamic JSON
+    # When the hook fired, as seen by the receiver; feeds end-to-end latency metrics.
+    created_at: str | None = None
+
+
+class HookEventResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+
+
+@router.post("/events", status_code=202, response_model=HookEventResponse)
+async def enqueue_hook_event(body: HookEventRequest) -> HookEventResponse:
+    """Persist a hook event in the outbox and wake the outbox worker."""
+    row_id = await db.enqueue_hook_event(
+        body.session_id, body.event_type, dict(body.payload), created_at=body.created_at
+    )
+    if _on_enqueued is not None:
+        _on_enqueued()
+    logger.trace("Hook event accepted over API socket", session_id=body.session_id, event_type=body.event_type)
+    return HookEventResponse(id=row_id)
+
+
+@router.post("/sessions/{session_id}/invalidate", status_code=204)
+async def invalidate_session(session_id: str) -> None:
+    """Drop the daemon's cached copy of a session row the receiver just wrote."""
+    db.invalidate_session_cache(session_id)
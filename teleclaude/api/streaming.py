@@ -2,14 +2,20 @@
 
 POST /api/chat/stream — returns AI SDK v5 UIMessage Stream.
 Two modes: history replay then live tail of the JSONL transcript.
+
+Transcript-derived events carry an SSE ``id`` cursor (``<file>:<entry>``, the
+next entry to send). A client that reconnects with that cursor, as
+``Last-Event-ID`` or in the body, is sent only what it has not seen; with a
+page size it is sent one page of history instead of the tail.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
-import os
+import re
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
@@ -31,11 +37,7 @@ from teleclaude.core.db_models import Session
 from teleclaude.core.models import JsonDict
 from teleclaude.output_projection.conversation_projector import project_entries
 from teleclaude.output_projection.models import WEB_POLICY
-from teleclaude.utils.transcript import (
-    _iter_claude_entries,
-    _iter_codex_entries,
-    _iter_gemini_entries,
-)
+from teleclaude.utils.transcript import get_transcript_offsets
 
 logger = get_logger(__name__)
 
@@ -73,6 +75,9 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 LIVE_POLL_INTERVAL_S = 1.0
 LIVE_IDLE_TIMEOUT_S = 300.0
+REPLAY_PAGE_SIZE_MAX = 1000
+
+_CURSOR = re.compile(r"(\d+):(\d+)")
 
 
 # ---------------------------------------------------------------------------
@@ -97,6 +102,22 @@ class ChatStreamRequest(BaseModel):
     session_id: str = Field(..., min_length=1, alias="sessionId")
     since_timestamp: str | None = None
     messages: list[ChatStreamMessage] | None = None
+    # Resume cursor from a previous stream's event ids (or a transcript message id);
+    # takes precedence over the Last-Event-ID header.
+    cursor: str | None = None
+    page_size: int | None = Field(default=None, ge=1, le=REPLAY_PAGE_SIZE_MAX, alias="pageSize")
+
+
+@dataclass
+class ReplayPosition:
+    """Next transcript entry to send: chain file index and entry ordinal within it."""
+
+    file_index: int = 0
+    entry_index: int = 0
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.file_index}:{self.entry_index}"
 
 
 # ---------------------------------------------------------------------------
@@ -124,21 +145,73 @@ def _get_agent_name(session: Session) -> AgentName:
     return resolve_parser_agent(session.active_agent)
 
 
-def _iter_entries_for_file(
+def _read_entries(
     path: str,
     agent_name: AgentName,
-) -> list[JsonDict]:
-    """Load transcript entries from a single file."""
-    p = Path(path).expanduser()
-    if not p.exists():
-        return []
-    if agent_name == AgentName.CLAUDE:
-        return list(_iter_claude_entries(p))
-    if agent_name == AgentName.CODEX:
-        return list(_iter_codex_entries(p))
-    if agent_name == AgentName.GEMINI:
-        return list(_iter_gemini_entries(p))
-    return list(_iter_claude_entries(p))
+    start: int,
+    stop: int | None = None,
+) -> tuple[list[JsonDict], int] | None:
+    """Load entries ``start``..``stop`` of one transcript via its offsets index.
+
+    Returns the entries and the ordinal of the first one, or None when the file
+    is missing. A start past the end means the file was replaced since the
+    cursor was issued, so the file is read from the beginning.
+    """
+    index = get_transcript_offsets(path, agent_name)
+    if index is None:
+        return None
+    with index.lock:
+        if start > index.entry_count:
+            start = 0
+        return index.entries(start, stop), start
+
+
+def _resolve_cursor(cursor: str | None, chain: list[str], agent_name: AgentName) -> ReplayPosition:
+    """Map a client cursor to a replay position; unknown cursors replay from the start."""
+    if not cursor:
+        return ReplayPosition()
+    match = _CURSOR.fullmatch(cursor)
+    if match:
+        file_index, entry_index = int(match.group(1)), int(match.group(2))
+        return ReplayPosition(file_index, entry_index) if file_index < len(chain) else ReplayPosition()
+    for file_index in range(len(chain) - 1, -1, -1):
+        index = get_transcript_offsets(chain[file_index], agent_name)
+        if index is None:
+            continue
+        with index.lock:
+            ordinal = index.ordinal_of(cursor)
+        if ordinal is not None:
+            return ReplayPosition(file_index, ordinal + 1)
+    return ReplayPosition()
+
+
+def _entry_events(
+    entries: list[JsonDict],
+    position: ReplayPosition,
+    first_entry_index: int,
+    since_timestamp: str | None = None,
+) -> list[str]:
+    """Convert entries to SSE events, tagging each entry's last event with the cursor after it."""
+    events: list[str] = []
+    for offset, entry in enumerate(entries):
+        entry_index = first_entry_index + offset
+        entry_events = [
+            sse_event
+            for projected in project_entries(
+                [entry],
+                WEB_POLICY,
+                since=since_timestamp,
+                file_index=position.file_index,
+                first_entry_index=entry_index,
+            )
+            for sse_event in convert_projected_block(projected)
+        ]
+        position.entry_index = entry_index + 1
+        if entry_events:
+            entry_events[-1] = f"id: {position.cursor}\n{entry_events[-1]}"
+            events.extend(entry_events)
+    position.entry_index = first_entry_index + len(entries)
+    return events
 
 
 async def _emit_initial_stream_events(
@@ -194,13 +267,32 @@ async def _replay_history(
     chain: list[str],
     agent_name: AgentName,
     since_timestamp: str | None,
+    position: ReplayPosition,
+    page_size: int | None = None,
 ) -> AsyncIterator[str]:
-    """Replay existing transcript history with the web visibility policy."""
-    for file_path in chain:
-        entries = _iter_entries_for_file(file_path, agent_name)
-        for projected in project_entries(entries, WEB_POLICY, since=since_timestamp):
-            for sse_event in convert_projected_block(projected):
+    """Replay transcript history from ``position`` with the web visibility policy.
+
+    Advances ``position`` as entries are sent. Without a page size it stops on
+    the last transcript of the chain, ready for the live tail.
+    """
+    remaining = page_size
+    while position.file_index < len(chain):
+        stop = None if remaining is None else position.entry_index + remaining
+        loaded = await asyncio.to_thread(
+            _read_entries, chain[position.file_index], agent_name, position.entry_index, stop
+        )
+        if loaded is not None:
+            entries, first_entry_index = loaded
+            for sse_event in _entry_events(entries, position, first_entry_index, since_timestamp):
                 yield sse_event
+            if remaining is not None:
+                remaining -= len(entries)
+                if remaining <= 0:
+                    return
+        if position.file_index == len(chain) - 1:
+            return
+        position.file_index += 1
+        position.entry_index = 0
 
 
 def _stream_is_live(chain: list[str]) -> bool:
@@ -208,25 +300,23 @@ def _stream_is_live(chain: list[str]) -> bool:
     return bool(chain) and Path(chain[-1]).exists()
 
 
-async def _emit_stream_finish(message_id: str) -> AsyncIterator[str]:
-    """Emit the terminal stream events."""
-    yield message_finish(message_id)
+async def _emit_stream_finish(message_id: str, position: ReplayPosition | None = None) -> AsyncIterator[str]:
+    """Emit the terminal stream events; ``finish`` carries the resume cursor."""
+    finish = message_finish(message_id)
+    yield f"id: {position.cursor}\n{finish}" if position is not None else finish
     yield stream_done()
 
 
 async def _load_live_transcript_events(
     live_file: str,
+    agent_name: AgentName,
     *,
-    file_size: int,
+    position: ReplayPosition,
     session_id: str,
-) -> tuple[int, list[str]]:
-    """Read newly appended transcript data and convert it into SSE events."""
-    events: list[str] = []
+) -> list[str] | None:
+    """Convert entries appended since ``position`` into SSE events; None if the file is unreadable."""
     try:
-        with open(live_file, "rb") as f:
-            f.seek(file_size)
-            new_bytes = f.read()
-            next_size = f.tell()
+        loaded = await asyncio.to_thread(_read_entries, live_file, agent_name, position.entry_index)
     except OSError as exc:
         logger.warning(
             "Web lane error reading live transcript",
@@ -236,24 +326,11 @@ async def _load_live_transcript_events(
             file=live_file,
             error=str(exc),
         )
-        return file_size, []
-
-    new_text = new_bytes.decode("utf-8", errors="ignore")
-    for line in new_text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entry_value: object = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(entry_value, dict):
-            continue
-        entry: dict[str, object] = entry_value  # guard: loose-dict - JSONL parse
-        for projected in project_entries([entry], WEB_POLICY):
-            events.extend(convert_projected_block(projected))
-
-    return next_size, events
+        return None
+    if loaded is None:
+        return None
+    entries, first_entry_index = loaded
+    return _entry_events(entries, position, first_entry_index)
 
 
 async def _resolve_stream_closure(session_id: str) -> tuple[bool, str | None]:
@@ -283,8 +360,10 @@ async def _stream_sse(
     session_id: str,
     since_timestamp: str | None,
     user_message: str | None,
+    cursor: str | None = None,
+    page_size: int | None = None,
 ) -> AsyncIterator[str]:
-    """Generate SSE events: history replay then live tail.
+    """Generate SSE events: history replay (or one page of it) then live tail.
 
     Yields SSE-formatted strings conforming to AI SDK v5 UIMessage Stream.
     Derives session status from canonical lifecycle_status (no hardcoded bypass).
@@ -298,17 +377,16 @@ async def _stream_sse(
     async for sse_event in _deliver_user_message(session_id, user_message):
         yield sse_event
 
-    async for sse_event in _replay_history(chain, agent_name, since_timestamp):
+    position = await asyncio.to_thread(_resolve_cursor, cursor, chain, agent_name)
+    async for sse_event in _replay_history(chain, agent_name, since_timestamp, position, page_size):
         yield sse_event
 
-    if not _stream_is_live(chain):
-        async for sse_event in _emit_stream_finish(message_id):
+    if page_size is not None or not _stream_is_live(chain):
+        async for sse_event in _emit_stream_finish(message_id, position):
             yield sse_event
         return
 
-    # Track file position for incremental reads
     live_file = chain[-1]
-    file_size = os.path.getsize(live_file)
     idle_elapsed = 0.0
 
     while idle_elapsed < LIVE_IDLE_TIMEOUT_S:
@@ -322,27 +400,29 @@ async def _stream_sse(
         if not Path(live_file).exists():
             break
 
-        current_size = os.path.getsize(live_file)
-        if current_size <= file_size:
+        sent_before = position.entry_index
+        live_events = await _load_live_transcript_events(
+            live_file,
+            agent_name,
+            position=position,
+            session_id=session_id,
+        )
+        if live_events is None:
+            break
+        if position.entry_index == sent_before:
             idle_elapsed += LIVE_POLL_INTERVAL_S
         else:
             idle_elapsed = 0.0
-            next_size, live_events = await _load_live_transcript_events(
-                live_file,
-                file_size=file_size,
-                session_id=session_id,
-            )
-            if next_size == file_size:
-                break
-            file_size = next_size
             for sse_event in live_events:
                 yield sse_event
 
         if rotated_live_file and rotated_live_file != live_file and Path(rotated_live_file).exists():
+            chain.append(rotated_live_file)
             live_file = rotated_live_file
-            file_size = 0
+            position.file_index = len(chain) - 1
+            position.entry_index = 0
 
-    async for sse_event in _emit_stream_finish(message_id):
+    async for sse_event in _emit_stream_finish(message_id, position):
         yield sse_event
 
 
@@ -376,6 +456,8 @@ async def chat_stream(http_request: Request, request: ChatStreamRequest) -> Stre
         session_id=request.session_id,
         since_timestamp=request.since_timestamp,
         user_message=user_message,
+        cursor=request.cursor or http_request.headers.get("last-event-id"),
+        page_size=request.page_size,
     )
 
     return StreamingResponse(
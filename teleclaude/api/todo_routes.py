@@ -7,6 +7,7 @@ with dual-factor caller identity enforcement.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from pathlib import Path
 from typing import Annotated
@@ -191,14 +192,14 @@ async def todo_mark_phase(  # pyright: ignore
 
     terminal_statuses = ("complete", "approved")
     if status in terminal_statuses:
-        if has_uncommitted_changes(cwd, slug):
+        if await asyncio.to_thread(has_uncommitted_changes, cwd, slug):
             raise HTTPException(
                 status_code=409,
                 detail=(
                     f"worktree {WORKTREE_DIR}/{slug} has uncommitted changes — commit them before marking phase complete"
                 ),
             )
-        stash_entries = get_stash_entries(cwd)
+        stash_entries = await asyncio.to_thread(get_stash_entries, cwd)
         if stash_entries:
             noun = "entry" if len(stash_entries) == 1 else "entries"
             raise HTTPException(
@@ -209,7 +210,7 @@ async def todo_mark_phase(  # pyright: ignore
                 ),
             )
 
-    updated_state = mark_phase(worktree_cwd, slug, phase, status)
+    updated_state = await asyncio.to_thread(mark_phase, worktree_cwd, slug, phase, status)
     return {"result": f"OK: {slug} state updated - {phase}: {status}", "state": str(updated_state)}
 
 
@@ -235,7 +236,7 @@ async def todo_mark_finalize_ready(  # pyright: ignore
         raise HTTPException(status_code=404, detail=f"worktree not found at {worktree_cwd}")
 
     try:
-        updated_state = mark_finalize_ready(cwd, slug, worker_session_id=worker_session_id)
+        updated_state = await asyncio.to_thread(mark_finalize_ready, cwd, slug, worker_session_id=worker_session_id)
     except ValueError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
 
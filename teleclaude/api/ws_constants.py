@@ -6,7 +6,7 @@ import asyncio
 import os
 from dataclasses import dataclass, field
 
-from teleclaude.core.models import JsonDict
+from teleclaude.api.ws_outbox import WsClientQueue
 
 API_WS_PING_INTERVAL_S = 20.0
 API_WS_PING_TIMEOUT_S = 20.0
@@ -29,8 +29,13 @@ API_WS_CONTROL_EVENTS = frozenset(
     }
 )
 API_WS_REPLACEABLE_EVENTS = frozenset({"chiptunes_state", "chiptunes_track", "refresh"})
+# Frames buffered per client before replaceable ones are evicted (refreshes are
+# merged instead); a client whose backlog is all control events beyond this is
+# dropped and must reconnect.
+API_WS_CLIENT_QUEUE_MAX = int(os.getenv("API_WS_CLIENT_QUEUE_MAX", "512"))
 
 __all__ = [
+    "API_WS_CLIENT_QUEUE_MAX",
     "API_WS_CONTROL_EVENTS",
     "API_WS_CONTROL_SEND_TIMEOUT_S",
     "API_WS_DEFAULT_SEND_TIMEOUT_S",
@@ -46,5 +51,7 @@ __all__ = [
 class _WsClientState:
     """Per-client sender state for serialized WebSocket writes."""
 
-    queue: asyncio.Queue[tuple[str, JsonDict]] = field(default_factory=asyncio.Queue)
+    queue: WsClientQueue = field(
+        default_factory=lambda: WsClientQueue(API_WS_CLIENT_QUEUE_MAX, API_WS_REPLACEABLE_EVENTS)
+    )
     sender_task: asyncio.Task[object] | None = None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
 
@@ -25,10 +25,12 @@ from teleclaude.api_models import (
     SessionStartedEventDTO,
     SessionUpdatedEventDTO,
     TodoDTO,
+    WsClientMetricsDTO,
 )
 from teleclaude.config import config
 from teleclaude.core.models import JsonDict, JsonValue, SessionSnapshot
 from teleclaude.transport.redis_transport import RedisTransport
+from teleclaude.utils import json_codec
 
 if TYPE_CHECKING:
     from teleclaude.core.adapter_client import AdapterClient
@@ -44,6 +46,7 @@ from teleclaude.api.ws_constants import (
     API_WS_REPLACEABLE_SEND_TIMEOUT_S,
     _WsClientState,
 )
+from teleclaude.api.ws_outbox import WsFrame
 
 logger = get_logger(__name__)
 
@@ -88,7 +91,7 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
             while True:
                 # Receive messages from client
                 message = await websocket.receive_text()
-                data_raw: object = json.loads(message)
+                data_raw: object = json_codec.loads(message)
 
                 # Type guard: ensure data is a dict
                 if not isinstance(data_raw, dict):
@@ -467,10 +470,14 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
             self._refresh_debounce_task = asyncio.create_task(_debounced())
 
     def _broadcast_payload(self, event: str, payload: JsonDict, *, targets: list[WebSocket] | None = None) -> None:
-        """Send a WS payload to connected clients. If targets is given, only those clients receive it."""
+        """Send a WS payload to connected clients. If targets is given, only those clients receive it.
+
+        All recipients share one frame, so the payload is serialized once per broadcast.
+        """
         clients = targets if targets is not None else list(self._ws_clients)
+        frame = WsFrame(event, payload)
         for ws in clients:
-            self._enqueue_ws_payload(ws, event, payload)
+            self._enqueue_ws_frame(ws, frame)
 
     async def _close_ws(self, websocket: WebSocket) -> None:
         """Close a WebSocket connection safely with timeout."""
@@ -483,7 +490,7 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
         """Create sender state lazily for a websocket client."""
         state = self._ws_client_states.get(websocket)
         if state is None:
-            state = _WsClientState(queue=asyncio.Queue())
+            state = _WsClientState()
             self._ws_client_states[websocket] = state
         if state.sender_task is None or state.sender_task.done():
             sender = self._ws_sender_loop(websocket, state)
@@ -496,10 +503,26 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
 
     def _enqueue_ws_payload(self, websocket: WebSocket, event: str, payload: JsonDict) -> None:
         """Queue a payload for serialized delivery to one websocket."""
+        self._enqueue_ws_frame(websocket, WsFrame(event, payload))
+
+    def _enqueue_ws_frame(self, websocket: WebSocket, frame: WsFrame) -> None:
+        """Queue a shared frame for one websocket, dropping the client if its backlog is full."""
         if websocket not in self._ws_clients:
             return
         state = self._ensure_ws_client_state(websocket)
-        state.queue.put_nowait((event, payload))
+        if state.queue.put_nowait(frame):
+            return
+        logger.warning(
+            "WebSocket client backlog full, removing client",
+            extra={"client_id": id(websocket), "event_type": frame.event, "queue_max": state.queue.maxsize},
+        )
+        # Stop routing to it immediately; cleanup awaits the sender task.
+        self._ws_clients.discard(websocket)
+        coro = self._drop_ws_client(websocket, reason=f"queue-overflow:{frame.event}")
+        if self.task_registry:
+            self.task_registry.spawn(coro, name=f"ws-drop-{id(websocket)}")
+        else:
+            asyncio.create_task(coro)
 
     async def _send_or_enqueue_payload(self, websocket: WebSocket, event: str, payload: JsonDict) -> None:
         """Send directly for untracked sockets or enqueue for managed clients."""
@@ -511,22 +534,28 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
     async def _ws_sender_loop(self, websocket: WebSocket, state: _WsClientState) -> None:
         """Serialize outbound writes for a websocket client."""
         while True:
-            event, payload = await state.queue.get()
+            frame = await state.queue.get()
             try:
-                delivered = await self._send_ws_payload(websocket, event, payload)
-                if not delivered:
+                started = time.monotonic()
+                if not await self._send_ws_frame(websocket, frame):
                     return
+                state.queue.record_sent(frame, time.monotonic() - started)
             finally:
                 state.queue.task_done()
 
     async def _send_ws_payload(self, websocket: WebSocket, event: str, payload: JsonDict) -> bool:
         """Send one payload and normalize disconnect handling."""
+        return await self._send_ws_frame(websocket, WsFrame(event, payload))
+
+    async def _send_ws_frame(self, websocket: WebSocket, frame: WsFrame) -> bool:
+        """Send one pre-encoded frame and normalize disconnect handling."""
+        event = frame.event
         timeout = self._ws_send_timeout_seconds(event)
         try:
             if timeout is None:
-                await websocket.send_json(payload)
+                await websocket.send_text(frame.text)
             else:
-                await asyncio.wait_for(websocket.send_json(payload), timeout=timeout)
+                await asyncio.wait_for(websocket.send_text(frame.text), timeout=timeout)
             return True
         except TimeoutError:
             logger.warning(
@@ -549,11 +578,40 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
                 event,
                 exc,
                 exc_info=True,
-                extra={"event_type": event, "payload_keys": list(payload.keys())},
+                extra={"event_type": event, "payload_keys": list(frame.payload.keys())},
             )
             await self._drop_ws_client(websocket, reason=f"send-error:{event}")
             raise
 
+    def _ws_client_metrics(self) -> list[WsClientMetricsDTO]:
+        """Snapshot delivery metrics for every connected websocket client."""
+        snapshots: list[WsClientMetricsDTO] = []
+        for websocket, state in list(self._ws_client_states.items()):
+            queue = state.queue
+            metrics = queue.metrics
+            snapshots.append(
+                WsClientMetricsDTO(
+                    client_id=id(websocket),
+                    subscriptions={
+                        computer: sorted(types)
+                        for computer, types in self._client_subscriptions.get(websocket, {}).items()
+                    },
+                    depth=queue.qsize(),
+                    max_depth=metrics.max_depth,
+                    queue_max=queue.maxsize,
+                    oldest_pending_ms=round(queue.oldest_age_s() * 1000, 1),
+                    enqueued=metrics.enqueued,
+                    sent=metrics.sent,
+                    coalesced=metrics.coalesced,
+                    evicted=metrics.evicted,
+                    overflowed=metrics.overflowed,
+                    last_lag_ms=round(metrics.last_lag_s * 1000, 1),
+                    max_lag_ms=round(metrics.max_lag_s * 1000, 1),
+                    last_send_ms=round(metrics.last_send_s * 1000, 1),
+                )
+            )
+        return snapshots
+
     def _ws_send_timeout_seconds(self, event: str) -> float | None:
         """Return the timeout budget for a websocket event.
 
@@ -589,24 +647,29 @@ class _WebSocketMixin:  # pyright: ignore[reportUnusedClass]
         self._ws_clients.discard(websocket)
         self._client_subscriptions.pop(websocket, None)
 
-        sender_task = state.sender_task if state is not None else None
-        current_task = asyncio.current_task()
-        if sender_task is not None and sender_task is not current_task and not sender_task.done():
-            sender_task.cancel()
-            try:
-                await sender_task
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                logger.debug("WebSocket sender task ended with error during cleanup", exc_info=True)
-
-        await self._close_ws(websocket)
-
+        try:
+            await self._close_ws(websocket)
+        finally:
+            if state is not None:
+                await self._stop_ws_sender(state)
         if self.cache and len(self._ws_clients) == 0:
             self._update_cache_interest()
 
         logger.debug("WebSocket client removed", extra={"client_id": id(websocket), "reason": reason})
 
+    async def _stop_ws_sender(self, state: _WsClientState) -> None:
+        """Cancel and await a client's sender task unless it is the caller."""
+        sender_task = state.sender_task
+        if sender_task is None or sender_task is asyncio.current_task() or sender_task.done():
+            return
+        sender_task.cancel()
+        try:
+            await sender_task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.debug("WebSocket sender task ended with error during cleanup", exc_info=True)
+
     async def _notification_push(
         self,
         notification_id: int,
@@ -0,0 +1,214 @@
+"""Outbound WebSocket frames and bounded, coalescing per-client queues.
+
+A broadcast builds one ``WsFrame`` and hands the same object to every client,
+so the payload is JSON-encoded once no matter how many TUIs and browsers are
+connected. Each client drains its own ``WsClientQueue``; a newer frame for the
+same coalescing key (one session, one refresh target) replaces the queued one
+in place instead of piling up behind a slow reader.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import cast
+
+from teleclaude.core.models import JsonDict
+from teleclaude.utils import json_codec
+
+__all__ = [
+    "WsClientMetrics",
+    "WsClientQueue",
+    "WsFrame",
+    "ws_coalesce_key",
+]
+
+
+class WsFrame:
+    """One outbound event, encoded lazily and at most once."""
+
+    __slots__ = ("_text", "created_at", "event", "payload")
+
+    def __init__(self, event: str, payload: JsonDict) -> None:
+        self.event = event
+        self.payload = payload
+        self.created_at = time.monotonic()
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Wire encoding, the same shape ``WebSocket.send_json`` would produce."""
+        if self._text is None:
+            self._text = json_codec.dumps(self.payload)
+        return self._text
+
+
+def ws_coalesce_key(frame: WsFrame) -> Hashable | None:
+    """Return the key under which a queued frame may be superseded, or None.
+
+    Only state-carrying events coalesce: the latest ``session_updated`` for a
+    session, the latest refresh for a (kind, computer, project), the latest
+    chiptunes state. Everything else is delivered in full.
+    """
+    event = frame.event
+    data = frame.payload.get("data")
+    if event == "session_updated":
+        session_id = data.get("session_id") if isinstance(data, dict) else None
+        return (event, session_id) if isinstance(session_id, str) else None
+    if event == "refresh":
+        if not isinstance(data, dict):
+            return (event, frame.payload.get("event"))
+        return (event, frame.payload.get("event"), data.get("computer"), data.get("project_path"))
+    if event in ("chiptunes_state", "chiptunes_track"):
+        return (event,)
+    return None
+
+
+@dataclass
+class WsClientMetrics:
+    """Delivery counters for one websocket client."""
+
+    enqueued: int = 0
+    coalesced: int = 0
+    evicted: int = 0
+    overflowed: int = 0
+    sent: int = 0
+    max_depth: int = 0
+    last_lag_s: float = 0.0
+    max_lag_s: float = 0.0
+    last_send_s: float = 0.0
+
+
+class WsClientQueue:
+    """Single-consumer FIFO of frames with per-key coalescing and a size bound.
+
+    When the queue is full, an incoming ``refresh`` is merged into a queued
+    refresh of the same kind, widened to the scope both share. Otherwise the
+    oldest frame whose event is in ``evictable`` is discarded to make room;
+    refresh frames are never discarded, since a client that misses one keeps
+    showing stale data. If nothing can be merged or evicted ``put_nowait``
+    returns False and the caller is expected to drop the client; it
+    resubscribes and receives fresh initial state on reconnect.
+    """
+
+    def __init__(self, maxsize: int = 0, evictable: frozenset[str] = frozenset()) -> None:
+        self.maxsize = maxsize
+        self._evictable = evictable
+        self._frames: OrderedDict[Hashable, WsFrame] = OrderedDict()
+        self._seq = 0
+        self._not_empty = asyncio.Event()
+        # Frames accepted but not yet marked done; coalescing replaces a frame
+        # without adding work, so this counts deliveries still owed.
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self.metrics = WsClientMetrics()
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+    def empty(self) -> bool:
+        return not self._frames
+
+    def oldest_age_s(self) -> float:
+        """Seconds the head of the queue has been waiting, 0.0 when empty."""
+        if not self._frames:
+            return 0.0
+        return time.monotonic() - next(iter(self._frames.values())).created_at
+
+    def put_nowait(self, frame: WsFrame) -> bool:
+        """Queue a frame; False if the queue is full of frames that must not be dropped."""
+        key = ws_coalesce_key(frame)
+        if key is not None and key in self._frames:
+            # Keep the original position so a busy session cannot starve others.
+            self._frames[key] = frame
+            self.metrics.coalesced += 1
+            return True
+        if self.maxsize > 0 and len(self._frames) >= self.maxsize:
+            if frame.event == "refresh" and self._merge_refresh(frame):
+                self.metrics.coalesced += 1
+                return True
+            if not self._evict_one():
+                self.metrics.overflowed += 1
+                return False
+        if key is None:
+            self._seq += 1
+            key = self._seq
+        self._frames[key] = frame
+        self._unfinished += 1
+        self._finished.clear()
+        self.metrics.enqueued += 1
+        self.metrics.max_depth = max(self.metrics.max_depth, len(self._frames))
+        self._not_empty.set()
+        return True
+
+    def _merge_refresh(self, frame: WsFrame) -> bool:
+        """Fold a refresh into a queued one of the same kind, keeping its position."""
+        kind = frame.payload.get("event")
+        data = frame.payload.get("data")
+        scope = data if isinstance(data, dict) else {}
+        target: Hashable | None = None
+        for key, queued in self._frames.items():
+            if queued.event != "refresh" or queued.payload.get("event") != kind:
+                continue
+            queued_data = queued.payload.get("data")
+            queued_scope = queued_data if isinstance(queued_data, dict) else {}
+            if all(scope.get(field) == value for field, value in queued_scope.items()):
+                # Already covered by a queued refresh of the same or wider scope.
+                return True
+            if target is None:
+                target = key
+        if target is None:
+            return False
+        queued = self._frames[target]
+        queued_data = queued.payload.get("data")
+        shared: JsonDict = {
+            field: value for field, value in cast(JsonDict, queued_data).items() if scope.get(field) == value
+        }
+        merged = WsFrame("refresh", {**queued.payload, "data": shared})
+        merged.created_at = queued.created_at
+        merged_key = ws_coalesce_key(merged)
+        self._frames = OrderedDict(
+            (merged_key, merged) if key == target else (key, entry) for key, entry in self._frames.items()
+        )
+        return True
+
+    def _evict_one(self) -> bool:
+        for key, queued in self._frames.items():
+            if queued.event in self._evictable and queued.event != "refresh":
+                del self._frames[key]
+                self.metrics.evicted += 1
+                self.task_done()
+                return True
+        return False
+
+    async def get(self) -> WsFrame:
+        """Wait for and remove the oldest frame."""
+        while not self._frames:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        _, frame = self._frames.popitem(last=False)
+        return frame
+
+    def task_done(self) -> None:
+        """Mark one frame returned by ``get`` (or evicted) as finished."""
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every accepted frame has been delivered or evicted."""
+        await self._finished.wait()
+
+    def record_sent(self, frame: WsFrame, send_s: float) -> None:
+        """Account one delivered frame; lag is measured from when it was built."""
+        lag = time.monotonic() - frame.created_at
+        self.metrics.sent += 1
+        self.metrics.last_lag_s = lag
+        self.metrics.max_lag_s = max(self.metrics.max_lag_s, lag)
+        self.metrics.last_send_s = send_s
@@ -594,6 +594,27 @@ class JobDTO(BaseModel):
     status: str
 
 
+class WsClientMetricsDTO(BaseModel):
+    """Outbound delivery metrics for one connected WebSocket client (GET /ws/clients)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    client_id: int
+    subscriptions: dict[str, list[str]] = Field(default_factory=dict)
+    depth: int
+    max_depth: int
+    queue_max: int
+    oldest_pending_ms: float
+    enqueued: int
+    sent: int
+    coalesced: int
+    evicted: int
+    overflowed: int
+    last_lag_ms: float
+    max_lag_ms: float
+    last_send_ms: float
+
+
 class RunSessionRequest(BaseModel):
     """Request to run an agent command in a new session (POST /sessions/run)."""
 
@@ -24,7 +24,7 @@ from instrukt_ai_logging import get_logger
 from teleclaude.api.auth import CallerIdentity, verify_caller
 from teleclaude.api.ws_constants import API_WS_PING_INTERVAL_S, API_WS_PING_TIMEOUT_S
 from teleclaude.api.ws_mixin import _WebSocketMixin
-from teleclaude.api_models import AgentActivityEventDTO, SessionLifecycleStatusEventDTO, TodoDTO
+from teleclaude.api_models import AgentActivityEventDTO, SessionLifecycleStatusEventDTO, TodoDTO, WsClientMetricsDTO
 from teleclaude.config import config
 from teleclaude.constants import API_SOCKET_PATH
 from teleclaude.core import command_handlers
@@ -127,6 +127,10 @@ class APIServer(_WebSocketMixin):  # pyright: ignore[reportIncompatibleVariableO
 
         self.app.include_router(hooks_router)
 
+        from teleclaude.api.hook_events_routes import router as hook_events_router
+
+        self.app.include_router(hook_events_router)
+
         from teleclaude.channels.api_routes import router as channels_router
 
         self.app.include_router(channels_router)
@@ -401,6 +405,13 @@ class APIServer(_WebSocketMixin):  # pyright: ignore[reportIncompatibleVariableO
             """Health check endpoint."""
             return {"status": "ok"}
 
+        @self.app.get("/ws/clients")
+        async def ws_clients(  # pyright: ignore
+            _identity: CallerIdentity = Depends(verify_caller),
+        ) -> list[WsClientMetricsDTO]:
+            """Per-client WebSocket backlog, lag and drop metrics."""
+            return self._ws_client_metrics()
+
         @self.app.get("/auth/whoami")
         async def auth_whoami(  # pyright: ignore
             identity: CallerIdentity = Depends(verify_caller),
@@ -816,15 +827,17 @@ class APIServer(_WebSocketMixin):  # pyright: ignore[reportIncompatibleVariableO
         while self._running:
             fd_count = _get_fd_count()
             ws_count = len(self._ws_clients)
+            ws_backlog = max((state.queue.qsize() for state in self._ws_client_states.values()), default=0)
             task_count = self.task_registry.task_count() if self.task_registry else 0
             server = self.server
             server_started = getattr(server, "started", None) if server else None
             server_should_exit = getattr(server, "should_exit", None) if server else None
             server_task_done = self.server_task.done() if self.server_task else None
             logger.info(
-                "API server metrics: fds=%d ws=%d tasks=%d started=%s should_exit=%s task_done=%s",
+                "API server metrics: fds=%d ws=%d ws_backlog=%d tasks=%d started=%s should_exit=%s task_done=%s",
                 fd_count,
                 ws_count,
+                ws_backlog,
                 task_count,
                 server_started,
                 server_should_exit,
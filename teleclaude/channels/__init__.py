@@ -1,6 +1,6 @@
 """Internal pub/sub channels backed by Redis Streams."""
 
-from teleclaude.channels.consumer import consume, ensure_consumer_group
+from teleclaude.channels.consumer import ack, consume, consume_streams, ensure_consumer_group
 from teleclaude.channels.publisher import list_channels, publish
 from teleclaude.channels.types import ChannelInfo, ConsumedMessage
 from teleclaude.channels.worker import run_subscription_worker
@@ -8,7 +8,9 @@ from teleclaude.channels.worker import run_subscription_worker
 __all__ = [
     "ChannelInfo",
     "ConsumedMessage",
+    "ack",
     "consume",
+    "consume_streams",
     "ensure_consumer_group",
     "list_channels",
     "publish",
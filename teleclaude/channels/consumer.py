@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from typing import Any
 
 from instrukt_ai_logging import get_logger
@@ -29,6 +30,33 @@ async def ensure_consumer_group(redis: Redis, channel: str, group: str) -> None:
             raise
 
 
+def _parse_entries(
+    entries: list[tuple[bytes | str, dict[bytes | str, bytes | str] | None]],
+) -> tuple[list[ConsumedMessage], list[bytes | str]]:
+    """Decode raw stream entries.
+
+    Returns the decoded messages plus the ids of entries without a payload
+    field; those are acknowledged by the caller to prevent redelivery.
+    """
+    messages: list[ConsumedMessage] = []
+    skipped: list[bytes | str] = []
+    for msg_id, fields in entries:
+        decoded_id = msg_id.decode() if hasattr(msg_id, "decode") else str(msg_id)
+        payload_raw = (fields.get(b"payload") or fields.get("payload")) if fields else None
+        if payload_raw is None:
+            logger.warning("Message %s has no payload field; acknowledging to prevent redelivery", decoded_id)
+            skipped.append(msg_id)
+            continue
+        payload_str = payload_raw.decode() if hasattr(payload_raw, "decode") else str(payload_raw)
+        try:
+            parsed = json.loads(payload_str)
+        except json.JSONDecodeError:
+            parsed = {"raw": payload_str}
+        payload: dict[str, Any] = parsed  # guard: loose-dict - Channel payload is arbitrary user JSON
+        messages.append(ConsumedMessage(id=decoded_id, payload=payload))
+    return messages, skipped
+
+
 async def consume(
     redis: Redis,
     channel: str,
@@ -64,23 +92,64 @@ async def consume(
     messages: list[ConsumedMessage] = []
     ack_ids: list[bytes | str] = []
     for _stream_name, entries in raw:
-        for msg_id, fields in entries:
-            decoded_id = msg_id.decode() if hasattr(msg_id, "decode") else str(msg_id)
-            payload_raw = fields.get(b"payload") or fields.get("payload")
-            if payload_raw is None:
-                logger.warning("Message %s has no payload field; acknowledging to prevent redelivery", decoded_id)
-                ack_ids.append(msg_id)
-                continue
-            payload_str = payload_raw.decode() if hasattr(payload_raw, "decode") else str(payload_raw)
-            try:
-                parsed = json.loads(payload_str)
-            except json.JSONDecodeError:
-                parsed = {"raw": payload_str}
-            payload: dict[str, Any] = parsed  # guard: loose-dict - Channel payload is arbitrary user JSON
-            messages.append(ConsumedMessage(id=decoded_id, payload=payload))
-            ack_ids.append(msg_id)
+        parsed, skipped = _parse_entries(entries)
+        messages.extend(parsed)
+        ack_ids.extend(skipped)
+        ack_ids.extend(message["id"] for message in parsed)
 
     if ack_ids:
         await redis.xack(channel, group, *ack_ids)
 
     return messages
+
+
+async def consume_streams(
+    redis: Redis,
+    streams: Mapping[str, str],
+    group: str,
+    consumer: str,
+    count: int = 10,
+    block_ms: int = 0,
+) -> dict[str, list[ConsumedMessage]]:
+    """Read from several channels with a single XREADGROUP, without acknowledging.
+
+    Args:
+        redis: Connected Redis client.
+        streams: Channel key -> read position. ``">"`` reads new messages;
+            an explicit id re-reads this consumer's pending (delivered but
+            unacknowledged) entries after that id.
+        group: Consumer group name.
+        consumer: Consumer name within the group.
+        count: Maximum messages to read per channel.
+        block_ms: How long to block waiting for messages (0 = no block).
+
+    Returns:
+        Messages per channel key. Callers acknowledge each message with
+        :func:`ack` once it has been handled; entries without a payload are
+        acknowledged here. A channel whose entries were all payload-less maps
+        to an empty list, while a channel with nothing to read is absent.
+    """
+    raw = await redis.xreadgroup(
+        group,
+        consumer,
+        dict(streams),
+        count=count,
+        block=block_ms if block_ms > 0 else None,
+    )
+    if not raw:
+        return {}
+
+    batches: dict[str, list[ConsumedMessage]] = {}
+    for stream_name, entries in raw:
+        channel = stream_name.decode() if hasattr(stream_name, "decode") else str(stream_name)
+        parsed, skipped = _parse_entries(entries)
+        if skipped:
+            await redis.xack(channel, group, *skipped)
+        batches[channel] = parsed
+    return batches
+
+
+async def ack(redis: Redis, channel: str, group: str, *message_ids: str) -> None:
+    """Acknowledge handled messages on a channel consumer group."""
+    if message_ids:
+        await redis.xack(channel, group, *message_ids)
@@ -55,19 +55,28 @@ async def list_channels(redis: Redis, project: str | None = None) -> list[Channe
         List of ChannelInfo dicts with ``key``, ``project``, ``topic``, and ``length`` fields.
     """
     pattern = f"{CHANNEL_PREFIX}:{project}:*" if project else f"{CHANNEL_PREFIX}:*"
-    channels: list[ChannelInfo] = []
+    keys: list[tuple[str, list[str]]] = []
     async for key_bytes in redis.scan_iter(match=pattern, _type="stream"):
         key = key_bytes.decode() if hasattr(key_bytes, "decode") else str(key_bytes)
         parts = key.split(":", 2)
         if len(parts) != 3:
             continue
-        length = await redis.xlen(key)
-        channels.append(
-            ChannelInfo(
-                key=key,
-                project=parts[1],
-                topic=parts[2],
-                length=length,
-            )
+        keys.append((key, parts))
+    if not keys:
+        return []
+
+    # One round trip for every XLEN instead of one per key.
+    async with redis.pipeline(transaction=False) as pipe:
+        for key, _parts in keys:
+            pipe.xlen(key)
+        lengths = await pipe.execute()
+
+    return [
+        ChannelInfo(
+            key=key,
+            project=parts[1],
+            topic=parts[2],
+            length=int(length),
         )
-    return channels
+        for (key, parts), length in zip(keys, lengths, strict=True)
+    ]
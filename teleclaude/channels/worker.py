@@ -1,17 +1,28 @@
-"""Background worker that polls subscribed channels and dispatches to targets."""
+"""Background worker that reads subscribed channels and dispatches to targets.
+
+All subscribed channels are read with one blocking XREADGROUP. Each channel
+has its own queue and dispatch task, so messages on a channel are handled in
+stream order while a slow channel never holds up the others. A message is
+fanned out to its matching subscriptions (bounded by a per-target concurrency
+limit) and acknowledged once all of them have handled it. A channel with too
+many unacknowledged messages is left out of the next read until its backlog
+drains.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import TYPE_CHECKING, Any
 
 from instrukt_ai_logging import get_logger
 
-from teleclaude.channels.consumer import consume, ensure_consumer_group
+from teleclaude.channels.consumer import ack, consume_streams, ensure_consumer_group
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from teleclaude.channels.types import ConsumedMessage
     from teleclaude.config.schema import ChannelSubscription
 
 logger = get_logger(__name__)
@@ -20,8 +31,16 @@ logger = get_logger(__name__)
 _WORKER_GROUP = "teleclaude-worker"
 _WORKER_CONSUMER = "main"
 
-# Polling interval when no messages are received
-_POLL_INTERVAL_S = 5.0
+# Upper bound for one XREADGROUP; also bounds how long shutdown takes to notice.
+_BLOCK_MS = 1000
+# Messages read per channel per XREADGROUP.
+_READ_COUNT = 20
+# Unacknowledged messages allowed per channel before it is paused.
+_CHANNEL_MAX_IN_FLIGHT = 100
+# Concurrent dispatches per subscription target.
+_TARGET_CONCURRENCY = 4
+# Pause after a failed read before retrying.
+_ERROR_BACKOFF_S = 1.0
 
 
 async def _dispatch_to_target(
@@ -71,18 +90,136 @@ def _matches_filter(
     return all(payload.get(k) == v for k, v in msg_filter.items())
 
 
+def _target_key(
+    target: dict[str, Any],  # guard: loose-dict - Subscription target schema is intentionally unstructured
+) -> str:
+    return json.dumps(target, sort_keys=True, default=str)
+
+
+class _SubscriptionDispatcher:
+    """Ordered per-channel dispatch with per-target limits and acknowledgement."""
+
+    def __init__(self, redis: Redis, subscriptions: list[ChannelSubscription]) -> None:
+        self._redis = redis
+        self._by_channel: dict[str, list[ChannelSubscription]] = {}
+        for sub in subscriptions:
+            self._by_channel.setdefault(sub.channel, []).append(sub)
+        self._target_slots: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[str, int] = dict.fromkeys(self._by_channel, 0)
+        self._capacity = asyncio.Event()
+        self._queues: dict[str, asyncio.Queue[ConsumedMessage]] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def channels(self) -> list[str]:
+        return list(self._by_channel)
+
+    def in_flight(self, channel: str) -> int:
+        return self._in_flight.get(channel, 0)
+
+    def ready_channels(self) -> list[str]:
+        """Channels with room for another full read batch."""
+        limit = _CHANNEL_MAX_IN_FLIGHT - _READ_COUNT
+        return [channel for channel, count in self._in_flight.items() if count <= limit]
+
+    async def wait_for_capacity(self) -> None:
+        """Block until a dispatch finishes (and may have freed a channel)."""
+        self._capacity.clear()
+        if self.ready_channels():
+            return
+        await self._capacity.wait()
+
+    def submit(self, channel: str, message: ConsumedMessage) -> None:
+        """Queue a message behind earlier ones from the same channel."""
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = self._queues[channel] = asyncio.Queue()
+            self._tasks[channel] = asyncio.create_task(self._run_channel(channel, queue))
+        self._in_flight[channel] = self._in_flight.get(channel, 0) + 1
+        queue.put_nowait(message)
+
+    async def drain(self) -> None:
+        """Wait for every queued dispatch to finish and acknowledge."""
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def cancel(self) -> None:
+        """Abandon queued dispatches; their messages stay pending for recovery."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queues.clear()
+
+    async def _run_channel(self, channel: str, queue: asyncio.Queue[ConsumedMessage]) -> None:
+        while True:
+            message = await queue.get()
+            try:
+                await self._handle(channel, message)
+            finally:
+                queue.task_done()
+
+    async def _handle(self, channel: str, message: ConsumedMessage) -> None:
+        matched = [sub for sub in self._by_channel.get(channel, []) if _matches_filter(sub.filter, message["payload"])]
+        try:
+            await asyncio.gather(*(self._dispatch(channel, message, sub) for sub in matched))
+            try:
+                await ack(self._redis, channel, _WORKER_GROUP, message["id"])
+            except Exception:
+                logger.warning("Ack failed for message %s on %s", message["id"], channel, exc_info=True)
+        finally:
+            self._in_flight[channel] -= 1
+            self._capacity.set()
+
+    async def _dispatch(self, channel: str, message: ConsumedMessage, sub: ChannelSubscription) -> None:
+        key = _target_key(sub.target)
+        slots = self._target_slots.get(key)
+        if slots is None:
+            slots = self._target_slots[key] = asyncio.Semaphore(_TARGET_CONCURRENCY)
+        async with slots:
+            try:
+                await _dispatch_to_target(sub.target, message["payload"])
+            except Exception:
+                logger.warning("Dispatch failed for message %s on %s", message["id"], channel, exc_info=True)
+
+
+async def _recover_pending(redis: Redis, dispatcher: _SubscriptionDispatcher) -> None:
+    """Redispatch messages delivered to this consumer but never acknowledged (e.g. before a restart)."""
+    for channel in dispatcher.channels:
+        last_id = "0"
+        while True:
+            try:
+                batches = await consume_streams(
+                    redis, {channel: last_id}, _WORKER_GROUP, _WORKER_CONSUMER, count=_READ_COUNT
+                )
+            except Exception:
+                logger.warning("Pending recovery failed on %s", channel, exc_info=True)
+                break
+            # Redis answers a drained pending list with an empty entry list.
+            # A batch of payload-less entries (acknowledged by consume_streams)
+            # also comes back empty and ends recovery rather than re-reading.
+            messages = batches.get(channel)
+            if not messages:
+                break
+            for message in messages:
+                dispatcher.submit(channel, message)
+            last_id = messages[-1]["id"]
+            if dispatcher.in_flight(channel) > _CHANNEL_MAX_IN_FLIGHT - _READ_COUNT:
+                await dispatcher.drain()
+
+
 async def run_subscription_worker(
     redis: Redis,
     subscriptions: list[ChannelSubscription],
     *,
     shutdown_event: asyncio.Event | None = None,
 ) -> None:
-    """Poll subscribed channels and dispatch matched messages.
+    """Consume subscribed channels and dispatch matched messages.
 
     This coroutine runs indefinitely (until *shutdown_event* is set or the task
-    is cancelled).  It creates consumer groups as needed, then enters a polling
-    loop that reads from each channel and dispatches matching messages to their
-    configured targets.
+    is cancelled).  It creates consumer groups as needed, redispatches any
+    messages left unacknowledged by a previous run, then blocks on a single
+    XREADGROUP across every channel that has dispatch capacity.
 
     Args:
         redis: Connected async Redis client.
@@ -93,44 +230,49 @@ async def run_subscription_worker(
         logger.info("No channel subscriptions configured; worker idle")
         return
 
+    dispatcher = _SubscriptionDispatcher(redis, subscriptions)
+
     # Ensure consumer groups exist for all subscribed channels.
-    for sub in subscriptions:
+    for channel in dispatcher.channels:
         try:
-            await ensure_consumer_group(redis, sub.channel, _WORKER_GROUP)
+            await ensure_consumer_group(redis, channel, _WORKER_GROUP)
         except Exception:
-            logger.warning("Failed to create consumer group for %s", sub.channel)
+            logger.warning("Failed to create consumer group for %s", channel)
 
-    logger.info("Channel subscription worker started", subscription_count=len(subscriptions))
+    logger.info(
+        "Channel subscription worker started",
+        subscription_count=len(subscriptions),
+        channel_count=len(dispatcher.channels),
+    )
 
-    while True:
-        if shutdown_event and shutdown_event.is_set():
-            break
-
-        for sub in subscriptions:
+    try:
+        await _recover_pending(redis, dispatcher)
+        while not (shutdown_event and shutdown_event.is_set()):
+            channels = dispatcher.ready_channels()
+            if not channels:
+                await dispatcher.wait_for_capacity()
+                continue
             try:
-                messages = await consume(
+                batches = await consume_streams(
                     redis,
-                    sub.channel,
+                    dict.fromkeys(channels, ">"),
                     _WORKER_GROUP,
                     _WORKER_CONSUMER,
-                    count=10,
-                    block_ms=0,
+                    count=_READ_COUNT,
+                    block_ms=_BLOCK_MS,
                 )
             except Exception:
-                logger.warning("Channel consume error on %s", sub.channel, exc_info=True)
+                logger.warning("Channel read error", channels=channels, exc_info=True)
+                await asyncio.sleep(_ERROR_BACKOFF_S)
                 continue
-
-            for msg in messages:
-                if not _matches_filter(sub.filter, msg["payload"]):
-                    continue
-                try:
-                    await _dispatch_to_target(sub.target, msg["payload"])
-                except Exception:
-                    logger.warning("Dispatch failed for message %s on %s", msg["id"], sub.channel, exc_info=True)
-
-        try:
-            await asyncio.sleep(_POLL_INTERVAL_S)
-        except asyncio.CancelledError:
-            break
+            for channel, messages in batches.items():
+                for message in messages:
+                    dispatcher.submit(channel, message)
+        await dispatcher.drain()
+    except asyncio.CancelledError:
+        await dispatcher.cancel()
+        logger.info("Channel subscription worker cancelled")
+        raise
+    await dispatcher.cancel()
 
     logger.info("Channel subscription worker stopped")
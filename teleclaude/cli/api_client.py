@@ -14,7 +14,7 @@ from typing import TypeAlias
 
 import httpx
 from instrukt_ai_logging import get_logger
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 from websockets.exceptions import ConnectionClosed, WebSocketException
 from websockets.sync.client import ClientConnection, unix_connect
 
@@ -39,6 +39,7 @@ from teleclaude.cli.models import (
 )
 from teleclaude.cli.session_auth import read_current_session_email
 from teleclaude.constants import API_SOCKET_PATH
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -172,7 +173,7 @@ class TelecAPIClient:
             if not self._ws:
                 return
             try:
-                self._ws.send(json.dumps(payload))
+                self._ws.send(json_codec.dumps(payload))
             except Exception:
                 pass
 
@@ -230,7 +231,7 @@ class TelecAPIClient:
                 "types": initial_sub.subscribe.types,
             }
         }
-        ws.send(json.dumps(initial_payload))
+        ws.send(json_codec.dumps(initial_payload))
         if self._ws_on_connect:
             self._ws_on_connect()
 
@@ -240,7 +241,7 @@ class TelecAPIClient:
                 break
 
             try:
-                ws_event: WsEvent = TypeAdapter(WsEvent).validate_json(message)
+                ws_event: WsEvent = json_codec.typed_decoder(WsEvent)(message)
                 if self._ws_callback:
                     self._ws_callback(ws_event)
             except json.JSONDecodeError:
@@ -452,7 +453,7 @@ class TelecAPIClient:
         if include_closed:
             params["include_closed"] = "true"
         resp = await self._request("GET", "/sessions", params=params)
-        return TypeAdapter(list[SessionInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(list[SessionInfo])(resp.text)
 
     async def list_computers(self) -> list[ComputerInfo]:
         """List online computers only.
@@ -464,7 +465,7 @@ class TelecAPIClient:
             APIError: If request fails
         """
         resp = await self._request("GET", "/computers")
-        return TypeAdapter(list[ComputerInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(list[ComputerInfo])(resp.text)
 
     async def list_projects(self, computer: str | None = None) -> list[ProjectInfo]:
         """List projects from all or specific computer.
@@ -480,7 +481,7 @@ class TelecAPIClient:
         """
         params: dict[str, str] = {"computer": computer} if computer else {}
         resp = await self._request("GET", "/projects", params=params)
-        return TypeAdapter(list[ProjectInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(list[ProjectInfo])(resp.text)
 
     async def create_session(
         self,
@@ -527,7 +528,7 @@ class TelecAPIClient:
         if skip_listener_registration:
             payload["skip_listener_registration"] = True  # type: ignore[assignment]
         resp = await self._request("POST", "/sessions", timeout=30.0, json_body=payload)  # type: ignore[arg-type]
-        return TypeAdapter(CreateSessionResult).validate_json(resp.text)
+        return json_codec.typed_decoder(CreateSessionResult)(resp.text)
 
     async def end_session(self, session_id: str, computer: str) -> bool:
         """End a session.
@@ -615,7 +616,7 @@ class TelecAPIClient:
             APIError: If request fails
         """
         resp = await self._request("GET", "/agents/availability")
-        return TypeAdapter(dict[str, AgentAvailabilityInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(dict[str, AgentAvailabilityInfo])(resp.text)
 
     async def set_agent_status(
         self,
@@ -643,7 +644,7 @@ class TelecAPIClient:
             f"/agents/{agent}/status",
             json_body={"status": status, "reason": reason, "duration_minutes": duration_minutes},  # type: ignore[dict-item]
         )
-        return TypeAdapter(AgentAvailabilityInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(AgentAvailabilityInfo)(resp.text)
 
     async def list_projects_with_todos(self) -> list[ProjectWithTodosInfo]:
         """List all projects with their todos included.
@@ -707,7 +708,7 @@ class TelecAPIClient:
         if computer:
             params["computer"] = computer
         resp = await self._request("GET", "/todos", params=params)
-        return TypeAdapter(list[TodoInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(list[TodoInfo])(resp.text)
 
     async def list_jobs(self) -> list[JobInfo]:
         """List scheduled jobs.
@@ -719,7 +720,7 @@ class TelecAPIClient:
             APIError: If request fails
         """
         resp = await self._request("GET", "/jobs")
-        return TypeAdapter(list[JobInfo]).validate_json(resp.text)
+        return json_codec.typed_decoder(list[JobInfo])(resp.text)
 
     async def run_job(self, name: str) -> bool:
         """Run a scheduled job immediately.
@@ -755,37 +756,37 @@ class TelecAPIClient:
     async def get_settings(self) -> SettingsInfo:
         """Get current runtime settings."""
         resp = await self._request("GET", "/settings")
-        return TypeAdapter(SettingsInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(SettingsInfo)(resp.text)
 
     async def patch_settings(self, updates: SettingsPatchInfo) -> SettingsInfo:
         """Apply partial updates to runtime settings."""
         resp = await self._request("PATCH", "/settings", json_body=updates.model_dump(exclude_none=True))
-        return TypeAdapter(SettingsInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(SettingsInfo)(resp.text)
 
     async def chiptunes_next(self) -> ChiptunesCommandReceiptInfo:
         """Queue skip-to-next chiptunes command."""
         resp = await self._request("POST", "/api/chiptunes/next")
-        return TypeAdapter(ChiptunesCommandReceiptInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(ChiptunesCommandReceiptInfo)(resp.text)
 
     async def chiptunes_prev(self) -> ChiptunesCommandReceiptInfo:
         """Queue previous-track chiptunes command."""
         resp = await self._request("POST", "/api/chiptunes/prev")
-        return TypeAdapter(ChiptunesCommandReceiptInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(ChiptunesCommandReceiptInfo)(resp.text)
 
     async def chiptunes_pause(self) -> ChiptunesCommandReceiptInfo:
         """Queue pause command for chiptunes playback."""
         resp = await self._request("POST", "/api/chiptunes/pause")
-        return TypeAdapter(ChiptunesCommandReceiptInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(ChiptunesCommandReceiptInfo)(resp.text)
 
     async def chiptunes_resume(self) -> ChiptunesCommandReceiptInfo:
         """Queue resume command for chiptunes playback."""
         resp = await self._request("POST", "/api/chiptunes/resume")
-        return TypeAdapter(ChiptunesCommandReceiptInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(ChiptunesCommandReceiptInfo)(resp.text)
 
     async def get_chiptunes_status(self) -> ChiptunesStatusInfo:
         """Fetch current chiptunes playback state."""
         resp = await self._request("GET", "/api/chiptunes/status")
-        return TypeAdapter(ChiptunesStatusInfo).validate_json(resp.text)
+        return json_codec.typed_decoder(ChiptunesStatusInfo)(resp.text)
 
     async def revive_session(
         self, session_id: str, *, agent: str | None = None, project: str | None = None
@@ -801,7 +802,7 @@ class TelecAPIClient:
         if project:
             params["project"] = project
         resp = await self._request("POST", f"/sessions/{session_id}/revive", params=params, timeout=30.0)
-        return TypeAdapter(CreateSessionResult).validate_json(resp.text)
+        return json_codec.typed_decoder(CreateSessionResult)(resp.text)
 
     async def memory_search(
         self,
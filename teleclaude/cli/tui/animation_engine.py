@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import time
+from array import array
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -34,8 +35,203 @@ class AnimationSlot:
     looping: bool = False
 
 
-# A buffer maps Z-level -> (pixel -> color)
-_ZBufferDict = dict[int, dict[tuple[int, int], str | int]]
+# Animations emit Z-level -> (pixel -> value) mappings; the engine stores them as flat arrays.
+_FrameLayers = Mapping[int, Mapping[tuple[int, int], str | int]]
+# (x, y, width, height) of the cells that changed in the last update
+DirtyRect = tuple[int, int, int, int]
+
+# Interned values per palette before a fresh palette is started (bounds memory for
+# long-running gradient animations that emit many distinct colors).
+_PALETTE_LIMIT = 1 << 16
+
+
+class _Palette:
+    """Interns pixel values so layers can store them as small integers.
+
+    Index 0 is reserved for "no pixel".
+    """
+
+    __slots__ = ("index", "values")
+
+    def __init__(self) -> None:
+        self.values: list[str | int | None] = [None]
+        self.index: dict[str | int, int] = {}
+
+    def intern(self, value: str | int) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.values.append(value)
+            self.index[value] = idx
+        return idx
+
+
+class _ZGrid:
+    """One frame of Z-layered pixels: a flat palette-index array per layer.
+
+    Cell (x, y) lives at index ``y * width + x``. The grid grows to fit the
+    pixels it is given; negative coordinates are never rendered and are dropped.
+    """
+
+    __slots__ = ("_blank", "_composite", "_z_desc", "height", "layers", "palette", "width")
+
+    def __init__(self, palette: _Palette) -> None:
+        self.width = 0
+        self.height = 0
+        self.palette = palette
+        self.layers: dict[int, array[int]] = {}
+        self._blank: array[int] = array("I")
+        self._z_desc: list[int] = []
+        self._composite: array[int] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.layers
+
+    @property
+    def z_levels(self) -> list[int]:
+        """Populated Z levels, front-most first."""
+        return self._z_desc
+
+    def clear(self) -> None:
+        self.width = 0
+        self.height = 0
+        self.layers = {}
+        self._blank = array("I")
+        self._z_desc = []
+        self._composite = None
+
+    def load(self, frame: _FrameLayers, palette: _Palette) -> None:
+        """Replace this grid's contents with a frame, reusing layer allocations."""
+        self.palette = palette
+        width, height = self.width, self.height
+        blank = self._blank
+        index = palette.index
+        intern = palette.intern
+        overflow: list[tuple[int, int, int, int]] = []
+        layers: dict[int, array[int]] = {}
+        for z, pixels in frame.items():
+            cells = self.layers.get(z)
+            if cells is None:
+                cells = array("I", blank)
+            else:
+                cells[:] = blank
+            for (x, y), value in pixels.items():
+                idx = index.get(value)
+                if idx is None:
+                    idx = intern(value)
+                if 0 <= x < width and 0 <= y < height:
+                    cells[y * width + x] = idx
+                elif x >= 0 and y >= 0:
+                    overflow.append((z, x, y, idx))
+            layers[z] = cells
+        self.layers = layers
+        if overflow:
+            self._grow(overflow)
+        self._z_desc = sorted(layers, reverse=True)
+        self._composite = None
+
+    def _grow(self, overflow: list[tuple[int, int, int, int]]) -> None:
+        old_width, old_height = self.width, self.height
+        width = max(old_width, max(x for _, x, _, _ in overflow) + 1)
+        height = max(old_height, max(y for _, _, y, _ in overflow) + 1)
+        blank = array("I", [0]) * (width * height)
+        for z, old in self.layers.items():
+            cells = array("I", blank)
+            for y in range(old_height):
+                cells[y * width : y * width + old_width] = old[y * old_width : (y + 1) * old_width]
+            self.layers[z] = cells
+        for z, x, y, idx in overflow:
+            self.layers[z][y * width + x] = idx
+        self.width, self.height = width, height
+        self._blank = blank
+
+    def value_at(self, z: int, x: int, y: int) -> str | int | None:
+        cells = self.layers.get(z)
+        if cells is None or not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return self.palette.values[cells[y * self.width + x]]
+
+    def color_at(self, x: int, y: int) -> str | None:
+        """Front-most color value at a cell, memoized per frame."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = y * self.width + x
+        composite = self._composite
+        if composite is None:
+            composite = self._composite = array("i", [-1]) * (self.width * self.height)
+        values = self.palette.values
+        resolved = composite[i]
+        if resolved < 0:
+            resolved = 0
+            for z in self._z_desc:
+                idx = self.layers[z][i]
+                value = values[idx]
+                # Only strings that look like colors (Hex or color(N)); skip
+                # single-character entity markers (Stars/Clouds) and -1.
+                if isinstance(value, str) and len(value) > 1:
+                    resolved = idx
+                    break
+            composite[i] = resolved
+        color = values[resolved]
+        return color if isinstance(color, str) else None
+
+    def full_rect(self) -> DirtyRect | None:
+        if self.is_empty or not self.width or not self.height:
+            return None
+        return (0, 0, self.width, self.height)
+
+    def diff_rect(self, previous: _ZGrid) -> DirtyRect | None:
+        """Bounding box of the cells that differ from ``previous``."""
+        if self.palette is not previous.palette or self.width != previous.width or self.height != previous.height:
+            width = max(self.width, previous.width)
+            height = max(self.height, previous.height)
+            if (self.is_empty and previous.is_empty) or not width or not height:
+                return None
+            return (0, 0, width, height)
+
+        width = self.width
+        x0, y0, x1, y1 = width, self.height, -1, -1
+        for z in self.layers.keys() | previous.layers.keys():
+            current = self.layers.get(z, self._blank)
+            before = previous.layers.get(z, previous._blank)
+            if current == before:
+                continue
+            for y in range(self.height):
+                start = y * width
+                span = _diff_span(current, before, start, start + width)
+                if span is None:
+                    continue
+                first, last = span
+                x0 = min(x0, first - start)
+                x1 = max(x1, last - start)
+                y0 = min(y0, y)
+                y1 = max(y1, y)
+        if x1 < 0:
+            return None
+        return (x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+
+
+def _diff_span(a: array[int], b: array[int], start: int, end: int) -> tuple[int, int] | None:
+    """First and last differing indices in ``[start, end)``, found by slice bisection."""
+    if a[start:end] == b[start:end]:
+        return None
+    lo, hi = start, end
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    first = lo
+    lo, hi = first, end
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[mid:hi] == b[mid:hi]:
+            hi = mid
+        else:
+            lo = mid
+    return first, lo
 
 
 class AnimationEngine:
@@ -43,12 +239,17 @@ class AnimationEngine:
 
     Supports priority-based animation queuing per target.
     Handles layered Z-Buffer compositing for physical occlusion.
+
+    Each target double-buffers its frames as flat per-layer arrays; after
+    every update the engine records the rectangle of cells that changed so
+    widgets only repaint what moved.
     """
 
     def __init__(self) -> None:
         self._targets: dict[str, AnimationSlot] = {}
-        self._buffers_front: dict[str, _ZBufferDict] = {}
-        self._buffers_back: dict[str, _ZBufferDict] = {}
+        self._buffers_front: dict[str, _ZGrid] = {}
+        self._buffers_back: dict[str, _ZGrid] = {}
+        self._dirty: dict[str, DirtyRect] = {}
         self._is_enabled: bool = True
         self._animation_mode: str = "periodic"
         self._has_active_animation: bool = False
@@ -85,8 +286,9 @@ class AnimationEngine:
     def _ensure_target(self, target: str) -> AnimationSlot:
         if target not in self._targets:
             self._targets[target] = AnimationSlot()
-            self._buffers_front[target] = {}
-            self._buffers_back[target] = {}
+            palette = _Palette()
+            self._buffers_front[target] = _ZGrid(palette)
+            self._buffers_back[target] = _ZGrid(palette)
         return self._targets[target]
 
     def play(
@@ -134,10 +336,7 @@ class AnimationEngine:
             slot.queue.clear()
             slot.looping = False
 
-        for buf in self._buffers_front.values():
-            buf.clear()
-        for buf in self._buffers_back.values():
-            buf.clear()
+        self.clear_colors()
         self._has_active_animation = False
 
     def stop_target(self, target: str) -> None:
@@ -152,12 +351,7 @@ class AnimationEngine:
         slot.queue.clear()
         slot.looping = False
 
-        front = self._buffers_front.get(target)
-        if front is not None:
-            front.clear()
-        back = self._buffers_back.get(target)
-        if back is not None:
-            back.clear()
+        self._clear_target(target)
 
         self._has_active_animation = any(existing.animation is not None for existing in self._targets.values())
 
@@ -168,15 +362,14 @@ class AnimationEngine:
     def update(self) -> bool:
         """Update animation state. Call this once per render cycle (~100ms).
 
-        Returns True if any animation produced new frame data (banner needs refresh).
+        Returns True if any target's visible frame changed (banner needs refresh).
+        The changed cells are available from ``get_dirty_regions()``.
         """
         current_time_ms = time.time() * 1000
-        changed = False
         any_active = False
+        self._dirty = {}
 
         for target_name, slot in self._targets.items():
-            back_buffer = self._buffers_back[target_name]
-
             if slot.animation:
                 any_active = True
                 elapsed_ms = current_time_ms - slot.last_update_ms
@@ -191,27 +384,15 @@ class AnimationEngine:
                             frame=slot.frame_count,
                         )
                         slot.animation = None
-                        back_buffer.clear()
+                        self._clear_target(target_name)
                         continue
 
-                    # Clear inner dicts (reuse z-level dict allocations)
-                    for layer in back_buffer.values():
-                        layer.clear()
-                    if isinstance(result, RenderBuffer):
-                        # Multi-layer update
-                        for z, pixels in result.layers.items():
-                            if z not in back_buffer:
-                                back_buffer[z] = {}
-                            back_buffer[z].update(pixels)
-                    else:
-                        # Legacy single-layer update (default to billboard level)
-                        if Z50 not in back_buffer:
-                            back_buffer[Z50] = {}
-                        back_buffer[Z50].update(result)
+                    # Legacy single-layer updates default to billboard level
+                    layers = result.layers if isinstance(result, RenderBuffer) else {Z50: result}
+                    self._present(target_name, layers)
 
                     slot.frame_count += 1
                     slot.last_update_ms = current_time_ms
-                    changed = True
 
                     if slot.animation.is_complete(slot.frame_count):
                         if slot.looping:
@@ -226,14 +407,48 @@ class AnimationEngine:
                                 self.on_animation_start(target_name, next_animation)
                         else:
                             slot.animation = None
-                            back_buffer.clear()
+                            self._clear_target(target_name)
             else:
-                back_buffer.clear()
+                self._clear_target(target_name)
 
-        # Swap buffers atomically
-        self._buffers_front, self._buffers_back = self._buffers_back, self._buffers_front
         self._has_active_animation = any_active
-        return changed
+        return bool(self._dirty)
+
+    def _present(self, target: str, layers: _FrameLayers) -> None:
+        """Load a frame into the back buffer, diff it against the front, and swap."""
+        front = self._buffers_front[target]
+        back = self._buffers_back[target]
+        palette = front.palette if len(front.palette.values) < _PALETTE_LIMIT else _Palette()
+        back.load(layers, palette)
+        rect = back.diff_rect(front)
+        self._buffers_front[target], self._buffers_back[target] = back, front
+        if rect is not None:
+            self._mark_dirty(target, rect)
+
+    def _clear_target(self, target: str) -> None:
+        """Blank a target's frame, recording the cleared area as dirty."""
+        front = self._buffers_front.get(target)
+        if front is None:
+            return
+        rect = front.full_rect()
+        front.clear()
+        self._buffers_back[target].clear()
+        if rect is not None:
+            self._mark_dirty(target, rect)
+
+    def _mark_dirty(self, target: str, rect: DirtyRect) -> None:
+        existing = self._dirty.get(target)
+        if existing is not None:
+            x0 = min(existing[0], rect[0])
+            y0 = min(existing[1], rect[1])
+            x1 = max(existing[0] + existing[2], rect[0] + rect[2])
+            y1 = max(existing[1] + existing[3], rect[1] + rect[3])
+            rect = (x0, y0, x1 - x0, y1 - y0)
+        self._dirty[target] = rect
+
+    def get_dirty_regions(self) -> dict[str, DirtyRect]:
+        """Per-target (x, y, width, height) of cells changed by the last ``update()``."""
+        return dict(self._dirty)
 
     def get_color(self, x: int, y: int, target: str = "banner") -> str | None:
         """Get the composited Rich color string for a specific pixel.
@@ -242,28 +457,17 @@ class AnimationEngine:
         if not self._is_enabled:
             return None
 
-        z_buffer = self._buffers_front.get(target)
-        if not z_buffer:
+        grid = self._buffers_front.get(target)
+        if grid is None or grid.is_empty:
             return None
-
-        # Compositor: Traverse layers from front-most (10) to back-most (0)
-        for z in sorted(z_buffer.keys(), reverse=True):
-            layer = z_buffer[z]
-            color = layer.get((x, y))
-            # Only return strings that look like colors (Hex or color(N))
-            # Skip single-character entity markers (Stars/Clouds)
-            if isinstance(color, str) and len(color) > 1:
-                return color
-            # If -1 or missing, continue to lower layer
-
-        return None
+        return grid.color_at(x, y)
 
     def get_layer_color(self, z: int, x: int, y: int, target: str = "banner") -> str | int | None:
         """Get the raw color value for a specific Z-layer."""
-        z_buffer = self._buffers_front.get(target)
-        if z_buffer and z in z_buffer:
-            return z_buffer[z].get((x, y))
-        return None
+        grid = self._buffers_front.get(target)
+        if grid is None:
+            return None
+        return grid.value_at(z, x, y)
 
     def get_entity_z_levels(self, target: str = "header") -> list[int]:
         """Return populated Z levels for entity scanning, highest first.
@@ -272,10 +476,10 @@ class AnimationEngine:
         """
         from teleclaude.cli.tui.animations.base import Z0
 
-        z_buffer = self._buffers_front.get(target)
-        if not z_buffer:
+        grid = self._buffers_front.get(target)
+        if grid is None:
             return []
-        return sorted((z for z in z_buffer if z != Z0), reverse=True)
+        return [z for z in grid.z_levels if z != Z0]
 
     def clear_colors(self) -> None:
         """Clear all active animation colors (both buffers)."""
@@ -6,6 +6,7 @@ import asyncio
 
 from instrukt_ai_logging import get_logger
 from textual import work
+from textual.geometry import Region
 
 from teleclaude.cli.models import ChiptunesStatusInfo
 from teleclaude.cli.tui.widgets.banner import Banner
@@ -14,6 +15,9 @@ from teleclaude.cli.tui.widgets.telec_footer import TelecFooter
 
 logger = get_logger(__name__)
 
+# The header sky scene spans the banner rows and continues into the tab bar below it.
+_TAB_BAR_HEADER_ROW = 7
+
 
 class TelecAppMediaMixin:
     """Animation engine, TTS, and ChipTunes management."""
@@ -338,11 +342,33 @@ class TelecAppMediaMixin:
             return
         if changed:
             try:
-                self.query_one(Banner).refresh()  # type: ignore[attr-defined]
-                self.query_one(BoxTabBar).refresh()  # type: ignore[attr-defined]
+                self._refresh_animated_widgets(self._animation_engine.get_dirty_regions())  # type: ignore[attr-defined]
             except Exception:
                 logger.exception("Header refresh failed after animation tick")
 
+    def _refresh_animated_widgets(self, dirty: dict[str, tuple[int, int, int, int]]) -> None:
+        """Repaint only the widget cells covered by the engine's dirty rectangles."""
+        banner = self.query_one(Banner)  # type: ignore[attr-defined]
+        tab_bar = self.query_one(BoxTabBar)  # type: ignore[attr-defined]
+        header = Region(*dirty["header"]) if "header" in dirty else None
+
+        # Banner/logo overlays are drawn at plate offsets, so repaint the whole banner.
+        if "banner" in dirty or "logo" in dirty:
+            banner.refresh()
+        elif header is not None:
+            region = header.intersection(Region(0, 0, banner.size.width, banner.size.height))
+            if region.area:
+                banner.refresh(region)
+
+        if "banner" in dirty and self._animation_engine.is_external_light():  # type: ignore[attr-defined]
+            tab_bar.refresh()
+        elif header is not None:
+            # The transition row samples the sky one row above, so extend one row down.
+            region = Region(header.x, header.y - _TAB_BAR_HEADER_ROW, header.width, header.height + 1)
+            region = region.intersection(Region(0, 0, tab_bar.size.width, tab_bar.size.height))
+            if region.area:
+                tab_bar.refresh(region)
+
     def _cycle_animation(self, new_mode: str) -> None:
         """Set animation mode, reconfigure engine, and update status bar."""
         self._animation_requested_mode = new_mode  # type: ignore[attr-defined]
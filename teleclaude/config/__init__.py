@@ -17,6 +17,7 @@ from teleclaude.constants import (
     DIRECTORY_CHECK_INTERVAL,
     HELP_DESK_SUBDIR,
     OUTPUT_CADENCE_S,
+    OUTPUT_PIPE_PANE_EVENTS,
     REDIS_MAX_CONNECTIONS,
     REDIS_MESSAGE_STREAM_MAXLEN,
     REDIS_OUTPUT_STREAM_MAXLEN,
@@ -66,6 +67,7 @@ class DatabaseConfig:
 class PollingConfig:
     directory_check_interval: int
     output_cadence_s: float = 1.0
+    pipe_pane_events: bool = OUTPUT_PIPE_PANE_EVENTS
 
 
 @dataclass
@@ -797,6 +799,7 @@ def _build_config(raw: dict[str, object]) -> Config:  # guard: loose-dict - YAML
         polling=PollingConfig(
             directory_check_interval=DIRECTORY_CHECK_INTERVAL,
             output_cadence_s=OUTPUT_CADENCE_S,
+            pipe_pane_events=OUTPUT_PIPE_PANE_EVENTS,
         ),
         redis=RedisConfig(
             enabled=bool(redis_raw["enabled"]),  # type: ignore[index,misc]
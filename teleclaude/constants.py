@@ -29,6 +29,7 @@ MCP_SOCKET_PATH = "/tmp/teleclaude.sock"
 DATABASE_FILENAME = "teleclaude.db"
 DIRECTORY_CHECK_INTERVAL = 5  # Seconds between directory change checks
 OUTPUT_CADENCE_S = 1.0
+OUTPUT_PIPE_PANE_EVENTS = True  # Wake output pollers from tmux pipe-pane instead of fixed-interval capture
 HELP_DESK_SUBDIR = ".teleclaude/help-desk"
 WHATSAPP_API_VERSION = "v21.0"
 UI_MESSAGE_MAX_CHARS = 3900  # Char budget for content selection (format + fit)
@@ -4,7 +4,6 @@ Provides instant reads for API endpoints and emits change events when data updat
 """
 
 import hashlib
-import json
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -14,6 +13,7 @@ from instrukt_ai_logging import get_logger
 
 from teleclaude.constants import CACHE_KEY_SEPARATOR, LOCAL_COMPUTER
 from teleclaude.core.models import ComputerInfo, ProjectInfo, SessionSnapshot, TodoInfo
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -473,7 +473,7 @@ class DaemonCache:
         return hashlib.sha256(joined.encode("utf-8")).hexdigest()
 
     def _computer_fingerprint(self, computer: ComputerInfo) -> str:
-        payload = json.dumps(computer.to_dict(), sort_keys=True, default=str)
+        payload = json_codec.dumps(computer.to_dict(), sort_keys=True, default=str)
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def _todos_fingerprint(self, todos_by_project: dict[str, list[TodoInfo]]) -> str:
@@ -10,18 +10,29 @@ from pathlib import Path
 
 from instrukt_ai_logging import get_logger
 
+from teleclaude.core.agents import AgentName
+from teleclaude.core.transcript_paths import lookup_transcript, record_transcript_paths
+from teleclaude.utils.transcript_discovery import TranscriptCandidate
+
 logger = get_logger(__name__)
 
 
-def discover_codex_transcript_path(native_session_id: str) -> str | None:
+def discover_codex_transcript_path(native_session_id: str, *, db_path: str | None = None) -> str | None:
     """Resolve Codex transcript path for a native session id.
 
     Codex stores transcripts in:
     ~/.codex/sessions/YYYY/MM/DD/rollout-*-{native_session_id}.jsonl
+
+    The transcript path index answers first; the directory scan only runs on
+    an index miss, and what it finds is added to the index.
     """
     if not native_session_id:
         return None
 
+    indexed = lookup_transcript(native_session_id, [AgentName.CODEX], db_path=db_path)
+    if indexed is not None:
+        return str(indexed.path)
+
     sessions_dir = Path.home() / ".codex" / "sessions"
     if not sessions_dir.exists():
         logger.debug(
@@ -43,7 +54,7 @@ def discover_codex_transcript_path(native_session_id: str) -> str | None:
                     native_session_id=native_session_id,
                     path=str(transcript_file),
                 )
-                return str(transcript_file)
+                return _remember(transcript_file, db_path)
         except (ValueError, OSError) as exc:
             logger.debug(
                 "Codex transcript date scan error",
@@ -58,7 +69,16 @@ def discover_codex_transcript_path(native_session_id: str) -> str | None:
             native_session_id=native_session_id,
             path=str(transcript_file),
         )
-        return str(transcript_file)
+        return _remember(transcript_file, db_path)
 
     logger.warning("Codex transcript not found", native_session_id=native_session_id)
     return None
+
+
+def _remember(transcript_file: Path, db_path: str | None) -> str:
+    try:
+        mtime = transcript_file.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    record_transcript_paths([TranscriptCandidate(transcript_file, AgentName.CODEX, mtime)], db_path=db_path)
+    return str(transcript_file)
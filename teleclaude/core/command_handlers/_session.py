@@ -525,7 +525,7 @@ async def get_session_data(
             session_id,
             session.native_session_id,
         )
-        discovered_path = discover_codex_transcript_path(session.native_session_id)
+        discovered_path = await asyncio.to_thread(discover_codex_transcript_path, session.native_session_id)
         if discovered_path:
             native_log_file_str = discovered_path
             logger.info(
@@ -15,6 +15,7 @@ from ._operations import DbOperationsMixin
 from ._rows import HookOutboxRow, InboundQueueRow, OperationRow
 from ._sessions import DbSessionsMixin
 from ._settings import DbSettingsMixin
+from ._summaries import DbSummaryCacheMixin
 from ._sync import (
     get_session_field_sync,
     get_session_id_by_field_sync,
@@ -34,6 +35,7 @@ class Db(
     DbInboundMixin,
     DbHooksMixin,
     DbSettingsMixin,
+    DbSummaryCacheMixin,
     DbSessionsMixin,
     DbBase,
 ):
@@ -1,5 +1,6 @@
 """Database base class: lifecycle, static helpers, and shared infrastructure."""
 
+import copy
 import dataclasses
 import json
 import os
@@ -18,6 +19,8 @@ from teleclaude.constants import DB_IN_MEMORY
 from .. import db_models
 from ..dates import ensure_utc, parse_iso_datetime
 from ..models import Session, SessionAdapterMetadata, SessionMetadata
+from ._group_commit import GroupCommitter
+from ._hooks import HOOK_OUTBOX_GROUP_COMMIT_MAX, _HookDelivery, _HookInsert
 
 if TYPE_CHECKING:
     from teleclaude.core.adapter_client import AdapterClient
@@ -27,9 +30,25 @@ logger = get_logger(__name__)
 _SM_FIELDS = {"system_role", "job", "human_email", "human_role", "principal"}
 
 
+def _clone_dataclass_tree(value: object) -> object:
+    """Copy a dataclass and every nested dataclass attribute (scalars are shared)."""
+    clone = copy.copy(value)
+    attrs = clone.__dict__
+    for name, attr in attrs.items():
+        if dataclasses.is_dataclass(attr) and not isinstance(attr, type):
+            attrs[name] = _clone_dataclass_tree(attr)
+    return clone
+
+
 class DbBase:
     """Database base class: init, lifecycle, and shared helpers."""
 
+    if TYPE_CHECKING:
+
+        async def _insert_hook_events(self, items: list[_HookInsert]) -> list[int]: ...
+
+        async def _mark_hook_events_delivered(self, items: list[_HookDelivery]) -> list[None]: ...
+
     @staticmethod
     def _serialize_adapter_metadata(
         value: SessionAdapterMetadata
@@ -128,6 +147,15 @@ class DbBase:
             visibility=row.visibility if hasattr(row, "visibility") else "private",
         )
 
+    @staticmethod
+    def _clone_session(session: Session) -> Session:
+        """Copy a cached session deep enough for callers to mutate it freely."""
+        clone = copy.copy(session)
+        clone.adapter_metadata = _clone_dataclass_tree(session.adapter_metadata)  # type: ignore[assignment]
+        if session.session_metadata is not None:
+            clone.session_metadata = copy.copy(session.session_metadata)
+        return clone
+
     def __init__(self, db_path: str) -> None:
         """Initialize database.
 
@@ -139,6 +167,17 @@ class DbBase:
         self._sessionmaker: object | None = None
         self.conn: aiosqlite.Connection | None = None
         self._temp_db_path: str | None = None
+        # Identity map behind get_session; see DbSessionsMixin for coherence rules.
+        self._session_cache: dict[str, Session] = {}
+        self._session_versions: dict[str, int] = {}
+        # Hook outbox writes are group-committed; the flush callables live on
+        # DbHooksMixin and are looked up per batch.
+        self._hook_insert_committer: GroupCommitter[_HookInsert, int] = GroupCommitter(
+            lambda items: self._insert_hook_events(items), HOOK_OUTBOX_GROUP_COMMIT_MAX
+        )
+        self._hook_delivery_committer: GroupCommitter[_HookDelivery, None] = GroupCommitter(
+            lambda items: self._mark_hook_events_delivered(items), HOOK_OUTBOX_GROUP_COMMIT_MAX
+        )
 
     async def initialize(self) -> None:
         """Initialize database, create tables, and run migrations."""
@@ -204,6 +243,7 @@ class DbBase:
             cursor.close()
 
         await self._normalize_adapter_metadata()
+        self._session_cache.clear()
 
     async def _normalize_adapter_metadata(self) -> None:
         """Normalize adapter_metadata types (e.g., topic_id stored as string)."""
@@ -270,6 +310,7 @@ class DbBase:
 
     async def close(self) -> None:
         """Close database connection."""
+        self._session_cache.clear()
         if self._engine:
             await self._engine.dispose()
         if self.conn:
@@ -0,0 +1,75 @@
+"""Group commit: coalesce concurrent writes into one transaction.
+
+Callers ``submit`` an item and await its result. The first submitter starts a
+drain task; everything submitted while a transaction is in flight is written
+by the next one, so a burst of N concurrent writers costs a handful of SQLite
+commits instead of N.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class GroupCommitter(Generic[T, R]):
+    """Batch concurrent submissions through a single async flush callable.
+
+    ``flush`` receives the batch in submission order and must return one result
+    per item, in the same order. If it raises, or returns the wrong number of
+    results, every submitter in that batch sees an exception.
+    """
+
+    def __init__(self, flush: Callable[[list[T]], Awaitable[Sequence[R]]], max_batch: int = 256) -> None:
+        self._flush = flush
+        self._max_batch = max(1, max_batch)
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._drain_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A drain task from another (closed) loop can never finish; start over.
+            self._loop = loop
+            self._pending = []
+            self._drain_task = None
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch = self._pending[: self._max_batch]
+            del self._pending[: self._max_batch]
+            try:
+                results = await self._flush([item for item, _ in batch])
+            except asyncio.CancelledError:
+                for _, future in (*batch, *self._pending):
+                    future.cancel()
+                self._pending = []
+                raise
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            if len(results) != len(batch):
+                mismatch = RuntimeError(f"group commit flush returned {len(results)} results for {len(batch)} items")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(mismatch)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
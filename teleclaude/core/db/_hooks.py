@@ -1,6 +1,9 @@
 """Mixin: DbHooksMixin."""
 
+import asyncio
 import json
+import os
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -15,6 +18,14 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+HOOK_OUTBOX_GROUP_COMMIT_MAX: int = int(os.getenv("HOOK_OUTBOX_GROUP_COMMIT_MAX", "256"))
+HOOK_OUTBOX_PRUNE_CHUNK: int = int(os.getenv("HOOK_OUTBOX_PRUNE_CHUNK", "2000"))
+
+# (session_id, event_type, payload_json, created_at, next_attempt_at)
+_HookInsert = tuple[str, str, str, str, str]
+# (row_id, error, delivered_at)
+_HookDelivery = tuple[int, str | None, str]
+
 
 class DbHooksMixin:
     async def get_agent_availability(self, agent: str) -> dict[str, bool | str | None] | None:
@@ -185,25 +196,48 @@ class DbHooksMixin:
         session_id: str,
         event_type: str,
         payload: dict[str, object],  # guard: loose-dict - Hook payload is dynamic JSON
+        *,
+        created_at: str | None = None,
     ) -> int:
-        """Persist a hook event in the outbox for durable delivery."""
+        """Persist a hook event in the outbox for durable delivery.
+
+        Concurrent calls are group-committed into one transaction. ``created_at``
+        lets callers record when the hook fired (for end-to-end latency);
+        it defaults to now.
+        """
         now = datetime.now(UTC).isoformat()
-        payload_json = json.dumps(payload)
+        item = (session_id, event_type, json.dumps(payload), created_at or now, now)
+        return await self._hook_insert_committer.submit(item)
+
+    async def _insert_hook_events(self, items: list[_HookInsert]) -> list[int]:
         async with self._session() as db_session:
-            row = db_models.HookOutbox(
-                session_id=session_id,
-                event_type=event_type,
-                payload=payload_json,
-                created_at=now,
-                next_attempt_at=now,
-                attempt_count=0,
-            )
-            db_session.add(row)
+            rows = [
+                db_models.HookOutbox(
+                    session_id=session_id,
+                    event_type=event_type,
+                    payload=payload_json,
+                    created_at=created_at,
+                    next_attempt_at=next_attempt_at,
+                    attempt_count=0,
+                )
+                for session_id, event_type, payload_json, created_at, next_attempt_at in items
+            ]
+            db_session.add_all(rows)
+            await db_session.flush()
+            row_ids = [row.id for row in rows]
             await db_session.commit()
-            await db_session.refresh(row)
-            if row.id is None:
-                raise RuntimeError("Failed to insert hook outbox row")
-            return int(row.id)
+        if any(row_id is None for row_id in row_ids):
+            raise RuntimeError("Failed to insert hook outbox row")
+        return [int(row_id) for row_id in row_ids if row_id is not None]
+
+    async def get_hook_outbox_high_water(self) -> int:
+        """Return the largest hook outbox row id (0 when empty); a cheap change probe."""
+        from sqlalchemy import func
+        from sqlmodel import select
+
+        async with self._session() as db_session:
+            result = await db_session.exec(select(func.max(db_models.HookOutbox.id)))
+            return int(result.one() or 0)
 
     async def fetch_hook_outbox_batch(
         self,
@@ -299,19 +333,115 @@ class DbHooksMixin:
             result = await db_session.exec(stmt_check)
             return {int(row_id) for row_id in result.all()}
 
+    async def claim_due_hook_outbox_batch(
+        self,
+        now_iso: str,
+        limit: int,
+        lock_cutoff_iso: str,
+        exclude_session_ids: Collection[str] = (),
+    ) -> list[HookOutboxRow]:
+        """Select and lock up to ``limit`` due rows in a single write transaction.
+
+        ``now_iso`` doubles as the claim token: rows locked by this call are read
+        back by ``locked_at == now_iso`` before the transaction commits.
+        Rows for ``exclude_session_ids`` (sessions with paused claims) are left alone.
+        """
+        from sqlalchemy import or_, update
+        from sqlmodel import col, select
+
+        outbox = db_models.HookOutbox
+        due = (
+            select(outbox.id)
+            .where(outbox.delivered_at.is_(None))
+            .where(outbox.next_attempt_at <= now_iso)
+            .where(or_(outbox.locked_at.is_(None), outbox.locked_at <= lock_cutoff_iso))
+            .order_by(outbox.created_at, outbox.id)
+            .limit(limit)
+        )
+        if exclude_session_ids:
+            due = due.where(col(outbox.session_id).not_in(list(exclude_session_ids)))
+        claim = update(outbox).where(col(outbox.id).in_(due.scalar_subquery())).values(locked_at=now_iso)
+        async with self._session() as db_session:
+            await db_session.exec(claim)
+            result = await db_session.exec(
+                select(outbox).where(outbox.locked_at == now_iso).order_by(outbox.created_at, outbox.id)
+            )
+            rows = result.all()
+            claimed = [
+                HookOutboxRow(
+                    id=row.id or 0,
+                    session_id=row.session_id,
+                    event_type=row.event_type,
+                    payload=row.payload,
+                    created_at=row.created_at,
+                    attempt_count=row.attempt_count,
+                )
+                for row in rows
+            ]
+            await db_session.commit()
+        return claimed
+
     async def mark_hook_outbox_delivered(self, row_id: int, error: str | None = None) -> None:
-        """Mark a hook outbox row delivered (optionally capturing last error)."""
+        """Mark a hook outbox row delivered (optionally capturing last error).
+
+        Concurrent calls are group-committed into one transaction.
+        """
+        await self._hook_delivery_committer.submit((row_id, error, datetime.now(UTC).isoformat()))
+
+    async def _mark_hook_events_delivered(self, items: list[_HookDelivery]) -> list[None]:
         from sqlalchemy import update
+        from sqlmodel import col
 
-        now = datetime.now(UTC).isoformat()
-        stmt = (
-            update(db_models.HookOutbox)
-            .where(db_models.HookOutbox.id == row_id)
-            .values(delivered_at=now, last_error=error, locked_at=None)
-        )
+        outbox = db_models.HookOutbox
+        clean = [row_id for row_id, error, _ in items if error is None]
+        delivered_at = max(at for _, _, at in items)
         async with self._session() as db_session:
-            await db_session.exec(stmt)
+            if clean:
+                await db_session.exec(
+                    update(outbox)
+                    .where(col(outbox.id).in_(clean))
+                    .values(delivered_at=delivered_at, last_error=None, locked_at=None)
+                )
+            for row_id, error, at in items:
+                if error is not None:
+                    await db_session.exec(
+                        update(outbox)
+                        .where(outbox.id == row_id)
+                        .values(delivered_at=at, last_error=error, locked_at=None)
+                    )
             await db_session.commit()
+        return [None] * len(items)
+
+    async def prune_delivered_hook_outbox(self, older_than_iso: str, chunk_size: int = HOOK_OUTBOX_PRUNE_CHUNK) -> int:
+        """Delete delivered rows older than the threshold in bounded chunks.
+
+        Each chunk is its own short transaction so hook inserts are never blocked
+        behind one long delete. Returns the number of rows deleted.
+        """
+        from sqlalchemy import delete
+        from sqlmodel import col, select
+
+        outbox = db_models.HookOutbox
+        expired = (
+            select(outbox.id)
+            .where(outbox.delivered_at.is_not(None))
+            .where(outbox.delivered_at < older_than_iso)
+            .limit(chunk_size)
+        )
+        stmt = delete(outbox).where(col(outbox.id).in_(expired.scalar_subquery()))
+        total = 0
+        while True:
+            async with self._session() as db_session:
+                result = await db_session.exec(stmt)
+                await db_session.commit()
+                deleted = result.rowcount or 0
+            total += deleted
+            if deleted < chunk_size:
+                break
+            await asyncio.sleep(0)
+        if total:
+            logger.info("Pruned %d delivered hook outbox rows", total)
+        return total
 
     async def mark_hook_outbox_failed(
         self,
@@ -119,6 +119,7 @@ class DbSessionsMixin:
         async with self._session() as db_session:
             db_session.add(db_row)
             await db_session.commit()
+        self.invalidate_session_cache(session_id)
 
         if emit_session_started:
             event_bus.emit(
@@ -190,23 +191,69 @@ class DbSessionsMixin:
         async with self._session() as db_session:
             db_session.add(db_row)
             await db_session.commit()
+        self.invalidate_session_cache(session_id)
 
         return session
 
     async def get_session(self, session_id: str) -> Session | None:
         """Get session by ID.
 
+        Served from the in-memory identity map when possible; each caller
+        gets its own copy, so mutating the result never leaks into the cache.
+
         Args:
             session_id: Session ID
 
         Returns:
             Session object or None if not found
         """
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            return self._clone_session(cached)
+
+        version = self._session_versions.get(session_id, 0)
         async with self._session() as db_session:
             row = await db_session.get(db_models.Session, session_id)
             if not row:
                 return None
-            return self._to_core_session(row)
+            session = self._to_core_session(row)
+        self._remember_session(session, version)
+        return self._clone_session(session)
+
+    def get_session_version(self, session_id: str) -> int:
+        """Return a counter that changes whenever the cached view of a session does."""
+        return self._session_versions.get(session_id, 0)
+
+    def invalidate_session_cache(self, session_id: str | None = None) -> None:
+        """Drop cached sessions after writes that bypass ``update_session``.
+
+        The hook receiver writes session rows from its own process; it calls
+        this through the daemon API so the next ``get_session`` re-reads.
+        Passing no ``session_id`` drops every entry.
+        """
+        session_ids = [session_id] if session_id is not None else list(self._session_versions)
+        for sid in session_ids:
+            self._session_versions[sid] = self._session_versions.get(sid, 0) + 1
+        if session_id is None:
+            self._session_cache.clear()
+        else:
+            self._session_cache.pop(session_id, None)
+
+    def _remember_session(self, session: Session, version: int) -> None:
+        """Cache a session read at ``version`` unless a write landed in the meantime."""
+        if self._session_versions.get(session.session_id, 0) == version:
+            self._session_cache[session.session_id] = session
+
+    def _write_through_session(self, session: Session, version: int, *, changed: bool) -> None:
+        """Refresh the cache from a row ``update_session`` just loaded (and maybe wrote)."""
+        if not changed:
+            self._remember_session(session, version)
+        elif self._session_versions.get(session.session_id, 0) == version:
+            self._session_versions[session.session_id] = version + 1
+            self._session_cache[session.session_id] = session
+        else:
+            # Another write interleaved with ours; this row may predate it.
+            self.invalidate_session_cache(session.session_id)
 
     async def get_session_field(self, session_id: str, field: str) -> object | None:
         """Get a single field from a session by ID.
@@ -319,6 +366,7 @@ class DbSessionsMixin:
         updates: dict[str, object] = {}  # guard: loose-dict - Dynamic update payload
 
         if fields:
+            version = self._session_versions.get(session_id, 0)
             async with self._session() as db_session:
                 row = await db_session.get(db_models.Session, session_id)
                 if not row:
@@ -392,6 +440,11 @@ class DbSessionsMixin:
                     db_session.add(row)
                     await db_session.commit()
 
+                # Write through: the row is fresh from this transaction, so it also
+                # picks up columns changed by other processes since the last read.
+                refreshed = self._to_core_session(row)
+            self._write_through_session(refreshed, version, changed=bool(updates))
+
         # Digest updates are internal dedupe state for output routing and can occur
         # very frequently. Emitting SESSION_UPDATED for digest-only writes creates
         # unnecessary event fan-out and cache churn.
@@ -423,6 +476,8 @@ class DbSessionsMixin:
             closed_at=datetime.now(UTC),
             lifecycle_status="closed",
         )
+        # Closed sessions are rarely read again; keep the identity map to live ones.
+        self._session_cache.pop(session_id, None)
         event_bus.emit(
             TeleClaudeEvents.SESSION_CLOSED,
             SessionLifecycleContext(session_id=session_id),
@@ -545,6 +600,7 @@ class DbSessionsMixin:
                 db_models.Session.__table__.delete().where(db_models.Session.session_id == session_id)
             )  # type: ignore[arg-type]
             await db_session.commit()
+        self.invalidate_session_cache(session_id)
         logger.debug("Deleted session %s from database", session_id)
 
         if session:
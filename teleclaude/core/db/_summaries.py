@@ -0,0 +1,63 @@
+"""Mixin: DbSummaryCacheMixin."""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from instrukt_ai_logging import get_logger
+
+from .. import db_models
+
+if TYPE_CHECKING:
+    pass
+
+logger = get_logger(__name__)
+
+
+class DbSummaryCacheMixin:
+    async def get_cached_summary(self, kind: str, digest: str) -> str | None:
+        """Return a cached summarizer result, or None on a miss.
+
+        Args:
+            kind: Result kind ("summary" or "title")
+            digest: Digest of the normalized summarizer input
+        """
+        async with self._session() as db_session:
+            row = await db_session.get(db_models.SummaryCacheEntry, (kind, digest))
+            return row.value if row else None
+
+    async def store_cached_summary(self, kind: str, digest: str, value: str) -> None:
+        """Store a summarizer result (upsert).
+
+        Args:
+            kind: Result kind ("summary" or "title")
+            digest: Digest of the normalized summarizer input
+            value: Summary or title text
+        """
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        now = datetime.now(UTC).isoformat()
+        stmt = sqlite_insert(db_models.SummaryCacheEntry).values(kind=kind, digest=digest, value=value, created_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["kind", "digest"],
+            set_={"value": stmt.excluded.value, "created_at": now},
+        )
+        async with self._session() as db_session:
+            await db_session.exec(stmt)
+            await db_session.commit()
+
+    async def prune_summary_cache(self, cutoff_iso: str) -> int:
+        """Delete cached summarizer results stored before cutoff_iso.
+
+        Returns:
+            Number of records deleted
+        """
+        from sqlalchemy import delete
+
+        stmt = delete(db_models.SummaryCacheEntry).where(db_models.SummaryCacheEntry.created_at < cutoff_iso)
+        async with self._session() as db_session:
+            result = await db_session.exec(stmt)
+            await db_session.commit()
+            deleted = result.rowcount or 0
+        if deleted > 0:
+            logger.info("Pruned %d cached summaries", deleted)
+        return deleted
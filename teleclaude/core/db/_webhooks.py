@@ -1,5 +1,6 @@
 """Mixin: DbWebhooksMixin."""
 
+from collections.abc import Collection, Mapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -122,6 +123,81 @@ class DbWebhooksMixin:
             await db_session.commit()
             return (result.rowcount or 0) == 1
 
+    async def claim_webhook_batch(
+        self,
+        limit: int,
+        now_iso: str,
+        *,
+        per_target: int | None = None,
+        target_room: Mapping[str, int] | None = None,
+        exclude_targets: Collection[str] = (),
+        locked_before: str | None = None,
+    ) -> list[db_models.WebhookOutbox]:
+        """Claim up to ``limit`` due webhook rows in one atomic UPDATE ... RETURNING.
+
+        Oldest rows first. ``per_target`` caps the rows claimed per target URL,
+        ``target_room`` overrides that cap for targets that already have rows
+        in flight, and ``exclude_targets`` skips targets entirely, so one
+        backed-up subscriber cannot fill the batch. Rows locked before
+        ``locked_before`` are treated as abandoned by a dead worker and claimed
+        again.
+        """
+        from sqlalchemy import case, func, or_, select, update
+
+        outbox = db_models.WebhookOutbox
+        claimable = outbox.locked_at.is_(None)
+        if locked_before is not None:
+            claimable = or_(claimable, outbox.locked_at < locked_before)
+        due = select(
+            outbox.id,
+            outbox.created_at,
+            outbox.target_url,
+            func.row_number()
+            .over(partition_by=outbox.target_url, order_by=(outbox.created_at, outbox.id))
+            .label("target_rank"),
+        ).where(
+            outbox.status == "pending",
+            outbox.next_attempt_at <= now_iso,
+            claimable,
+        )
+        if exclude_targets:
+            due = due.where(outbox.target_url.not_in(list(exclude_targets)))
+        ranked = due.subquery()
+        picked = select(ranked.c.id).order_by(ranked.c.created_at, ranked.c.id).limit(limit)
+        if target_room:
+            cap = case(target_room, value=ranked.c.target_url, else_=per_target)
+            picked = picked.where(or_(cap.is_(None), ranked.c.target_rank <= cap))
+        elif per_target is not None:
+            picked = picked.where(ranked.c.target_rank <= per_target)
+        stmt = (
+            update(outbox)
+            .where(outbox.id.in_(picked), claimable)
+            .values(locked_at=now_iso)
+            .returning(outbox)
+            .execution_options(synchronize_session=False)
+        )
+        async with self._session() as db_session:
+            result = await db_session.exec(stmt)
+            rows = list(result.scalars().all())
+            await db_session.commit()
+        rows.sort(key=lambda row: (row.created_at or "", row.id or 0))
+        return rows
+
+    async def release_webhook_claims(self, row_ids: Collection[int]) -> None:
+        """Unlock claimed rows that were never delivered so they can be claimed again."""
+        from sqlalchemy import update
+
+        if not row_ids:
+            return
+        stmt = (
+            update(db_models.WebhookOutbox)
+            .where(db_models.WebhookOutbox.id.in_(list(row_ids)), db_models.WebhookOutbox.status == "pending")
+            .values(locked_at=None)
+        )
+        async with self._session() as db_session:
+            await db_session.exec(stmt)
+            await db_session.commit()
+
     async def mark_webhook_delivered(self, row_id: int) -> None:
         """Mark a webhook delivery as successful."""
         from sqlalchemy import update
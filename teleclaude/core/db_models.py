@@ -330,3 +330,15 @@ class SessionToken(SQLModel, table=True):
     issued_at: str
     expires_at: str
     revoked_at: str | None = None
+
+
+class SummaryCacheEntry(SQLModel, table=True):
+    """summary_cache table — summarizer results keyed by input digest."""
+
+    __tablename__ = "summary_cache"
+    __table_args__ = {"extend_existing": True}
+
+    kind: str = Field(primary_key=True)  # "summary" or "title"
+    digest: str = Field(primary_key=True)
+    value: str
+    created_at: str
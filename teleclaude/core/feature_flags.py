@@ -5,6 +5,7 @@ from __future__ import annotations
 from teleclaude.config import config
 
 THREADED_OUTPUT_EXPERIMENT = "threaded_output"
+IMPACT_BUILD_GATES_EXPERIMENT = "impact_build_gates"
 
 
 def _normalize_agent(agent_key: str | None) -> str | None:
@@ -24,3 +25,8 @@ def is_threaded_output_enabled(agent_key: str | None, adapter: str | None = None
     """
     normalized_agent = _normalize_agent(agent_key)
     return config.is_experiment_enabled(THREADED_OUTPUT_EXPERIMENT, normalized_agent, adapter=adapter)
+
+
+def is_impact_build_gates_enabled() -> bool:
+    """Return True when build gates may run only the tests affected by a change."""
+    return config.is_experiment_enabled(IMPACT_BUILD_GATES_EXPERIMENT)
@@ -0,0 +1,52 @@
+"""Add per-transcript parse offsets for incremental mirror generation."""
+
+from __future__ import annotations
+
+import aiosqlite
+
+
+async def up(db: aiosqlite.Connection) -> None:
+    """Create mirror offset storage and limit FTS rewrites to indexed columns."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS mirror_offsets (
+            source_identity TEXT PRIMARY KEY,
+            transcript_path TEXT NOT NULL,
+            byte_offset INTEGER NOT NULL DEFAULT 0,
+            file_inode INTEGER NOT NULL DEFAULT 0,
+            entry_count INTEGER NOT NULL DEFAULT 0,
+            fingerprint TEXT NOT NULL DEFAULT '',
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    # Bookkeeping updates (updated_at, message_count) must not rewrite the FTS row.
+    await db.execute("DROP TRIGGER IF EXISTS mirrors_au")
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS mirrors_au AFTER UPDATE OF title, conversation_text ON mirrors BEGIN
+            INSERT INTO mirrors_fts(mirrors_fts, rowid, title, conversation_text)
+            VALUES ('delete', old.id, old.title, old.conversation_text);
+            INSERT INTO mirrors_fts(rowid, title, conversation_text)
+            VALUES (new.id, new.title, new.conversation_text);
+        END
+        """
+    )
+    await db.commit()
+
+
+async def down(db: aiosqlite.Connection) -> None:
+    """Drop mirror offsets and restore the unconditional FTS update trigger."""
+    await db.execute("DROP TRIGGER IF EXISTS mirrors_au")
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS mirrors_au AFTER UPDATE ON mirrors BEGIN
+            INSERT INTO mirrors_fts(mirrors_fts, rowid, title, conversation_text)
+            VALUES ('delete', old.id, old.title, old.conversation_text);
+            INSERT INTO mirrors_fts(rowid, title, conversation_text)
+            VALUES (new.id, new.title, new.conversation_text);
+        END
+        """
+    )
+    await db.execute("DROP TABLE IF EXISTS mirror_offsets")
+    await db.commit()
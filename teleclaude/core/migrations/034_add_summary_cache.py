@@ -0,0 +1,29 @@
+"""Add the digest-keyed summary and title cache."""
+
+from __future__ import annotations
+
+import aiosqlite
+
+
+async def up(db: aiosqlite.Connection) -> None:
+    """Create summary_cache keyed by kind and normalized-input digest."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS summary_cache (
+            kind TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            value TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (kind, digest)
+        )
+        """
+    )
+    await db.execute("CREATE INDEX IF NOT EXISTS idx_summary_cache_created ON summary_cache(created_at)")
+    await db.commit()
+
+
+async def down(db: aiosqlite.Connection) -> None:
+    """Drop the summary cache."""
+    await db.execute("DROP INDEX IF EXISTS idx_summary_cache_created")
+    await db.execute("DROP TABLE IF EXISTS summary_cache")
+    await db.commit()
@@ -0,0 +1,31 @@
+"""Add the native session id to transcript path index."""
+
+from __future__ import annotations
+
+import aiosqlite
+
+
+async def up(db: aiosqlite.Connection) -> None:
+    """Create transcript_paths keyed by path and indexed by native session id."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS transcript_paths (
+            transcript_path TEXT PRIMARY KEY,
+            agent TEXT NOT NULL,
+            native_session_id TEXT NOT NULL,
+            file_mtime REAL NOT NULL DEFAULT 0,
+            indexed_at TEXT NOT NULL
+        )
+        """
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_transcript_paths_session ON transcript_paths(native_session_id, file_mtime)"
+    )
+    await db.commit()
+
+
+async def down(db: aiosqlite.Connection) -> None:
+    """Drop the transcript path index."""
+    await db.execute("DROP INDEX IF EXISTS idx_transcript_paths_session")
+    await db.execute("DROP TABLE IF EXISTS transcript_paths")
+    await db.commit()
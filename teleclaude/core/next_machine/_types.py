@@ -100,6 +100,8 @@ FINDING_ID_PATTERN = re.compile(r"\bR\d+-F\d+\b")
 NEXT_WORK_PHASE_LOG = "NEXT_WORK_PHASE"
 _PREP_STATE_VERSION = 1
 _WORKTREE_PREP_STATE_REL = ".teleclaude/worktree-prep-state.json"
+_BUILD_GATE_STATE_VERSION = 1
+_BUILD_GATE_STATE_REL = ".teleclaude/build-gate-state.json"
 _PREP_INPUT_FILES = (
     "Makefile",
     "package.json",
@@ -138,6 +140,21 @@ class EnsureWorktreeResult:
     prep_reason: str
 
 
+class GateMode(str, Enum):
+    CACHED = "cached"
+    IMPACT = "impact"
+    FULL = "full"
+
+
+@dataclass(frozen=True)
+class GateSelection:
+    mode: GateMode
+    reason: str
+    head_commit: str = ""
+    base_commit: str = ""
+    test_files: tuple[str, ...] = ()
+
+
 @dataclass
 class RoadmapEntry:
     slug: str
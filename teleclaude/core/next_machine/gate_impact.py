@@ -0,0 +1,274 @@
+"""Test-impact selection for build gates.
+
+A passing full test gate records the worktree HEAD. With the
+``impact_build_gates`` experiment enabled, the next gate diffs the worktree
+against that commit: with nothing test-relevant changed the previous verdict
+stands, otherwise the changed Python modules are mapped through the import
+graph to the test modules that depend on them. Changes the graph cannot see
+(build config, fixtures, non-Python sources, scripts outside a package) fall
+back to the full suite. Without the experiment every gate runs the full suite.
+
+No imports from core.py (circular-import guard).
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import subprocess
+import threading
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+
+from teleclaude.constants import WORKTREE_DIR
+from teleclaude.core.next_machine._types import (
+    _BUILD_GATE_STATE_REL,
+    _BUILD_GATE_STATE_VERSION,
+    GateMode,
+    GateSelection,
+)
+from teleclaude.utils.git_query import git_query
+
+# Planning state, orchestrator files and prose never change a test outcome.
+_IGNORED_PREFIXES = ("todos/", ".teleclaude/", "docs/")
+_IGNORED_SUFFIXES = (".md",)
+_TEST_ROOT = "tests"
+_SKIPPED_DIRS = frozenset({WORKTREE_DIR, "node_modules", "__pycache__"})
+# String literals such as patch("pkg.mod.func") count as a dependency on pkg.mod.
+_DOTTED_NAME = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+")
+
+_parse_cache: dict[str, tuple[tuple[int, int], frozenset[str]]] = {}
+_parse_cache_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Green-gate record
+# ---------------------------------------------------------------------------
+
+
+def _gate_state_path(worktree_cwd: str) -> Path:
+    return Path(worktree_cwd) / _BUILD_GATE_STATE_REL
+
+
+def read_green_commit(worktree_cwd: str) -> str:
+    """Return the commit of the last passing test gate, or "" when unknown."""
+    state_path = _gate_state_path(worktree_cwd)
+    if not state_path.exists():
+        return ""
+    try:
+        raw = json.loads(state_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return ""
+    if not isinstance(raw, dict) or raw.get("version") != _BUILD_GATE_STATE_VERSION:
+        return ""
+    commit = raw.get("green_commit")
+    return commit if isinstance(commit, str) else ""
+
+
+def record_green_gate(worktree_cwd: str, head_commit: str) -> bool:
+    """Record a passing full test gate for HEAD when the worktree matches HEAD.
+
+    Uncommitted test-relevant changes were part of what passed but are not
+    part of the commit, so the verdict is only recorded for a clean tree.
+    Impacted-test runs must not call this: a subset passing says nothing about
+    the tests it skipped.
+    """
+    if not head_commit:
+        return False
+    dirty = _changed_files(worktree_cwd, head_commit)
+    if dirty is None or any(not _is_ignored(path) for path in dirty):
+        return False
+    state_path = _gate_state_path(worktree_cwd)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": _BUILD_GATE_STATE_VERSION,
+        "green_commit": head_commit,
+        "passed_at": datetime.now(UTC).isoformat(),
+    }
+    state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def select_gate_tests(worktree_cwd: str, *, impact: bool) -> GateSelection:
+    """Decide whether the test gate can reuse a verdict, run impacted tests, or must run in full."""
+    try:
+        head = git_query(worktree_cwd).rev_parse("HEAD")
+    except (subprocess.SubprocessError, OSError):
+        head = ""
+    if not head:
+        return GateSelection(GateMode.FULL, "HEAD unavailable")
+    if not impact:
+        return GateSelection(GateMode.FULL, "impact selection disabled", head_commit=head)
+    base = read_green_commit(worktree_cwd)
+    if not base:
+        return GateSelection(GateMode.FULL, "no previous green gate", head_commit=head)
+
+    changed = _changed_files(worktree_cwd, base)
+    if changed is None:
+        return GateSelection(GateMode.FULL, f"unable to diff against {base[:12]}", head_commit=head)
+    relevant = sorted(path for path in changed if not _is_ignored(path))
+    if not relevant:
+        return GateSelection(
+            GateMode.CACHED,
+            f"no test-relevant changes since green gate at {base[:12]}",
+            head_commit=head,
+            base_commit=base,
+        )
+    root = Path(worktree_cwd)
+    for path in relevant:
+        trigger = _full_run_trigger(root, path)
+        if trigger:
+            return GateSelection(GateMode.FULL, trigger, head_commit=head, base_commit=base)
+
+    tests = select_impacted_tests(root, relevant)
+    return GateSelection(
+        GateMode.IMPACT,
+        f"{len(relevant)} changed file(s) since green gate at {base[:12]}",
+        head_commit=head,
+        base_commit=base,
+        test_files=tuple(tests),
+    )
+
+
+def _changed_files(worktree_cwd: str, base: str) -> list[str] | None:
+    """Tracked changes between base and the working tree, plus untracked files."""
+    query = git_query(worktree_cwd)
+    try:
+        diff = query.run(["diff", "--name-only", "--no-renames", base])
+        untracked = query.run(["ls-files", "--others", "--exclude-standard"])
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if diff.returncode != 0 or untracked.returncode != 0:
+        return None
+    paths = {line.strip() for line in (*diff.stdout.splitlines(), *untracked.stdout.splitlines())}
+    return sorted(path for path in paths if path)
+
+
+def _is_ignored(path: str) -> bool:
+    return path.startswith(_IGNORED_PREFIXES) or path.endswith(_IGNORED_SUFFIXES)
+
+
+def _full_run_trigger(root: Path, path: str) -> str:
+    """Return why a changed path needs the full suite, or "" when the graph covers it."""
+    if not path.endswith(".py"):
+        return f"non-Python change: {path}"
+    if Path(path).name == "conftest.py":
+        return f"test fixture change: {path}"
+    top = path.split("/", 1)[0]
+    if top != _TEST_ROOT and (path == top or not (root / top / "__init__.py").exists()):
+        return f"change outside a package: {path}"
+    return ""
+
+
+# ---------------------------------------------------------------------------
+# Import graph
+# ---------------------------------------------------------------------------
+
+
+def select_impacted_tests(root: Path, changed: list[str]) -> list[str]:
+    """Return test files that import a changed module, directly or transitively."""
+    modules = {_module_name(path): path for path in _python_files(root)}
+    changed_modules = {_module_name(path) for path in changed}
+    known = modules.keys() | changed_modules
+
+    dependents: dict[str, set[str]] = {}
+    for module, path in modules.items():
+        for imported in _imports(root / path, module):
+            for target in _resolve(imported, known):
+                if target != module:
+                    dependents.setdefault(target, set()).add(module)
+
+    seen = set(changed_modules)
+    queue = deque(changed_modules)
+    while queue:
+        for dependent in dependents.get(queue.popleft(), ()):
+            if dependent not in seen:
+                seen.add(dependent)
+                queue.append(dependent)
+
+    return sorted(
+        path
+        for module, path in modules.items()
+        if module in seen and path.startswith(f"{_TEST_ROOT}/") and Path(path).name.startswith("test_")
+    )
+
+
+def _python_files(root: Path) -> list[str]:
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".") and name not in _SKIPPED_DIRS]
+        rel_dir = Path(dirpath).relative_to(root)
+        files.extend((rel_dir / name).as_posix() for name in filenames if name.endswith(".py"))
+    return files
+
+
+def _module_name(path: str) -> str:
+    parts = path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _resolve(name: str, known: set[str]) -> list[str]:
+    """Known modules executed by importing ``name``: the module and its parent packages."""
+    parts = name.split(".")
+    return [prefix for i in range(1, len(parts) + 1) if (prefix := ".".join(parts[:i])) in known]
+
+
+def _imports(path: Path, module: str) -> frozenset[str]:
+    """Dotted names a file imports or references, cached by file stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return frozenset()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_key = str(path)
+    with _parse_cache_lock:
+        cached = _parse_cache.get(cache_key)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError, OSError):
+        names: frozenset[str] = frozenset()
+    else:
+        names = frozenset(_collect_imports(tree, module, is_package=path.name == "__init__.py"))
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = (key, names)
+    return names
+
+
+def _collect_imports(tree: ast.AST, module: str, *, is_package: bool) -> set[str]:
+    package = module if is_package else module.rpartition(".")[0]
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                anchor = package.split(".") if package else []
+                anchor = anchor[: len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                base = ".".join([*anchor, *([node.module] if node.module else [])])
+            else:
+                base = node.module or ""
+            if not base:
+                continue
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and _DOTTED_NAME.fullmatch(node.value):
+            names.add(node.value)
+    return names
+
+
+def clear_gate_impact_cache() -> None:
+    """Forget parsed import lists (tests)."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
@@ -9,16 +9,16 @@ import asyncio
 import os
 import subprocess
 from pathlib import Path
-from typing import cast
 
 from git import Repo
-from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+from git.exc import InvalidGitRepositoryError
 from instrukt_ai_logging import get_logger
 
 from teleclaude.constants import WORKTREE_DIR
 from teleclaude.core.db import Db
 from teleclaude.core.next_machine._types import _WORKTREE_PREP_STATE_REL
 from teleclaude.core.next_machine.state_io import read_text_sync, write_text_sync
+from teleclaude.utils.git_query import git_query
 
 logger = get_logger(__name__)
 
@@ -127,15 +127,14 @@ def get_stash_entries(cwd: str) -> list[str]:
     intentionally evaluated at repo scope.
     """
     try:
-        repo = Repo(cwd)
-        raw = cast(str, repo.git.stash("list"))
-        return [line.strip() for line in raw.splitlines() if line.strip()]
-    except (InvalidGitRepositoryError, NoSuchPathError):
-        logger.warning("Invalid git repository path for stash lookup: %s", cwd)
-        return []
-    except GitCommandError as exc:
+        entries = git_query(cwd).stash_entries()
+    except (subprocess.SubprocessError, OSError) as exc:
         logger.warning("Unable to read git stash list at %s: %s", cwd, exc)
         return []
+    if entries is None:
+        logger.warning("Unable to read git stash list at %s", cwd)
+        return []
+    return entries
 
 
 def has_git_stash_entries(cwd: str) -> bool:
@@ -19,7 +19,7 @@ from teleclaude.core.next_machine._types import (
     RoadmapDict,
     RoadmapEntry,
 )
-from teleclaude.core.next_machine.state_io import read_phase_state, read_text_sync, write_text_sync
+from teleclaude.core.next_machine.state_io import read_phase_state_snapshot, read_text_sync, write_text_sync
 
 
 def _roadmap_path(cwd: str) -> Path:
@@ -188,7 +188,7 @@ def check_dependencies_satisfied(cwd: str, slug: str, deps: dict[str, list[str]]
             # Not in roadmap - treat as satisfied (completed and cleaned up)
             continue
 
-        dep_state = read_phase_state(cwd, dep)
+        dep_state = read_phase_state_snapshot(cwd, dep)
         dep_phase = dep_state.get("phase")
         if dep_phase == ItemPhase.DONE.value:
             continue
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import subprocess
+from collections.abc import Mapping
 from pathlib import Path
 
 from teleclaude.core.next_machine._types import DOR_READY_THRESHOLD, ItemPhase, PhaseName, PhaseStatus
@@ -18,7 +19,14 @@ from teleclaude.core.next_machine.roadmap import (
     load_roadmap_slugs,
     slug_in_roadmap,
 )
-from teleclaude.core.next_machine.state_io import read_breakdown_state, read_phase_state, write_phase_state
+from teleclaude.core.next_machine.state_io import (
+    PhaseStateSnapshot,
+    read_breakdown_state,
+    read_many,
+    read_phase_state,
+    read_phase_state_snapshot,
+    write_phase_state,
+)
 
 
 def _find_next_prepare_slug(cwd: str) -> str | None:
@@ -167,19 +175,21 @@ def resolve_slug(
     if not entries:
         return None, False, ""
 
+    states = read_many(cwd, (entry.slug for entry in entries))
     for entry in entries:
         found_slug = entry.slug
-        phase = get_item_phase(cwd, found_slug)
+        state = states[found_slug]
+        phase = _item_phase(state)
 
         if ready_only:
-            if not is_ready_for_work(cwd, found_slug):
+            if not _is_ready_for_work(state):
                 continue
         else:
             # Skip done items for next_prepare
             if phase == ItemPhase.DONE.value:
                 continue
 
-        is_ready = phase == ItemPhase.IN_PROGRESS.value or is_ready_for_work(cwd, found_slug)
+        is_ready = phase == ItemPhase.IN_PROGRESS.value or _is_ready_for_work(state)
 
         # R6: Enforce dependency gating when ready_only=True and dependencies provided
         if ready_only and dependencies is not None:
@@ -246,14 +256,20 @@ def get_item_phase(cwd: str, slug: str) -> str:
     Returns:
         One of "pending", "in_progress", "done"
     """
-    state = read_phase_state(cwd, slug)
+    return _item_phase(read_phase_state_snapshot(cwd, slug))
+
+
+def _item_phase(state: PhaseStateSnapshot) -> str:
     phase = state.get("phase")
     return phase if isinstance(phase, str) else ItemPhase.PENDING.value
 
 
 def is_ready_for_work(cwd: str, slug: str) -> bool:
     """Check if item is ready for work: pending phase + DOR score >= threshold."""
-    state = read_phase_state(cwd, slug)
+    return _is_ready_for_work(read_phase_state_snapshot(cwd, slug))
+
+
+def _is_ready_for_work(state: PhaseStateSnapshot) -> bool:
     phase = state.get("phase")
     if phase != ItemPhase.PENDING.value:
         return False
@@ -261,7 +277,7 @@ def is_ready_for_work(cwd: str, slug: str) -> bool:
     if build != PhaseStatus.PENDING.value:
         return False
     dor = state.get("dor")
-    if not isinstance(dor, dict):
+    if not isinstance(dor, Mapping):
         return False
     score = dor.get("score")
     return isinstance(score, int) and score >= DOR_READY_THRESHOLD
@@ -9,9 +9,13 @@ from __future__ import annotations
 
 import copy
 import hashlib
+import os
 import subprocess
+import threading
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 from instrukt_ai_logging import get_logger
@@ -29,6 +33,7 @@ from teleclaude.core.next_machine._types import (
     PreparePhase,
     StateValue,
 )
+from teleclaude.utils.git_query import git_query
 
 logger = get_logger(__name__)
 
@@ -63,30 +68,23 @@ def _file_sha256(path: Path) -> str:
 
 def _get_head_commit(cwd: str) -> str:
     """Return HEAD commit hash for cwd, or empty string when unavailable."""
-    try:
-        result = subprocess.run(
-            ["git", "-C", cwd, "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (subprocess.CalledProcessError, OSError):
-        return ""
-    return result.stdout.strip()
+    return _get_ref_commit(cwd, "HEAD")
 
 
 def _get_ref_commit(cwd: str, ref: str) -> str:
     """Return commit hash for a git ref in cwd, or empty string when unavailable."""
     try:
-        result = subprocess.run(
-            ["git", "-C", cwd, "rev-parse", ref],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (subprocess.CalledProcessError, OSError):
+        return git_query(cwd).rev_parse(ref)
+    except (subprocess.SubprocessError, OSError):
         return ""
-    return result.stdout.strip()
+
+
+def _get_ref_commits(cwd: str, refs: list[str]) -> list[str]:
+    """Resolve several refs in cwd with one git call; empty strings when unavailable."""
+    try:
+        return git_query(cwd).rev_parse_many(refs)
+    except (subprocess.SubprocessError, OSError):
+        return [""] * len(refs)
 
 
 def _get_remote_branch_head(cwd: str, branch: str) -> str:
@@ -207,25 +205,46 @@ def _get_finalize_state(state: dict[str, StateValue]) -> FinalizeState:
     return _normalize_finalize_state(state.get("finalize"))
 
 
-def read_phase_state(cwd: str, slug: str) -> dict[str, StateValue]:
-    """Read state.yaml from worktree (falls back to state.json for backward compat).
+PhaseStateSnapshot = Mapping[str, object]
+"""Read-only phase state: nested dicts are mappings and lists are tuples."""
 
-    Returns default state if file doesn't exist.
-    Migrates missing 'phase' field from existing build/dor state.
-    Performs deep-merge for nested dict keys so v2 sub-key defaults are always present.
-    """
+# Parsed state per file, keyed by (mtime_ns, size, inode). The merged dict is
+# never handed out; callers get a deep copy or the frozen snapshot.
+_StateKey = tuple[int, int, int]
+_state_cache: dict[Path, tuple[_StateKey, dict[str, StateValue], PhaseStateSnapshot]] = {}
+_state_cache_lock = threading.Lock()
+
+
+def _freeze(value: object) -> object:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_DEFAULT_SNAPSHOT: PhaseStateSnapshot = _freeze(DEFAULT_STATE)  # type: ignore[assignment]
+
+
+def _stat_key(path: Path) -> _StateKey | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _resolve_state_file(cwd: str, slug: str) -> tuple[Path, _StateKey] | None:
     state_path = get_state_path(cwd, slug)
-    # Backward compat: try state.json if state.yaml doesn't exist
-    if not state_path.exists():
-        legacy_path = state_path.with_name("state.json")
-        if legacy_path.exists():
-            state_path = legacy_path
+    key = _stat_key(state_path)
+    if key is None:
+        # Backward compat: try state.json if state.yaml doesn't exist
+        state_path = state_path.with_name("state.json")
+        key = _stat_key(state_path)
+    return (state_path, key) if key is not None else None
 
-    if not state_path.exists():
-        return copy.deepcopy(DEFAULT_STATE)
 
-    content = read_text_sync(state_path)
-    raw_state = yaml.safe_load(content)
+def _merge_persisted_state(cwd: str, slug: str, raw_state: object) -> dict[str, StateValue]:
     if raw_state is None:
         state: dict[str, StateValue] = {}
     elif isinstance(raw_state, dict):
@@ -251,13 +270,73 @@ def read_phase_state(cwd: str, slug: str) -> dict[str, StateValue]:
     return merged
 
 
+def _load_phase_state(cwd: str, slug: str) -> tuple[dict[str, StateValue], PhaseStateSnapshot] | None:
+    """Cached (merged, snapshot) pair for a slug, or None when no state file exists."""
+    resolved = _resolve_state_file(cwd, slug)
+    if resolved is None:
+        return None
+    state_path, key = resolved
+    with _state_cache_lock:
+        cached = _state_cache.get(state_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    merged = _merge_persisted_state(cwd, slug, yaml.safe_load(read_text_sync(state_path)))
+    snapshot: PhaseStateSnapshot = _freeze(merged)  # type: ignore[assignment]
+    with _state_cache_lock:
+        _state_cache[state_path] = (key, merged, snapshot)
+    return merged, snapshot
+
+
+def read_phase_state(cwd: str, slug: str) -> dict[str, StateValue]:
+    """Read state.yaml from worktree (falls back to state.json for backward compat).
+
+    Returns default state if file doesn't exist.
+    Migrates missing 'phase' field from existing build/dor state.
+    Performs deep-merge for nested dict keys so v2 sub-key defaults are always present.
+    The result is a private copy the caller may mutate and pass to ``write_phase_state``.
+    """
+    loaded = _load_phase_state(cwd, slug)
+    if loaded is None:
+        return copy.deepcopy(DEFAULT_STATE)
+    return copy.deepcopy(loaded[0])
+
+
+def read_phase_state_snapshot(cwd: str, slug: str) -> PhaseStateSnapshot:
+    """Read-only view of ``read_phase_state`` that is shared rather than copied.
+
+    Use this for checks that only inspect state; unchanged files are served
+    from the process-wide cache without parsing.
+    """
+    loaded = _load_phase_state(cwd, slug)
+    return _DEFAULT_SNAPSHOT if loaded is None else loaded[1]
+
+
+def read_many(cwd: str, slugs: Iterable[str]) -> dict[str, PhaseStateSnapshot]:
+    """Snapshots for many slugs at once, for roadmap-wide scans."""
+    return {slug: read_phase_state_snapshot(cwd, slug) for slug in slugs}
+
+
+def clear_phase_state_cache() -> None:
+    with _state_cache_lock:
+        _state_cache.clear()
+
+
 def write_phase_state(cwd: str, slug: str, state: dict[str, StateValue]) -> None:
-    """Write state.yaml."""
+    """Write state.yaml and update the state cache with what was written."""
     state_path = get_state_path(cwd, slug)
     state_path.parent.mkdir(parents=True, exist_ok=True)
     content = yaml.dump(state, default_flow_style=False, sort_keys=False)
     write_text_sync(state_path, content)
 
+    key = _stat_key(state_path)
+    if key is None:
+        return
+    merged = _merge_persisted_state(cwd, slug, copy.deepcopy(state))
+    snapshot: PhaseStateSnapshot = _freeze(merged)  # type: ignore[assignment]
+    with _state_cache_lock:
+        _state_cache[state_path] = (key, merged, snapshot)
+
 
 # ---------------------------------------------------------------------------
 # Mark operations
@@ -386,8 +465,8 @@ def mark_finalize_ready(cwd: str, slug: str, worker_session_id: str = "") -> dic
     if has_uncommitted_changes(cwd, slug):
         raise ValueError(f"worktree {WORKTREE_DIR}/{slug} has uncommitted changes")
 
-    worktree_head = _get_head_commit(worktree_cwd)
-    branch_head = _get_ref_commit(cwd, slug)
+    # The worktree shares refs with the main checkout, so one lookup covers both.
+    worktree_head, branch_head = _get_ref_commits(worktree_cwd, ["HEAD", f"refs/heads/{slug}"])
     if not worktree_head or not branch_head:
         raise ValueError(f"unable to resolve finalized branch head for {slug}")
     if worktree_head != branch_head:
@@ -451,7 +530,7 @@ def _mark_finalize_handed_off(
 
 def _review_scope_note(cwd: str, slug: str) -> str:
     """Build an iterative review scope note from state.yaml metadata."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     review_round_raw = state.get("review_round")
     max_rounds_raw = state.get("max_review_rounds")
     review_round = review_round_raw if isinstance(review_round_raw, int) else 0
@@ -460,7 +539,7 @@ def _review_scope_note(cwd: str, slug: str) -> str:
     baseline = state.get("review_baseline_commit")
     baseline_sha = baseline if isinstance(baseline, str) else ""
     unresolved = state.get("unresolved_findings")
-    unresolved_ids = unresolved if isinstance(unresolved, list) else []
+    unresolved_ids = unresolved if isinstance(unresolved, tuple) else ()
 
     unresolved_text = ", ".join(str(x) for x in unresolved_ids) if unresolved_ids else "none"
     baseline_text = baseline_sha if baseline_sha else "unset (initial full review)"
@@ -473,7 +552,7 @@ def _review_scope_note(cwd: str, slug: str) -> str:
 
 def _is_review_round_limit_reached(cwd: str, slug: str) -> tuple[bool, int, int]:
     """Return whether next review round would exceed configured max."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     review_round_raw = state.get("review_round")
     max_rounds_raw = state.get("max_review_rounds")
     review_round = review_round_raw if isinstance(review_round_raw, int) else 0
@@ -487,12 +566,12 @@ def read_breakdown_state(cwd: str, slug: str) -> dict[str, bool | list[str]] | N
     Returns:
         Breakdown state dict with 'assessed' and 'todos' keys, or None if not present.
     """
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     breakdown = state.get("breakdown")
-    if breakdown is None or not isinstance(breakdown, dict):
+    if breakdown is None or not isinstance(breakdown, Mapping):
         return None
-    # At this point breakdown is dict with bool/list values from json
-    return dict(breakdown)  # type: ignore
+    # At this point breakdown holds bool/list values from yaml
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in breakdown.items()}
 
 
 def write_breakdown_state(cwd: str, slug: str, assessed: bool, todos: list[str]) -> None:
@@ -516,21 +595,21 @@ def write_breakdown_state(cwd: str, slug: str, assessed: bool, todos: list[str])
 
 def is_build_complete(cwd: str, slug: str) -> bool:
     """Check if build phase is complete."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     build = state.get(PhaseName.BUILD.value)
     return isinstance(build, str) and build == PhaseStatus.COMPLETE.value
 
 
 def is_review_approved(cwd: str, slug: str) -> bool:
     """Check if review phase is approved."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     review = state.get(PhaseName.REVIEW.value)
     return isinstance(review, str) and review == PhaseStatus.APPROVED.value
 
 
 def is_review_changes_requested(cwd: str, slug: str) -> bool:
     """Check if review requested changes."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     review = state.get(PhaseName.REVIEW.value)
     return isinstance(review, str) and review == PhaseStatus.CHANGES_REQUESTED.value
 
@@ -544,13 +623,13 @@ def has_pending_deferrals(cwd: str, slug: str) -> bool:
     if not deferrals_path.exists():
         return False
 
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     return state.get("deferrals_processed") is not True
 
 
 def is_bug_todo(cwd: str, slug: str) -> bool:
     """Check if a todo is a bug (kind='bug' in state.yaml)."""
-    state = read_phase_state(cwd, slug)
+    state = read_phase_state_snapshot(cwd, slug)
     return state.get("kind") == "bug"
 
 
@@ -709,11 +788,13 @@ def _has_content(path: Path) -> bool:
 
 
 __all__ = [
+    "PhaseStateSnapshot",
     "_file_sha256",
     "_is_review_round_limit_reached",
     "_mark_finalize_handed_off",
     "_review_scope_note",
     "check_review_status",
+    "clear_phase_state_cache",
     "get_state_path",
     "has_pending_deferrals",
     "is_bug_todo",
@@ -726,7 +807,9 @@ __all__ = [
     "mark_prepare_verdict",
     "mark_ready",
     "read_breakdown_state",
+    "read_many",
     "read_phase_state",
+    "read_phase_state_snapshot",
     "read_text_sync",
     "write_breakdown_state",
     "write_phase_state",
@@ -16,11 +16,14 @@ from teleclaude.config import config
 from teleclaude.constants import DIRECTORY_CHECK_INTERVAL
 from teleclaude.core import tmux_bridge
 from teleclaude.core.db import db
+from teleclaude.core.pane_activity import PaneActivityStream, get_activity_fifo
 
 logger = get_logger(__name__)
 _CONFIG_FOR_TESTS = config
 IDLE_SUMMARY_INTERVAL_S = 60.0
 PROCESS_START_GRACE_S = 3.0
+# Liveness heartbeat when pipe-pane events drive the loop and nothing is pending.
+ACTIVITY_HEARTBEAT_S = 5.0
 _TERMINAL_SESSION_STATUSES = frozenset({"closing", "closed"})
 
 
@@ -289,6 +292,27 @@ class OutputPoller:
         ]
         return False, True, events
 
+    async def _wait_for_activity(
+        self,
+        activity_stream: PaneActivityStream,
+        *,
+        poll_interval: float,
+        last_capture_at: float,
+        has_pending: bool,
+    ) -> None:
+        """Sleep until the pane writes output, bounded by cadence and liveness heartbeat.
+
+        Pending output still needs cadence ticks to flush; otherwise the loop only
+        wakes for new bytes or the heartbeat. Captures stay rate-limited to one per
+        poll_interval, so the first change after idle is picked up immediately.
+        """
+        timeout = poll_interval if has_pending else ACTIVITY_HEARTBEAT_S
+        if not await activity_stream.wait_for_activity(timeout):
+            return
+        remaining = poll_interval - (time.monotonic() - last_capture_at)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
     async def poll(  # pylint: disable=too-many-locals  # Poll loop naturally has many state variables
         self,
         session_id: str,
@@ -300,7 +324,7 @@ class OutputPoller:
         Args:
             session_id: Session ID
             tmux_session_name: tmux session name
-            output_file: Reserved for future file-based polling; currently unused.
+            output_file: Session output file; its directory hosts the pipe-pane activity FIFO.
 
         Yields:
             OutputEvent subclasses (OutputChanged, ProcessExited, DirectoryChanged)
@@ -326,8 +350,15 @@ class OutputPoller:
         suppressed_idle_ticks = 0
         last_summary_time: float | None = None
         idle_summary_interval = IDLE_SUMMARY_INTERVAL_S
+        activity_stream: PaneActivityStream | None = None
+        last_capture_at = 0.0
 
         try:
+            if _CONFIG_FOR_TESTS.polling.pipe_pane_events:
+                activity_stream = PaneActivityStream(tmux_session_name, get_activity_fifo(output_file))
+                if not await activity_stream.start():
+                    activity_stream = None
+
             # Initial delay before first poll (1s to catch fast commands)
             await asyncio.sleep(1.0)
             started_at = time.time()
@@ -379,7 +410,12 @@ class OutputPoller:
 
                 session_existed_last_poll = session_exists_now
 
-                captured_output = await tmux_bridge.capture_pane(tmux_session_name)
+                # With pipe-pane events, skip the capture entirely when the pane wrote nothing.
+                if activity_stream is None or activity_stream.consume_activity() or poll_iteration == 1:
+                    captured_output = await tmux_bridge.capture_pane(tmux_session_name)
+                    last_capture_at = time.monotonic()
+                else:
+                    captured_output = previous_output
                 output_changed = captured_output != previous_output
                 current_cleaned = captured_output
 
@@ -450,7 +486,17 @@ class OutputPoller:
                 if directory_event is not None:
                     yield directory_event
 
-                await asyncio.sleep(poll_interval)
+                if activity_stream is None:
+                    await asyncio.sleep(poll_interval)
+                else:
+                    await self._wait_for_activity(
+                        activity_stream,
+                        poll_interval=poll_interval,
+                        last_capture_at=last_capture_at,
+                        has_pending=pending_output or pending_idle_flush,
+                    )
 
         finally:
+            if activity_stream is not None:
+                await activity_stream.stop()
             logger.debug("Polling ended for session %s", session_id)
@@ -0,0 +1,167 @@
+"""Event-driven pane activity signal built on tmux pipe-pane.
+
+tmux pipes raw pane output into a per-session FIFO. The daemon reads the FIFO
+non-blockingly from the event loop and only uses it as a wake-up signal: tmux
+itself remains the virtual screen, so the poller captures the rendered pane
+only after bytes arrived instead of on every tick. Idle panes produce no
+reads, no captures and no string comparisons.
+"""
+
+import asyncio
+import os
+import shlex
+import stat
+from pathlib import Path
+
+from instrukt_ai_logging import get_logger
+
+from teleclaude.core import tmux_bridge
+
+logger = get_logger(__name__)
+
+_READ_CHUNK = 65536
+
+
+def get_activity_fifo(output_file: Path) -> Path:
+    """Return the FIFO path used for pipe-pane activity next to the session output file."""
+    return output_file.with_name("tmux.fifo")
+
+
+class PaneActivityStream:
+    """Wakes a poller when a tmux pane writes output.
+
+    Usage:
+        stream = PaneActivityStream(tmux_session_name, fifo_path)
+        if await stream.start():
+            await stream.wait_for_activity(timeout=5.0)
+        await stream.stop()
+    """
+
+    def __init__(self, tmux_session_name: str, fifo_path: Path) -> None:
+        self._tmux_session_name = tmux_session_name
+        self._fifo_path = fifo_path
+        self._fd: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event = asyncio.Event()
+        self.bytes_received = 0
+
+    @property
+    def active(self) -> bool:
+        """True while the FIFO reader is registered with the event loop."""
+        return self._fd is not None
+
+    async def start(self) -> bool:
+        """Create the FIFO, register the reader and attach pipe-pane.
+
+        Returns:
+            True if activity events are flowing, False if the caller should poll.
+        """
+        owner = str(self._fifo_path)
+        state = await tmux_bridge.get_pane_pipe_state(self._tmux_session_name)
+        if state is None:
+            logger.info("Pane %s pipe state unqueryable, using interval capture", self._tmux_session_name)
+            return False
+        piped, piped_by = state
+        if piped:
+            # pipe-pane -o toggles an existing pipe off, and stopping it would cut off
+            # whoever owns it; leave other consumers' pipes alone and let the caller poll.
+            if piped_by != owner:
+                logger.info("Pane %s already piped elsewhere, using interval capture", self._tmux_session_name)
+                return False
+            # Our own pipe, left behind by a previous daemon: detach it and attach afresh.
+            logger.debug("Re-attaching stale pane activity pipe for %s", self._tmux_session_name)
+            await tmux_bridge.stop_pipe_pane(self._tmux_session_name)
+        try:
+            self._prepare_fifo()
+            # O_RDWR keeps a writer reference so the FIFO never reports EOF
+            # while pipe-pane is (re)attaching; reads stay non-blocking.
+            self._fd = os.open(self._fifo_path, os.O_RDWR | os.O_NONBLOCK)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self._fd, self._on_readable)
+        except (OSError, NotImplementedError, RuntimeError) as exc:
+            logger.warning("Pane activity FIFO unavailable for %s: %s", self._tmux_session_name, exc)
+            self._close_fd()
+            return False
+
+        command = f"cat > {shlex.quote(owner)}"
+        if not await tmux_bridge.start_pipe_pane(self._tmux_session_name, command, owner=owner):
+            logger.warning("pipe-pane failed for %s, falling back to interval capture", self._tmux_session_name)
+            self._close_fd()
+            return False
+        logger.debug("Pane activity stream attached for %s", self._tmux_session_name)
+        return True
+
+    async def stop(self) -> None:
+        """Detach pipe-pane and release the FIFO."""
+        if self._fd is None:
+            return
+        await tmux_bridge.stop_pipe_pane(self._tmux_session_name)
+        self._close_fd()
+
+    def consume_activity(self) -> bool:
+        """Return True if output arrived since the last call, clearing the signal."""
+        if not self._event.is_set():
+            return False
+        self._event.clear()
+        return True
+
+    async def wait_for_activity(self, timeout: float) -> bool:
+        """Wait until pane output arrives or the timeout expires.
+
+        The signal is left set so the next ``consume_activity`` call sees it.
+
+        Returns:
+            True if output arrived, False on timeout.
+        """
+        if self._event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _prepare_fifo(self) -> None:
+        path = self._fifo_path
+        if path.exists() or path.is_symlink():
+            if stat.S_ISFIFO(path.lstat().st_mode):
+                return
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.mkfifo(path, 0o600)
+
+    def _on_readable(self) -> None:
+        fd = self._fd
+        if fd is None:
+            return
+        received = 0
+        while True:
+            try:
+                chunk = os.read(fd, _READ_CHUNK)
+            except BlockingIOError:
+                break
+            except OSError as exc:
+                logger.warning("Pane activity FIFO read failed for %s: %s", self._tmux_session_name, exc)
+                break
+            if not chunk:
+                break
+            received += len(chunk)
+        if received:
+            self.bytes_received += received
+            self._event.set()
+
+    def _close_fd(self) -> None:
+        fd = self._fd
+        self._fd = None
+        if fd is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(fd)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        try:
+            self._fifo_path.unlink(missing_ok=True)
+        except OSError:
+            pass
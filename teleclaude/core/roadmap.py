@@ -2,10 +2,20 @@
 
 Centralizes the logic for reading roadmap.yaml, icebox, and todo directories
 into a single list of rich TodoInfo objects. Used by CLI, API, and TUI.
+
+Every file and directory listing read during assembly is parsed once per
+project and reused while its (mtime_ns, size) is unchanged. Projects watched
+by ``TodoWatcher`` additionally keep the assembled result in memory until the
+watcher reports a change under the project.
 """
 
+import os
 import re
+import threading
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
+from typing import Any, TypeVar
 
 import yaml
 from instrukt_ai_logging import get_logger
@@ -17,6 +27,145 @@ from teleclaude.core.next_machine.core import load_delivered, load_icebox, load_
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+_MISSING = object()
+
+# (name, is_dir, is_file) per directory entry, sorted by name.
+_DirListing = tuple[tuple[str, bool, bool], ...]
+_ResultKey = tuple[bool, bool, bool, bool]
+
+
+class RoadmapIndex:
+    """Parsed roadmap inputs of one project, reused across ``assemble_roadmap`` calls."""
+
+    def __init__(self, project_path: str) -> None:
+        self.project_path = project_path
+        # Held for a whole assembly; watcher invalidations wait for it.
+        self.lock = threading.Lock()
+        self._files: dict[Path, tuple[tuple[int, int], object]] = {}
+        self._results: dict[_ResultKey, list[TodoInfo]] = {}
+        # Set while TodoWatcher observes todos/ (and trees/ when watched_trees).
+        self.watched = False
+        self.watched_trees = False
+
+    def read(self, path: Path, parse: Callable[[Path], _T], default: _T) -> _T:
+        """Return ``parse(path)``, reparsing only when the file's stat key changed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._files.pop(path, None)
+            return default
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]  # type: ignore[return-value]
+        value = parse(path)
+        self._files[path] = (key, value)
+        return value
+
+    def list_dir(self, path: Path) -> _DirListing:
+        return self.read(path, _scan_dir, ())
+
+    def is_dir(self, path: Path) -> bool:
+        return any(name == path.name and is_dir for name, is_dir, _ in self.list_dir(path.parent))
+
+    def cached_result(self, key: _ResultKey, trees_dir: Path) -> list[TodoInfo] | None:
+        if not self.watched:
+            return None
+        if not self.watched_trees and trees_dir.is_dir():
+            # A worktree appeared where the watcher is not looking.
+            self._results.clear()
+            return None
+        cached = self._results.get(key)
+        return _copy_todos(cached) if cached is not None else None
+
+    def store_result(self, key: _ResultKey, todos: list[TodoInfo]) -> None:
+        if self.watched:
+            self._results[key] = _copy_todos(todos)
+
+    def invalidate(self, changed_path: str | None = None) -> None:
+        """Drop assembled results and the entries a filesystem change may affect."""
+        self._results.clear()
+        if changed_path is None:
+            self._files.clear()
+            return
+        path = Path(changed_path)
+        self._files.pop(path, None)
+        self._files.pop(path.parent, None)
+
+
+_indexes: dict[str, RoadmapIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _index_key(project_path: str) -> str:
+    return os.path.abspath(os.path.expanduser(project_path))
+
+
+def get_roadmap_index(project_path: str) -> RoadmapIndex:
+    """Return the shared index for a project, creating it on first use."""
+    key = _index_key(project_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = RoadmapIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def watch_roadmap_index(project_path: str, *, trees: bool) -> None:
+    """Mark a project as observed by TodoWatcher so assembled results can be kept."""
+    index = get_roadmap_index(project_path)
+    with index.lock:
+        index.watched = True
+        index.watched_trees = trees
+        index.invalidate()
+
+
+def unwatch_roadmap_index(project_path: str) -> None:
+    index = get_roadmap_index(project_path)
+    with index.lock:
+        index.watched = False
+        index.watched_trees = False
+        index.invalidate()
+
+
+def invalidate_roadmap_index(project_path: str, changed_path: str | None = None) -> None:
+    """Report a filesystem change under a project's todos/ or trees/ directory."""
+    index = get_roadmap_index(project_path)
+    with index.lock:
+        index.invalidate(changed_path)
+
+
+def clear_roadmap_index_cache() -> None:
+    with _indexes_lock:
+        _indexes.clear()
+
+
+def _copy_todos(todos: list[TodoInfo]) -> list[TodoInfo]:
+    return [replace(todo, files=list(todo.files), after=list(todo.after)) for todo in todos]
+
+
+def _scan_dir(path: Path) -> _DirListing:
+    try:
+        with os.scandir(path) as entries:
+            return tuple(sorted((entry.name, entry.is_dir(), entry.is_file()) for entry in entries))
+    except OSError:
+        return ()
+
+
+def _load_state_file(path: Path) -> Any:
+    return yaml.safe_load(path.read_text())
+
+
+def _read_state(index: RoadmapIndex, candidates: list[Path]) -> Any:
+    """Parsed content of the first existing state file, or ``_MISSING``."""
+    for path in candidates:
+        state = index.read(path, _load_state_file, _MISSING)
+        if state is not _MISSING:
+            return state
+    return _MISSING
+
 
 def _slugify_heading(value: str) -> str:
     """Normalize a todo title heading into a filesystem-style slug."""
@@ -24,22 +173,21 @@ def _slugify_heading(value: str) -> str:
 
 
 def _load_icebox_data(
+    index: RoadmapIndex,
     todos_root: Path,
     icebox_root: Path,
     icebox_path: Path,
 ) -> tuple[list[RoadmapEntry], set[str], set[str]]:
-    icebox_entries: list[RoadmapEntry] = []
-    icebox_slugs: set[str] = set()
-    icebox_groups: set[str] = set()
-    icebox_yaml_path = icebox_root / "icebox.yaml"
-    if icebox_yaml_path.exists():
-        icebox_entries = load_icebox(str(todos_root.parent))
+    icebox_entries = index.read(icebox_root / "icebox.yaml", lambda _path: load_icebox(str(todos_root.parent)), None)
+    if icebox_entries is not None:
         icebox_slugs = {entry.slug for entry in icebox_entries}
         icebox_groups = {entry.group for entry in icebox_entries if entry.group}
         return icebox_entries, icebox_slugs, icebox_groups
-    if not icebox_path.exists():
-        return icebox_entries, icebox_slugs, icebox_groups
+    return [], set(index.read(icebox_path, _parse_legacy_icebox, frozenset())), set()
+
 
+def _parse_legacy_icebox(icebox_path: Path) -> frozenset[str]:
+    icebox_slugs: set[str] = set()
     heading_pattern = re.compile(r"^\s*#+\s+(.*)\s*$")
     table_pattern = re.compile(r"\|\s*([a-z0-9-]+)\s*\|")
     try:
@@ -55,10 +203,11 @@ def _load_icebox_data(
                 icebox_slugs.add(table_match.group(1))
     except OSError:
         pass
-    return icebox_entries, icebox_slugs, icebox_groups
+    return frozenset(icebox_slugs)
 
 
 def _read_todo_metadata(
+    index: RoadmapIndex,
     project_path: str,
     todo_dir: Path,
 ) -> tuple[
@@ -75,8 +224,10 @@ def _read_todo_metadata(
     str | None,
     str | None,
 ]:
-    has_requirements = (todo_dir / "requirements.md").exists()
-    has_impl_plan = (todo_dir / "implementation-plan.md").exists()
+    entries = index.list_dir(todo_dir)
+    names = {name for name, _, _ in entries}
+    has_requirements = "requirements.md" in names
+    has_impl_plan = "implementation-plan.md" in names
     build_status = None
     review_status = None
     dor_score = None
@@ -90,15 +241,13 @@ def _read_todo_metadata(
     slug = todo_dir.name
     project_root = Path(project_path)
     worktree_state = project_root / WORKTREE_DIR / slug / "todos" / slug / "state.yaml"
-    state_path = worktree_state if worktree_state.exists() else todo_dir / "state.yaml"
-    if not state_path.exists():
-        legacy_path = todo_dir / "state.json"
-        if legacy_path.exists():
-            state_path = legacy_path
+    try:
+        state = _read_state(index, [worktree_state, todo_dir / "state.yaml", todo_dir / "state.json"])
+    except (yaml.YAMLError, OSError):
+        state = _MISSING
 
-    if state_path.exists():
+    if state is not _MISSING:
         try:
-            state = yaml.safe_load(state_path.read_text())
             build_status = state.get("build") if isinstance(state.get("build"), str) else "pending"
             review_status = state.get("review") if isinstance(state.get("review"), str) else "pending"
             dor = state.get("dor")
@@ -116,11 +265,7 @@ def _read_todo_metadata(
         except (yaml.YAMLError, OSError):
             pass
 
-    files = (
-        sorted(f.name for f in todo_dir.iterdir() if f.is_file() and not f.name.startswith("."))
-        if todo_dir.is_dir()
-        else []
-    )
+    files = [name for name, _, is_file in entries if is_file and not name.startswith(".")]
     return (
         has_requirements,
         has_impl_plan,
@@ -162,6 +307,7 @@ def _derive_phase_status(raw_phase: object, build_status: str | None, dor_score:
 
 def _append_todo(
     todos: list[TodoInfo],
+    index: RoadmapIndex,
     *,
     project_path: str,
     todos_root: Path,
@@ -172,7 +318,7 @@ def _append_todo(
     group: str | None = None,
     is_icebox_item: bool = False,
 ) -> None:
-    todo_dir = (icebox_root / slug) if is_icebox_item and (icebox_root / slug).is_dir() else todos_root / slug
+    todo_dir = (icebox_root / slug) if is_icebox_item and index.is_dir(icebox_root / slug) else todos_root / slug
     (
         has_requirements,
         has_impl_plan,
@@ -186,7 +332,7 @@ def _append_todo(
         prepare_phase,
         integration_phase,
         finalize_status,
-    ) = _read_todo_metadata(project_path, todo_dir)
+    ) = _read_todo_metadata(index, project_path, todo_dir)
     todos.append(
         TodoInfo(
             slug=slug,
@@ -199,8 +345,8 @@ def _append_todo(
             dor_score=dor_score,
             deferrals_status=deferrals_status,
             findings_count=findings_count,
-            files=files,
-            after=after or [],
+            files=list(files),
+            after=list(after or []),
             group=group,
             prepare_phase=prepare_phase,
             integration_phase=integration_phase,
@@ -209,10 +355,11 @@ def _append_todo(
     )
 
 
-def _infer_input_description(todo_dir: Path) -> str | None:
-    input_path = todo_dir / "input.md"
-    if not input_path.exists():
-        return None
+def _infer_input_description(index: RoadmapIndex, todo_dir: Path) -> str | None:
+    return index.read(todo_dir / "input.md", _parse_input_description, None)
+
+
+def _parse_input_description(input_path: Path) -> str | None:
     try:
         for line in input_path.read_text().splitlines():
             cleaned = line.strip()
@@ -227,13 +374,14 @@ def _infer_input_description(todo_dir: Path) -> str | None:
 def _load_active_roadmap_items(
     todos: list[TodoInfo],
     seen_slugs: set[str],
+    index: RoadmapIndex,
     *,
     project_path: str,
     todos_root: Path,
     icebox_root: Path,
     icebox_slugs: set[str],
 ) -> None:
-    for entry in load_roadmap(project_path):
+    for entry in index.read(todos_root / "roadmap.yaml", lambda _path: load_roadmap(project_path), []):
         if entry.slug in seen_slugs:
             logger.warning("Duplicate todo slug '%s' in roadmap.yaml, ignoring duplicate", entry.slug)
             continue
@@ -243,6 +391,7 @@ def _load_active_roadmap_items(
         seen_slugs.add(entry.slug)
         _append_todo(
             todos,
+            index,
             project_path=project_path,
             todos_root=todos_root,
             icebox_root=icebox_root,
@@ -256,6 +405,7 @@ def _load_active_roadmap_items(
 def _load_icebox_items(
     todos: list[TodoInfo],
     seen_slugs: set[str],
+    index: RoadmapIndex,
     *,
     project_path: str,
     todos_root: Path,
@@ -271,6 +421,7 @@ def _load_icebox_items(
         seen_slugs.add(entry.slug)
         _append_todo(
             todos,
+            index,
             project_path=project_path,
             todos_root=todos_root,
             icebox_root=icebox_root,
@@ -285,6 +436,7 @@ def _load_icebox_items(
 def _load_delivered_items(
     todos: list[TodoInfo],
     seen_slugs: set[str],
+    index: RoadmapIndex,
     *,
     project_path: str,
     todos_root: Path,
@@ -293,12 +445,13 @@ def _load_delivered_items(
 ) -> None:
     if not include_delivered:
         return
-    for entry in load_delivered(project_path):
+    for entry in index.read(todos_root / "delivered.yaml", lambda _path: load_delivered(project_path), []):
         if entry.slug in seen_slugs:
             continue
         seen_slugs.add(entry.slug)
         _append_todo(
             todos,
+            index,
             project_path=project_path,
             todos_root=todos_root,
             icebox_root=icebox_root,
@@ -312,6 +465,7 @@ def _load_delivered_items(
 def _append_orphan_todos(
     todos: list[TodoInfo],
     seen_slugs: set[str],
+    index: RoadmapIndex,
     *,
     project_path: str,
     todos_root: Path,
@@ -322,13 +476,9 @@ def _append_orphan_todos(
     icebox_only: bool,
     delivered_only: bool,
 ) -> None:
-    for todo_dir in sorted(todos_root.iterdir(), key=lambda p: p.name):
-        if (
-            not todo_dir.is_dir()
-            or todo_dir.name.startswith(".")
-            or todo_dir.name == "_icebox"
-            or todo_dir.name in seen_slugs
-        ):
+    for name, is_dir, _ in index.list_dir(todos_root):
+        todo_dir = todos_root / name
+        if not is_dir or todo_dir.name.startswith(".") or todo_dir.name == "_icebox" or todo_dir.name in seen_slugs:
             continue
         is_icebox = todo_dir.name in icebox_slugs or todo_dir.name in icebox_groups
         if (is_icebox and not include_icebox) or (icebox_only and not is_icebox) or delivered_only:
@@ -339,27 +489,24 @@ def _append_orphan_todos(
         )
         _append_todo(
             todos,
+            index,
             project_path=project_path,
             todos_root=todos_root,
             icebox_root=icebox_root,
             slug=todo_dir.name,
-            description=_infer_input_description(todo_dir),
+            description=_infer_input_description(index, todo_dir),
             group=orphan_group,
         )
 
 
-def _inject_breakdown_relationships(todos: list[TodoInfo], todos_root: Path) -> None:
+def _inject_breakdown_relationships(todos: list[TodoInfo], index: RoadmapIndex, todos_root: Path) -> None:
     slug_to_idx = {todo.slug: idx for idx, todo in enumerate(todos)}
     for todo in list(todos):
-        state_path = todos_root / todo.slug / "state.yaml"
-        if not state_path.exists():
-            legacy_path = todos_root / todo.slug / "state.json"
-            if legacy_path.exists():
-                state_path = legacy_path
-        if not state_path.exists():
-            continue
+        todo_dir = todos_root / todo.slug
         try:
-            state = yaml.safe_load(state_path.read_text())
+            state = _read_state(index, [todo_dir / "state.yaml", todo_dir / "state.json"])
+            if state is _MISSING:
+                continue
             child_slugs = state.get("breakdown", {}).get("todos", [])
             children_in_list = [child_slug for child_slug in child_slugs if child_slug in slug_to_idx]
             if not children_in_list:
@@ -407,22 +554,52 @@ def assemble_roadmap(
         include_delivered = True
 
     todos_root = Path(project_path) / "todos"
+    if not todos_root.exists():
+        return []
+
+    index = get_roadmap_index(project_path)
+    key = (include_icebox, icebox_only, include_delivered, delivered_only)
+    with index.lock:
+        cached = index.cached_result(key, Path(project_path) / WORKTREE_DIR)
+        if cached is not None:
+            return cached
+        todos = _assemble_roadmap(
+            index,
+            project_path,
+            todos_root,
+            include_icebox=include_icebox,
+            icebox_only=icebox_only,
+            include_delivered=include_delivered,
+            delivered_only=delivered_only,
+        )
+        index.store_result(key, todos)
+    return todos
+
+
+def _assemble_roadmap(
+    index: RoadmapIndex,
+    project_path: str,
+    todos_root: Path,
+    *,
+    include_icebox: bool,
+    icebox_only: bool,
+    include_delivered: bool,
+    delivered_only: bool,
+) -> list[TodoInfo]:
     icebox_root = todos_root / "_icebox"
     icebox_path = todos_root / "icebox.md"  # Legacy fallback
 
     todos: list[TodoInfo] = []
     seen_slugs: set[str] = set()
 
-    if not todos_root.exists():
-        return []
-
-    icebox_entries, icebox_slugs, icebox_groups = _load_icebox_data(todos_root, icebox_root, icebox_path)
+    icebox_entries, icebox_slugs, icebox_groups = _load_icebox_data(index, todos_root, icebox_root, icebox_path)
 
     # 1. Load active roadmap items
     if not icebox_only and not delivered_only:
         _load_active_roadmap_items(
             todos,
             seen_slugs,
+            index,
             project_path=project_path,
             todos_root=todos_root,
             icebox_root=icebox_root,
@@ -433,6 +610,7 @@ def assemble_roadmap(
     _load_icebox_items(
         todos,
         seen_slugs,
+        index,
         project_path=project_path,
         todos_root=todos_root,
         icebox_root=icebox_root,
@@ -444,6 +622,7 @@ def assemble_roadmap(
     _load_delivered_items(
         todos,
         seen_slugs,
+        index,
         project_path=project_path,
         todos_root=todos_root,
         icebox_root=icebox_root,
@@ -454,6 +633,7 @@ def assemble_roadmap(
     _append_orphan_todos(
         todos,
         seen_slugs,
+        index,
         project_path=project_path,
         todos_root=todos_root,
         icebox_root=icebox_root,
@@ -463,6 +643,6 @@ def assemble_roadmap(
         icebox_only=icebox_only,
         delivered_only=delivered_only,
     )
-    _inject_breakdown_relationships(todos, todos_root)
+    _inject_breakdown_relationships(todos, index, todos_root)
 
     return todos
@@ -330,3 +330,13 @@ CREATE TABLE IF NOT EXISTS session_tokens (
 );
 CREATE INDEX IF NOT EXISTS idx_session_tokens_session ON session_tokens(session_id);
 CREATE INDEX IF NOT EXISTS idx_session_tokens_expires ON session_tokens(expires_at);
+
+-- Summarizer cache: LLM summaries and titles keyed by normalized-input digest
+CREATE TABLE IF NOT EXISTS summary_cache (
+    kind TEXT NOT NULL,            -- "summary" or "title"
+    digest TEXT NOT NULL,          -- sha256 of the normalized input
+    value TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (kind, digest)
+);
+CREATE INDEX IF NOT EXISTS idx_summary_cache_created ON summary_cache(created_at);
@@ -1,14 +1,30 @@
-"""Summary utilities for agent stop payloads."""
+"""Summary utilities for agent stop payloads.
 
+Results are cached by the digest of their normalized input, in memory and in
+the ``summary_cache`` table, so a repeated output (status polls, "waiting on
+build" loops) costs one lookup instead of an LLM call. Concurrent requests for
+the same digest share one call, outputs short enough to stand on their own are
+returned without a call, and title requests that arrive within a short window
+are sent to the model as one batch.
+"""
+
+import asyncio
+import functools
+import hashlib
 import json
 import os
-from collections.abc import Callable
-from typing import Any, cast
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Protocol, cast
 
 from anthropic import AsyncAnthropic
+from instrukt_ai_logging import get_logger
 from openai import AsyncOpenAI
 from openai.types.shared_params.response_format_json_schema import ResponseFormatJSONSchema
 
+logger = get_logger(__name__)
+
 SUMMARY_MODEL_ANTHROPIC = "claude-haiku-4-5-20251001"
 SUMMARY_MODEL_OPENAI = "gpt-5-nano-2025-08-07"
 TITLE_SCHEMA: dict[str, object] = {  # guard: loose-dict - JSON schema definition
@@ -27,6 +43,66 @@ SUMMARY_SCHEMA: dict[str, object] = {  # guard: loose-dict - JSON schema definit
     "required": ["summary"],
     "additionalProperties": False,
 }
+TITLES_SCHEMA: dict[str, object] = {  # guard: loose-dict - JSON schema definition
+    "type": "object",
+    "properties": {
+        "titles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "session": {"type": "integer"},
+                    "title": {"type": "string"},
+                },
+                "required": ["session", "title"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["titles"],
+    "additionalProperties": False,
+}
+
+MAX_SUMMARY_WORDS = 30
+# Outputs at or under this size are already a summary and are returned as-is.
+SHORT_OUTPUT_MAX_WORDS = 12
+SHORT_OUTPUT_MAX_CHARS = 120
+SUMMARY_CACHE_MEMORY_ENTRIES = 512
+TITLE_BATCH_WINDOW_S = 0.25
+TITLE_BATCH_MAX = 8
+
+KIND_SUMMARY = "summary"
+KIND_TITLE = "title"
+
+_WHITESPACE = re.compile(r"\s+")
+
+SummaryBackend = Callable[..., Awaitable[Any]]
+
+
+class SummaryStore(Protocol):
+    """Persistent side of the summary cache (implemented by ``Db``)."""
+
+    async def get_cached_summary(self, kind: str, digest: str) -> str | None: ...
+
+    async def store_cached_summary(self, kind: str, digest: str, value: str) -> None: ...
+
+
+def normalize_output(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a digest."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def output_digest(text: str) -> str:
+    """sha256 hex digest of the normalized text, the summary cache key."""
+    return hashlib.sha256(normalize_output(text).encode("utf-8")).hexdigest()
+
+
+def local_summary(agent_output: str) -> str | None:
+    """Return the output itself when it is too short to need summarizing."""
+    normalized = normalize_output(agent_output)
+    if len(normalized) > SHORT_OUTPUT_MAX_CHARS or len(normalized.split(" ")) > SHORT_OUTPUT_MAX_WORDS:
+        return None
+    return normalized
 
 
 def _build_session_title_prompt(recent_turns: list[tuple[str, str]]) -> str:
@@ -45,6 +121,25 @@ transient operational chatter such as run commands, model changes, or status noi
 """
 
 
+def _build_session_titles_prompt(batch: Sequence[list[tuple[str, str]]]) -> str:
+    """Build prompt for generating titles for several sessions in one call."""
+    sections = "\n\n".join(
+        f"## Session {index}:\n" + "\n\n".join(f"{role.title()}: {text}" for role, text in turns)
+        for index, turns in enumerate(batch, start=1)
+    )
+    return f"""Generate a concise title for each of these sessions.
+
+Base each title on the enduring user intent across that session's recent conversation,
+not transient operational chatter such as run commands, model changes, or status noise.
+
+{sections}
+
+## Output:
+1. **titles**: one entry per session, each with **session** (the session number) and
+   **title** (max 7 words, max 70 chars). Prefer imperative phrasing when it fits.
+"""
+
+
 def _build_agent_output_summary_prompt(agent_output: str, max_summary_words: int) -> str:
     """Build prompt for summarizing agent output."""
     return f"""Summarize this assistant response.
@@ -61,24 +156,193 @@ async def generate_session_title(recent_turns: list[tuple[str, str]]) -> str | N
     """Generate a session title from recent transcript turns."""
     if not recent_turns:
         raise ValueError("Empty session title context")
-    prompt = _build_session_title_prompt(recent_turns)
-    return await _call_title_summarizer(prompt)
+    return await _default_cache().title(recent_turns)
+
+
+async def generate_session_titles(batch: Sequence[list[tuple[str, str]]]) -> list[str | None]:
+    """Generate titles for several sessions, batching the model calls."""
+    if any(not turns for turns in batch):
+        raise ValueError("Empty session title context")
+    return await _default_cache().titles(batch)
 
 
 async def summarize_agent_output(agent_output: str) -> tuple[str | None, str]:
     """Summarize agent output. Returns (None, summary)."""
     if not agent_output or not agent_output.strip():
         raise ValueError("Empty agent output")
-    max_summary_words = 30
-    prompt = _build_agent_output_summary_prompt(agent_output, max_summary_words)
-    summary = await _call_summary_summarizer(prompt)
-    return None, summary
+    return None, await _default_cache().summarize(agent_output)
+
+
+class SummaryCache:
+    """Digest-keyed, coalescing front for the summarizer backend.
+
+    Lookups go memory, then the persistent store, then the backend. Store
+    failures are logged and treated as misses; backend failures propagate to
+    every caller waiting on that digest and are not cached. A cancelled caller
+    stops waiting without cancelling the shared load.
+    """
+
+    def __init__(
+        self,
+        backend: SummaryBackend | None = None,
+        store: SummaryStore | None = None,
+        *,
+        memory_entries: int = SUMMARY_CACHE_MEMORY_ENTRIES,
+        title_batch_window_s: float = TITLE_BATCH_WINDOW_S,
+        title_batch_max: int = TITLE_BATCH_MAX,
+    ) -> None:
+        self._backend = backend or _call_summarizer
+        self._store = store
+        self._memory_entries = memory_entries
+        self._title_batch_window_s = title_batch_window_s
+        self._title_batch_max = title_batch_max
+        self._memory: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+        self._pending_titles: list[tuple[list[tuple[str, str]], asyncio.Future[str | None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def summarize(self, agent_output: str) -> str:
+        """Summarize agent output, reusing earlier results for the same normalized text."""
+        short = local_summary(agent_output)
+        if short is not None:
+            return short
+        summary = await self._lookup(KIND_SUMMARY, output_digest(agent_output), lambda: self._summarize(agent_output))
+        return cast(str, summary)
+
+    async def title(self, recent_turns: list[tuple[str, str]]) -> str | None:
+        """Generate a title, joining other sessions' requests in the current batch window."""
+        digest = output_digest(_build_session_title_prompt(recent_turns))
+        return await self._lookup(KIND_TITLE, digest, lambda: self._enqueue_title(recent_turns))
+
+    async def titles(self, batch: Sequence[list[tuple[str, str]]]) -> list[str | None]:
+        """Generate titles for several sessions; misses share batched backend calls."""
+        return list(await asyncio.gather(*(self.title(turns) for turns in batch)))
+
+    async def _lookup(self, kind: str, digest: str, compute: Callable[[], Awaitable[str | None]]) -> str | None:
+        key = (kind, digest)
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._memory.move_to_end(key)
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            # The shared load runs as its own task so one caller's cancellation
+            # leaves every other waiter (and the cache fill) untouched.
+            task = asyncio.get_running_loop().create_task(self._fill(kind, digest, compute))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._fill_done, key))
+        return await asyncio.shield(task)
+
+    def _fill_done(self, key: tuple[str, str], task: asyncio.Task[str | None]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Failures nobody else awaited must not be reported as unretrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fill(self, kind: str, digest: str, compute: Callable[[], Awaitable[str | None]]) -> str | None:
+        value = await self._load(kind, digest)
+        if value is None:
+            value = await compute()
+            if value:
+                await self._save(kind, digest, value)
+        if value:
+            self._remember((kind, digest), value)
+        return value
+
+    def _remember(self, key: tuple[str, str], value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _resolve_store(self) -> SummaryStore:
+        if self._store is None:
+            from teleclaude.core.db import db
+
+            self._store = db
+        return self._store
+
+    async def _load(self, kind: str, digest: str) -> str | None:
+        try:
+            return await self._resolve_store().get_cached_summary(kind, digest)
+        except Exception as exc:
+            logger.debug("Summary cache read failed: %s", exc)
+            return None
+
+    async def _save(self, kind: str, digest: str, value: str) -> None:
+        try:
+            await self._resolve_store().store_cached_summary(kind, digest, value)
+        except Exception as exc:
+            logger.debug("Summary cache write failed: %s", exc)
+
+    async def _summarize(self, agent_output: str) -> str:
+        prompt = _build_agent_output_summary_prompt(agent_output, MAX_SUMMARY_WORDS)
+        return cast(str, await self._backend(prompt, SUMMARY_SCHEMA, _parse_summary_response))
+
+    async def _title(self, recent_turns: list[tuple[str, str]]) -> str | None:
+        prompt = _build_session_title_prompt(recent_turns)
+        return cast(str | None, await self._backend(prompt, TITLE_SCHEMA, _parse_title_response))
+
+    def _enqueue_title(self, recent_turns: list[tuple[str, str]]) -> asyncio.Future[str | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+        self._pending_titles.append((recent_turns, future))
+        if len(self._pending_titles) >= self._title_batch_max:
+            self._start_title_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._title_batch_window_s, self._start_title_flush)
+        return future
+
+    def _start_title_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending_titles = self._pending_titles, []
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush_titles(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_titles(self, pending: list[tuple[list[tuple[str, str]], asyncio.Future[str | None]]]) -> None:
+        titles: dict[int, str] = {}
+        if len(pending) > 1:
+            prompt = _build_session_titles_prompt([turns for turns, _future in pending])
+            try:
+                titles = await self._backend(
+                    prompt, TITLES_SCHEMA, _parse_titles_response, max_tokens=100 + 40 * len(pending)
+                )
+            except Exception as exc:
+                logger.warning("Batched title summarization failed, retrying per session: %s", exc)
+        for index, (turns, future) in enumerate(pending, start=1):
+            if future.done():
+                continue
+            try:
+                title = titles.get(index) or await self._title(turns)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(title)
+
+
+_cache: SummaryCache | None = None
+
+
+def _default_cache() -> SummaryCache:
+    global _cache
+    if _cache is None:
+        _cache = SummaryCache()
+    return _cache
 
 
 async def _call_summarizer(
     prompt: str,
     schema: dict[str, object],  # guard: loose-dict - JSON schema shape is dynamic.
     parser: Callable[[str], Any],
+    *,
+    max_tokens: int = 200,
 ) -> Any:
     """Call the summarizer API with the given prompt."""
 
@@ -90,7 +354,7 @@ async def _call_summarizer(
             anthropic_client = AsyncAnthropic(api_key=api_key)
             response = await anthropic_client.beta.messages.create(
                 model=SUMMARY_MODEL_ANTHROPIC,
-                max_tokens=200,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
                 betas=["structured-outputs-2025-11-13"],
                 output_format={
@@ -122,7 +386,7 @@ async def _call_summarizer(
             }
             response = await openai_client.chat.completions.create(
                 model=SUMMARY_MODEL_OPENAI,
-                max_tokens=200,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
                 response_format=response_format,
             )
@@ -137,14 +401,6 @@ async def _call_summarizer(
     raise RuntimeError("No summarizer available (missing API key)")
 
 
-async def _call_title_summarizer(prompt: str) -> str | None:
-    return await _call_summarizer(prompt, TITLE_SCHEMA, _parse_title_response)  # type: ignore[no-any-return]
-
-
-async def _call_summary_summarizer(prompt: str) -> str:
-    return await _call_summarizer(prompt, SUMMARY_SCHEMA, _parse_summary_response)  # type: ignore[no-any-return]
-
-
 def _parse_title_response(text: str) -> str | None:
     data = json.loads(text.strip())
     title_value = data.get("title")
@@ -154,6 +410,16 @@ def _parse_title_response(text: str) -> str | None:
     return title
 
 
+def _parse_titles_response(text: str) -> dict[int, str]:
+    data = json.loads(text.strip())
+    titles: dict[int, str] = {}
+    for entry in data["titles"]:
+        title = str(entry.get("title") or "").strip()[:70]
+        if title:
+            titles[int(entry["session"])] = title
+    return titles
+
+
 def _parse_summary_response(text: str) -> str:
     data = json.loads(text.strip())
     summary_value = data["summary"]
@@ -3,6 +3,12 @@
 All functions are stateless and use config imported from teleclaude.config.
 """
 
+from teleclaude.core.tmux_bridge._control import (
+    TmuxControlClient,
+    get_control_client,
+    start_control_client,
+    stop_control_client,
+)
 from teleclaude.core.tmux_bridge._keys import (
     pid_is_alive,
     send_arrow_key,
@@ -22,6 +28,7 @@ from teleclaude.core.tmux_bridge._pane import (
     get_current_command,
     get_current_directory,
     get_pane_pid,
+    get_pane_pipe_state,
     get_pane_title,
     get_pane_tty,
     get_session_pane_id,
@@ -52,12 +59,15 @@ __all__ = [
     "SUBPROCESS_TIMEOUT_LONG",
     "SUBPROCESS_TIMEOUT_QUICK",
     "SubprocessTimeoutError",
+    "TmuxControlClient",
     "capture_pane",
     "communicate_with_timeout",
     "ensure_tmux_session",
+    "get_control_client",
     "get_current_command",
     "get_current_directory",
     "get_pane_pid",
+    "get_pane_pipe_state",
     "get_pane_title",
     "get_pane_tty",
     "get_session_pane_id",
@@ -78,7 +88,9 @@ __all__ = [
     "send_signal",
     "send_tab",
     "session_exists",
+    "start_control_client",
     "start_pipe_pane",
+    "stop_control_client",
     "stop_pipe_pane",
     "update_tmux_session",
     "wait_for_shell_ready",
@@ -0,0 +1,395 @@
+"""Persistent tmux control-mode (``tmux -C``) client.
+
+One long-lived control client multiplexes tmux commands over a single pipe
+instead of forking a ``tmux`` process per query. Replies arrive in command
+order framed by ``%begin``/``%end`` (or ``%error``) guards, so pending commands
+are resolved from a FIFO queue. Asynchronous notifications (``%output``,
+``%exit``, ``%session-changed``) are consumed by the same reader task.
+
+The client is optional: callers go through ``run_tmux_command`` which falls
+back to spawning a tmux subprocess whenever a command could not be handed to
+the control connection. Once a command has been written it is never re-run,
+so keystrokes are not typed twice when a reply is lost.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+from instrukt_ai_logging import get_logger
+
+from teleclaude.config import config
+
+from ._subprocess import SUBPROCESS_TIMEOUT_QUICK, communicate_with_timeout
+
+logger = get_logger(__name__)
+
+# Dedicated tmux session the control client attaches to. Deliberately not
+# prefixed with TMUX_SESSION_PREFIX so orphan cleanup never touches it.
+CONTROL_SESSION_NAME = "teleclaude-control"
+
+# Control replies contain whole pane captures on a single line when -J is used.
+_STREAM_LIMIT = 8 * 1024 * 1024
+_RECONNECT_BACKOFF_S = 5.0
+
+OutputListener = Callable[[str, bytes], None]
+
+
+class TmuxCommandResult(NamedTuple):
+    """Result of a tmux command, shaped like a finished subprocess."""
+
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+
+
+class TmuxControlError(Exception):
+    """Raised when the control connection is unusable for a command."""
+
+
+class TmuxControlNotSentError(TmuxControlError):
+    """Raised when a command never reached tmux, so running it elsewhere is safe."""
+
+
+def quote_tmux_arg(arg: str) -> str:
+    """Quote an argument for the tmux command parser.
+
+    Double quotes keep ``#{...}`` formats and leading ``#``/``~`` literal;
+    only backslash, double quote and ``$`` need escaping inside them.
+    """
+    escaped = arg.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$")
+    escaped = escaped.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+    return f'"{escaped}"'
+
+
+def decode_control_output(data: str) -> bytes:
+    """Decode ``%output`` payloads (non-printables and backslash are octal-escaped)."""
+    raw = data.encode("utf-8", errors="surrogateescape")
+    if b"\\" not in raw:
+        return raw
+    out = bytearray()
+    i = 0
+    while i < len(raw):
+        byte = raw[i]
+        octal = raw[i + 1 : i + 4]
+        if byte == 0x5C and len(octal) == 3 and octal.isdigit():
+            out.append(int(octal, 8) & 0xFF)
+            i += 4
+            continue
+        out.append(byte)
+        i += 1
+    return bytes(out)
+
+
+class _PendingCommand:
+    __slots__ = ("future", "lines")
+
+    def __init__(self, future: "asyncio.Future[TmuxCommandResult]") -> None:
+        self.future = future
+        self.lines: list[bytes] = []
+
+
+class TmuxControlClient:
+    """Single multiplexed tmux control-mode connection."""
+
+    def __init__(self, tmux_binary: str, session_name: str = CONTROL_SESSION_NAME) -> None:
+        self._tmux_binary = tmux_binary
+        self._session_name = session_name
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: deque[_PendingCommand] = deque()
+        self._active: _PendingCommand | None = None
+        self._active_number: bytes | None = None
+        self._output_listeners: list[OutputListener] = []
+        self._connected = False
+        self.attached_session: str | None = None
+
+    @property
+    def connected(self) -> bool:
+        """True while the control client is attached and accepting commands."""
+        return self._connected and self._process is not None and self._process.returncode is None
+
+    def add_output_listener(self, listener: OutputListener) -> None:
+        """Register a callback for ``%output`` notifications (pane_id, data)."""
+        self._output_listeners.append(listener)
+
+    def remove_output_listener(self, listener: OutputListener) -> None:
+        """Unregister a previously added ``%output`` callback."""
+        if listener in self._output_listeners:
+            self._output_listeners.remove(listener)
+
+    async def start(self) -> None:
+        """Spawn the control client, attaching to (or creating) the control session."""
+        self._process = await asyncio.create_subprocess_exec(
+            self._tmux_binary,
+            "-C",
+            "new-session",
+            "-A",
+            "-s",
+            self._session_name,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_STREAM_LIMIT,
+        )
+        self._connected = True
+        self._reader_task = asyncio.create_task(self._read_loop())
+        logger.info("tmux control client started (pid=%s, session=%s)", self._process.pid, self._session_name)
+
+    async def close(self) -> None:
+        """Detach the control client and fail any pending commands."""
+        self._connected = False
+        process = self._process
+        if process is not None and process.returncode is None and process.stdin is not None:
+            try:
+                # An empty line detaches a control client cleanly.
+                process.stdin.write(b"\n")
+                await asyncio.wait_for(process.stdin.drain(), timeout=1.0)
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except (TimeoutError, ConnectionError, BrokenPipeError):
+                process.kill()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        self._fail_pending(TmuxControlError("tmux control client closed"))
+
+    async def run(self, args: Sequence[str], timeout: float = SUBPROCESS_TIMEOUT_QUICK) -> TmuxCommandResult:
+        """Run a tmux command over the control connection.
+
+        Raises:
+            TmuxControlNotSentError: If the connection was down before the command was written.
+            TmuxControlError: If the command was written but its reply was lost; tmux may
+                or may not have executed it.
+        """
+        process = self._process
+        if not self.connected or process is None or process.stdin is None:
+            raise TmuxControlNotSentError("tmux control client not connected")
+
+        loop = asyncio.get_running_loop()
+        pending = _PendingCommand(loop.create_future())
+        line = " ".join(quote_tmux_arg(arg) for arg in args).encode("utf-8") + b"\n"
+        # Enqueue and write without yielding so reply order matches queue order.
+        self._pending.append(pending)
+        try:
+            process.stdin.write(line)
+        except (ConnectionError, BrokenPipeError) as exc:
+            self._pending.remove(pending)
+            self._mark_disconnected(f"write failed: {exc}")
+            raise TmuxControlNotSentError("tmux control write failed") from exc
+        try:
+            await process.stdin.drain()
+        except (ConnectionError, BrokenPipeError) as exc:
+            # Part of the line may already be in tmux's hands.
+            self._mark_disconnected(f"drain failed: {exc}")
+            raise TmuxControlError("tmux control connection lost after write") from exc
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.future), timeout=timeout)
+        except TimeoutError:
+            # Reply framing can no longer be trusted; drop the connection.
+            self._mark_disconnected(f"reply timeout after {timeout}s")
+            if self._process is not None and self._process.returncode is None:
+                self._process.kill()
+            raise TmuxControlError(f"tmux control reply timed out after {timeout}s") from None
+
+    async def _read_loop(self) -> None:
+        process = self._process
+        assert process is not None and process.stdout is not None
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                self._handle_line(line.rstrip(b"\n"))
+        except (ValueError, asyncio.LimitOverrunError) as exc:
+            logger.warning("tmux control reader overrun: %s", exc)
+        finally:
+            self._mark_disconnected("control stream closed")
+
+    def _handle_line(self, line: bytes) -> None:
+        if self._active is not None:
+            if line.startswith((b"%end ", b"%error ")) and self._guard_number(line) == self._active_number:
+                self._finish_active(failed=line.startswith(b"%error "))
+            else:
+                self._active.lines.append(line)
+            return
+
+        if line.startswith(b"%begin "):
+            parts = line.split(b" ")
+            flags = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 1
+            if flags & 1 and self._pending:
+                self._active = self._pending.popleft()
+            else:
+                # Reply to a command tmux ran on its own (e.g. the initial attach).
+                self._active = _PendingCommand(asyncio.get_running_loop().create_future())
+            self._active_number = self._guard_number(line)
+            return
+
+        if line.startswith(b"%output "):
+            self._dispatch_output(line)
+        elif line.startswith(b"%session-changed "):
+            parts = line.decode("utf-8", errors="replace").split(" ", 2)
+            self.attached_session = parts[2] if len(parts) > 2 else None
+        elif line.startswith(b"%exit"):
+            self._mark_disconnected(line.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    def _guard_number(line: bytes) -> bytes | None:
+        parts = line.split(b" ")
+        return parts[2] if len(parts) > 2 else None
+
+    def _finish_active(self, *, failed: bool) -> None:
+        active = self._active
+        self._active = None
+        self._active_number = None
+        if active is None or active.future.done():
+            return
+        body = b"\n".join(active.lines) + (b"\n" if active.lines else b"")
+        if failed:
+            active.future.set_result(TmuxCommandResult(1, b"", body))
+        else:
+            active.future.set_result(TmuxCommandResult(0, body, b""))
+
+    def _dispatch_output(self, line: bytes) -> None:
+        if not self._output_listeners:
+            return
+        _, _, rest = line.partition(b" ")
+        pane_id, _, data = rest.partition(b" ")
+        payload = decode_control_output(data.decode("utf-8", errors="surrogateescape"))
+        pane = pane_id.decode("ascii", errors="replace")
+        for listener in list(self._output_listeners):
+            try:
+                listener(pane, payload)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning("tmux control output listener failed: %s", exc)
+
+    def _mark_disconnected(self, reason: str) -> None:
+        if self._connected:
+            logger.warning("tmux control client disconnected: %s", reason)
+        self._connected = False
+        self._fail_pending(TmuxControlError(f"tmux control client disconnected: {reason}"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        if self._active is not None and not self._active.future.done():
+            self._active.future.set_exception(error)
+        self._active = None
+        self._active_number = None
+        while self._pending:
+            pending = self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_exception(error)
+
+
+_client: TmuxControlClient | None = None
+_enabled = False
+_last_connect_attempt = 0.0
+_connect_lock: asyncio.Lock | None = None
+
+
+def get_control_client() -> TmuxControlClient | None:
+    """Return the shared control client when it is connected."""
+    if _client is not None and _client.connected:
+        return _client
+    return None
+
+
+async def start_control_client() -> bool:
+    """Enable control mode and connect the shared client.
+
+    Returns:
+        True if the control client is connected, False if callers will use subprocesses.
+    """
+    global _enabled  # pylint: disable=global-statement
+    _enabled = True
+    return await _ensure_connected(force=True)
+
+
+async def stop_control_client() -> None:
+    """Disable control mode and close the shared client."""
+    global _client, _enabled  # pylint: disable=global-statement
+    _enabled = False
+    client = _client
+    _client = None
+    if client is not None:
+        await client.close()
+        logger.info("tmux control client stopped")
+
+
+async def _ensure_connected(*, force: bool = False) -> bool:
+    global _client, _last_connect_attempt, _connect_lock  # pylint: disable=global-statement
+    if not _enabled:
+        return False
+    if _client is not None and _client.connected:
+        return True
+    now = time.monotonic()
+    if not force and now - _last_connect_attempt < _RECONNECT_BACKOFF_S:
+        return False
+    if _connect_lock is None:
+        _connect_lock = asyncio.Lock()
+    async with _connect_lock:
+        if _client is not None and _client.connected:
+            return True
+        _last_connect_attempt = time.monotonic()
+        previous = _client
+        client = TmuxControlClient(config.computer.tmux_binary)
+        try:
+            await client.start()
+        except (OSError, ValueError) as exc:
+            logger.warning("tmux control client unavailable, using subprocess fallback: %s", exc)
+            return False
+        if previous is not None:
+            for listener in previous._output_listeners:  # pylint: disable=protected-access
+                client.add_output_listener(listener)
+            await previous.close()
+        _client = client
+        return True
+
+
+async def run_control_command(
+    args: Sequence[str], timeout: float = SUBPROCESS_TIMEOUT_QUICK
+) -> TmuxCommandResult | None:
+    """Run a tmux command over the shared control connection.
+
+    Returns:
+        The command result; a failed result (returncode -1) when the command was
+        written but its reply was lost; or None when control mode is disabled or
+        the command never reached tmux and the caller should spawn a subprocess.
+    """
+    if not _enabled:
+        return None
+    if not await _ensure_connected():
+        return None
+    client = _client
+    if client is None:
+        return None
+    try:
+        return await client.run(args, timeout=timeout)
+    except TmuxControlNotSentError as exc:
+        logger.debug("tmux control command not sent, falling back to subprocess: %s", exc)
+        return None
+    except TmuxControlError as exc:
+        logger.warning("tmux control command outcome unknown, not retrying: %s (%s)", args[:1], exc)
+        return TmuxCommandResult(-1, b"", str(exc).encode("utf-8"))
+
+
+async def run_tmux_command(cmd: list[str]) -> TmuxCommandResult:
+    """Run a tmux command with captured output, preferring the control connection.
+
+    Args:
+        cmd: Full command line starting with the tmux binary
+
+    Returns:
+        Return code, stdout and stderr as from a finished subprocess
+    """
+    control_result = await run_control_command(cmd[1:])
+    if control_result is not None:
+        return control_result
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    stdout, stderr = await communicate_with_timeout(process, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+    return TmuxCommandResult(process.returncode if process.returncode is not None else -1, stdout, stderr)
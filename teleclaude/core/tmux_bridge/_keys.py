@@ -14,6 +14,7 @@ from instrukt_ai_logging import get_logger
 from teleclaude.config import config
 from teleclaude.core.agents import AgentName
 
+from ._control import run_control_command, run_tmux_command
 from ._session import ensure_tmux_session
 from ._subprocess import SUBPROCESS_TIMEOUT_QUICK, communicate_with_timeout, wait_with_timeout
 
@@ -31,6 +32,16 @@ def pid_is_alive(pid: int) -> bool:
     return True
 
 
+async def _send_tmux(cmd: list[str]) -> bool:
+    """Run a fire-and-forget tmux command, preferring the control connection."""
+    control_result = await run_control_command(cmd[1:])
+    if control_result is not None:
+        return control_result.returncode == 0
+    result = await asyncio.create_subprocess_exec(*cmd)
+    await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+    return result.returncode == 0
+
+
 async def send_keys(
     session_name: str,
     text: str,
@@ -179,10 +190,8 @@ async def _send_keys_tmux(
     cmd_text = [config.computer.tmux_binary, "send-keys", "-t", session_name, "-l", "--", send_text]
     if has_bracketed_paste:
         logger.debug("Unwrapped bracketed paste markers for literal tmux send: %s", send_text[:80])
-    result = await asyncio.create_subprocess_exec(
-        *cmd_text, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-    )
-    _, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+    result = await run_tmux_command(cmd_text)
+    stderr = result.stderr
 
     if result.returncode != 0:
         logger.error(
@@ -202,10 +211,8 @@ async def _send_keys_tmux(
     # Send Enter key once if requested
     if send_enter:
         cmd_enter = [config.computer.tmux_binary, "send-keys", "-t", session_name, "C-m"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd_enter, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        _, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd_enter)
+        stderr = result.stderr
 
         if result.returncode != 0:
             logger.error(
@@ -234,10 +241,8 @@ async def send_signal(session_name: str, signal: Signals = SIGINT) -> bool:
             # SIGKILL requires finding the process PID and killing it directly
             # Get the shell PID in the tmux pane
             cmd = [config.computer.tmux_binary, "display-message", "-p", "-t", session_name, "#{pane_pid}"]
-            result = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+            result = await run_tmux_command(cmd)
+            stdout, stderr = result.stdout, result.stderr
 
             if result.returncode != 0:
                 logger.error(
@@ -304,10 +309,8 @@ async def send_signal(session_name: str, signal: Signals = SIGINT) -> bool:
             return False
 
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, key]
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stderr = result.stderr
 
         if result.returncode != 0:
             logger.error(
@@ -337,10 +340,7 @@ async def send_escape(session_name: str) -> bool:
     """
     try:
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "Escape"]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending escape to tmux: {e}")
@@ -361,10 +361,7 @@ async def send_ctrl_key(session_name: str, key: str) -> bool:
         # tmux notation for control keys: C-<key>
         ctrl_key = f"C-{key.lower()}"
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, ctrl_key]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending ctrl+{key} to tmux: {e}")
@@ -382,10 +379,7 @@ async def send_tab(session_name: str) -> bool:
     """
     try:
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "Tab"]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending tab to tmux: {e}")
@@ -410,10 +404,7 @@ async def send_shift_tab(session_name: str, count: int = 1) -> bool:
 
         # tmux send-keys with -N flag for repeat count
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "-N", str(count), "BTab"]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending shift+tab (x{count}) to tmux: {e}")
@@ -438,10 +429,7 @@ async def send_backspace(session_name: str, count: int = 1) -> bool:
 
         # tmux send-keys with -N flag for repeat count
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "-N", str(count), "BSpace"]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending backspace (x{count}) to tmux: {e}")
@@ -459,10 +447,7 @@ async def send_enter(session_name: str) -> bool:
     """
     try:
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "C-m"]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending enter to tmux: {e}")
@@ -495,10 +480,7 @@ async def send_arrow_key(session_name: str, direction: str, count: int = 1) -> b
         # tmux send-keys with -N flag for repeat count
         key_name = valid_directions[direction]
         cmd = [config.computer.tmux_binary, "send-keys", "-t", session_name, "-N", str(count), key_name]
-        result = await asyncio.create_subprocess_exec(*cmd)
-        await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
-
-        return result.returncode == 0
+        return await _send_tmux(cmd)
 
     except Exception as e:
         print(f"Error sending arrow key ({direction} x{count}) to tmux: {e}")
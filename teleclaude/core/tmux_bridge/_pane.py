@@ -12,6 +12,7 @@ from instrukt_ai_logging import get_logger
 from teleclaude.config import config
 from teleclaude.constants import UI_MESSAGE_MAX_CHARS
 
+from ._control import CONTROL_SESSION_NAME, run_tmux_command
 from ._subprocess import (
     SUBPROCESS_TIMEOUT_QUICK,
     SubprocessTimeoutError,
@@ -30,10 +31,8 @@ async def get_pane_tty(session_name: str) -> str | None:
     """Get tty path for the tmux pane backing a session."""
     try:
         cmd = [config.computer.tmux_binary, "display-message", "-p", "-t", session_name, "#{pane_tty}"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, stderr = result.stdout, result.stderr
         if result.returncode != 0:
             logger.error(
                 "Failed to get pane tty for session %s: %s",
@@ -55,10 +54,8 @@ async def get_pane_pid(session_name: str) -> int | None:
     """Get shell PID for the tmux pane backing a session."""
     try:
         cmd = [config.computer.tmux_binary, "display-message", "-p", "-t", session_name, "#{pane_pid}"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, stderr = result.stdout, result.stderr
         if result.returncode != 0:
             logger.error(
                 "Failed to get pane PID for session %s: %s",
@@ -103,10 +100,8 @@ async def capture_pane(session_name: str, *, capture_lines: int | None = None) -
             f"-{window_lines}",
         ]
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, stderr = result.stdout, result.stderr
 
         if result.returncode == 0:
             return stdout.decode("utf-8", errors="replace")
@@ -157,14 +152,13 @@ async def list_tmux_sessions() -> list[str]:
     try:
         cmd = [config.computer.tmux_binary, "list-sessions", "-F", "#{session_name}"]
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, _ = result.stdout, result.stderr
 
         if result.returncode == 0:
             sessions: list[str] = stdout.decode("utf-8").strip().split("\n")
-            return [s for s in sessions if s]  # Filter empty strings
+            # Skip empty strings and the control client's own attach session.
+            return [s for s in sessions if s and s != CONTROL_SESSION_NAME]
         return []
 
     except Exception as e:
@@ -186,10 +180,8 @@ async def session_exists(session_name: str, log_missing: bool = True) -> bool:
     try:
         cmd = [config.computer.tmux_binary, "has-session", "-t", session_name]
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        _, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        _, stderr = result.stdout, result.stderr
 
         if result.returncode != 0:
             if log_missing:
@@ -260,10 +252,8 @@ async def get_current_command(session_name: str) -> str | None:
     try:
         cmd = [config.computer.tmux_binary, "display-message", "-p", "-t", session_name, "#{pane_current_command}"]
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, stderr = result.stdout, result.stderr
 
         if result.returncode != 0:
             logger.warning(
@@ -312,10 +302,8 @@ async def is_pane_dead(session_name: str) -> bool:
     """Return True if all tmux panes are marked dead (shell exited)."""
     try:
         cmd = [config.computer.tmux_binary, "list-panes", "-t", session_name, "-F", "#{pane_dead}"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, _ = result.stdout, result.stderr
         if result.returncode != 0:
             return False
         lines = stdout.decode("utf-8").strip().split("\n") if stdout else []
@@ -343,10 +331,8 @@ async def get_session_pane_id(session_name: str) -> str | None:
     try:
         cmd = [config.computer.tmux_binary, "list-panes", "-t", session_name, "-F", "#{pane_id}"]
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, _ = result.stdout, result.stderr
 
         if result.returncode == 0:
             pane_id: str = stdout.decode("utf-8").strip()
@@ -358,18 +344,26 @@ async def get_session_pane_id(session_name: str) -> str | None:
         return None
 
 
-async def start_pipe_pane(session_name: str, command: str) -> bool:
+# Session option naming whoever attached the current pipe-pane, so a restarted
+# daemon can tell its own pipe from someone else's.
+PIPE_OWNER_OPTION = "@teleclaude_pipe"
+
+
+async def start_pipe_pane(session_name: str, command: str, *, owner: str | None = None) -> bool:
     """Start piping pane output to a command.
 
     Args:
         session_name: Session name
         command: Command to pipe output to
+        owner: Tag recorded in ``PIPE_OWNER_OPTION`` alongside the pipe
 
     Returns:
         True if successful, False otherwise
     """
     try:
         cmd = [config.computer.tmux_binary, "pipe-pane", "-t", session_name, "-o", command]
+        if owner is not None:
+            cmd += [";", "set-option", "-t", session_name, PIPE_OWNER_OPTION, owner]
         result = await asyncio.create_subprocess_exec(*cmd)
         await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
 
@@ -380,8 +374,38 @@ async def start_pipe_pane(session_name: str, command: str) -> bool:
         return False
 
 
+async def get_pane_pipe_state(session_name: str) -> tuple[bool, str] | None:
+    """Check whether a pane already has a pipe-pane consumer attached, and whose.
+
+    Args:
+        session_name: Session name
+
+    Returns:
+        ``(piped, owner)`` where owner is the tag passed to ``start_pipe_pane``
+        (empty when none was recorded), or None if tmux could not be queried
+    """
+    try:
+        cmd = [
+            config.computer.tmux_binary,
+            "display-message",
+            "-p",
+            "-t",
+            session_name,
+            f"#{{pane_pipe}} #{{{PIPE_OWNER_OPTION}}}",
+        ]
+        result = await run_tmux_command(cmd)
+        if result.returncode != 0:
+            return None
+        piped, _, owner = result.stdout.decode("utf-8").rstrip("\n").partition(" ")
+        return piped.strip() == "1", owner.strip()
+
+    except Exception as e:
+        logger.error("Failed to query pane pipe state for %s: %s", session_name, e)
+        return None
+
+
 async def stop_pipe_pane(session_name: str) -> bool:
-    """Stop piping pane output.
+    """Stop piping pane output and clear the recorded pipe owner.
 
     Args:
         session_name: Session name
@@ -390,7 +414,19 @@ async def stop_pipe_pane(session_name: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        cmd = [config.computer.tmux_binary, "pipe-pane", "-t", session_name]
+        cmd = [
+            config.computer.tmux_binary,
+            "pipe-pane",
+            "-t",
+            session_name,
+            ";",
+            "set-option",
+            "-q",
+            "-u",
+            "-t",
+            session_name,
+            PIPE_OWNER_OPTION,
+        ]
         result = await asyncio.create_subprocess_exec(*cmd)
         await wait_with_timeout(result, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
 
@@ -412,12 +448,8 @@ async def get_pane_title(session_name: str) -> str | None:
     """
     try:
         cmd = [config.computer.tmux_binary, "display-message", "-p", "-t", session_name, "#{pane_title}"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, _ = result.stdout, result.stderr
 
         if result.returncode == 0:
             pane_title: str = stdout.decode().strip()
@@ -441,12 +473,8 @@ async def get_current_directory(session_name: str) -> str | None:
     """
     try:
         cmd = [config.computer.tmux_binary, "display", "-p", "-t", session_name, "#{pane_current_path}"]
-        result = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await communicate_with_timeout(result, None, SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
+        result = await run_tmux_command(cmd)
+        stdout, stderr = result.stdout, result.stderr
 
         if result.returncode == 0:
             current_dir: str = stdout.decode().strip()
@@ -1,7 +1,10 @@
 """Filesystem watcher for todos/ directories across trusted projects.
 
 Watches for changes to roadmap.yaml, state.yaml, and directory structure within
-todos/ and triggers granular cache updates via the daemon cache.
+todos/ and triggers granular cache updates via the daemon cache. Every raw
+event also invalidates the project's roadmap index right away, so
+``assemble_roadmap`` never serves a stale in-memory result during the
+debounce window.
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from watchdog.observers import Observer
 from teleclaude.config import config
 from teleclaude.constants import WORKTREE_DIR
 from teleclaude.core.cache import DaemonCache
+from teleclaude.core.roadmap import invalidate_roadmap_index, unwatch_roadmap_index, watch_roadmap_index
 
 logger = get_logger(__name__)
 
@@ -71,6 +75,9 @@ class _TodoHandler(FileSystemEventHandler):
 
     def _handle(self, event: FileSystemEvent) -> None:
         src = event.src_path
+        for changed in (src, getattr(event, "dest_path", None)):
+            if isinstance(changed, str) and changed:
+                invalidate_roadmap_index(self._project_path, changed)
         if not isinstance(src, str) or not _is_relevant(src):
             return
         hint = _classify_event(event)
@@ -110,18 +117,23 @@ class TodoWatcher:
         self._observer = observer
 
         watched = 0
+        indexed: list[tuple[str, bool]] = []
         for td in config.computer.get_all_trusted_dirs():
             handler = _TodoHandler(td.path, loop, queue)
             todos_dir = Path(td.path) / "todos"
-            if todos_dir.is_dir():
+            todos_watched = todos_dir.is_dir()
+            if todos_watched:
                 observer.schedule(handler, str(todos_dir), recursive=True)
                 watched += 1
                 logger.debug("TodoWatcher: watching %s", todos_dir)
             trees_dir = Path(td.path) / WORKTREE_DIR
-            if trees_dir.is_dir():
+            trees_watched = trees_dir.is_dir()
+            if trees_watched:
                 observer.schedule(handler, str(trees_dir), recursive=True)
                 watched += 1
                 logger.debug("TodoWatcher: watching %s", trees_dir)
+            if todos_watched:
+                indexed.append((td.path, trees_watched))
 
         if watched == 0:
             logger.info("TodoWatcher: no todos/ directories found, watcher idle")
@@ -132,6 +144,9 @@ class TodoWatcher:
                 return
 
         observer.start()
+        # Only after the observer runs can assembled roadmaps be served from memory.
+        for project_path, trees_watched in indexed:
+            watch_roadmap_index(project_path, trees=trees_watched)
         logger.info("TodoWatcher: started, watching %d project(s)", watched)
 
         # Debounce state: project_path -> (last_event_time, last_hint)
@@ -160,6 +175,8 @@ class TodoWatcher:
         except asyncio.CancelledError:
             pass
         finally:
+            for project_path, _ in indexed:
+                unwatch_roadmap_index(project_path)
             observer.stop()
             observer.join(timeout=2)
             logger.info("TodoWatcher: stopped")
@@ -0,0 +1,184 @@
+"""Index from native agent session id to transcript path.
+
+Agents name transcripts after their own session id, but in directory layouts
+(date folders, per-project folders) that make a lookup by id a walk over every
+transcript. The ``transcript_paths`` table maps each id to its file and agent.
+The mirror worker's transcript watcher and periodic reconcile keep it current;
+lookups verify the file still exists, drop stale rows, and report a miss so the
+caller can fall back to a scan and record what it finds.
+
+Every call blocks; async callers wrap them in ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from instrukt_ai_logging import get_logger
+
+from teleclaude.config import config
+from teleclaude.core.agents import AgentName
+from teleclaude.utils.transcript_discovery import TranscriptCandidate, extract_native_session_id
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "TranscriptLocation",
+    "forget_transcript_path",
+    "lookup_transcript",
+    "lookup_transcript_prefix",
+    "record_transcript_paths",
+]
+
+# Upper bound for a prefix range scan over native_session_id.
+_PREFIX_END = "\U0010ffff"
+
+
+@dataclass(frozen=True)
+class TranscriptLocation:
+    native_session_id: str
+    agent: AgentName
+    path: Path
+
+
+def _connect(db_path: str | None, *, readonly: bool) -> sqlite3.Connection:
+    # Never create the database: only the daemon's migrations make the table.
+    path = Path(db_path or config.database.path).expanduser().resolve()
+    conn = sqlite3.connect(f"file:{quote(str(path))}?mode={'ro' if readonly else 'rw'}", uri=True)
+    conn.execute("PRAGMA busy_timeout = 5000")
+    return conn
+
+
+def _agent_filter(agents: Sequence[AgentName] | None) -> tuple[str, list[str]]:
+    if not agents:
+        return "", []
+    return f" AND agent IN ({', '.join('?' * len(agents))})", [agent.value for agent in agents]
+
+
+def _is_missing_index(exc: sqlite3.OperationalError) -> bool:
+    message = str(exc).lower()
+    return "no such table" in message or "unable to open" in message
+
+
+def _query(sql: str, params: Sequence[object], db_path: str | None) -> list[tuple[str, str, str]]:
+    try:
+        with closing(_connect(db_path, readonly=True)) as conn:
+            return [(str(row[0]), str(row[1]), str(row[2])) for row in conn.execute(sql, params).fetchall()]
+    except sqlite3.OperationalError as exc:
+        if _is_missing_index(exc):
+            return []
+        raise
+
+
+def _first_existing(rows: list[tuple[str, str, str]], db_path: str | None) -> TranscriptLocation | None:
+    stale: list[str] = []
+    found: TranscriptLocation | None = None
+    for native_session_id, agent_value, transcript_path in rows:
+        try:
+            agent = AgentName(agent_value)
+        except ValueError:
+            continue
+        path = Path(transcript_path)
+        if path.is_file():
+            found = TranscriptLocation(native_session_id=native_session_id, agent=agent, path=path)
+            break
+        stale.append(transcript_path)
+    if stale:
+        forget_transcript_path(*stale, db_path=db_path)
+    return found
+
+
+def lookup_transcript(
+    native_session_id: str, agents: Sequence[AgentName] | None = None, *, db_path: str | None = None
+) -> TranscriptLocation | None:
+    """Return the newest indexed transcript for an exact native session id, or None."""
+    if not native_session_id:
+        return None
+    agent_sql, agent_params = _agent_filter(agents)
+    rows = _query(
+        "SELECT native_session_id, agent, transcript_path FROM transcript_paths"
+        f" WHERE native_session_id = ?{agent_sql} ORDER BY file_mtime DESC",
+        [native_session_id.lower(), *agent_params],
+        db_path,
+    )
+    return _first_existing(rows, db_path)
+
+
+def lookup_transcript_prefix(
+    prefix: str, agents: Sequence[AgentName] | None = None, *, db_path: str | None = None
+) -> TranscriptLocation | None:
+    """Return the newest indexed transcript whose native session id starts with prefix, or None."""
+    if not prefix:
+        return None
+    needle = prefix.lower()
+    agent_sql, agent_params = _agent_filter(agents)
+    rows = _query(
+        "SELECT native_session_id, agent, transcript_path FROM transcript_paths"
+        f" WHERE native_session_id >= ? AND native_session_id < ?{agent_sql} ORDER BY file_mtime DESC",
+        [needle, needle + _PREFIX_END, *agent_params],
+        db_path,
+    )
+    return _first_existing(rows, db_path)
+
+
+def record_transcript_paths(candidates: Iterable[TranscriptCandidate], *, db_path: str | None = None) -> int:
+    """Upsert index rows for discovered transcripts; returns the number of rows submitted.
+
+    The index is an accelerator: when it cannot be written (database not yet
+    migrated, read-only, locked) nothing is recorded and lookups fall back to
+    scanning.
+    """
+    indexed_at = datetime.now(UTC).isoformat()
+    rows = [
+        (
+            str(candidate.path),
+            candidate.agent.value,
+            extract_native_session_id(candidate.path, candidate.agent).lower(),
+            candidate.mtime,
+            indexed_at,
+        )
+        for candidate in candidates
+    ]
+    if not rows:
+        return 0
+    try:
+        with closing(_connect(db_path, readonly=False)) as conn:
+            conn.executemany(
+                """
+                INSERT INTO transcript_paths (transcript_path, agent, native_session_id, file_mtime, indexed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(transcript_path) DO UPDATE SET
+                    agent = excluded.agent,
+                    native_session_id = excluded.native_session_id,
+                    file_mtime = excluded.file_mtime,
+                    indexed_at = excluded.indexed_at
+                WHERE transcript_paths.file_mtime != excluded.file_mtime
+                    OR transcript_paths.native_session_id != excluded.native_session_id
+                """,
+                rows,
+            )
+            conn.commit()
+    except sqlite3.Error as exc:
+        logger.debug("Transcript path index not updated: %s", exc)
+        return 0
+    return len(rows)
+
+
+def forget_transcript_path(*transcript_paths: str, db_path: str | None = None) -> None:
+    """Remove index rows for transcripts that no longer exist."""
+    if not transcript_paths:
+        return
+    try:
+        with closing(_connect(db_path, readonly=False)) as conn:
+            conn.executemany(
+                "DELETE FROM transcript_paths WHERE transcript_path = ?", [(path,) for path in transcript_paths]
+            )
+            conn.commit()
+    except sqlite3.Error as exc:
+        logger.debug("Transcript path index not updated: %s", exc)
@@ -70,6 +70,7 @@ RESOURCE_SNAPSHOT_INTERVAL_S = float(os.getenv("RESOURCE_SNAPSHOT_INTERVAL_S", "
 LAUNCHD_WATCH_INTERVAL_S = float(os.getenv("LAUNCHD_WATCH_INTERVAL_S", "300"))
 LAUNCHD_WATCH_ENABLED = os.getenv("TELECLAUDE_LAUNCHD_WATCH", "1") == "1"
 CODEX_TRANSCRIPT_WATCH_INTERVAL_S = float(os.getenv("CODEX_TRANSCRIPT_WATCH_INTERVAL_S", "1"))
+TMUX_CONTROL_MODE_ENABLED = os.getenv("TELECLAUDE_TMUX_CONTROL_MODE", "1") == "1"
 
 logger = get_logger("teleclaude.daemon")
 
@@ -244,6 +245,9 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
         self._hook_outbox_last_backlog_warn_at: dict[str, float] = {}
         self._hook_outbox_last_lag_warn_at: dict[str, float] = {}
         self._hook_outbox_claim_paused_sessions: set[str] = set()
+        self._hook_outbox_wakeup = asyncio.Event()
+        self._hook_outbox_high_water = -1
+        self._hook_outbox_recheck_at = 0.0
         self.resource_monitor_task: asyncio.Task[object] | None = None
         self.launchd_watch_task: asyncio.Task[object] | None = None
         self._start_time = time.time()
@@ -257,6 +261,7 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
         self.webhook_delivery_task: asyncio.Task[object] | None = None
         self.channel_subscription_worker_task: asyncio.Task[object] | None = None
         self._ingest_scheduler_task: asyncio.Task[object] | None = None
+        self._correlation_checkpoint_task: asyncio.Task[object] | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
 
         self.lifecycle = DaemonLifecycle(
@@ -479,6 +484,13 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
         try:
             await self.lifecycle.startup()
 
+            # Multiplex tmux queries over one control-mode client (subprocess fallback otherwise)
+            if TMUX_CONTROL_MODE_ENABLED:
+                if await tmux_bridge.start_control_client():
+                    logger.info("tmux control-mode client connected")
+                else:
+                    logger.warning("tmux control-mode client unavailable, using per-call subprocesses")
+
             # Start periodic cleanup task (runs every hour)
             self.cleanup_task = asyncio.create_task(self.maintenance_service.periodic_cleanup())
             self.cleanup_task.add_done_callback(self._log_background_task_exception("periodic_cleanup"))
@@ -538,6 +550,9 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
             self._wal_checkpoint_task.add_done_callback(self._log_background_task_exception("wal_checkpoint"))
             logger.info("WAL checkpoint task started (interval=300s)")
 
+            if self.tts_manager.start_prewarm() is not None:
+                logger.info("TTS audio cache pre-warm started")
+
             todo_watcher = TodoWatcher(self.cache)
             self.todo_watcher_task = asyncio.create_task(todo_watcher.run())
             self.todo_watcher_task.add_done_callback(self._log_background_task_exception("todo_watcher"))
@@ -584,6 +599,7 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
             ("launchd_watch_task", "Launchd watch task stopped"),
             ("_ingest_scheduler_task", "IngestScheduler stopped"),
             ("_event_processor_task", "EventProcessor stopped"),
+            ("_correlation_checkpoint_task", "Correlation checkpoints stopped"),
         ):
             await self._cancel_task_attr(attr_name, log_message)
 
@@ -610,6 +626,8 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
             await self.task_registry.shutdown(timeout=5.0)
             logger.info("Task registry shutdown complete")
 
+        await tmux_bridge.stop_control_client()
+
         await self.lifecycle.shutdown()
 
         self._release_lock()
@@ -619,6 +637,8 @@ class TeleClaudeDaemon(_DaemonHookOutboxMixin, _DaemonEventPlatformMixin, _Daemo
         """Stop the sandbox manager before other shutdown work."""
         if not hasattr(self, "_sandbox_manager"):
             return
+        if hasattr(self, "_sandbox_bridge"):
+            await self._sandbox_bridge.close()
         try:
             await self._sandbox_manager.stop()
             logger.info("Sandbox container stopped")
@@ -77,6 +77,7 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
         _event_db: EventDB | None
         _event_processor_task: asyncio.Task[object] | None
         _ingest_scheduler_task: asyncio.Task[object] | None
+        _correlation_checkpoint_task: asyncio.Task[object] | None
         webhook_delivery_task: asyncio.Task[object] | None
         channel_subscription_worker_task: asyncio.Task[object] | None
 
@@ -273,6 +274,7 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
         self,
         context: PipelineContext,
         integration_trigger: IntegrationTriggerCartridge,
+        correlation: CorrelationCartridge,
     ) -> Pipeline:
         """Build the system event pipeline."""
         return Pipeline(
@@ -281,7 +283,7 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
                 integration_trigger,
                 DeduplicationCartridge(),
                 EnrichmentCartridge(),
-                CorrelationCartridge(),
+                correlation,
                 ClassificationCartridge(),
                 NotificationProjectorCartridge(),
                 PrepareQualityCartridge(),
@@ -313,7 +315,8 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
                 cartridges_dir=sandbox_dir,
                 producer=event_producer,
             )
-            pipeline.register(SandboxBridgeCartridge(manager=sandbox_manager))
+            sandbox_bridge = SandboxBridgeCartridge(manager=sandbox_manager)
+            pipeline.register(sandbox_bridge)
             self._start_sandbox_watch_task(
                 sandbox_manager.watch_cartridges_dir(self.shutdown_event),
                 "sandbox_cartridges_watcher",
@@ -323,6 +326,7 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
                 "sandbox_health_watcher",
             )
             self._sandbox_manager = sandbox_manager
+            self._sandbox_bridge = sandbox_bridge
             logger.info("Sandbox bridge cartridge registered (socket=%s, dir=%s)", sandbox_socket, sandbox_dir)
         except Exception as exc:
             logger.error("Sandbox subsystem init failed — skipping: %s", exc, exc_info=True)
@@ -458,7 +462,15 @@ class _DaemonEventPlatformMixin:  # pyright: ignore[reportUnusedClass]
             push_callbacks = self._build_push_callbacks()
             integration_trigger = self._build_integration_trigger()
             context = self._build_pipeline_context(event_catalog, push_callbacks, event_producer)
-            pipeline = self._build_pipeline(context, integration_trigger)
+            correlation = CorrelationCartridge()
+            pipeline = self._build_pipeline(context, integration_trigger, correlation)
+            self._correlation_checkpoint_task = asyncio.create_task(
+                correlation.run_checkpoints(context.db, context.correlation_config, self.shutdown_event),
+                name="correlation_checkpoints",
+            )
+            self._correlation_checkpoint_task.add_done_callback(
+                self._log_background_task_exception("correlation_checkpoints")
+            )
             self._register_sandbox_bridge(pipeline, event_producer)
             computer_label = self._start_event_processor(redis_client, pipeline)
             await self._emit_daemon_restarted_event(event_producer, computer_label)
@@ -41,6 +41,7 @@ logger = get_logger(__name__)
 
 
 # Hook outbox worker
+# Idle interval between cheap high-water probes for rows written by the receiver directly.
 HOOK_OUTBOX_POLL_INTERVAL_S: float = float(os.getenv("HOOK_OUTBOX_POLL_INTERVAL_S", "1"))
 HOOK_OUTBOX_BATCH_SIZE: int = int(os.getenv("HOOK_OUTBOX_BATCH_SIZE", "25"))
 HOOK_OUTBOX_LOCK_TTL_S: float = float(os.getenv("HOOK_OUTBOX_LOCK_TTL_S", "30"))
@@ -127,6 +128,9 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
         _hook_outbox_last_backlog_warn_at: dict[str, float]
         _hook_outbox_last_lag_warn_at: dict[str, float]
         _hook_outbox_claim_paused_sessions: set[str]
+        _hook_outbox_wakeup: asyncio.Event
+        _hook_outbox_high_water: int
+        _hook_outbox_recheck_at: float
         cache: DaemonCache
 
         def _queue_background_task(self, coro: Coroutine[object, object, object], label: str) -> None: ...
@@ -326,6 +330,7 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
             self._hook_outbox_last_summary_at = now
             return
 
+        p50_lag = self._percentile(self._hook_outbox_lag_samples_s, 0.50)
         p95_lag = self._percentile(self._hook_outbox_lag_samples_s, 0.95)
         p99_lag = self._percentile(self._hook_outbox_lag_samples_s, 0.99)
         logger.info(
@@ -334,6 +339,7 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
             coalesced=self._hook_outbox_coalesced_count,
             queue_depth=queue_depth,
             lag_sample_count=len(self._hook_outbox_lag_samples_s),
+            p50_lag_s=round(p50_lag, 3) if p50_lag is not None else None,
             p95_lag_s=round(p95_lag, 3) if p95_lag is not None else None,
             p99_lag_s=round(p99_lag, 3) if p99_lag is not None else None,
         )
@@ -472,7 +478,7 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
             and isinstance(native_session_id, str)
             and native_session_id
         ):
-            discovered_path = discover_codex_transcript_path(native_session_id)
+            discovered_path = await asyncio.to_thread(discover_codex_transcript_path, native_session_id)
             if discovered_path:
                 native_log_file = discovered_path
                 data["native_log_file"] = discovered_path
@@ -546,51 +552,82 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
             except Exception as exc:
                 logger.warning("WAL checkpoint failed: %s", exc)
 
+    def _wake_hook_outbox(self) -> None:
+        """Fetch immediately; called when an event arrives over the API socket."""
+        self._hook_outbox_wakeup.set()
+
+    def _schedule_hook_outbox_recheck(self, delay_s: float) -> None:
+        """Make sure the worker fetches again once a retry or paused claim comes due."""
+        due_at = time.monotonic() + max(0.0, delay_s)
+        if due_at < self._hook_outbox_recheck_at:
+            self._hook_outbox_recheck_at = due_at
+
+    async def _wait_for_hook_outbox_work(self) -> None:
+        """Sleep until there may be claimable rows.
+
+        Returns on an explicit wakeup (socket handoff), when a scheduled retry or
+        lock expiry comes due, or when the outbox high-water id moved because the
+        receiver wrote a row directly. The high-water probe is a single index
+        lookup, so an idle daemon no longer runs the full due-rows query.
+        """
+        while not self.shutdown_event.is_set():
+            timeout = min(HOOK_OUTBOX_POLL_INTERVAL_S, max(0.0, self._hook_outbox_recheck_at - time.monotonic()))
+            try:
+                await asyncio.wait_for(self._hook_outbox_wakeup.wait(), timeout=timeout)
+                return
+            except TimeoutError:
+                pass
+            if time.monotonic() >= self._hook_outbox_recheck_at:
+                return
+            high_water = await db.get_hook_outbox_high_water()
+            if high_water != self._hook_outbox_high_water:
+                self._hook_outbox_high_water = high_water
+                return
+
+    async def _paused_hook_outbox_sessions(self) -> set[str]:
+        """Sessions whose claims are paused by watermark hysteresis."""
+        candidates = set(self._session_outbox_queues) | self._hook_outbox_claim_paused_sessions
+        return {session_id for session_id in candidates if await self._should_pause_hook_outbox_claims(session_id)}
+
     async def _hook_outbox_worker(self) -> None:
         """Drain hook outbox for durable, restart-safe delivery.
 
         Dispatch model:
         - One logical serial worker per session (strict ordering inside session).
         - Different sessions are handled in parallel.
+
+        Rows accepted over the API socket wake the worker at once; rows the hook
+        receiver wrote directly are noticed by the high-water probe. Due rows are
+        selected and locked in one transaction, skipping sessions whose claims
+        are paused.
         """
+        from teleclaude.api import hook_events_routes
+
+        hook_events_routes.configure(on_enqueued=self._wake_hook_outbox)
         try:
             while not self.shutdown_event.is_set():
+                # Clear before fetching so a wakeup racing the fetch is not lost.
+                self._hook_outbox_wakeup.clear()
+                # Safety net: re-scan at least once per lock TTL so expired claims are recovered.
+                self._hook_outbox_recheck_at = time.monotonic() + HOOK_OUTBOX_LOCK_TTL_S
                 now = datetime.now(UTC)
                 now_iso = now.isoformat()
                 lock_cutoff = (now - timedelta(seconds=HOOK_OUTBOX_LOCK_TTL_S)).isoformat()
-                rows = await db.fetch_hook_outbox_batch(now_iso, HOOK_OUTBOX_BATCH_SIZE, lock_cutoff)
-
-                if not rows:
-                    self._maybe_log_hook_outbox_summary()
-                    await asyncio.sleep(HOOK_OUTBOX_POLL_INTERVAL_S)
-                    continue
+                paused = await self._paused_hook_outbox_sessions()
+                if paused:
+                    self._schedule_hook_outbox_recheck(HOOK_OUTBOX_POLL_INTERVAL_S)
+                rows = await db.claim_due_hook_outbox_batch(now_iso, HOOK_OUTBOX_BATCH_SIZE, lock_cutoff, paused)
 
-                claimable_rows: list[HookOutboxRow] = []
                 for row in rows:
-                    session_id = str(row["session_id"])
-                    if await self._should_pause_hook_outbox_claims(session_id):
-                        continue
-                    claimable_rows.append(row)
-
-                if not claimable_rows:
-                    self._maybe_log_hook_outbox_summary()
-                    await asyncio.sleep(HOOK_OUTBOX_POLL_INTERVAL_S)
-                    continue
-
-                row_ids = [int(row["id"]) for row in claimable_rows]
-                claimed_ids = await db.claim_hook_outbox_batch(row_ids, now_iso, lock_cutoff)
-
-                for row in claimable_rows:
                     if self.shutdown_event.is_set():
                         break
-                    if int(row["id"]) not in claimed_ids:
-                        continue
-
-                    session_id = str(row["session_id"])
-                    await self._enqueue_session_outbox_item(session_id, row)
+                    await self._enqueue_session_outbox_item(str(row["session_id"]), row)
 
                 self._maybe_log_hook_outbox_summary()
+                if len(rows) < HOOK_OUTBOX_BATCH_SIZE:
+                    await self._wait_for_hook_outbox_work()
         finally:
+            hook_events_routes.configure(on_enqueued=None)
             self._maybe_log_hook_outbox_summary(force=True)
 
     def _get_or_create_session_outbox_queue(self, session_id: str) -> _HookOutboxSessionQueue:
@@ -698,11 +735,9 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
         if not dropped_rows:
             return
         self._hook_outbox_coalesced_count += len(dropped_rows)
-        for dropped in dropped_rows:
-            await db.mark_hook_outbox_delivered(
-                dropped["id"],
-                error=f"coalesced:{event_type or 'unknown'}",
-            )
+        error = f"coalesced:{event_type or 'unknown'}"
+        # Issued together so the DB group-commits them into one transaction.
+        await asyncio.gather(*(db.mark_hook_outbox_delivered(dropped["id"], error=error) for dropped in dropped_rows))
 
     async def _requeue_critical_outbox_row(
         self,
@@ -722,6 +757,7 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
         attempt = int(row.get("attempt_count", 0)) + 1
         delay = self._hook_outbox_backoff(attempt)
         retry_at = (datetime.now(UTC) + timedelta(seconds=delay)).isoformat()
+        self._schedule_hook_outbox_recheck(delay)
         await db.mark_hook_outbox_failed(
             row_id=row_id or row["id"],
             attempt_count=attempt,
@@ -881,6 +917,7 @@ class _DaemonHookOutboxMixin:  # pyright: ignore[reportUnusedClass]
 
             delay = self._hook_outbox_backoff(attempt)
             next_attempt = (datetime.now(UTC) + timedelta(seconds=delay)).isoformat()
+            self._schedule_hook_outbox_recheck(delay)
             logger.error(
                 "Hook outbox dispatch failed (retrying)",
                 row_id=row_id,
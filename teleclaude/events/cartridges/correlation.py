@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -9,6 +11,7 @@ from datetime import UTC, datetime, timedelta
 from instrukt_ai_logging import get_logger
 
 from teleclaude.core.models import JsonDict
+from teleclaude.events.db import EventDB
 from teleclaude.events.envelope import EventEnvelope, EventLevel, EventVisibility
 from teleclaude.events.pipeline import PipelineContext
 
@@ -27,14 +30,163 @@ class CorrelationConfig:
     burst_threshold: int = 10
     crash_cascade_threshold: int = 3
     entity_failure_threshold: int = 3
+    bucket_seconds: int = 1
+    checkpoint_interval_seconds: int = 10
     clock: Callable[[], datetime] = lambda: datetime.now(UTC)
 
 
+class _BucketRing:
+    """Per-key event counts in time buckets, oldest first, with a running total."""
+
+    __slots__ = ("buckets", "total")
+
+    def __init__(self) -> None:
+        self.buckets: deque[list[int]] = deque()
+        self.total = 0
+
+    def add(self, bucket: int, count: int) -> None:
+        # Out-of-order timestamps fold into the newest bucket to keep eviction ordered.
+        if self.buckets and self.buckets[-1][0] >= bucket:
+            self.buckets[-1][1] += count
+        else:
+            self.buckets.append([bucket, count])
+        self.total += count
+
+    def expire(self, oldest_bucket: int) -> None:
+        while self.buckets and self.buckets[0][0] < oldest_bucket:
+            self.total -= self.buckets.popleft()[1]
+
+
+class CorrelationWindows:
+    """In-memory sliding-window counters keyed by (event_type, entity).
+
+    Increments and counts are amortized O(1): each key keeps a deque of time
+    buckets plus a running total, and expired buckets are evicted on access.
+    Per-type totals are tracked separately so type-wide counts never scan entities.
+    """
+
+    def __init__(self, window_seconds: int, bucket_seconds: int = 1) -> None:
+        self._window_seconds = window_seconds
+        self._bucket_seconds = max(1, bucket_seconds)
+        self._by_key: dict[tuple[str, str | None], _BucketRing] = {}
+        self._by_type: dict[str, _BucketRing] = {}
+
+    def _bucket(self, ts: datetime) -> int:
+        return int(ts.timestamp() // self._bucket_seconds)
+
+    def _oldest_bucket(self, now: datetime) -> int:
+        return self._bucket(now - timedelta(seconds=self._window_seconds))
+
+    def increment(self, event_type: str, entity: str | None, ts: datetime, count: int = 1) -> None:
+        bucket = self._bucket(ts)
+        key = (event_type, entity)
+        ring = self._by_key.get(key)
+        if ring is None:
+            ring = self._by_key[key] = _BucketRing()
+        ring.add(bucket, count)
+        type_ring = self._by_type.get(event_type)
+        if type_ring is None:
+            type_ring = self._by_type[event_type] = _BucketRing()
+        type_ring.add(bucket, count)
+
+    def count(self, event_type: str, entity: str | None, now: datetime) -> int:
+        """Events of ``event_type`` (optionally for one entity) within the window ending at ``now``."""
+        ring = self._by_type.get(event_type) if entity is None else self._by_key.get((event_type, entity))
+        if ring is None:
+            return 0
+        ring.expire(self._oldest_bucket(now))
+        return ring.total
+
+    def snapshot(self, now: datetime) -> list[tuple[str, str | None, datetime, int]]:
+        """Live buckets as (event_type, entity, bucket_start, count) rows; drops empty keys."""
+        oldest = self._oldest_bucket(now)
+        rows: list[tuple[str, str | None, datetime, int]] = []
+        for key, ring in list(self._by_key.items()):
+            ring.expire(oldest)
+            if not ring.buckets:
+                del self._by_key[key]
+                continue
+            event_type, entity = key
+            for bucket, count in ring.buckets:
+                rows.append((event_type, entity, datetime.fromtimestamp(bucket * self._bucket_seconds, UTC), count))
+        for event_type, ring in list(self._by_type.items()):
+            ring.expire(oldest)
+            if not ring.buckets:
+                del self._by_type[event_type]
+        return rows
+
+
 class CorrelationCartridge:
     name = "correlation"
 
     def __init__(self) -> None:
         self._emitted_bursts: set[tuple[str, int]] = set()
+        self._windows: CorrelationWindows | None = None
+        # flush() and process() can both trigger the first load; only one may run it.
+        self._windows_lock = asyncio.Lock()
+        self._last_checkpoint: datetime | None = None
+        self._dirty = False
+        # Rows written by the last checkpoint; a quiet period still needs one
+        # write once buckets expire so the persisted windows shrink too.
+        self._persisted: list[tuple[str, str | None, datetime, int]] = []
+
+    async def _load_windows(self, db: EventDB, config: CorrelationConfig, now: datetime) -> CorrelationWindows:
+        windows = CorrelationWindows(config.window_seconds, config.bucket_seconds)
+        try:
+            rows = await db.load_correlation_windows(since=now - timedelta(seconds=config.window_seconds))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("correlation: failed to restore windows from checkpoint: %s", exc)
+            rows = []
+        for event_type, entity, window_start, count in rows:
+            windows.increment(event_type, entity, window_start, count)
+        self._last_checkpoint = now
+        return windows
+
+    async def _ensure_windows(self, db: EventDB, config: CorrelationConfig, now: datetime) -> CorrelationWindows:
+        """Return the live windows, restoring them from the last checkpoint on first use."""
+        if self._windows is not None:
+            return self._windows
+        async with self._windows_lock:
+            if self._windows is None:
+                self._windows = await self._load_windows(db, config, now)
+            return self._windows
+
+    async def checkpoint(self, db: EventDB, now: datetime) -> None:
+        """Persist the live window buckets so counts survive a restart."""
+        if self._windows is None:
+            return
+        self._last_checkpoint = now
+        rows = self._windows.snapshot(now)
+        if not self._dirty and rows == self._persisted:
+            return
+        self._dirty = False
+        try:
+            await db.replace_correlation_windows(rows)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._dirty = True
+            logger.warning("correlation: checkpoint failed: %s", exc)
+            return
+        self._persisted = rows
+
+    async def flush(self, db: EventDB, config: CorrelationConfig, now: datetime) -> None:
+        """Forget burst markers from past windows and checkpoint the counters."""
+        # Restoring also drops checkpointed rows that expired while the daemon was down.
+        await self._ensure_windows(db, config, now)
+        current_window = int(now.timestamp() // config.window_seconds)
+        self._emitted_bursts = {key for key in self._emitted_bursts if key[1] >= current_window}
+        await self.checkpoint(db, now)
+
+    async def run_checkpoints(self, db: EventDB, config: CorrelationConfig, shutdown_event: asyncio.Event) -> None:
+        """Flush on the checkpoint interval even when no events arrive, and once more on exit."""
+        try:
+            while not shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(shutdown_event.wait(), timeout=config.checkpoint_interval_seconds)
+                except TimeoutError:
+                    pass
+                await self.flush(db, config, config.clock())
+        finally:
+            await self.checkpoint(db, config.clock())
 
     async def process(self, event: EventEnvelope, context: PipelineContext) -> EventEnvelope | None:
         # Skip synthetic events from correlation to prevent re-entry loops
@@ -44,13 +196,13 @@ class CorrelationCartridge:
         config = context.correlation_config
         now = config.clock()
         window_start = now - timedelta(seconds=config.window_seconds)
-        prune_before = now - timedelta(seconds=2 * config.window_seconds)
 
-        await context.db.prune_correlation_windows(older_than=prune_before)
-        await context.db.increment_correlation_window(event.event, event.entity, now)
+        windows = await self._ensure_windows(context.db, config, now)
+        windows.increment(event.event, event.entity, now)
+        self._dirty = True
 
         # Burst detection: N events of same type in window — emit once per window bucket
-        burst_count = await context.db.get_correlation_count(event.event, None, window_start)
+        burst_count = windows.count(event.event, None, now)
         if burst_count >= config.burst_threshold:
             window_bucket = int(now.timestamp() // config.window_seconds)
             burst_key = (event.event, window_bucket)
@@ -68,7 +220,7 @@ class CorrelationCartridge:
 
         # Crash cascade detection
         if event.event == "system.worker.crashed":
-            crash_count = await context.db.get_correlation_count("system.worker.crashed", None, window_start)
+            crash_count = windows.count("system.worker.crashed", None, now)
             if crash_count >= config.crash_cascade_threshold:
                 workers = [event.entity] if event.entity else []
                 await self._emit_synthetic(
@@ -83,7 +235,7 @@ class CorrelationCartridge:
 
         # Entity failure detection
         if event.entity is not None and _is_failure_type(event.event):
-            entity_fail_count = await context.db.get_correlation_count(event.event, event.entity, window_start)
+            entity_fail_count = windows.count(event.event, event.entity, now)
             if entity_fail_count >= config.entity_failure_threshold:
                 await self._emit_synthetic(
                     "system.entity.degraded",
@@ -95,6 +247,10 @@ class CorrelationCartridge:
                     context,
                 )
 
+        last_checkpoint = self._last_checkpoint
+        if last_checkpoint is None or (now - last_checkpoint).total_seconds() >= config.checkpoint_interval_seconds:
+            await self.flush(context.db, config, now)
+
         return event
 
     async def _emit_synthetic(self, event_type: str, payload: JsonDict, context: PipelineContext) -> None:
@@ -31,11 +31,18 @@ class EventSchema(BaseModel):
 class EventCatalog:
     def __init__(self) -> None:
         self._registry: dict[str, EventSchema] = {}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Bumped on every registration; lets consumers cache derived views."""
+        return self._revision
 
     def register(self, schema: EventSchema) -> None:
         if schema.event_type in self._registry:
             raise ValueError(f"Event type already registered: {schema.event_type}")
         self._registry[schema.event_type] = schema
+        self._revision += 1
 
     def get(self, event_type: str) -> EventSchema | None:
         return self._registry.get(event_type)
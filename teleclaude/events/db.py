@@ -392,30 +392,22 @@ class EventDB:
 
     # --- Correlation window methods ---
 
-    async def increment_correlation_window(self, event_type: str, entity: str | None, ts: datetime) -> None:
-        await self._db().execute(
-            "INSERT INTO correlation_windows (event_type, entity, window_start, count) VALUES (?, ?, ?, 1)",
-            (event_type, entity, ts.isoformat()),
+    async def load_correlation_windows(self, since: datetime) -> list[tuple[str, str | None, datetime, int]]:
+        """Return persisted (event_type, entity, window_start, count) rows newer than ``since``."""
+        cursor = await self._db().execute(
+            "SELECT event_type, entity, window_start, count FROM correlation_windows "
+            "WHERE window_start >= ? ORDER BY window_start",
+            (since.isoformat(),),
         )
-        await self._db().commit()
-
-    async def get_correlation_count(self, event_type: str, entity: str | None, since: datetime) -> int:
-        if entity is None:
-            cursor = await self._db().execute(
-                "SELECT COALESCE(SUM(count), 0) FROM correlation_windows WHERE event_type = ? AND window_start >= ?",
-                (event_type, since.isoformat()),
-            )
-        else:
-            cursor = await self._db().execute(
-                "SELECT COALESCE(SUM(count), 0) FROM correlation_windows WHERE event_type = ? AND entity = ? AND window_start >= ?",
-                (event_type, entity, since.isoformat()),
-            )
-        row = await cursor.fetchone()
-        return int(row[0]) if row else 0
-
-    async def prune_correlation_windows(self, older_than: datetime) -> None:
-        await self._db().execute(
-            "DELETE FROM correlation_windows WHERE window_start < ?",
-            (older_than.isoformat(),),
+        rows = await cursor.fetchall()
+        return [(row[0], row[1], datetime.fromisoformat(row[2]), int(row[3])) for row in rows]
+
+    async def replace_correlation_windows(self, rows: list[tuple[str, str | None, datetime, int]]) -> None:
+        """Replace all correlation windows with an in-memory snapshot in one transaction."""
+        conn = self._db()
+        await conn.execute("DELETE FROM correlation_windows")
+        await conn.executemany(
+            "INSERT INTO correlation_windows (event_type, entity, window_start, count) VALUES (?, ?, ?, ?)",
+            [(event_type, entity, window_start.isoformat(), count) for event_type, entity, window_start, count in rows],
         )
-        await self._db().commit()
+        await conn.commit()
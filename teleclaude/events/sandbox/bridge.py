@@ -2,19 +2,29 @@
 
 Routes events to sandbox cartridges running inside the Docker sidecar.
 All failures are caught and logged; the approved pipeline result is never blocked.
+
+Requests share one long-lived connection, multiplexed by request id, and the
+cartridges for an event are invoked concurrently. The event catalog snapshot
+is only sent when the runner has not yet seen the current catalog version.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
+import json
+import os
 
 from instrukt_ai_logging import get_logger
 
 from teleclaude.core.models import JsonDict
+from teleclaude.events.catalog import EventCatalog
 from teleclaude.events.envelope import EventEnvelope
 from teleclaude.events.pipeline import PipelineContext
 from teleclaude.events.sandbox.container import SandboxContainerManager, scan_cartridges
 from teleclaude.events.sandbox.protocol import (
+    CATALOG_UNKNOWN,
     FrameTooLargeError,
     SandboxRequest,
     read_frame,
@@ -28,11 +38,106 @@ logger = get_logger(__name__)
 _CARTRIDGE_TIMEOUT = 10.0  # seconds per cartridge call
 
 
+class _SandboxChannel:
+    """One persistent runner connection carrying concurrent requests.
+
+    A background reader resolves each request's future by the id echoed in the
+    response. Any read or write failure drops the connection and fails every
+    outstanding request; the next request reconnects.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self._socket_path = socket_path
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task[None] | None = None
+        self._pending: dict[str, asyncio.Future[JsonDict]] = {}
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        # Catalog version the runner is known to hold for this connection.
+        self.catalog_version: str | None = None
+
+    async def request(self, request: SandboxRequest) -> JsonDict:
+        writer = await self._connect()
+        request_id = str(next(self._ids))
+        request.request_id = request_id
+        future: asyncio.Future[JsonDict] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            try:
+                async with self._write_lock:
+                    await write_frame(writer, request_to_dict(request))
+            except (ConnectionError, OSError) as exc:
+                self._disconnect(exc)
+                raise
+            return await asyncio.wait_for(future, timeout=_CARTRIDGE_TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        self._disconnect(ConnectionError("sandbox channel closed"))
+        task = self._read_task
+        self._read_task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return self._writer
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self._socket_path),
+                timeout=_CARTRIDGE_TIMEOUT,
+            )
+            self._writer = writer
+            self.catalog_version = None
+            self._read_task = asyncio.create_task(self._read_responses(reader, writer))
+            return writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        error: BaseException = ConnectionError("sandbox runner closed the connection")
+        try:
+            while True:
+                raw = await read_frame(reader)
+                future = self._pending.pop(str(raw.get("request_id")), None)
+                if future is not None and not future.done():
+                    future.set_result(raw)
+        except asyncio.IncompleteReadError:
+            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = exc
+        finally:
+            if self._writer is writer:
+                self._disconnect(error)
+
+    def _disconnect(self, error: BaseException) -> None:
+        writer = self._writer
+        self._writer = None
+        self.catalog_version = None
+        if writer is not None:
+            writer.close()
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+
 class SandboxBridgeCartridge:
     name = "sandbox-bridge"
 
     def __init__(self, manager: SandboxContainerManager) -> None:
         self._manager = manager
+        self._channel: _SandboxChannel | None = None
+        self._cartridges_key: tuple[str, int] | None = None
+        self._cartridge_names: list[str] = []
+        self._catalog: EventCatalog | None = None
+        self._catalog_revision = -1
+        self._catalog_version = ""
+        self._catalog_snapshot: list[JsonDict] = []
 
     async def process(self, event: EventEnvelope, context: PipelineContext) -> EventEnvelope | None:
         try:
@@ -41,56 +146,90 @@ class SandboxBridgeCartridge:
             logger.error("Sandbox bridge unexpected error: %s", exc, exc_info=True)
             return event
 
+    async def close(self) -> None:
+        """Drop the runner connection."""
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+
     async def _process(self, event: EventEnvelope, context: PipelineContext) -> EventEnvelope:
         if not self._manager.has_cartridges or self._manager.permanently_failed or self._manager.docker_unavailable:
             return event
 
-        cartridge_names = scan_cartridges(self._manager.cartridges_dir)
+        cartridge_names = self._scan_cartridges()
         if not cartridge_names:
             return event
 
-        results: list[JsonDict] = []
-
-        # Build catalog snapshot from context
-        catalog_snapshot = [schema.model_dump() for schema in context.catalog.list_all()]
+        self._refresh_catalog(context.catalog)
+        envelope: JsonDict = event.to_stream_dict()  # type: ignore[assignment]
+        results = await asyncio.gather(*(self._invoke_cartridge(name, envelope) for name in cartridge_names))
 
-        for name in cartridge_names:
-            result_entry = await self._invoke_cartridge(name, event, catalog_snapshot)
-            results.append(result_entry)
-
-        event.payload["_sandbox_results"] = results
+        event.payload["_sandbox_results"] = list(results)
         return event
 
-    async def _invoke_cartridge(
-        self,
-        cartridge_name: str,
-        event: EventEnvelope,
-        catalog_snapshot: list[JsonDict],
-    ) -> JsonDict:
+    def _scan_cartridges(self) -> list[str]:
+        """Cartridge names, rescanned only when the directory's mtime changes."""
+        cartridges_dir = self._manager.cartridges_dir
         try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_unix_connection(self._manager.socket_path),
-                timeout=_CARTRIDGE_TIMEOUT,
+            mtime_ns = os.stat(cartridges_dir).st_mtime_ns
+        except OSError:
+            self._cartridges_key = None
+            return scan_cartridges(cartridges_dir)
+        key = (cartridges_dir, mtime_ns)
+        if key != self._cartridges_key:
+            self._cartridge_names = scan_cartridges(cartridges_dir)
+            self._cartridges_key = key
+        return self._cartridge_names
+
+    def _refresh_catalog(self, catalog: EventCatalog) -> None:
+        if catalog is self._catalog and catalog.revision == self._catalog_revision:
+            return
+        snapshot = [schema.model_dump(mode="json") for schema in catalog.list_all()]
+        encoded = json.dumps(snapshot, sort_keys=True).encode("utf-8")
+        self._catalog = catalog
+        self._catalog_revision = catalog.revision
+        self._catalog_snapshot = snapshot
+        self._catalog_version = hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _get_channel(self) -> _SandboxChannel:
+        if self._channel is None:
+            self._channel = _SandboxChannel(self._manager.socket_path)
+        return self._channel
+
+    async def _call(self, cartridge_name: str, envelope: JsonDict) -> JsonDict:
+        channel = self._get_channel()
+        version = self._catalog_version
+        send_snapshot = channel.catalog_version != version
+        raw = await channel.request(
+            SandboxRequest(
+                cartridge_name=cartridge_name,
+                envelope=envelope,
+                catalog_snapshot=self._catalog_snapshot if send_snapshot else None,
+                catalog_version=version,
             )
-            try:
-                request = SandboxRequest(
+        )
+        if raw.get("error") == CATALOG_UNKNOWN:
+            # The runner restarted or evicted this version; resend it once.
+            raw = await channel.request(
+                SandboxRequest(
                     cartridge_name=cartridge_name,
-                    envelope=event.to_stream_dict(),  # type: ignore[arg-type]
-                    catalog_snapshot=catalog_snapshot,
+                    envelope=envelope,
+                    catalog_snapshot=self._catalog_snapshot,
+                    catalog_version=version,
                 )
-                await write_frame(writer, request_to_dict(request))
-                raw = await asyncio.wait_for(read_frame(reader), timeout=_CARTRIDGE_TIMEOUT)
-                response = response_from_dict(raw)
-                if response.error:
-                    logger.warning("Sandbox cartridge %r returned error: %s", cartridge_name, response.error)
-                    return {"cartridge": cartridge_name, "error": response.error}
-                return {"cartridge": cartridge_name, "result": response.envelope}
-            finally:
-                writer.close()
-                try:
-                    await writer.wait_closed()
-                except Exception:
-                    pass
+            )
+            send_snapshot = True
+        if send_snapshot and raw.get("error") != CATALOG_UNKNOWN:
+            channel.catalog_version = version
+        return raw
+
+    async def _invoke_cartridge(self, cartridge_name: str, envelope: JsonDict) -> JsonDict:
+        try:
+            response = response_from_dict(await self._call(cartridge_name, envelope))
+            if response.error:
+                logger.warning("Sandbox cartridge %r returned error: %s", cartridge_name, response.error)
+                return {"cartridge": cartridge_name, "error": response.error}
+            return {"cartridge": cartridge_name, "result": response.envelope}
         except TimeoutError:
             logger.warning("Sandbox cartridge %r timed out", cartridge_name)
             return {"cartridge": cartridge_name, "error": "timeout"}
@@ -2,6 +2,12 @@
 
 Wire format: 4-byte big-endian length prefix (bytes) followed by UTF-8 JSON body.
 Frame size limit: 4 MB.
+
+A connection carries any number of requests. Requests tagged with a
+``request_id`` may be answered out of order; the response echoes the id. A
+request names the catalog version it was built against and only carries the
+catalog snapshot when the runner may not have seen that version yet; a runner
+that does not know the version answers with ``CATALOG_UNKNOWN``.
 """
 
 from __future__ import annotations
@@ -18,6 +24,8 @@ _MAX_FRAME_BYTES = 4 * 1024 * 1024  # 4 MB
 _HEADER_FMT = ">I"  # big-endian unsigned 32-bit int
 _HEADER_SIZE = struct.calcsize(_HEADER_FMT)
 
+CATALOG_UNKNOWN = "catalog_unknown"
+
 
 class FrameTooLargeError(Exception):
     """Raised when a message exceeds the 4 MB frame limit."""
@@ -27,7 +35,9 @@ class FrameTooLargeError(Exception):
 class SandboxRequest:
     cartridge_name: str
     envelope: JsonDict
-    catalog_snapshot: list[JsonDict] = field(default_factory=list)
+    catalog_snapshot: list[JsonDict] | None = field(default_factory=list)
+    catalog_version: str | None = None
+    request_id: str | None = None
 
 
 @dataclass
@@ -35,6 +45,7 @@ class SandboxResponse:
     envelope: JsonDict | None
     error: str | None
     duration_ms: float
+    request_id: str | None = None
 
 
 def encode_message(obj: JsonDict) -> bytes:
@@ -71,30 +82,35 @@ async def write_frame(writer: asyncio.StreamWriter, obj: JsonDict) -> None:
 
 
 def request_to_dict(req: SandboxRequest) -> JsonDict:
-    return {
-        "cartridge_name": req.cartridge_name,
-        "envelope": req.envelope,
-        "catalog_snapshot": cast(list[JsonValue], req.catalog_snapshot),
-    }
+    data: JsonDict = {"cartridge_name": req.cartridge_name, "envelope": req.envelope}
+    if req.catalog_snapshot is not None:
+        data["catalog_snapshot"] = cast(list[JsonValue], req.catalog_snapshot)
+    if req.catalog_version is not None:
+        data["catalog_version"] = req.catalog_version
+    if req.request_id is not None:
+        data["request_id"] = req.request_id
+    return data
 
 
 def request_from_dict(d: JsonDict) -> SandboxRequest:
     return SandboxRequest(
         cartridge_name=d["cartridge_name"],  # type: ignore[arg-type]
         envelope=d["envelope"],  # type: ignore[arg-type]
-        catalog_snapshot=d.get("catalog_snapshot", []),  # type: ignore[arg-type]
+        catalog_snapshot=d.get("catalog_snapshot"),  # type: ignore[arg-type]
+        catalog_version=d.get("catalog_version"),  # type: ignore[arg-type]
+        request_id=d.get("request_id"),  # type: ignore[arg-type]
     )
 
 
 def response_to_dict(resp: SandboxResponse) -> JsonDict:
-    return cast(
-        JsonDict,
-        {
-            "envelope": resp.envelope,
-            "error": resp.error,
-            "duration_ms": resp.duration_ms,
-        },
-    )
+    data: JsonDict = {
+        "envelope": resp.envelope,
+        "error": resp.error,
+        "duration_ms": resp.duration_ms,
+    }
+    if resp.request_id is not None:
+        data["request_id"] = resp.request_id
+    return data
 
 
 def response_from_dict(d: JsonDict) -> SandboxResponse:
@@ -102,4 +118,5 @@ def response_from_dict(d: JsonDict) -> SandboxResponse:
         envelope=d.get("envelope"),  # type: ignore[arg-type]
         error=d.get("error"),  # type: ignore[arg-type]
         duration_ms=d.get("duration_ms", 0.0),  # type: ignore[arg-type]
+        request_id=d.get("request_id"),  # type: ignore[arg-type]
     )
@@ -1,8 +1,10 @@
 """Sandbox runner — Unix socket server running inside the Docker sidecar.
 
 Listens for SandboxRequest frames, loads and executes the addressed cartridge,
-and returns an SandboxResponse frame. Each request reloads the cartridge from disk
-(hot-reload, no module cache).
+and returns an SandboxResponse frame. A connection may carry many requests;
+each runs on its own task so independent cartridges execute concurrently.
+Cartridge modules are cached by file mtime and size (edits still hot-reload),
+and catalogs are cached by the version the bridge sends.
 """
 
 from __future__ import annotations
@@ -11,6 +13,7 @@ import asyncio
 import importlib.util
 import time
 import types
+from collections import OrderedDict
 from pathlib import Path
 
 from instrukt_ai_logging import get_logger
@@ -20,7 +23,9 @@ from teleclaude.events.catalog import EventCatalog, EventSchema
 from teleclaude.events.envelope import EventEnvelope
 from teleclaude.events.pipeline import PipelineContext
 from teleclaude.events.sandbox.protocol import (
+    CATALOG_UNKNOWN,
     FrameTooLargeError,
+    SandboxRequest,
     SandboxResponse,
     read_frame,
     request_from_dict,
@@ -31,6 +36,7 @@ from teleclaude.events.sandbox.protocol import (
 logger = get_logger(__name__)
 
 _CARTRIDGE_TIMEOUT = 10.0  # seconds
+_CATALOG_CACHE_SIZE = 4  # catalog versions kept; old ones are only needed mid-rollover
 
 
 def _build_catalog_from_snapshot(snapshot: list[JsonDict]) -> EventCatalog:
@@ -58,10 +64,35 @@ def _load_cartridge_module(cartridges_dir: str, cartridge_name: str) -> types.Mo
     return module
 
 
+class _CartridgeModuleCache:
+    """Loaded cartridge modules, reloaded when the file's mtime or size changes."""
+
+    def __init__(self, cartridges_dir: str) -> None:
+        self._cartridges_dir = cartridges_dir
+        self._modules: dict[str, tuple[tuple[int, int], types.ModuleType]] = {}
+
+    def get(self, cartridge_name: str) -> types.ModuleType:
+        path = Path(self._cartridges_dir) / f"{cartridge_name}.py"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._modules.pop(cartridge_name, None)
+            raise FileNotFoundError(f"Cartridge not found: {path}") from None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._modules.get(cartridge_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        module = _load_cartridge_module(self._cartridges_dir, cartridge_name)
+        self._modules[cartridge_name] = (signature, module)
+        return module
+
+
 class SandboxRunner:
     def __init__(self, socket_path: str, cartridges_dir: str) -> None:
         self._socket_path = socket_path
         self._cartridges_dir = cartridges_dir
+        self._modules = _CartridgeModuleCache(cartridges_dir)
+        self._catalogs: OrderedDict[str, EventCatalog] = OrderedDict()
 
     async def start(self, shutdown_event: asyncio.Event) -> None:
         server = await asyncio.start_unix_server(self._handle_client, path=self._socket_path)
@@ -71,49 +102,97 @@ class SandboxRunner:
         logger.info("SandboxRunner shutting down")
 
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
         try:
-            raw = await read_frame(reader)
-            request = request_from_dict(raw)
-
-            # Ping handler — health check, no disk access
-            if request.cartridge_name == "__ping__":
-                await write_frame(writer, response_to_dict(SandboxResponse(envelope=None, error=None, duration_ms=0.0)))
-                return
-
-            start = time.monotonic()
-            try:
-                module = _load_cartridge_module(self._cartridges_dir, request.cartridge_name)
-                process_fn = getattr(module, "process", None)
-                if not callable(process_fn):
-                    raise AttributeError(f"Cartridge {request.cartridge_name!r} has no callable 'process'")
-
-                envelope = EventEnvelope.from_stream_dict(request.envelope)  # type: ignore[arg-type]
-                catalog = _build_catalog_from_snapshot(request.catalog_snapshot)
-                context = PipelineContext(catalog=catalog, db=None)
-
-                result: EventEnvelope | None = await asyncio.wait_for(
-                    process_fn(envelope, context), timeout=_CARTRIDGE_TIMEOUT
-                )
-                duration_ms = (time.monotonic() - start) * 1000
-                result_dict = result.to_stream_dict() if result is not None else None
-                response = SandboxResponse(envelope=result_dict, error=None, duration_ms=duration_ms)  # type: ignore[arg-type]
-            except TimeoutError:
-                duration_ms = (time.monotonic() - start) * 1000
-                logger.warning("Cartridge %r timed out after %.0fms", request.cartridge_name, duration_ms)
-                response = SandboxResponse(envelope=None, error="timeout", duration_ms=duration_ms)
-            except Exception as exc:
-                duration_ms = (time.monotonic() - start) * 1000
-                logger.exception("Cartridge %r raised: %s", request.cartridge_name, exc)
-                response = SandboxResponse(envelope=None, error=str(exc), duration_ms=duration_ms)
-
-            await write_frame(writer, response_to_dict(response))
+            while True:
+                try:
+                    raw = await read_frame(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                task = asyncio.create_task(self._respond(request_from_dict(raw), writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
         except FrameTooLargeError as exc:
-            logger.warning("Frame too large, dropping: %s", exc)
+            logger.warning("Frame too large, dropping connection: %s", exc)
         except Exception as exc:
             logger.error("Unexpected error handling sandbox client: %s", exc, exc_info=True)
         finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
             try:
                 writer.close()
                 await writer.wait_closed()
             except Exception:
                 pass
+
+    async def _respond(self, request: SandboxRequest, writer: asyncio.StreamWriter, write_lock: asyncio.Lock) -> None:
+        response = await self._run_request(request)
+        response.request_id = request.request_id
+        try:
+            async with write_lock:
+                await write_frame(writer, response_to_dict(response))
+        except FrameTooLargeError as exc:
+            logger.warning("Response for %r too large: %s", request.cartridge_name, exc)
+            async with write_lock:
+                await write_frame(
+                    writer,
+                    response_to_dict(
+                        SandboxResponse(
+                            envelope=None,
+                            error="frame_too_large",
+                            duration_ms=response.duration_ms,
+                            request_id=request.request_id,
+                        )
+                    ),
+                )
+        except (ConnectionError, OSError) as exc:
+            logger.debug("Sandbox client went away before response: %s", exc)
+
+    def _catalog_for(self, request: SandboxRequest) -> EventCatalog | None:
+        version = request.catalog_version
+        if version is None:
+            return _build_catalog_from_snapshot(request.catalog_snapshot or [])
+        catalog = self._catalogs.get(version)
+        if catalog is not None:
+            self._catalogs.move_to_end(version)
+            return catalog
+        if request.catalog_snapshot is None:
+            return None
+        catalog = self._catalogs[version] = _build_catalog_from_snapshot(request.catalog_snapshot)
+        while len(self._catalogs) > _CATALOG_CACHE_SIZE:
+            self._catalogs.popitem(last=False)
+        return catalog
+
+    async def _run_request(self, request: SandboxRequest) -> SandboxResponse:
+        # Ping handler — health check, no disk access
+        if request.cartridge_name == "__ping__":
+            return SandboxResponse(envelope=None, error=None, duration_ms=0.0)
+
+        start = time.monotonic()
+        try:
+            catalog = self._catalog_for(request)
+            if catalog is None:
+                return SandboxResponse(envelope=None, error=CATALOG_UNKNOWN, duration_ms=0.0)
+            module = self._modules.get(request.cartridge_name)
+            process_fn = getattr(module, "process", None)
+            if not callable(process_fn):
+                raise AttributeError(f"Cartridge {request.cartridge_name!r} has no callable 'process'")
+
+            envelope = EventEnvelope.from_stream_dict(request.envelope)  # type: ignore[arg-type]
+            context = PipelineContext(catalog=catalog, db=None)
+
+            result: EventEnvelope | None = await asyncio.wait_for(
+                process_fn(envelope, context), timeout=_CARTRIDGE_TIMEOUT
+            )
+            duration_ms = (time.monotonic() - start) * 1000
+            result_dict = result.to_stream_dict() if result is not None else None
+            return SandboxResponse(envelope=result_dict, error=None, duration_ms=duration_ms)  # type: ignore[arg-type]
+        except TimeoutError:
+            duration_ms = (time.monotonic() - start) * 1000
+            logger.warning("Cartridge %r timed out after %.0fms", request.cartridge_name, duration_ms)
+            return SandboxResponse(envelope=None, error="timeout", duration_ms=duration_ms)
+        except Exception as exc:
+            duration_ms = (time.monotonic() - start) * 1000
+            logger.exception("Cartridge %r raised: %s", request.cartridge_name, exc)
+            return SandboxResponse(envelope=None, error=str(exc), duration_ms=duration_ms)
@@ -13,6 +13,7 @@ import httpx
 
 from teleclaude.constants import API_SOCKET_PATH
 from teleclaude.core.agents import AgentName
+from teleclaude.core.transcript_paths import lookup_transcript_prefix, record_transcript_paths
 from teleclaude.mirrors.store import MirrorRecord, MirrorSearchResult, get_mirror, search_mirrors
 from teleclaude.utils.transcript import parse_session_transcript
 from teleclaude.utils.transcript_discovery import discover_transcripts, extract_session_id
@@ -65,9 +66,19 @@ def _coerce_remote_rows(payload: object) -> list[RemoteMirrorRow]:
 
 
 def find_transcript(agents: Sequence[AgentName], session_id: str) -> tuple[Path, AgentName] | None:
-    """Find a transcript file by session ID prefix across agents."""
+    """Find a transcript file by session ID prefix across agents.
+
+    Native session ids resolve through the transcript path index. Anything
+    else (a mirror session id, a fragment of a file name) falls back to a scan,
+    which also refreshes the index for the next lookup.
+    """
+    indexed = lookup_transcript_prefix(session_id, agents)
+    if indexed is not None:
+        return indexed.path, indexed.agent
     needle = session_id.lower()
-    for candidate in discover_transcripts(agents):
+    candidates = discover_transcripts(agents)
+    record_transcript_paths(candidates)
+    for candidate in candidates:
         extracted = extract_session_id(candidate.path, candidate.agent).lower()
         if extracted.startswith(needle) or candidate.path.stem.lower().startswith(needle):
             return candidate.path, candidate.agent
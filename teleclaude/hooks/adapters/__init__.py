@@ -13,6 +13,7 @@ __all__ = [
     "GeminiAdapter",
     "HookAdapter",
     "get_adapter",
+    "get_adapter_names",
 ]
 
 _ADAPTERS: dict[str, HookAdapter] = {
@@ -25,3 +26,8 @@ _ADAPTERS: dict[str, HookAdapter] = {
 def get_adapter(agent: str) -> HookAdapter:
     """Get the hook adapter for an agent."""
     return _ADAPTERS[agent]
+
+
+def get_adapter_names() -> tuple[str, ...]:
+    """Agent names with a registered hook adapter."""
+    return tuple(_ADAPTERS)
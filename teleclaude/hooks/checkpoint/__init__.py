@@ -313,7 +313,20 @@ def get_checkpoint_content(
             )
             return None
 
-        git_files = _get_uncommitted_files(project_path)
+        if transcript_path:
+            timeline = extract_tool_calls_current_turn(transcript_path, agent_name)
+        else:
+            timeline = TurnTimeline(tool_calls=[], has_data=False)
+
+        # Only files the turn touched can survive scoping below, so a turn
+        # without touched files needs no git call and the diff is limited to
+        # the touched paths otherwise.
+        touched_files: set[str] = set()
+        if timeline.has_data:
+            touched_files, _ = _extract_turn_file_signals(timeline, project_path)
+        git_files: list[str] | None = []
+        if touched_files:
+            git_files = _get_uncommitted_files(project_path, touched_files)
         if git_files is None:
             logger.warning(
                 "Checkpoint payload fallback to generic message (git unavailable)",
@@ -321,11 +334,6 @@ def get_checkpoint_content(
             )
             return CHECKPOINT_MESSAGE  # git unavailable — fall back to generic
 
-        if transcript_path:
-            timeline = extract_tool_calls_current_turn(transcript_path, agent_name)
-        else:
-            timeline = TurnTimeline(tool_calls=[], has_data=False)
-
         effective_git_files = _scope_git_files_to_current_turn(
             git_files,
             timeline,
@@ -3,8 +3,7 @@
 import logging
 import re
 import shlex
-import subprocess
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from fnmatch import fnmatch
 from pathlib import Path
 
@@ -14,10 +13,14 @@ from teleclaude.constants import (
     FileCategory,
 )
 from teleclaude.hooks.checkpoint._models import TranscriptObservability
+from teleclaude.utils.git_query import git_query
 from teleclaude.utils.transcript import TurnTimeline
 
 logger = logging.getLogger(__name__)
 
+# Longer path lists fall back to a full diff rather than an unbounded argv.
+_MAX_DIFF_PATHSPECS = 200
+
 __all__ = [
     "_canonical_tool_name",
     "_categorize_files",
@@ -65,41 +68,28 @@ def _is_checkpoint_project_supported(project_path: str) -> bool:
     return has_checkpoint and has_next_work
 
 
-def _get_uncommitted_files(project_path: str) -> list[str] | None:
+def _get_uncommitted_files(project_path: str, paths: Iterable[str] | None = None) -> list[str] | None:
     """Run git diff --name-only HEAD to get uncommitted changed files.
 
+    When ``paths`` is given the diff is limited to those project-relative
+    paths, so git only stats files the turn actually touched.
+
     Returns None if git is unavailable or the command fails (fail-open).
     """
-
-    def _run_git_diff_name_only() -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
-            ["git", "diff", "--name-only", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=project_path or None,
-        )
+    query = git_query(project_path)
+    diff_args = ["diff", "--name-only", "HEAD"]
+    pathspecs = sorted(paths) if paths is not None else []
+    if pathspecs and len(pathspecs) <= _MAX_DIFF_PATHSPECS:
+        diff_args = ["--literal-pathspecs", *diff_args, "--", *pathspecs]
 
     def _normalize_non_bare_repo() -> bool:
-        bare_probe = subprocess.run(
-            ["git", "rev-parse", "--is-bare-repository"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=project_path or None,
-        )
+        bare_probe = query.run(["rev-parse", "--is-bare-repository"])
         if bare_probe.returncode != 0:
             return False
         if bare_probe.stdout.strip().lower() != "true":
             return True
 
-        normalize = subprocess.run(
-            ["git", "config", "--local", "core.bare", "false"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=project_path or None,
-        )
+        normalize = query.run(["config", "--local", "core.bare", "false"])
         if normalize.returncode != 0:
             logger.warning(
                 "Checkpoint git self-heal failed: unable to set core.bare=false for %s",
@@ -113,11 +103,12 @@ def _get_uncommitted_files(project_path: str) -> list[str] | None:
         return True
 
     try:
-        _normalize_non_bare_repo()
-        result = _run_git_diff_name_only()
+        # A healthy worktree answers in one fork; the bare-repo self-heal only
+        # runs when git refuses the diff for lack of a work tree.
+        result = query.run(diff_args)
         if result.returncode != 0 and "must be run in a work tree" in (result.stderr or "").lower():
             if _normalize_non_bare_repo():
-                result = _run_git_diff_name_only()
+                result = query.run(diff_args)
         if result.returncode != 0:
             return None
         files = [f.strip() for f in result.stdout.strip().splitlines() if f.strip()]
@@ -1,10 +1,22 @@
-"""Outbound webhook delivery worker."""
+"""Outbound webhook delivery worker.
+
+Due outbox rows are claimed in batches with one atomic statement and delivered
+concurrently by a bounded pool. Each target URL gets its own concurrency limit
+and circuit breaker, so a slow or dead subscriber only delays its own rows:
+while a target is saturated or its breaker is open its rows are left unclaimed.
+One shared ``httpx.AsyncClient`` keeps connections alive per host.
+
+On cancellation the worker hands its undelivered rows back to the outbox; rows
+left locked by a worker that died are claimed again once their lock expires.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
 import hmac
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -25,6 +37,14 @@ WEBHOOK_BASE_BACKOFF_S = 1.0
 WEBHOOK_MAX_BACKOFF_S = 60.0
 WEBHOOK_DELIVERY_TIMEOUT_S = 10.0
 WEBHOOK_MAX_ATTEMPTS = 10
+WEBHOOK_WORKER_CONCURRENCY = 16
+WEBHOOK_TARGET_CONCURRENCY = 4
+WEBHOOK_KEEPALIVE_EXPIRY_S = 30.0
+WEBHOOK_BREAKER_FAILURE_THRESHOLD = 5
+WEBHOOK_BREAKER_RESET_S = 30.0
+# A claim older than this belongs to a worker that died mid-delivery; the row is
+# claimable again. Well past the delivery timeout so live deliveries keep their rows.
+WEBHOOK_LOCK_EXPIRY_S = 6 * WEBHOOK_DELIVERY_TIMEOUT_S
 
 
 def compute_signature(body: bytes, secret: str) -> str:
@@ -39,15 +59,100 @@ def compute_backoff(attempt: int) -> float:
     return min(delay, WEBHOOK_MAX_BACKOFF_S)
 
 
+class CircuitBreaker:
+    """Consecutive-failure breaker for one delivery target.
+
+    Closed: deliveries flow. After ``threshold`` consecutive failures it opens
+    for ``reset_s``; then a single trial delivery is let through (half-open),
+    which closes it on success or re-opens it on failure.
+    """
+
+    def __init__(
+        self,
+        threshold: int = WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+        reset_s: float = WEBHOOK_BREAKER_RESET_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold = threshold
+        self.reset_s = reset_s
+        self._clock = clock
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._opened_at is None
+
+    def accepting(self) -> bool:
+        """True when a delivery to this target may start now."""
+        if self._opened_at is None:
+            return True
+        return not self._probing and self._clock() >= self._opened_at + self.reset_s
+
+    def allow(self) -> bool:
+        """Like ``accepting``, but claims the half-open trial slot."""
+        if not self.accepting():
+            return False
+        if self._opened_at is not None:
+            self._probing = True
+        return True
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker lets a trial delivery through."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_s - self._clock())
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True when this failure opened the breaker."""
+        self.failures += 1
+        was_closed = self._opened_at is None
+        if self._probing or self.failures >= self.threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+        return was_closed and self._opened_at is not None
+
+
 class WebhookDeliveryWorker:
     """Background worker that delivers webhooks from the outbox."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        concurrency: int = WEBHOOK_WORKER_CONCURRENCY,
+        target_concurrency: int = WEBHOOK_TARGET_CONCURRENCY,
+        breaker_threshold: int = WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+        breaker_reset_s: float = WEBHOOK_BREAKER_RESET_S,
+    ) -> None:
         self._client: httpx.AsyncClient | None = None
+        self.concurrency = concurrency
+        self.target_concurrency = target_concurrency
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset_s = breaker_reset_s
+        self._in_flight: set[asyncio.Task[None]] = set()
+        # Claimed rows not yet delivered, failed or deferred, by row id.
+        self._claimed: set[int] = set()
+        # Claimed-but-unfinished rows per target URL, and the slots they deliver through.
+        self._pending: dict[str, int] = {}
+        self._target_slots: dict[str, asyncio.Semaphore] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=WEBHOOK_DELIVERY_TIMEOUT_S)
+            self._client = httpx.AsyncClient(
+                timeout=WEBHOOK_DELIVERY_TIMEOUT_S,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                    keepalive_expiry=WEBHOOK_KEEPALIVE_EXPIRY_S,
+                ),
+            )
         return self._client
 
     async def close(self) -> None:
@@ -57,33 +162,135 @@ class WebhookDeliveryWorker:
             self._client = None
 
     async def run(self, shutdown_event: asyncio.Event) -> None:
-        """Main delivery loop."""
-        while not shutdown_event.is_set():
+        """Main delivery loop: keep the pool fed until shutdown, then drain it.
+
+        When cancelled instead, in-flight deliveries are cancelled and their
+        rows unlocked before the cancellation propagates.
+        """
+        stop = asyncio.ensure_future(shutdown_event.wait())
+        try:
+            while not shutdown_event.is_set():
+                wanted = min(self.concurrency - len(self._in_flight), WEBHOOK_BATCH_SIZE)
+                claimed = 0
+                if wanted > 0:
+                    try:
+                        claimed = await self._claim(wanted)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        logger.error("Webhook delivery loop failure, retrying", exc_info=True)
+                if wanted <= 0 or claimed < wanted:
+                    # Pool full or outbox drained: wait for a free slot, new work or shutdown.
+                    await asyncio.wait(
+                        {stop, *self._in_flight},
+                        timeout=WEBHOOK_POLL_INTERVAL_S,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+        except asyncio.CancelledError:
+            await self._release_in_flight()
+            raise
+        finally:
+            stop.cancel()
             try:
-                now = datetime.now(UTC)
-                now_iso = now.isoformat()
-                rows = await db.fetch_webhook_batch(WEBHOOK_BATCH_SIZE, now_iso)
+                await self.close()
+            except Exception:
+                logger.warning("Error closing webhook HTTP client", exc_info=True)
+
+    async def _release_in_flight(self) -> None:
+        """Cancel in-flight deliveries and unlock the rows they had not finished."""
+        tasks = list(self._in_flight)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        row_ids = sorted(self._claimed)
+        self._claimed.clear()
+        if not row_ids:
+            return
+        try:
+            await db.release_webhook_claims(row_ids)
+            logger.info("Released %d undelivered webhook claims on shutdown", len(row_ids))
+        except Exception:
+            logger.warning("Failed to release webhook claims: rows=%s", row_ids, exc_info=True)
 
-                if not rows:
-                    await asyncio.sleep(WEBHOOK_POLL_INTERVAL_S)
+    async def _claim(self, limit: int) -> int:
+        """Claim due rows for targets with room and start delivering them."""
+        # Targets with rows in flight may only take up their remaining room.
+        room = {target: self.target_concurrency - pending for target, pending in self._pending.items()}
+        busy = {target for target, free in room.items() if free <= 0}
+        busy.update(target for target, breaker in self._breakers.items() if not breaker.accepting())
+        now = datetime.now(UTC)
+        rows = await db.claim_webhook_batch(
+            limit,
+            now.isoformat(),
+            per_target=self.target_concurrency,
+            target_room={target: free for target, free in room.items() if target not in busy},
+            exclude_targets=busy,
+            locked_before=(now - timedelta(seconds=WEBHOOK_LOCK_EXPIRY_S)).isoformat(),
+        )
+        for row in rows:
+            if row.id is not None:
+                if row.id in self._claimed:
+                    # Lock expired while our own delivery is still running.
                     continue
+                self._claimed.add(row.id)
+            target = row.target_url
+            self._pending[target] = self._pending.get(target, 0) + 1
+            task = asyncio.create_task(self._dispatch(row), name=f"webhook-delivery-{row.id}")
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        return len(rows)
 
-                for row in rows:
-                    if shutdown_event.is_set():
-                        break
-                    claimed = await db.claim_webhook(row.id, now_iso)
-                    if not claimed:
-                        continue
-                    await self._deliver(row)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.error("Webhook delivery loop failure, retrying", exc_info=True)
-                await asyncio.sleep(WEBHOOK_POLL_INTERVAL_S)
+    def _breaker(self, target: str) -> CircuitBreaker:
+        breaker = self._breakers.get(target)
+        if breaker is None:
+            breaker = self._breakers[target] = CircuitBreaker(self._breaker_threshold, self._breaker_reset_s)
+        return breaker
+
+    async def _dispatch(self, row: db_models.WebhookOutbox) -> None:
+        """Deliver one claimed row within its target's concurrency limit and breaker."""
+        target = row.target_url
+        slots = self._target_slots.get(target)
+        if slots is None:
+            slots = self._target_slots[target] = asyncio.Semaphore(self.target_concurrency)
+        finished = True
         try:
-            await self.close()
+            async with slots:
+                breaker = self._breaker(target)
+                if not breaker.allow():
+                    await self._defer(row, breaker.retry_in())
+                    return
+                if await self._deliver(row):
+                    breaker.record_success()
+                elif breaker.record_failure():
+                    logger.warning("Webhook target circuit opened: url=%s failures=%d", target, breaker.failures)
+        except asyncio.CancelledError:
+            # The row stays claimed; run() unlocks it on the way out.
+            finished = False
+            raise
         except Exception:
-            logger.warning("Error closing webhook HTTP client", exc_info=True)
+            logger.error("Webhook dispatch failure: row=%s", row.id, exc_info=True)
+        finally:
+            if finished and row.id is not None:
+                self._claimed.discard(row.id)
+            remaining = self._pending.get(target, 1) - 1
+            if remaining > 0:
+                self._pending[target] = remaining
+            else:
+                self._pending.pop(target, None)
+                self._target_slots.pop(target, None)
+                # Only healthy breakers are dropped; failure streaks and open circuits persist.
+                breaker = self._breakers.get(target)
+                if breaker is not None and breaker.is_closed and breaker.failures == 0:
+                    del self._breakers[target]
+
+    async def _defer(self, row: db_models.WebhookOutbox, delay: float) -> None:
+        """Release a row whose target breaker is open without spending an attempt."""
+        if row.id is None:
+            return
+        next_at = (datetime.now(UTC) + timedelta(seconds=max(delay, WEBHOOK_POLL_INTERVAL_S))).isoformat()
+        await db.mark_webhook_failed(row.id, "circuit open", row.attempt_count or 0, next_at)
 
     async def _mark_failed(self, row_id: int, reason: str, attempt: int) -> None:
         """Mark a webhook as failed or dead-lettered."""
@@ -99,11 +306,15 @@ class WebhookDeliveryWorker:
         await db.mark_webhook_failed(row_id, reason, attempt, next_at)
         logger.warning("Webhook transient failure: row=%s status=%s retry_in=%.1fs", row_id, reason, delay)
 
-    async def _deliver(self, row: db_models.WebhookOutbox) -> None:
-        """Deliver a single webhook."""
+    async def _deliver(self, row: db_models.WebhookOutbox) -> bool:
+        """Deliver a single webhook.
+
+        Returns False when the target looks unhealthy (5xx, timeout, transport
+        error); a 4xx rejection still means the target is up.
+        """
         row_id = row.id
         if row_id is None:
-            return
+            return True
         body = row.event_json.encode()
         headers = {"Content-Type": "application/json"}
 
@@ -116,7 +327,8 @@ class WebhookDeliveryWorker:
             if response.status_code < 400:
                 await db.mark_webhook_delivered(row_id)
                 logger.debug("Webhook delivered: row=%s url=%s", row_id, row.target_url)
-            elif response.status_code < 500:
+                return True
+            if response.status_code < 500:
                 # 4xx = permanent failure
                 attempt = (row.attempt_count or 0) + 1
                 await db.mark_webhook_failed(row_id, f"HTTP {response.status_code}", attempt, None, status="rejected")
@@ -125,15 +337,18 @@ class WebhookDeliveryWorker:
                     row_id,
                     response.status_code,
                 )
-            else:
-                # 5xx = transient, retry
-                attempt = (row.attempt_count or 0) + 1
-                await self._mark_failed(row_id, f"HTTP {response.status_code}", attempt)
+                return True
+            # 5xx = transient, retry
+            attempt = (row.attempt_count or 0) + 1
+            await self._mark_failed(row_id, f"HTTP {response.status_code}", attempt)
+            return False
         except httpx.TimeoutException:
             attempt = (row.attempt_count or 0) + 1
             await self._mark_failed(row_id, "timeout", attempt)
             logger.warning("Webhook timeout: row=%s", row_id)
+            return False
         except Exception as exc:
             attempt = (row.attempt_count or 0) + 1
             await self._mark_failed(row_id, str(exc), attempt)
             logger.error("Webhook delivery error: row=%s error=%s", row_id, exc, exc_info=True)
+            return False
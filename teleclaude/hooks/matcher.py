@@ -1,13 +1,31 @@
-"""Property-based matching engine for webhook contracts."""
+"""Property-based matching engine for webhook contracts.
+
+``match_event`` checks one event against one contract. ``ContractIndex``
+compiles a set of contracts once so that matching an event only evaluates the
+contracts that could match it: contracts with an exact type and/or source
+criterion are bucketed by those values, everything else (wildcards, presence
+checks, no criterion) sits in a residual list that every event visits.
+Criteria are compiled to predicates up front, wildcard patterns to regexes.
+"""
 
 from __future__ import annotations
 
 import fnmatch
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
 
 from teleclaude.hooks.webhook_models import Contract, HookEvent, PropertyCriterion
 
+PropertyValue = str | int | float | bool | list[str] | None
+CriterionCheck = Callable[[PropertyValue], bool]
+
+# Bucket key component for "any value": the criterion is absent or not an exact match.
+_ANY = None
+
 
-def match_criterion(value: str | int | float | bool | list[str] | None, criterion: PropertyCriterion) -> bool:
+def match_criterion(value: PropertyValue, criterion: PropertyCriterion) -> bool:
     """Evaluate a single value against a property criterion.
 
     Returns True if the value satisfies the criterion.
@@ -57,3 +75,121 @@ def match_event(event: HookEvent, contract: Contract) -> bool:
             return False
 
     return True
+
+
+def compile_criterion(criterion: PropertyCriterion) -> CriterionCheck | None:
+    """Compile a criterion into a predicate equivalent to ``match_criterion``.
+
+    Returns None for criteria that always pass.
+    """
+    if not criterion.required:
+        return None
+
+    if criterion.match is None and criterion.pattern is None:
+        return _is_present
+
+    if criterion.pattern is not None:
+        # fnmatch.fnmatch is this regex after os.path.normcase, which is the identity on POSIX.
+        regex_match = re.compile(fnmatch.translate(criterion.pattern)).match
+        return lambda value: value is not None and regex_match(str(value)) is not None
+
+    match = criterion.match
+    if isinstance(match, list):
+        if all(isinstance(member, str) for member in match):
+            members = frozenset(match)
+            return lambda value: value is not None and str(value) in members
+        return lambda value: value is not None and (value in match or str(value) in match)
+    if isinstance(match, str):
+        return lambda value: value is not None and str(value) == match
+    return lambda value: value is not None and (value == match or str(value) == str(match))
+
+
+def _is_present(value: PropertyValue) -> bool:
+    return value is not None
+
+
+def _exact_values(criterion: PropertyCriterion | None) -> tuple[str, ...] | None:
+    """Values a criterion accepts when it is an exact string match, else None."""
+    if criterion is None or not criterion.required or criterion.pattern is not None or criterion.match is None:
+        return None
+    values = criterion.match if isinstance(criterion.match, list) else [criterion.match]
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return tuple(dict.fromkeys(values))
+
+
+@dataclass(frozen=True)
+class _CompiledContract:
+    ordinal: int
+    contract: Contract
+    expires_at: datetime | None
+    # Criteria not already guaranteed by the bucket the contract sits in.
+    source_check: CriterionCheck | None
+    type_check: CriterionCheck | None
+    property_checks: tuple[tuple[str, CriterionCheck], ...]
+
+    def matches(self, event: HookEvent, now: datetime) -> bool:
+        if self.expires_at is not None and now >= self.expires_at:
+            return False
+        if self.source_check is not None and not self.source_check(event.source):
+            return False
+        if self.type_check is not None and not self.type_check(event.type):
+            return False
+        properties = event.properties
+        return all(check(properties.get(name)) for name, check in self.property_checks)
+
+
+class ContractIndex:
+    """Active contracts compiled for matching, bucketed by exact event type and source.
+
+    An index is a snapshot: build a new one when the contract set changes.
+    """
+
+    def __init__(self, contracts: Iterable[Contract]) -> None:
+        self._buckets: dict[tuple[str | None, str | None], list[_CompiledContract]] = {}
+        self._size = 0
+        for ordinal, contract in enumerate(contracts):
+            if contract.active:
+                self._add(ordinal, contract)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _add(self, ordinal: int, contract: Contract) -> None:
+        type_values = _exact_values(contract.type_criterion)
+        source_values = _exact_values(contract.source_criterion)
+        if type_values == () or source_values == ():
+            # An empty exact-match list can never match.
+            return
+        compiled = _CompiledContract(
+            ordinal=ordinal,
+            contract=contract,
+            expires_at=datetime.fromisoformat(contract.expires_at) if contract.expires_at is not None else None,
+            source_check=compile_criterion(contract.source_criterion)
+            if contract.source_criterion is not None and source_values is None
+            else None,
+            type_check=compile_criterion(contract.type_criterion)
+            if contract.type_criterion is not None and type_values is None
+            else None,
+            property_checks=tuple(
+                (name, check)
+                for name, criterion in contract.properties.items()
+                if (check := compile_criterion(criterion)) is not None
+            ),
+        )
+        for type_key in type_values or (_ANY,):
+            for source_key in source_values or (_ANY,):
+                self._buckets.setdefault((type_key, source_key), []).append(compiled)
+        self._size += 1
+
+    def match(self, event: HookEvent, *, now: datetime | None = None) -> list[Contract]:
+        """Return the unexpired contracts matching ``event``, in registration order."""
+        now = now or datetime.now(UTC)
+        matched: list[_CompiledContract] = []
+        # A contract sits in exactly one of these buckets for a given event.
+        for key in ((event.type, event.source), (event.type, _ANY), (_ANY, event.source), (_ANY, _ANY)):
+            bucket = self._buckets.get(key)
+            if bucket:
+                matched.extend(compiled for compiled in bucket if compiled.matches(event, now))
+        matched.sort(key=lambda compiled: compiled.ordinal)
+        return [compiled.contract for compiled in matched]
@@ -1,4 +1,10 @@
-"""Unified hook receiver for agent CLIs."""
+"""Unified hook receiver for agent CLIs.
+
+This module runs once per agent hook invocation, so module-level imports are
+kept to the stdlib, the logging stack, and light ``teleclaude`` modules. Config,
+sqlmodel and the ORM models are imported inside the helpers that touch the
+database; events that are dropped or handed to the daemon never load them.
+"""
 
 from __future__ import annotations
 
@@ -12,34 +18,35 @@ from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from teleclaude.config.schema import PersonEntry
+    from teleclaude.core.models import JsonDict
 
 from instrukt_ai_logging import configure_logging, get_logger
 
-from teleclaude.config import config
 from teleclaude.constants import UI_MESSAGE_MAX_CHARS, is_internal_user_text
-from teleclaude.core import db_models
-from teleclaude.core.agents import AgentName, get_default_agent
 from teleclaude.core.events import AgentHookEvents, AgentHookEventType
-from teleclaude.core.models import JsonDict
-from teleclaude.hooks.adapters import get_adapter
+from teleclaude.hooks.adapters import get_adapter, get_adapter_names
 from teleclaude.hooks.checkpoint_flags import (
     CHECKPOINT_RECHECK_FLAG,
     consume_checkpoint_flag,
     is_checkpoint_disabled,
     set_checkpoint_flag,
 )
+from teleclaude.hooks.receiver._daemon_socket import _post_hook_event, _post_session_invalidation
 from teleclaude.hooks.receiver._session import (
     _create_sync_engine,
     _find_session_id_by_native,
     _get_cached_session_id,
     _get_memory_context,
+    _get_native_metadata_path,
     _get_session_map_path,
     _get_tmux_contract_session_id,
     _get_tmux_contract_tmpdir,
     _is_headless_route,
+    _is_native_metadata_known,
     _is_tmux_contract_session_compatible,
     _load_session_map,
     _persist_session_map,
+    _remember_native_metadata,
     _resolve_hook_session_id,
     _resolve_or_refresh_session_id,
     _session_map_key,
@@ -84,6 +91,8 @@ def _maybe_checkpoint_output(
 
     from sqlmodel import Session as SqlSession
 
+    from teleclaude.core import db_models
+
     try:
         with SqlSession(_create_sync_engine()) as db_session:
             row = db_session.get(db_models.Session, session_id)
@@ -121,6 +130,7 @@ def _maybe_checkpoint_output(
     logger.debug("Checkpoint eval for session %s (%.1fs elapsed)", session_id, elapsed)
 
     # Build context-aware checkpoint message from git diff + transcript
+    from teleclaude.core.agents import AgentName, get_default_agent
     from teleclaude.hooks.checkpoint import get_checkpoint_content
 
     # Prefer persisted session project_path (source of truth). Fall back to
@@ -162,6 +172,7 @@ def _maybe_checkpoint_output(
                 update_row.last_checkpoint_at = now
                 db_session.add(update_row)
                 db_session.commit()
+                _post_session_invalidation(session_id)
     except Exception as exc:
         logger.warning("Checkpoint DB update failed: %s", exc)
     logger.info(
@@ -220,6 +231,8 @@ def _print_memory_injection(cwd: str | None, adapter: object, session_id: str |
         try:
             from sqlmodel import Session as SqlSession
 
+            from teleclaude.config import config
+            from teleclaude.core import db_models
             from teleclaude.core.identity import derive_identity_key
             from teleclaude.core.models import SessionAdapterMetadata
 
@@ -256,7 +269,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--agent",
         required=True,
-        choices=AgentName.choices(),
+        choices=get_adapter_names(),
         help="Agent name for adapter selection",
     )
     parser.add_argument(
@@ -305,18 +318,34 @@ def _enqueue_hook_event(
     session_id: str,
     event_type: str,
     data: dict[str, object],  # guard: loose-dict - Hook payload is dynamic JSON.
+) -> None:
+    """Hand hook event to the daemon, or persist it to the local outbox when unreachable."""
+    created_at = datetime.now(UTC).isoformat()
+    if _post_hook_event(session_id, event_type, data, created_at=created_at):
+        return
+    _write_hook_outbox_row(session_id, event_type, data, created_at=created_at)
+
+
+def _write_hook_outbox_row(
+    session_id: str,
+    event_type: str,
+    data: dict[str, object],  # guard: loose-dict - Hook payload is dynamic JSON.
+    *,
+    created_at: str | None = None,
 ) -> None:
     """Persist hook event to local outbox for durable delivery."""
     now = datetime.now(UTC).isoformat()
     payload_json = json.dumps(data)
     from sqlmodel import Session as SqlSession
 
+    from teleclaude.core import db_models
+
     with SqlSession(_create_sync_engine()) as session:
         row = db_models.HookOutbox(
             session_id=session_id,
             event_type=event_type,
             payload=payload_json,
-            created_at=now,
+            created_at=created_at or now,
             next_attempt_at=now,
             attempt_count=0,
         )
@@ -331,20 +360,23 @@ def _update_session_native_fields(
     event_type: str,
     native_log_file: str | None = None,
     native_session_id: str | None = None,
-) -> None:
+) -> bool:
     """Update native session fields directly on the session row.
 
     When native_log_file changes and the previous value is non-empty,
     the old path is appended to transcript_files before replacing native_log_file.
+    Returns False when there was nothing to write or no session row.
     """
     if not native_log_file and not native_session_id:
-        return
+        return False
     from sqlmodel import Session as SqlSession
 
+    from teleclaude.core import db_models
+
     with SqlSession(_create_sync_engine()) as session:
         row = session.get(db_models.Session, session_id)
         if not row:
-            return
+            return False
         previous_native_session_id = row.native_session_id
         previous_native_log_file = row.native_log_file
 
@@ -372,7 +404,8 @@ def _update_session_native_fields(
         session_changed = bool(native_session_id and previous_native_session_id != native_session_id)
         transcript_changed_log = bool(native_log_file and previous_native_log_file != native_log_file)
         if not session_changed and not transcript_changed_log:
-            return
+            return True
+        _post_session_invalidation(session_id)
 
         old_path = Path(previous_native_log_file).expanduser() if previous_native_log_file else None
         new_path = Path(native_log_file).expanduser() if native_log_file else None
@@ -393,6 +426,7 @@ def _update_session_native_fields(
             old_path_exists=old_exists,
             new_path_exists=new_exists,
         )
+    return True
 
 
 # guard: loose-dict-func - Main path processes raw hook payload boundaries.
@@ -553,22 +587,18 @@ def _persist_native_metadata(
     raw_native_session_id: str | None,
     raw_native_log_file: str | None,
 ) -> None:
-    if raw_native_session_id:
-        _update_session_native_fields(
-            session_id,
-            agent=agent,
-            event_type=event_type,
-            native_log_file=raw_native_log_file,
-            native_session_id=raw_native_session_id,
-        )
+    # Most events (every tool call) repeat the fields an earlier event already
+    # wrote; only new values are worth loading the ORM and opening the DB for.
+    if _is_native_metadata_known(session_id, raw_native_session_id, raw_native_log_file):
         return
-    if raw_native_log_file:
-        _update_session_native_fields(
-            session_id,
-            agent=agent,
-            event_type=event_type,
-            native_log_file=raw_native_log_file,
-        )
+    if _update_session_native_fields(
+        session_id,
+        agent=agent,
+        event_type=event_type,
+        native_log_file=raw_native_log_file,
+        native_session_id=raw_native_session_id,
+    ):
+        _remember_native_metadata(session_id, raw_native_session_id, raw_native_log_file)
 
 
 def _handle_user_prompt_submit(
@@ -776,14 +806,17 @@ __all__ = [
     "_find_session_id_by_native",
     "_get_cached_session_id",
     "_get_memory_context",
+    "_get_native_metadata_path",
     "_get_session_map_path",
     "_get_tmux_contract_session_id",
     "_get_tmux_contract_tmpdir",
     "_is_headless_route",
+    "_is_native_metadata_known",
     "_is_tmux_contract_session_compatible",
     "_load_session_map",
     "_persist_session_map",
     "_read_stdin",
+    "_remember_native_metadata",
     "_render_person_header",
     "_resolve_hook_session_id",
     "_resolve_or_refresh_session_id",
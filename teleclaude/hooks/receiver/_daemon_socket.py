@@ -0,0 +1,118 @@
+"""Hand hook events to the running daemon over its API Unix socket.
+
+Stdlib only: this runs on every hook invocation, so it must not pull in
+httpx, sqlmodel, or the config stack.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+
+from instrukt_ai_logging import get_logger
+
+from teleclaude.constants import API_SOCKET_PATH
+
+logger = get_logger("teleclaude.hooks.receiver")
+
+HOOK_EVENTS_ENDPOINT = "/hooks/events"
+HOOK_SESSION_INVALIDATE_ENDPOINT = "/hooks/sessions/{session_id}/invalidate"
+HOOK_SOCKET_TIMEOUT_S: float = float(os.getenv("TELECLAUDE_HOOK_SOCKET_TIMEOUT_S", "0.5"))
+
+__all__ = [
+    "HOOK_EVENTS_ENDPOINT",
+    "HOOK_SESSION_INVALIDATE_ENDPOINT",
+    "HOOK_SOCKET_TIMEOUT_S",
+    "_post_hook_event",
+    "_post_session_invalidation",
+]
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a Unix domain socket instead of TCP."""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _post_hook_event(
+    session_id: str,
+    event_type: str,
+    data: dict[str, object],  # guard: loose-dict - Hook payload is dynamic JSON.
+    *,
+    created_at: str | None = None,
+    socket_path: str = API_SOCKET_PATH,
+    timeout: float = HOOK_SOCKET_TIMEOUT_S,
+) -> bool:
+    """Post a hook event to the daemon; return True once the daemon has persisted it.
+
+    Any failure (no socket, daemon down, timeout, non-2xx) returns False so the
+    caller can fall back to writing the outbox row itself. A timeout after the
+    request was sent may mean the daemon stored it anyway; the outbox is
+    at-least-once, so a rare duplicate is preferred over a lost event.
+    """
+    body = json.dumps(
+        {"session_id": session_id, "event_type": event_type, "payload": data, "created_at": created_at}
+    ).encode("utf-8")
+    return _post_json(
+        HOOK_EVENTS_ENDPOINT,
+        body,
+        socket_path=socket_path,
+        timeout=timeout,
+        session_id=session_id,
+        event_type=event_type,
+    )
+
+
+def _post_session_invalidation(
+    session_id: str,
+    *,
+    socket_path: str = API_SOCKET_PATH,
+    timeout: float = HOOK_SOCKET_TIMEOUT_S,
+) -> bool:
+    """Tell the daemon a session row was written here so it drops its cached copy.
+
+    Best effort: if the daemon is down there is no cache to invalidate, and
+    ``update_session`` re-syncs the cached row on the next hook dispatch.
+    """
+    endpoint = HOOK_SESSION_INVALIDATE_ENDPOINT.format(session_id=session_id)
+    return _post_json(endpoint, b"", socket_path=socket_path, timeout=timeout, session_id=session_id)
+
+
+def _post_json(
+    endpoint: str,
+    body: bytes,
+    *,
+    socket_path: str,
+    timeout: float,
+    **log_fields: str,
+) -> bool:
+    if not os.path.exists(socket_path):
+        return False
+    conn = _UnixHTTPConnection(socket_path, timeout)
+    try:
+        conn.request("POST", endpoint, body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+    except (OSError, http.client.HTTPException) as exc:
+        logger.debug("Daemon socket handoff failed", endpoint=endpoint, error=str(exc), **log_fields)
+        return False
+    finally:
+        conn.close()
+    if not 200 <= response.status < 300:
+        logger.debug("Daemon socket handoff rejected", endpoint=endpoint, status=response.status, **log_fields)
+        return False
+    return True
@@ -10,9 +10,8 @@ from pathlib import Path
 
 from instrukt_ai_logging import get_logger
 
-from teleclaude.config import config
-from teleclaude.core import db_models
-from teleclaude.paths import SESSION_MAP_PATH
+from teleclaude.hooks.receiver._daemon_socket import _post_session_invalidation
+from teleclaude.paths import HOOK_NATIVE_METADATA_PATH, SESSION_MAP_PATH
 
 logger = get_logger("teleclaude.hooks.receiver")
 
@@ -21,13 +20,16 @@ __all__ = [
     "_find_session_id_by_native",
     "_get_cached_session_id",
     "_get_memory_context",
+    "_get_native_metadata_path",
     "_get_session_map_path",
     "_get_tmux_contract_session_id",
     "_get_tmux_contract_tmpdir",
     "_is_headless_route",
+    "_is_native_metadata_known",
     "_is_tmux_contract_session_compatible",
     "_load_session_map",
     "_persist_session_map",
+    "_remember_native_metadata",
     "_resolve_hook_session_id",
     "_resolve_or_refresh_session_id",
     "_session_map_key",
@@ -40,6 +42,8 @@ def _create_sync_engine() -> object:
     from sqlalchemy import create_engine
     from sqlalchemy import event as sa_event
 
+    from teleclaude.config import config
+
     engine = create_engine(f"sqlite:///{config.database.path}")
 
     @sa_event.listens_for(engine, "connect")
@@ -58,6 +62,7 @@ def _create_sync_engine() -> object:
 def _get_memory_context(project_name: str, identity_key: str | None = None) -> str:
     """Fetch pre-formatted memory context from local database."""
     try:
+        from teleclaude.config import config
         from teleclaude.memory.context import generate_context_sync
 
         db_path = str(config.database.path)
@@ -70,6 +75,10 @@ def _get_session_map_path() -> Path:
     return SESSION_MAP_PATH
 
 
+def _get_native_metadata_path() -> Path:
+    return HOOK_NATIVE_METADATA_PATH
+
+
 def _session_map_key(agent: str, native_session_id: str) -> str:
     return f"{agent}:{native_session_id}"
 
@@ -135,6 +144,8 @@ def _is_tmux_contract_session_compatible(session_id: str, native_session_id: str
 
     from sqlmodel import Session as SqlSession
 
+    from teleclaude.core import db_models
+
     try:
         with SqlSession(_create_sync_engine()) as session:
             row = session.get(db_models.Session, session_id)
@@ -232,6 +243,8 @@ def _resolve_or_refresh_session_id(
 
     from sqlmodel import Session as SqlSession
 
+    from teleclaude.core import db_models
+
     try:
         with SqlSession(_create_sync_engine()) as session:
             row = session.get(db_models.Session, candidate_session_id)
@@ -257,6 +270,7 @@ def _resolve_or_refresh_session_id(
                 row.native_session_id = raw_native_session_id
                 session.add(row)
                 session.commit()
+                _post_session_invalidation(candidate_session_id)
                 logger.info(
                     "Updated stale native_session_id in DB",
                     agent=agent,
@@ -282,6 +296,8 @@ def _find_session_id_by_native(native_session_id: str | None) -> str | None:
     from sqlmodel import Session as SqlSession
     from sqlmodel import select
 
+    from teleclaude.core import db_models
+
     try:
         with SqlSession(_create_sync_engine()) as session:
             statement = (
@@ -304,35 +320,66 @@ def _find_session_id_by_native(native_session_id: str | None) -> str | None:
     return row.session_id
 
 
+def _update_state_map(path: Path, updates: dict[str, str]) -> None:
+    """Merge ``updates`` into a JSON string map file under an exclusive lock."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = path.with_suffix(".lock")
+    with open(lock_path, "w", encoding="utf-8") as lock_file:
+        try:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        except Exception:
+            pass
+        data = _load_session_map(path)
+        data.update(updates)
+        _write_session_map_atomic(path, data)
+
+
 def _persist_session_map(agent: str, native_session_id: str | None, session_id: str) -> None:
     """Persist session mapping keyed by agent + native session id."""
     if not native_session_id:
         return
     path = _get_session_map_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    lock_path = path.with_suffix(".lock")
     try:
-        with open(lock_path, "w", encoding="utf-8") as lock_file:
-            try:
-                import fcntl
-
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
-            except Exception:
-                pass
-            data = _load_session_map(path)
-            data[_session_map_key(agent, native_session_id)] = session_id
-            _write_session_map_atomic(path, data)
-            logger.debug(
-                "Session map persisted",
-                agent=agent,
-                native_session_id=(native_session_id or ""),
-                session_id=session_id,
-                path=str(path),
-            )
+        _update_state_map(path, {_session_map_key(agent, native_session_id): session_id})
+        logger.debug(
+            "Session map persisted",
+            agent=agent,
+            native_session_id=(native_session_id or ""),
+            session_id=session_id,
+            path=str(path),
+        )
     except OSError as exc:
         logger.warning("Failed to persist session map: %s", exc)
 
 
+def _native_metadata_fields(native_session_id: str | None, native_log_file: str | None) -> dict[str, str]:
+    fields = {"native_session_id": native_session_id, "native_log_file": native_log_file}
+    return {name: value for name, value in fields.items() if value}
+
+
+def _is_native_metadata_known(session_id: str, native_session_id: str | None, native_log_file: str | None) -> bool:
+    """True when these native fields were already written to the session row by an earlier event."""
+    data = _load_session_map(_get_native_metadata_path())
+    fields = _native_metadata_fields(native_session_id, native_log_file)
+    return all(data.get(f"{session_id}:{name}") == value for name, value in fields.items())
+
+
+def _remember_native_metadata(session_id: str, native_session_id: str | None, native_log_file: str | None) -> None:
+    """Record native fields written to the session row so later events can skip the DB."""
+    updates = {
+        f"{session_id}:{name}": value
+        for name, value in _native_metadata_fields(native_session_id, native_log_file).items()
+    }
+    if not updates:
+        return
+    try:
+        _update_state_map(_get_native_metadata_path(), updates)
+    except OSError as exc:
+        logger.warning("Failed to record native session metadata: %s", exc)
+
+
 def _resolve_hook_session_id(
     *,
     agent: str,
@@ -353,6 +400,10 @@ def _resolve_hook_session_id(
         if not resolved_session_id:
             return None, None, None
 
+        if native_session_id and _get_cached_session_id(agent, native_session_id) == resolved_session_id:
+            # An earlier event already validated and mapped this binding; skip the DB.
+            return resolved_session_id, None, None
+
         if native_session_id and not _is_tmux_contract_session_compatible(
             resolved_session_id, native_session_id, agent=agent
         ):
@@ -5,7 +5,7 @@ from __future__ import annotations
 from instrukt_ai_logging import get_logger
 
 from teleclaude.core.db import db
-from teleclaude.hooks.matcher import match_event
+from teleclaude.hooks.matcher import ContractIndex
 from teleclaude.hooks.webhook_models import Contract, HookEvent
 
 logger = get_logger(__name__)
@@ -16,6 +16,8 @@ class ContractRegistry:
 
     def __init__(self) -> None:
         self._cache: dict[str, Contract] = {}
+        # Compiled from _cache on the next match; dropped whenever _cache changes.
+        self._index: ContractIndex | None = None
 
     async def load_from_db(self) -> None:
         """Load all active contracts from DB into cache."""
@@ -28,23 +30,29 @@ class ContractRegistry:
             except Exception as exc:
                 logger.error("Failed to load contract %s: %s", row.id, exc, exc_info=True)
         self._cache = new_cache
+        self._index = None
         logger.info("Loaded %d active contracts from DB", len(self._cache))
 
     async def register(self, contract: Contract) -> None:
         """Register or update a contract (DB + cache)."""
         await db.upsert_webhook_contract(contract.id, contract.to_json(), contract.source)
         self._cache[contract.id] = contract
+        self._index = None
         logger.debug("Registered contract: %s", contract.id)
 
     async def deactivate(self, contract_id: str) -> bool:
         """Deactivate a contract."""
         result = await db.deactivate_webhook_contract(contract_id)
         self._cache.pop(contract_id, None)
+        self._index = None
         return result
 
     def match(self, event: HookEvent) -> list[Contract]:
         """Find all active, non-expired contracts matching an event."""
-        return [c for c in self._cache.values() if c.active and not c.is_expired and match_event(event, c)]
+        index = self._index
+        if index is None:
+            index = self._index = ContractIndex(self._cache.values())
+        return index.match(event)
 
     async def sweep_expired(self) -> int:
         """Deactivate expired contracts. Returns count of swept contracts."""
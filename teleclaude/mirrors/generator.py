@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
 from dataclasses import replace
 from datetime import UTC, datetime
+from pathlib import Path
 
 from teleclaude.core.agents import AgentName
-from teleclaude.utils.transcript import StructuredMessage, extract_structured_messages
-
-from .store import MirrorRecord, delete_mirror, get_mirror, upsert_mirror
+from teleclaude.core.models import JsonDict
+from teleclaude.utils.transcript import (
+    StructuredMessage,
+    _get_appended_entries_for_agent,
+    _get_entries_for_agent,
+    structured_messages_from_entries,
+)
+
+from .store import (
+    MirrorOffsetRecord,
+    MirrorRecord,
+    append_mirror,
+    delete_mirror,
+    delete_mirror_offset,
+    get_mirror,
+    get_mirror_offset,
+    upsert_mirror,
+    upsert_mirror_offset,
+)
 
 _SYSTEM_REMINDER_RE = re.compile(r"<system-reminder>.*?</system-reminder>", flags=re.DOTALL)
 _TITLE_MAX_CHARS = 120
@@ -48,6 +66,67 @@ def _render_conversation(messages: list[StructuredMessage]) -> str:
     return "\n\n".join(lines)
 
 
+def _offset_fingerprint(tail: bytes) -> str:
+    """Digest of the bytes just before an offset, as stored in ``mirror_offsets``."""
+    return hashlib.sha256(tail).hexdigest()
+
+
+def _conversation_from_entries(entries: list[JsonDict], start_index: int = 0) -> list[StructuredMessage]:
+    structured = structured_messages_from_entries(
+        entries,
+        include_tools=False,
+        include_thinking=False,
+        start_index=start_index,
+    )
+    return _normalize_conversation_messages(structured)
+
+
+def _append_mirror_sync(
+    path: Path,
+    transcript_path: str,
+    agent_name: AgentName,
+    offset: MirrorOffsetRecord,
+    db: object | None,
+) -> bool | None:
+    """Parse only what was appended since ``offset``; None means a full rebuild is required."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if (
+        offset.transcript_path != transcript_path
+        or stat.st_ino != offset.file_inode
+        or stat.st_size < offset.byte_offset
+    ):
+        return None
+
+    chunk = _get_appended_entries_for_agent(transcript_path, agent_name, offset.byte_offset)
+    if chunk is None or _offset_fingerprint(chunk.prefix) != offset.fingerprint:
+        return None
+    entries, byte_offset = chunk.entries, chunk.end_offset
+    messages = _conversation_from_entries(entries, start_index=offset.entry_count)
+
+    now = datetime.now(UTC).isoformat()
+    next_offset = replace(
+        offset,
+        byte_offset=byte_offset,
+        entry_count=offset.entry_count + len(entries),
+        fingerprint=_offset_fingerprint(chunk.suffix),
+        updated_at=now,
+    )
+    appended = append_mirror(
+        next_offset,
+        conversation_text=_render_conversation(messages),
+        message_count=len(messages),
+        title=_title_from_messages(messages),
+        timestamp_start=messages[0].timestamp if messages else None,
+        timestamp_end=messages[-1].timestamp if messages else None,
+        updated_at=now,
+        db=db,
+    )
+    return True if appended else None
+
+
 def generate_mirror_sync(
     session_id: str,
     source_identity: str,
@@ -57,16 +136,25 @@ def generate_mirror_sync(
     project: str,
     db: object | None,
 ) -> bool:
-    """Extract conversation-only text from a transcript and upsert a mirror."""
-    structured = extract_structured_messages(
-        transcript_path,
-        agent_name,
-        include_tools=False,
-        include_thinking=False,
-    )
-    conversation_messages = _normalize_conversation_messages(structured)
+    """Extract conversation-only text from a transcript and upsert a mirror.
+
+    JSONL transcripts are append-only, so once a mirror exists only the bytes
+    written after the recorded offset are parsed and appended. Truncation,
+    rotation (inode change) or a rewritten tail falls back to a full rebuild.
+    """
+    path = Path(transcript_path).expanduser()
+    offset = get_mirror_offset(source_identity, db=db)
+    if offset is not None:
+        appended = _append_mirror_sync(path, transcript_path, agent_name, offset, db)
+        if appended is not None:
+            return appended
+
+    chunk = _get_appended_entries_for_agent(transcript_path, agent_name, 0)
+    entries = chunk.entries if chunk is not None else _get_entries_for_agent(transcript_path, agent_name) or []
+    conversation_messages = _conversation_from_entries(entries)
     if not conversation_messages:
         delete_mirror(session_id=session_id, source_identity=source_identity, db=db)
+        delete_mirror_offset(source_identity, db=db)
         return False
 
     existing = get_mirror(source_identity=source_identity, db=db)
@@ -90,6 +178,19 @@ def generate_mirror_sync(
         source_identity=source_identity,
     )
     upsert_mirror(record, db=db)
+    if chunk is not None:
+        upsert_mirror_offset(
+            MirrorOffsetRecord(
+                source_identity=source_identity,
+                transcript_path=transcript_path,
+                byte_offset=chunk.end_offset,
+                file_inode=path.stat().st_ino,
+                entry_count=len(entries),
+                fingerprint=_offset_fingerprint(chunk.suffix),
+                updated_at=now,
+            ),
+            db=db,
+        )
     return True
 
 
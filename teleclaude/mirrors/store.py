@@ -59,6 +59,17 @@ class MirrorTombstoneRecord:
     created_at: str
 
 
+@dataclass(frozen=True)
+class MirrorOffsetRecord:
+    source_identity: str
+    transcript_path: str
+    byte_offset: int
+    file_inode: int
+    entry_count: int
+    fingerprint: str
+    updated_at: str
+
+
 @dataclass(frozen=True)
 class SessionMirrorContext:
     session_id: str
@@ -364,6 +375,95 @@ def upsert_mirror(record: MirrorRecord, *, db: object | None = None) -> None:
         conn.commit()
 
 
+def _upsert_mirror_offset(conn: sqlite3.Connection, record: MirrorOffsetRecord) -> None:
+    conn.execute(
+        """
+        INSERT INTO mirror_offsets (
+            source_identity,
+            transcript_path,
+            byte_offset,
+            file_inode,
+            entry_count,
+            fingerprint,
+            updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source_identity) DO UPDATE SET
+            transcript_path = excluded.transcript_path,
+            byte_offset = excluded.byte_offset,
+            file_inode = excluded.file_inode,
+            entry_count = excluded.entry_count,
+            fingerprint = excluded.fingerprint,
+            updated_at = excluded.updated_at
+        """,
+        (
+            record.source_identity,
+            record.transcript_path,
+            record.byte_offset,
+            record.file_inode,
+            record.entry_count,
+            record.fingerprint,
+            record.updated_at,
+        ),
+    )
+
+
+def append_mirror(
+    offset: MirrorOffsetRecord,
+    *,
+    conversation_text: str,
+    message_count: int,
+    title: str,
+    timestamp_start: str | None,
+    timestamp_end: str | None,
+    updated_at: str,
+    db: object | None = None,
+) -> bool:
+    """Append newly parsed conversation text to a mirror and advance its offset.
+
+    Only touches ``conversation_text``/``title`` (and thus the FTS row) when there
+    is new text. Returns False if no mirror row exists for the source identity.
+    """
+    with _connect_rw(db) as conn:
+        if conversation_text:
+            cursor = conn.execute(
+                """
+                UPDATE mirrors SET
+                    conversation_text = CASE
+                        WHEN conversation_text = '' THEN ?
+                        ELSE conversation_text || char(10) || char(10) || ?
+                    END,
+                    message_count = message_count + ?,
+                    title = CASE WHEN title = '' THEN ? ELSE title END,
+                    timestamp_start = COALESCE(timestamp_start, ?),
+                    timestamp_end = COALESCE(?, timestamp_end),
+                    updated_at = ?
+                WHERE source_identity = ?
+                """,
+                (
+                    conversation_text,
+                    conversation_text,
+                    message_count,
+                    title,
+                    timestamp_start,
+                    timestamp_end,
+                    updated_at,
+                    offset.source_identity,
+                ),
+            )
+        else:
+            cursor = conn.execute(
+                "UPDATE mirrors SET updated_at = ? WHERE source_identity = ?",
+                (updated_at, offset.source_identity),
+            )
+        if cursor.rowcount == 0:
+            conn.rollback()
+            return False
+        _upsert_mirror_offset(conn, offset)
+        conn.commit()
+    return True
+
+
 def delete_mirror(
     session_id: str | None = None,
     *,
@@ -453,6 +553,59 @@ def get_mirror_state_by_transcript(db: object | None = None) -> dict[str, tuple[
     return state
 
 
+def get_mirror_offset(source_identity: str, *, db: object | None = None) -> MirrorOffsetRecord | None:
+    """Fetch the incremental parse offset for a transcript."""
+    try:
+        with _connect_ro(db) as conn:
+            row = conn.execute(
+                """
+                SELECT source_identity, transcript_path, byte_offset, file_inode, entry_count, fingerprint, updated_at
+                FROM mirror_offsets
+                WHERE source_identity = ?
+                """,
+                (source_identity,),
+            ).fetchone()
+    except sqlite3.OperationalError as exc:
+        if "no such table" in str(exc).lower():
+            return None
+        raise
+
+    if row is None:
+        return None
+
+    return MirrorOffsetRecord(
+        source_identity=str(row["source_identity"]),
+        transcript_path=str(row["transcript_path"]),
+        byte_offset=int(row["byte_offset"]),
+        file_inode=int(row["file_inode"]),
+        entry_count=int(row["entry_count"]),
+        fingerprint=str(row["fingerprint"]),
+        updated_at=str(row["updated_at"]),
+    )
+
+
+def upsert_mirror_offset(record: MirrorOffsetRecord, *, db: object | None = None) -> None:
+    """Insert or update the incremental parse offset for a transcript."""
+    try:
+        with _connect_rw(db) as conn:
+            _upsert_mirror_offset(conn, record)
+            conn.commit()
+    except sqlite3.OperationalError as exc:
+        if "no such table" not in str(exc).lower():
+            raise
+
+
+def delete_mirror_offset(source_identity: str, *, db: object | None = None) -> None:
+    """Forget the parse offset so the next generation re-reads the transcript."""
+    try:
+        with _connect_rw(db) as conn:
+            conn.execute("DELETE FROM mirror_offsets WHERE source_identity = ?", (source_identity,))
+            conn.commit()
+    except sqlite3.OperationalError as exc:
+        if "no such table" not in str(exc).lower():
+            raise
+
+
 def get_mirror_tombstone(source_identity: str, *, db: object | None = None) -> MirrorTombstoneRecord | None:
     """Fetch a tombstone by source identity."""
     try:
@@ -5,22 +5,29 @@ from __future__ import annotations
 import asyncio
 import json
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from time import perf_counter
 
 from instrukt_ai_logging import get_logger
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 
 from teleclaude.config import config
 from teleclaude.core.agents import AgentName
+from teleclaude.core.transcript_paths import record_transcript_paths
 
 from ..utils.transcript_discovery import (
     TranscriptCandidate,
     build_source_identity,
+    candidate_for_path,
     extract_project,
     extract_session_id,
     in_session_root,
+    session_roots,
 )
 from ..utils.transcript_discovery import discover_transcripts as _discover_transcripts
 from .generator import generate_mirror_sync
@@ -37,6 +44,8 @@ from .store import (
 logger = get_logger(__name__)
 
 RECONCILE_INTERVAL_S = 300
+# Transcripts are appended to in bursts while an agent works; batch events per window.
+WATCH_DEBOUNCE_S = 2.0
 
 __all__ = ["MirrorWorker", "ReconcileResult", "TranscriptCandidate"]
 
@@ -50,12 +59,49 @@ class ReconcileResult:
     duration_s: float
 
 
+class _TranscriptEventHandler(FileSystemEventHandler):
+    """Watchdog handler that queues changed transcript paths."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue[str]) -> None:
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+
+    def _handle(self, path: object) -> None:
+        if isinstance(path, bytes):
+            path = path.decode("utf-8", errors="replace")
+        if not isinstance(path, str) or not path:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, path)
+        except RuntimeError:
+            pass  # Loop closed
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._handle(event.dest_path)
+
+
 class MirrorWorker:
-    """Idempotent reconciliation loop for stale or missing mirrors."""
+    """Idempotent reconciliation loop for stale or missing mirrors.
+
+    Changed transcripts are reconciled as filesystem events arrive; the full
+    scan every ``interval_s`` only backstops missed events. Both paths also
+    keep the native session id to transcript path index current.
+    """
 
-    def __init__(self, db: object | None = None, interval_s: int = RECONCILE_INTERVAL_S) -> None:
+    def __init__(self, db: object | None = None, interval_s: int = RECONCILE_INTERVAL_S, *, watch: bool = True) -> None:
         self.db_path = resolve_db_path(db)
         self.interval_s = interval_s
+        self.watch = watch
 
     def _wal_size_kb(self) -> int:
         wal_path = Path(f"{self.db_path}-wal")
@@ -110,12 +156,68 @@ class MirrorWorker:
             f"wal_after_kb={wal_after_kb}"
         )
 
+    def _reconcile_candidate(
+        self,
+        candidate: TranscriptCandidate,
+        state: dict[str, tuple[str | None, str]] | None,
+        result: ReconcileResult,
+    ) -> None:
+        """Regenerate one transcript's mirror unless it is unchanged or tombstoned.
+
+        ``state`` is None for event-triggered runs, where the change is already known.
+        """
+        transcript_path = str(candidate.path)
+        try:
+            if state is not None:
+                mtime_dt = datetime.fromtimestamp(candidate.mtime or candidate.path.stat().st_mtime, tz=UTC)
+                existing = state.get(transcript_path)
+                updated_at = existing[1] if existing else None
+                parsed_updated = self._parse_updated_at(updated_at)
+                if parsed_updated is not None and parsed_updated >= mtime_dt:
+                    result.skipped_unchanged += 1
+                    return
+
+            source_identity = build_source_identity(candidate.path, candidate.agent)
+            if self._should_skip_tombstoned_transcript(source_identity, candidate):
+                result.skipped_unchanged += 1
+                return
+
+            session_id = extract_session_id(candidate.path, candidate.agent)
+            computer = config.computer.name
+            project = extract_project(candidate.path, candidate.agent)
+
+            generated = generate_mirror_sync(
+                session_id=session_id,
+                source_identity=source_identity,
+                transcript_path=transcript_path,
+                agent_name=candidate.agent,
+                computer=computer,
+                project=project,
+                db=self.db_path,
+            )
+            if generated:
+                delete_mirror_tombstone(source_identity, db=self.db_path)
+            else:
+                self._record_tombstone(source_identity, candidate)
+                delete_mirror(session_id=session_id, source_identity=source_identity, db=self.db_path)
+            result.processed += 1
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result.failed += 1
+            logger.error(
+                "Mirror reconciliation failed for transcript %s (%s): %s",
+                transcript_path,
+                candidate.agent.value,
+                exc,
+                exc_info=True,
+            )
+
     def _reconcile_sync(self) -> ReconcileResult:
         """Reconcile all known transcripts once."""
         wal_before_kb = self._wal_size_kb()
         started_at = perf_counter()
         state = get_mirror_state_by_transcript(self.db_path)
         transcripts = _discover_transcripts()
+        record_transcript_paths(transcripts, db_path=self.db_path)
         result = ReconcileResult(
             discovered=len(transcripts),
             processed=0,
@@ -125,55 +227,45 @@ class MirrorWorker:
         )
 
         for candidate in transcripts:
-            transcript_path = str(candidate.path)
-            try:
-                mtime_dt = datetime.fromtimestamp(candidate.mtime or candidate.path.stat().st_mtime, tz=UTC)
-                existing = state.get(transcript_path)
-                updated_at = existing[1] if existing else None
-                parsed_updated = self._parse_updated_at(updated_at)
-                if parsed_updated is not None and parsed_updated >= mtime_dt:
-                    result.skipped_unchanged += 1
-                    continue
-
-                source_identity = build_source_identity(candidate.path, candidate.agent)
-                if self._should_skip_tombstoned_transcript(source_identity, candidate):
-                    result.skipped_unchanged += 1
-                    continue
-
-                session_id = extract_session_id(candidate.path, candidate.agent)
-                computer = config.computer.name
-                project = extract_project(candidate.path, candidate.agent)
-
-                generated = generate_mirror_sync(
-                    session_id=session_id,
-                    source_identity=source_identity,
-                    transcript_path=transcript_path,
-                    agent_name=candidate.agent,
-                    computer=computer,
-                    project=project,
-                    db=self.db_path,
-                )
-                if generated:
-                    delete_mirror_tombstone(source_identity, db=self.db_path)
-                else:
-                    self._record_tombstone(source_identity, candidate)
-                    delete_mirror(session_id=session_id, source_identity=source_identity, db=self.db_path)
-                result.processed += 1
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                result.failed += 1
-                logger.error(
-                    "Mirror reconciliation failed for transcript %s (%s): %s",
-                    transcript_path,
-                    candidate.agent.value,
-                    exc,
-                    exc_info=True,
-                )
+            self._reconcile_candidate(candidate, state, result)
 
         result.duration_s = perf_counter() - started_at
         wal_after_kb = self._wal_size_kb()
         self._log_reconcile_result(result, wal_before_kb, wal_after_kb)
         return result
 
+    def _reconcile_paths_sync(self, paths: Iterable[str]) -> ReconcileResult:
+        """Reconcile only the given changed paths, ignoring non-transcript files."""
+        started_at = perf_counter()
+        candidates: list[TranscriptCandidate] = []
+        for path in paths:
+            try:
+                candidate = candidate_for_path(path)
+            except OSError:
+                continue
+            if candidate is not None:
+                candidates.append(candidate)
+        record_transcript_paths(candidates, db_path=self.db_path)
+
+        result = ReconcileResult(
+            discovered=len(candidates),
+            processed=0,
+            failed=0,
+            skipped_unchanged=0,
+            duration_s=0.0,
+        )
+        for candidate in candidates:
+            self._reconcile_candidate(candidate, None, result)
+        result.duration_s = perf_counter() - started_at
+        if candidates:
+            logger.debug(
+                "mirror.reconciliation.events processed=%d failed=%d duration_s=%.3f",
+                result.processed,
+                result.failed,
+                result.duration_s,
+            )
+        return result
+
     def backfill_sync(self) -> ReconcileResult:
         """Remove stale mirror rows and repopulate canonical rows from transcripts."""
         try:
@@ -215,13 +307,55 @@ class MirrorWorker:
         """Reconcile all known transcripts once."""
         return await asyncio.to_thread(self._reconcile_sync)
 
-    async def run(self) -> None:
-        """Run reconciliation on startup and every interval until cancelled."""
-        while True:
+    def _start_observer(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue[str]) -> BaseObserver | None:
+        roots = session_roots()
+        if not self.watch or not roots:
+            return None
+        observer = Observer()
+        observer.daemon = True
+        handler = _TranscriptEventHandler(loop, queue)
+        try:
+            for _agent, root in roots:
+                observer.schedule(handler, str(root), recursive=True)
+            observer.start()
+        except OSError as exc:
+            logger.warning("Mirror transcript watcher unavailable, using periodic scans only: %s", exc)
+            return None
+        logger.info("Mirror transcript watcher started for %d session root(s)", len(roots))
+        return observer
+
+    async def _process_events_until(self, queue: asyncio.Queue[str], deadline: float) -> None:
+        """Reconcile debounced transcript change batches until the next full scan is due."""
+        loop = asyncio.get_running_loop()
+        while (remaining := deadline - loop.time()) > 0:
             try:
-                await self.run_once()
-            except asyncio.CancelledError:
-                raise
+                first_path = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except TimeoutError:
+                return
+            await asyncio.sleep(WATCH_DEBOUNCE_S)
+            paths = {first_path}
+            while not queue.empty():
+                paths.add(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._reconcile_paths_sync, sorted(paths))
             except Exception as exc:  # pylint: disable=broad-exception-caught
-                logger.error("Mirror reconciliation cycle failed: %s", exc, exc_info=True)
-            await asyncio.sleep(self.interval_s)
+                logger.error("Mirror event reconciliation failed: %s", exc, exc_info=True)
+
+    async def run(self) -> None:
+        """Run reconciliation on startup, on transcript changes, and every interval until cancelled."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        observer = self._start_observer(loop, queue)
+        try:
+            while True:
+                try:
+                    await self.run_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    logger.error("Mirror reconciliation cycle failed: %s", exc, exc_info=True)
+                await self._process_events_until(queue, loop.time() + self.interval_s)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join(timeout=2)
@@ -213,6 +213,7 @@ def project_entries(
     policy: VisibilityPolicy,
     since: str | None = None,
     file_index: int = 0,
+    first_entry_index: int = 0,
 ) -> Iterator[ProjectedBlock]:
     """Apply visibility policy to transcript entries, yielding visible projected blocks.
 
@@ -228,12 +229,14 @@ def project_entries(
         policy: Visibility policy controlling which block types are emitted.
         since: Optional ISO 8601 UTC timestamp; skip entries at or before this time.
         file_index: Position in the chain (passed through to ProjectedBlock).
+        first_entry_index: Position of the first entry in its transcript, for
+            callers projecting a slice that does not start at the beginning.
 
     Yields:
         ProjectedBlock for each visible block in the entries.
     """
     since_dt = _parse_timestamp(since) if since else None
-    for entry_idx, entry in enumerate(entries):
+    for entry_idx, entry in enumerate(entries, start=first_entry_index):
         if not isinstance(entry, Mapping):
             logger.debug("Skipping non-Mapping entry at index %d", entry_idx)
             continue
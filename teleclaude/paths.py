@@ -5,9 +5,12 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 TELECLAUDE_HOME = Path("~/.teleclaude").expanduser()
 STATE_DIR = TELECLAUDE_HOME / "state"
+CACHE_DIR = TELECLAUDE_HOME / "cache"
 GLOBAL_SNIPPETS_DIR = TELECLAUDE_HOME / "docs"
 TUI_STATE_PATH = STATE_DIR / "tui_state.json"
 CRON_STATE_PATH = STATE_DIR / "cron_state.json"
 SESSION_MAP_PATH = STATE_DIR / "session_map.json"
+HOOK_NATIVE_METADATA_PATH = STATE_DIR / "hook_native_metadata.json"
 CHIPTUNES_FAVORITES_PATH = STATE_DIR / "chiptunes-favorites.json"
 RUNTIME_SETTINGS_PATH = STATE_DIR / "runtime-settings.json"
+TTS_CACHE_DIR = CACHE_DIR / "tts"
@@ -28,6 +28,10 @@ logger = get_logger(__name__)
 # Customer sessions trigger memory extraction after this idle threshold (seconds).
 # Unlike admin idle timeout, this does NOT terminate the session.
 COMPACTION_IDLE_THRESHOLD_S = 30 * 60  # 30 minutes — applies to any long-lived session
+# Delivered hook outbox rows are kept this long for debugging, then pruned in bulk.
+HOOK_OUTBOX_RETENTION_S = 24 * 3600
+# Cached summaries and titles are dropped after this long so prompt changes take effect.
+SUMMARY_CACHE_RETENTION_S = 30 * 24 * 3600
 
 
 class MaintenanceService:
@@ -63,6 +67,10 @@ class MaintenanceService:
                 await db.cleanup_stale_voice_assignments()
                 cutoff_iso = (datetime.now(UTC) - timedelta(hours=72)).isoformat()
                 await db.cleanup_inbound(cutoff_iso)
+                hook_cutoff_iso = (datetime.now(UTC) - timedelta(seconds=HOOK_OUTBOX_RETENTION_S)).isoformat()
+                await db.prune_delivered_hook_outbox(hook_cutoff_iso)
+                summary_cutoff_iso = (datetime.now(UTC) - timedelta(seconds=SUMMARY_CACHE_RETENTION_S)).isoformat()
+                await db.prune_summary_cache(summary_cutoff_iso)
                 try:
                     await get_operations_service().expire_stale_operations()
                 except Exception:
@@ -116,7 +124,7 @@ class MaintenanceService:
             if current_log_file and Path(current_log_file).expanduser().exists():
                 continue
 
-            discovered_path = discover_codex_transcript_path(native_session_id)
+            discovered_path = await asyncio.to_thread(discover_codex_transcript_path, native_session_id)
             if not discovered_path:
                 continue
             if current_log_file == discovered_path:
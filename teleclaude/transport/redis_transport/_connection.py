@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     from teleclaude.core.cache import DaemonCache
     from teleclaude.core.task_registry import TaskRegistry
 
+    from ._response_mux import _ResponseMultiplexer
+
 
 class _ConnectionMixin:  # pyright: ignore[reportUnusedClass]
     """Mixin: Redis connection lifecycle, reconnect loop, start/stop."""
@@ -38,6 +40,7 @@ class _ConnectionMixin:  # pyright: ignore[reportUnusedClass]
         redis: Redis
         redis_url: str
         redis_password: str | None
+        _response_mux: _ResponseMultiplexer
         max_connections: int
         socket_timeout: float | None
         message_stream_maxlen: int
@@ -271,6 +274,8 @@ class _ConnectionMixin:  # pyright: ignore[reportUnusedClass]
             except asyncio.CancelledError:
                 pass
 
+        await self._response_mux.close()
+
         # Close Redis connection
         if self.redis:
             await self.redis.aclose()
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from instrukt_ai_logging import get_logger
 
+from teleclaude.utils import json_codec
+
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
@@ -79,7 +80,7 @@ class _HeartbeatMixin:  # pyright: ignore[reportUnusedClass]
         await redis_client.setex(
             key,
             self.heartbeat_ttl,
-            json.dumps(payload),
+            json_codec.dumps(payload),
         )
 
     # === Event Push (Phase 5) - DISABLED ===
@@ -33,6 +33,7 @@ from teleclaude.types.commands import (
     RunAgentCommand,
     StartAgentCommand,
 )
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -179,7 +180,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
             cmd_name, cmd_args = parse_command_string(parsed.command)
             if cmd_name in {"stop_notification", "input_notification"}:
                 result = await self._handle_agent_notification_command(cmd_name, cmd_args)
-                response_json = json.dumps(result)
+                response_json = json_codec.dumps(result)
                 await self.send_response(message_id, response_json)
                 return
             if cmd_name in {"list_sessions", "list_projects", "list_projects_with_todos", "get_computer_info"}:
@@ -194,7 +195,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
                 else:
                     payload = (await command_handlers.get_computer_info()).to_dict()
 
-                response_json = json.dumps({"status": "success", "data": payload})
+                response_json = json_codec.dumps({"status": "success", "data": payload})
                 await self.send_response(message_id, response_json)
                 return
 
@@ -231,7 +232,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
             logger.info(">>> command service completed for: %s", command.command_type)
 
             # Result is always envelope: {"status": "success/error", "data": ..., "error": ...}
-            response_json = json.dumps(result)
+            response_json = json_codec.dumps(result)
             logger.info(
                 ">>> About to send_response for message_id: %s, response length: %d", message_id, len(response_json)
             )
@@ -242,7 +243,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
             logger.error("Failed to handle incoming message: %s", e, exc_info=True)
             # Send error response if possible
             try:
-                error_response = json.dumps({"status": "error", "error": str(e)})
+                error_response = json_codec.dumps({"status": "error", "error": str(e)})
                 await self.send_response(message_id, error_response)
             except Exception:
                 pass
@@ -339,7 +340,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
         channel_metadata: JsonDict | None = None
         if b"channel_metadata" in data:
             try:
-                parsed = json.loads(data[b"channel_metadata"].decode("utf-8"))
+                parsed = json_codec.loads(data[b"channel_metadata"])
                 if isinstance(parsed, dict):
                     channel_metadata = parsed
             except json.JSONDecodeError:
@@ -352,7 +353,7 @@ class _MessagingMixin:  # pyright: ignore[reportUnusedClass]
         launch_intent = None
         if launch_intent_raw:
             try:
-                parsed_intent = json.loads(launch_intent_raw)
+                parsed_intent = json_codec.loads(launch_intent_raw)
                 if isinstance(parsed_intent, dict):
                     launch_intent = cast(JsonDict, parsed_intent)
             except json.JSONDecodeError:
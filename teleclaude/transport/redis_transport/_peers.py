@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
 
@@ -12,6 +11,7 @@ from teleclaude.core.dates import parse_iso_datetime
 from teleclaude.core.models import JsonDict, MessageMetadata, PeerInfo
 from teleclaude.core.redis_utils import scan_keys
 from teleclaude.types import SystemStats
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -67,9 +67,9 @@ class _PeersMixin:  # pyright: ignore[reportUnusedClass]
                 # Get data
                 data_bytes: object = await redis_client.get(key)
                 if data_bytes:
-                    # Redis returns bytes - decode to str for json.loads
+                    # Redis returns bytes
                     data_str: str = data_bytes.decode("utf-8")  # pyright: ignore[reportAttributeAccessIssue]
-                    info_obj: object = json.loads(data_str)
+                    info_obj: object = json_codec.loads(data_str)
                     if not isinstance(info_obj, dict):
                         continue
                     info: JsonDict = info_obj
@@ -119,9 +119,9 @@ class _PeersMixin:  # pyright: ignore[reportUnusedClass]
                 # Get data
                 data_bytes: object = await redis_client.get(key)
                 if data_bytes:
-                    # Redis returns bytes - decode to str for json.loads
+                    # Redis returns bytes
                     data_str: str = data_bytes.decode("utf-8")  # pyright: ignore[reportAttributeAccessIssue]
-                    info_obj: object = json.loads(data_str)
+                    info_obj: object = json_codec.loads(data_str)
                     if not isinstance(info_obj, dict):
                         continue
                     info: JsonDict = info_obj
@@ -154,7 +154,7 @@ class _PeersMixin:  # pyright: ignore[reportUnusedClass]
                         response_data = await self.client.read_response(
                             message_id, timeout=3.0, target_computer=computer_name
                         )
-                        envelope_obj: object = json.loads(response_data.strip())
+                        envelope_obj: object = json_codec.loads(response_data.strip())
                         if not isinstance(envelope_obj, dict):
                             continue
                         envelope: JsonDict = envelope_obj
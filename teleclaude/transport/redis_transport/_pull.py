@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
 from instrukt_ai_logging import get_logger
 
 from teleclaude.core.models import JsonDict, MessageMetadata, ProjectInfo, SessionSnapshot, TodoInfo
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -67,7 +67,7 @@ class _PullMixin:  # pyright: ignore[reportUnusedClass]
 
                 # Wait for response with short timeout
                 response_data = await self.client.read_response(message_id, timeout=3.0, target_computer=computer_name)
-                envelope_obj: object = json.loads(response_data.strip())
+                envelope_obj: object = json_codec.loads(response_data.strip())
 
                 if not isinstance(envelope_obj, dict):
                     logger.warning("Invalid response from %s: not a dict", computer_name)
@@ -123,7 +123,7 @@ class _PullMixin:  # pyright: ignore[reportUnusedClass]
 
             # Wait for response with short timeout
             response_data = await self.client.read_response(message_id, timeout=3.0, target_computer=computer)
-            envelope_obj: object = json.loads(response_data.strip())
+            envelope_obj: object = json_codec.loads(response_data.strip())
 
             if not isinstance(envelope_obj, dict):
                 logger.warning("Invalid response from %s: not a dict", computer)
@@ -174,7 +174,7 @@ class _PullMixin:  # pyright: ignore[reportUnusedClass]
             message_id = await self.send_request(computer, "list_projects_with_todos", MessageMetadata())
 
             response_data = await self.client.read_response(message_id, timeout=5.0, target_computer=computer)
-            envelope_obj: object = json.loads(response_data.strip())
+            envelope_obj: object = json_codec.loads(response_data.strip())
 
             if not isinstance(envelope_obj, dict):
                 logger.warning("Invalid response from %s: not a dict", computer)
@@ -234,7 +234,7 @@ class _PullMixin:  # pyright: ignore[reportUnusedClass]
 
             # Wait for response with short timeout
             response_data = await self.client.read_response(message_id, timeout=3.0, target_computer=computer)
-            envelope_obj: object = json.loads(response_data.strip())
+            envelope_obj: object = json_codec.loads(response_data.strip())
 
             if not isinstance(envelope_obj, dict):
                 logger.warning("Invalid response from %s: not a dict", computer)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, cast
@@ -13,6 +12,7 @@ from instrukt_ai_logging import get_logger
 from teleclaude.core.models import ComputerInfo, JsonDict
 from teleclaude.core.redis_utils import scan_keys
 from teleclaude.types import SystemStats
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
@@ -218,7 +218,7 @@ class _RefreshMixin:  # pyright: ignore[reportUnusedClass]
             try:
                 data_bytes: object = await redis_client.get(key)
                 data_str: str = data_bytes.decode("utf-8")  # pyright: ignore[reportAttributeAccessIssue]
-                info_obj: object = json.loads(data_str)
+                info_obj: object = json_codec.loads(data_str)
                 info = cast(JsonDict, info_obj)
 
                 computer_name = cast(str, info["computer_name"])
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
@@ -12,12 +11,15 @@ from instrukt_ai_logging import get_logger
 
 from teleclaude.core.models import JsonDict, MessageMetadata
 from teleclaude.core.origins import InputOrigin
+from teleclaude.utils import json_codec
 
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from ._response_mux import _ResponseMultiplexer
+
 
 class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
     """Mixin: request/response pattern, observation, and system commands."""
@@ -26,6 +28,7 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
         computer_name: str
         message_stream_maxlen: int
         output_stream_maxlen: int
+        _response_mux: _ResponseMultiplexer
 
         async def _get_redis(self) -> Redis: ...
 
@@ -53,7 +56,7 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
             "observer": self.computer_name,
             "started_at": time.time(),
         }
-        data = json.dumps(observation_data)
+        data = json_codec.dumps(observation_data)
 
         # Set key with TTL - auto-expires after duration
         redis_client = await self._get_redis()
@@ -121,7 +124,7 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
 
         # Add command arguments if provided
         if args:
-            data[b"args"] = json.dumps(args).encode("utf-8")
+            data[b"args"] = json_codec.dumpb(args)
 
         # Add optional session creation metadata
         if metadata.title:
@@ -129,9 +132,9 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
         if metadata.project_path:
             data[b"project_path"] = metadata.project_path.encode("utf-8")
         if metadata.channel_metadata:
-            data[b"channel_metadata"] = json.dumps(metadata.channel_metadata).encode("utf-8")
+            data[b"channel_metadata"] = json_codec.dumpb(metadata.channel_metadata)
         if metadata.launch_intent:
-            data[b"launch_intent"] = json.dumps(metadata.launch_intent.to_dict()).encode("utf-8")
+            data[b"launch_intent"] = json_codec.dumpb(metadata.launch_intent.to_dict())
         origin = metadata.origin or InputOrigin.REDIS.value
         data[b"origin"] = origin.encode("utf-8")
 
@@ -194,7 +197,8 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
         """Read response from ephemeral request (non-streaming).
 
         Used for one-shot request/response like list_projects, get_computer_info.
-        Reads once from the Redis stream instead of continuous polling.
+        All concurrent waits share one blocking XREAD (see _ResponseMultiplexer),
+        so a response wakes its waiter on arrival instead of on the next poll.
 
         Args:
             message_id: Redis stream entry ID from the original request
@@ -211,55 +215,15 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
             output_stream = f"output:{target_computer}:{message_id}"
         else:
             output_stream = f"output:{message_id}"
-        start_time = time.time()
         logger.trace("Redis response wait", stream=output_stream, timeout_s=timeout)
 
         try:
-            poll_count = 0
-            while True:
-                # Check timeout
-                elapsed = time.time() - start_time
-                if elapsed > timeout:
-                    logger.warning(
-                        "read_response() timed out after %d polls (%.1fs) for message %s",
-                        poll_count,
-                        elapsed,
-                        message_id,
-                    )
-                    raise TimeoutError(f"No response received for message {message_id} within {timeout}s")
-
-                # Read from stream (blocking with 100ms timeout)
-                poll_count += 1
-                logger.trace(
-                    "Redis response poll",
-                    request_id=message_id,
-                    poll=poll_count,
-                    elapsed_s=round(elapsed, 1),
-                )
-                redis_client = await self._get_redis()
-                messages = await redis_client.xread({output_stream.encode("utf-8"): b"0"}, block=100, count=1)
-
-                if messages:
-                    # Got response - extract and return
-                    for _stream_name, stream_messages in messages:
-                        for _entry_id, data in stream_messages:
-                            chunk_bytes: bytes = data.get(b"chunk", b"")
-                            chunk: str = chunk_bytes.decode("utf-8")
-                            if chunk:
-                                logger.debug(
-                                    "Redis response received",
-                                    request_id=message_id,
-                                    polls=poll_count,
-                                    length=len(chunk),
-                                )
-                                return chunk
-
-                # No message yet, continue polling
-                await asyncio.sleep(0.1)
-
+            chunk = await self._response_mux.wait(output_stream, timeout)
         except asyncio.CancelledError:
             logger.debug("read_response cancelled for message %s", message_id)
             raise
+        logger.debug("Redis response received", request_id=message_id, length=len(chunk))
+        return chunk
 
     async def send_system_command(self, computer_name: str, command: str, args: JsonDict | None = None) -> str:
         """Send system command to remote computer (not session-specific).
@@ -289,7 +253,7 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
 
         # Add args as JSON if provided
         if args:
-            data[b"args"] = json.dumps(args).encode("utf-8")
+            data[b"args"] = json_codec.dumpb(args)
 
         # Send to Redis stream
         logger.debug("Sending system command to %s: %s", computer_name, command)
@@ -317,7 +281,7 @@ class _RequestResponseMixin:  # pyright: ignore[reportUnusedClass]
         if not data:
             return {"status": "unknown"}
 
-        result_obj: object = json.loads(data.decode("utf-8"))
+        result_obj: object = json_codec.loads(data)
         if not isinstance(result_obj, dict):
             return {"status": "error", "error": "Invalid result format"}
         result: JsonDict = result_obj
@@ -0,0 +1,145 @@
+"""Response multiplexer: one blocking XREAD serving every pending request/response wait."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from instrukt_ai_logging import get_logger
+
+logger = get_logger(__name__)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Upper bound for one XREAD; new waiters normally interrupt it via the wake stream.
+_BLOCK_MS = 1000
+_ERROR_BACKOFF_S = 0.2
+
+
+class _ResponseMultiplexer:
+    """Dispatch responses from many ``output:*`` streams to per-request futures.
+
+    A single reader task issues one blocking XREAD across all outstanding
+    response streams plus a private wake stream. Registering a new waiter
+    appends to the wake stream so the blocked XREAD returns and is reissued
+    with the new stream included. The reader exits when nothing is pending.
+    """
+
+    def __init__(self, get_redis: Callable[[], Awaitable[Redis]], computer_name: str) -> None:
+        self._get_redis = get_redis
+        self._wake_stream = f"output:{computer_name}:mux:{uuid.uuid4().hex}".encode()
+        self._wake_last_id = b"0"
+        self._waiters: dict[bytes, asyncio.Future[str]] = {}
+        self._last_ids: dict[bytes, bytes] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+        self._wake_stream_used = False
+
+    @property
+    def pending_count(self) -> int:
+        """Number of requests currently waiting for a response."""
+        return len(self._waiters)
+
+    async def wait(self, output_stream: str, timeout: float) -> str:
+        """Wait for the first non-empty chunk on ``output_stream``.
+
+        Raises:
+            TimeoutError: If no response arrives within ``timeout`` seconds.
+        """
+        stream_key = output_stream.encode("utf-8")
+        existing = self._waiters.get(stream_key)
+        future: asyncio.Future[str] = existing or asyncio.get_running_loop().create_future()
+        if existing is None:
+            self._waiters[stream_key] = future
+            self._last_ids[stream_key] = b"0"
+            await self._ensure_reader()
+
+        start_time = time.monotonic()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                "read_response() timed out after %.1fs for stream %s (pending=%d)",
+                time.monotonic() - start_time,
+                output_stream,
+                len(self._waiters),
+            )
+            raise TimeoutError(f"No response received on {output_stream} within {timeout}s") from None
+        finally:
+            if self._waiters.get(stream_key) is future:
+                self._waiters.pop(stream_key, None)
+                self._last_ids.pop(stream_key, None)
+
+    async def close(self) -> None:
+        """Stop the reader task and drop the wake stream."""
+        task = self._reader_task
+        self._reader_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for future in self._waiters.values():
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
+        self._last_ids.clear()
+        if self._wake_stream_used:
+            try:
+                redis_client = await asyncio.wait_for(self._get_redis(), timeout=1.0)
+                await redis_client.delete(self._wake_stream)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.debug("Failed to delete response mux wake stream: %s", exc)
+
+    async def _ensure_reader(self) -> None:
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._read_loop(), name="redis-response-mux")
+            return
+        # Reader is (probably) blocked in XREAD without the new stream: interrupt it.
+        try:
+            redis_client = await self._get_redis()
+            await redis_client.xadd(self._wake_stream, {b"wake": b"1"}, maxlen=1)
+            self._wake_stream_used = True
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.debug("Response mux wake failed (reader picks up new stream after block): %s", exc)
+
+    async def _read_loop(self) -> None:
+        while self._waiters:
+            streams: dict[bytes, bytes] = {self._wake_stream: self._wake_last_id}
+            streams.update(self._last_ids)
+            try:
+                redis_client = await self._get_redis()
+                messages = await redis_client.xread(streams, block=_BLOCK_MS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning("Response mux XREAD failed: %s", exc)
+                await asyncio.sleep(_ERROR_BACKOFF_S)
+                continue
+
+            if messages:
+                self._dispatch(messages)
+            # Always yield: an empty XREAD must not starve waiters' timeouts.
+            await asyncio.sleep(0)
+
+    def _dispatch(self, messages: list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]) -> None:
+        for stream_name, stream_messages in messages:
+            stream_key = stream_name if isinstance(stream_name, bytes) else str(stream_name).encode("utf-8")
+            if stream_key == self._wake_stream:
+                if stream_messages:
+                    self._wake_last_id = stream_messages[-1][0]
+                continue
+            future = self._waiters.get(stream_key)
+            for entry_id, data in stream_messages:
+                if stream_key in self._last_ids:
+                    self._last_ids[stream_key] = entry_id
+                chunk_bytes: bytes = data.get(b"chunk", b"")
+                chunk = chunk_bytes.decode("utf-8")
+                if chunk and future is not None and not future.done():
+                    logger.debug("Redis response received", stream=stream_key.decode("utf-8"), length=len(chunk))
+                    future.set_result(chunk)
+                    break
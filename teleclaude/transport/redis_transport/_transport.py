@@ -28,6 +28,7 @@ from ._peers import _PeersMixin
 from ._pull import _PullMixin
 from ._refresh import _RefreshMixin
 from ._request_response import _RequestResponseMixin
+from ._response_mux import _ResponseMultiplexer
 
 if TYPE_CHECKING:
     from teleclaude.core.adapter_client import AdapterClient
@@ -126,6 +127,9 @@ class RedisTransport(  # pyright: ignore[reportIncompatibleMethodOverride]
         self.heartbeat_interval = 30  # Send heartbeat every 30s
         self.heartbeat_ttl = 60  # Key expires after 60s
 
+        # Single blocking XREAD shared by all read_response() waiters
+        self._response_mux = _ResponseMultiplexer(lambda: self._get_redis(), self.computer_name)
+
         # Track pending new_session requests for response
         self._pending_new_session_request: str | None = None
 
@@ -0,0 +1,151 @@
+"""Disk-backed LRU cache of synthesized speech.
+
+Clips are content-addressed by (service, voice, normalized text) so repeated
+phrases — canned session-start greetings, recurring summaries — are played
+from disk instead of being re-synthesized through a cloud or local model.
+Recency is tracked with file mtimes and mirrored in an in-memory index, so a
+put only touches the directory tree when the cache has grown past its byte
+budget; then the tree is rescanned and the oldest clips are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from instrukt_ai_logging import get_logger
+
+from teleclaude.paths import TTS_CACHE_DIR
+from teleclaude.tts.models import SynthesizedAudio
+
+logger = get_logger(__name__)
+
+TTS_CACHE_MAX_BYTES: int = int(os.getenv("TTS_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+_PLAYBACK_TIMEOUT_S = 300
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different renderings share one clip."""
+    return " ".join(text.split())
+
+
+def cache_voice(service: str, voice: str | None) -> str | None:
+    """Voice to synthesize and key clips with; None means the provider default.
+
+    Services without a voice list are assigned their own name as the voice, and
+    fallback chains pass None for them; both render the same default voice.
+    """
+    if not voice or voice == service:
+        return None
+    return voice
+
+
+class TTSAudioCache:
+    """Content-addressed clip store with least-recently-played eviction."""
+
+    def __init__(self, root: Path = TTS_CACHE_DIR, max_bytes: int = TTS_CACHE_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Clip path -> size, least recently used first; loaded on first put.
+        self._sizes: OrderedDict[Path, int] | None = None
+        self._total = 0
+
+    @staticmethod
+    def cache_key(service: str, voice: str | None, text: str) -> str:
+        material = "\0".join((service, cache_voice(service, voice) or "", normalize_text(text)))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, service: str, voice: str | None, text: str) -> Path | None:
+        """Return the cached clip and mark it recently used, or None on a miss."""
+        key = self.cache_key(service, voice, text)
+        bucket = self.root / key[:2]
+        try:
+            candidates = [path for path in bucket.iterdir() if path.stem == key]
+        except OSError:
+            return None
+        for path in candidates:
+            try:
+                os.utime(path)
+            except OSError:
+                continue
+            with self._lock:
+                if self._sizes is not None and path in self._sizes:
+                    self._sizes.move_to_end(path)
+            return path
+        return None
+
+    def put(self, service: str, voice: str | None, text: str, clip: SynthesizedAudio) -> Path:
+        """Store a clip atomically and evict old clips beyond the byte budget."""
+        key = self.cache_key(service, voice, text)
+        bucket = self.root / key[:2]
+        bucket.mkdir(parents=True, exist_ok=True)
+        path = bucket / f"{key}{clip.suffix}"
+        fd, tmp_name = tempfile.mkstemp(dir=bucket, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(clip.data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._record(path, len(clip.data))
+        return path
+
+    def _record(self, path: Path, size: int) -> None:
+        with self._lock:
+            if self._sizes is None:
+                self._rescan_locked()
+            assert self._sizes is not None
+            self._total += size - self._sizes.pop(path, 0)
+            self._sizes[path] = size
+            if self._total > self.max_bytes:
+                # Another process may share the directory; trust the disk before deleting.
+                self._rescan_locked()
+                self._evict_locked()
+
+    def _rescan_locked(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        self._sizes = OrderedDict((path, size) for _mtime, size, path in entries)
+        self._total = sum(self._sizes.values())
+
+    def _evict_locked(self) -> None:
+        assert self._sizes is not None
+        while self._total > self.max_bytes and self._sizes:
+            path, size = self._sizes.popitem(last=False)
+            path.unlink(missing_ok=True)
+            self._total -= size
+            logger.debug("TTS cache evicted %s", path.name)
+
+
+def play_audio_file(path: Path) -> bool:
+    """Play an encoded clip synchronously with the platform player."""
+    player = shutil.which("afplay")
+    cmd = [player, str(path)] if player else None
+    if cmd is None:
+        ffplay = shutil.which("ffplay")
+        cmd = [ffplay, "-nodisp", "-autoexit", "-loglevel", "quiet", str(path)] if ffplay else None
+    if cmd is None:
+        logger.debug("No audio player available for cached clip")
+        return False
+    try:
+        result = subprocess.run(cmd, check=False, capture_output=True, timeout=_PLAYBACK_TIMEOUT_S)
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.debug("Cached clip playback failed: %s", exc)
+        return False
+    return result.returncode == 0
@@ -4,6 +4,8 @@ import os
 
 from instrukt_ai_logging import get_logger
 
+from teleclaude.tts.models import SynthesizedAudio
+
 logger = get_logger(__name__)
 
 
@@ -51,3 +53,28 @@ class ElevenLabsBackend:
         except Exception as e:
             logger.debug(f"ElevenLabs failed: {e}")
             return False
+
+    def synthesize(self, text: str, voice_id: str | None = None) -> SynthesizedAudio | None:
+        """Synthesize text to MP3 without playing it (used by the audio cache)."""
+        try:
+            from elevenlabs.client import ElevenLabs
+
+            api_key = os.getenv("ELEVENLABS_API_KEY")
+            if not api_key or not voice_id:
+                return None
+
+            client = ElevenLabs(api_key=api_key)
+            audio = client.text_to_speech.convert(
+                text=text,
+                voice_id=voice_id,
+                model_id="eleven_flash_v2_5",
+                output_format="mp3_44100_128",
+            )
+            data = audio if isinstance(audio, bytes) else b"".join(audio)
+            return SynthesizedAudio(data=data, suffix=".mp3") if data else None
+        except ImportError:
+            logger.debug("elevenlabs library not installed")
+            return None
+        except Exception as e:
+            logger.debug(f"ElevenLabs synthesis failed: {e}")
+            return None
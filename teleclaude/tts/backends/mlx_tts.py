@@ -10,6 +10,7 @@ from pathlib import Path
 from instrukt_ai_logging import get_logger
 
 from teleclaude.mlx_utils import resolve_model_ref
+from teleclaude.tts.models import SynthesizedAudio
 
 generate_audio = None
 load_model = None
@@ -161,62 +162,95 @@ class MLXTTSBackend:
             logger.error("MLX TTS [%s] failed: %s", self._service_name, e)
             return False
 
+    def synthesize(self, text: str, voice_name: str | None = None) -> SynthesizedAudio | None:
+        """Synthesize text to WAV without playing it (used by the audio cache)."""
+        if not self._ensure_model():
+            return None
+        try:
+            voice = voice_name or self._service_name
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                prefix = f"{tmp_dir}/tts_output"
+                if self._model is None and self._cli_bin:
+                    audio_file = self._generate_cli(text, voice, prefix)
+                else:
+                    model_type = getattr(getattr(self._model, "config", None), "tts_model_type", "unknown")
+                    audio_file = self._generate_local(text, voice, model_type, prefix)
+                if audio_file is None:
+                    return None
+                return SynthesizedAudio(data=audio_file.read_bytes(), suffix=".wav")
+        except Exception as e:
+            logger.error("MLX TTS [%s] synthesis failed: %s", self._service_name, e)
+            return None
+
     def _speak_cli(self, text: str, voice: str) -> bool:
         """Speak via CLI subprocess fallback."""
         if not self._cli_bin:
             return False
 
         with tempfile.TemporaryDirectory() as tmp_dir:
-            prefix = f"{tmp_dir}/tts_output"
-            cmd = self._build_cli_command(
-                text=text,
-                voice=voice,
-                file_prefix=prefix,
-            )
-
-            # Pass config params as CLI flags, excluding internally-controlled keys.
-            # `play` would re-add async playback (the exact bug this fix removes);
-            # `model`, `text`, `voice`, `file_prefix`, `join_audio`, `audio_format`
-            # are already set by _build_cli_command and must not be doubled.
-            _protected = frozenset(
-                {"play", "verbose", "model", "text", "voice", "file_prefix", "join_audio", "audio_format"}
-            )
-            for key, val in self._params.items():
-                if key not in _protected:
-                    cmd.extend([f"--{key}", str(val)])
-
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(
-                    "MLX TTS [%s] CLI failed: %s", self._service_name, (result.stderr or result.stdout).strip()
-                )
-                return False
-
-            audio_file = Path(f"{prefix}.wav")
-            if not audio_file.exists() or audio_file.stat().st_size == 0:
-                logger.error("MLX TTS [%s] CLI produced no audio file (voice=%s)", self._service_name, voice)
+            audio_file = self._generate_cli(text, voice, f"{tmp_dir}/tts_output")
+            if audio_file is None:
                 return False
 
             # Play audio explicitly (synchronous) while temp dir still exists.
             # This keeps the playback lock held for the full audio duration,
             # preventing overlapping playback that would otherwise cause echoes.
-            play_result = subprocess.run(
-                ["afplay", str(audio_file)],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if play_result.returncode != 0:
-                logger.error(
-                    "MLX TTS [%s] CLI playback failed: %s",
-                    self._service_name,
-                    (play_result.stderr or play_result.stdout).strip(),
-                )
+            if not self._play(audio_file, "CLI playback"):
                 return False
 
         logger.debug("MLX TTS [%s]: spoke %d chars via CLI (voice=%s)", self._service_name, len(text), voice)
         return True
 
+    def _generate_cli(self, text: str, voice: str, prefix: str) -> Path | None:
+        """Generate a WAV file via the CLI; return its path or None on failure."""
+        if not self._cli_bin:
+            return None
+        cmd = self._build_cli_command(
+            text=text,
+            voice=voice,
+            file_prefix=prefix,
+        )
+
+        # Pass config params as CLI flags, excluding internally-controlled keys.
+        # `play` would re-add async playback (the exact bug this fix removes);
+        # `model`, `text`, `voice`, `file_prefix`, `join_audio`, `audio_format`
+        # are already set by _build_cli_command and must not be doubled.
+        _protected = frozenset(
+            {"play", "verbose", "model", "text", "voice", "file_prefix", "join_audio", "audio_format"}
+        )
+        for key, val in self._params.items():
+            if key not in _protected:
+                cmd.extend([f"--{key}", str(val)])
+
+        result = subprocess.run(cmd, check=False, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.error("MLX TTS [%s] CLI failed: %s", self._service_name, (result.stderr or result.stdout).strip())
+            return None
+
+        audio_file = Path(f"{prefix}.wav")
+        if not audio_file.exists() or audio_file.stat().st_size == 0:
+            logger.error("MLX TTS [%s] CLI produced no audio file (voice=%s)", self._service_name, voice)
+            return None
+        return audio_file
+
+    def _play(self, audio_file: Path, label: str) -> bool:
+        """Play a generated WAV synchronously with afplay."""
+        result = subprocess.run(
+            ["afplay", str(audio_file)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            logger.error(
+                "MLX TTS [%s] %s failed: %s",
+                self._service_name,
+                label,
+                (result.stderr or result.stdout).strip(),
+            )
+            return False
+        return True
+
     def _build_cli_command(self, text: str, voice: str, file_prefix: str) -> list[str]:
         """Build the CLI command list for the fallback CLI path."""
         cli_args = [
@@ -256,54 +290,50 @@ class MLXTTSBackend:
     def _speak_local(self, text: str, voice: str, model_type: str) -> bool:
         """Speak via in-process mlx_audio."""
         with tempfile.TemporaryDirectory() as tmp_dir:
-            prefix = f"{tmp_dir}/tts_output"
-            generate_kwargs: dict[str, object] = {  # guard: loose-dict - mlx_audio kwargs are dynamic.
-                "model": self._model,
-                "text": text,
-                "voice": voice,
-                "file_prefix": prefix,
-                "play": False,
-                "join_audio": True,
-                "audio_format": "wav",
-                "verbose": False,
-            }
-
-            if model_type == "voice_design":
-                generate_kwargs["instruct"] = os.getenv("TELECLAUDE_MLX_TTS_INSTRUCT", DEFAULT_VOICE_DESIGN_INSTRUCT)
-
-            # Merge config params, but never let user params override the internally-
-            # controlled keys. Overriding `play` would cause double-playback (echo);
-            # overriding `verbose` would leak model output to the daemon TTY.
-            _protected = frozenset(
-                {"play", "verbose", "model", "text", "voice", "file_prefix", "join_audio", "audio_format"}
-            )
-            generate_kwargs.update({k: v for k, v in self._params.items() if k not in _protected})
-
-            generate_audio(**generate_kwargs)
-
-            audio_file = Path(f"{prefix}.wav")
-            if not audio_file.exists() or audio_file.stat().st_size == 0:
-                logger.error(
-                    "MLX TTS [%s] produced no audio (model_type=%s voice=%s)",
-                    self._service_name,
-                    model_type,
-                    voice,
-                )
+            audio_file = self._generate_local(text, voice, model_type, f"{tmp_dir}/tts_output")
+            if audio_file is None:
                 return False
-
-            result = subprocess.run(
-                ["afplay", str(audio_file)],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                logger.error(
-                    "MLX TTS [%s] playback failed: %s", self._service_name, (result.stderr or result.stdout).strip()
-                )
+            if not self._play(audio_file, "playback"):
                 return False
 
         logger.debug(
             "MLX TTS [%s]: spoke %d chars (model_type=%s voice=%s)", self._service_name, len(text), model_type, voice
         )
         return True
+
+    def _generate_local(self, text: str, voice: str, model_type: str, prefix: str) -> Path | None:
+        """Generate a WAV file in-process; return its path or None on failure."""
+        generate_kwargs: dict[str, object] = {  # guard: loose-dict - mlx_audio kwargs are dynamic.
+            "model": self._model,
+            "text": text,
+            "voice": voice,
+            "file_prefix": prefix,
+            "play": False,
+            "join_audio": True,
+            "audio_format": "wav",
+            "verbose": False,
+        }
+
+        if model_type == "voice_design":
+            generate_kwargs["instruct"] = os.getenv("TELECLAUDE_MLX_TTS_INSTRUCT", DEFAULT_VOICE_DESIGN_INSTRUCT)
+
+        # Merge config params, but never let user params override the internally-
+        # controlled keys. Overriding `play` would cause double-playback (echo);
+        # overriding `verbose` would leak model output to the daemon TTY.
+        _protected = frozenset(
+            {"play", "verbose", "model", "text", "voice", "file_prefix", "join_audio", "audio_format"}
+        )
+        generate_kwargs.update({k: v for k, v in self._params.items() if k not in _protected})
+
+        generate_audio(**generate_kwargs)
+
+        audio_file = Path(f"{prefix}.wav")
+        if not audio_file.exists() or audio_file.stat().st_size == 0:
+            logger.error(
+                "MLX TTS [%s] produced no audio (model_type=%s voice=%s)",
+                self._service_name,
+                model_type,
+                voice,
+            )
+            return None
+        return audio_file
@@ -6,6 +6,8 @@ import tempfile
 
 from instrukt_ai_logging import get_logger
 
+from teleclaude.tts.models import SynthesizedAudio
+
 logger = get_logger(__name__)
 
 
@@ -63,3 +65,27 @@ class OpenAITTSBackend:
         except Exception as e:
             logger.debug(f"OpenAI TTS failed: {e}")
             return False
+
+    def synthesize(self, text: str, voice_name: str | None = None) -> SynthesizedAudio | None:
+        """Synthesize text to MP3 without playing it (used by the audio cache)."""
+        try:
+            from openai import OpenAI
+
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                return None
+
+            client = OpenAI(api_key=api_key)
+            response = client.audio.speech.create(
+                model="gpt-4o-mini-tts",
+                voice=voice_name or "nova",
+                input=text,
+            )
+            data = response.content
+            return SynthesizedAudio(data=data, suffix=".mp3") if data else None
+        except ImportError:
+            logger.debug("openai library not installed")
+            return None
+        except Exception as e:
+            logger.debug(f"OpenAI TTS synthesis failed: {e}")
+            return None
@@ -1,6 +1,7 @@
 """TTS Manager - unified interface for TTS across TeleClaude."""
 
 import asyncio
+import os
 import random
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -12,8 +13,10 @@ from teleclaude.core.db import db
 from teleclaude.core.events import AgentHookEvents, AgentHookEventType
 from teleclaude.core.origins import InputOrigin
 from teleclaude.core.voice_assignment import VoiceConfig
+from teleclaude.tts import backends
+from teleclaude.tts.audio_cache import cache_voice
 from teleclaude.tts.audio_focus import AudioFocusCoordinator
-from teleclaude.tts.queue_runner import run_tts_with_lock_async
+from teleclaude.tts.queue_runner import get_audio_cache, run_tts_with_lock_async, tts_lock
 
 if TYPE_CHECKING:
     from teleclaude.chiptunes.manager import ChiptunesManager
@@ -43,6 +46,8 @@ SESSION_START_MESSAGES = [
 
 logger = get_logger(__name__)
 
+TTS_PREWARM_MAX_CLIPS: int = int(os.getenv("TTS_PREWARM_MAX_CLIPS", "200"))
+
 
 @dataclass(slots=True)
 class _SpeechJob:
@@ -64,6 +69,7 @@ class TTSManager:
         self._speech_queue: asyncio.Queue[_SpeechJob] | None = None
         self._worker_task: asyncio.Task[None] | None = None
         self._runtime_lock: asyncio.Lock | None = None
+        self._prewarm_task: asyncio.Task[int] | None = None
 
     def set_chiptunes_manager(self, manager: "ChiptunesManager") -> None:
         """Inject ChiptunesManager reference for pause/resume during TTS."""
@@ -330,6 +336,8 @@ class TTSManager:
             self._worker_task = None
         if not hasattr(self, "_runtime_lock"):
             self._runtime_lock = None
+        if not hasattr(self, "_prewarm_task"):
+            self._prewarm_task = None
 
     async def _ensure_playback_runtime(self) -> None:
         self._ensure_runtime_state()
@@ -413,9 +421,80 @@ class TTSManager:
             return
         logger.error("TTS worker crashed: %s", exc, exc_info=exc)
 
+    def start_prewarm(self) -> asyncio.Task[int] | None:
+        """Synthesize canned messages into the audio cache in the background."""
+        if not self.enabled:
+            return None
+        self._ensure_runtime_state()
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            return self._prewarm_task
+        self._prewarm_task = asyncio.create_task(asyncio.to_thread(self._prewarm_cache), name="tts-prewarm")
+        return self._prewarm_task
+
+    def _canned_messages(self) -> list[str]:
+        """All fixed phrases TTS may speak for configured events."""
+        messages: list[str] = []
+        for event_name, event_cfg in (self.tts_config.events or {}).items():
+            if not event_cfg.enabled:
+                continue
+            if event_name == "session_start":
+                messages.extend(SESSION_START_MESSAGES)
+                continue
+            messages.extend(event_cfg.messages or [])
+            if event_cfg.message:
+                messages.append(event_cfg.message)
+        return list(dict.fromkeys(messages))
+
+    def _prewarm_cache(self) -> int:
+        """Synthesize uncached canned clips for every voice of cache-capable services.
+
+        Runs in a worker thread. Each clip is synthesized under the playback
+        lock, so an in-process model never runs concurrently with speech.
+        Returns the number of clips synthesized.
+        """
+        cache = get_audio_cache()
+        messages = self._canned_messages()
+        synthesized = 0
+        for service_name, service_cfg in (self.tts_config.services or {}).items():
+            if not service_cfg.enabled:
+                continue
+            backend = backends.get_backend(service_name)
+            synthesize = getattr(backend, "synthesize", None)
+            if synthesize is None:
+                continue
+            configured = [v.voice_id or v.name for v in service_cfg.voices] if service_cfg.voices else [None]
+            voices = list(dict.fromkeys(cache_voice(service_name, voice) for voice in configured))
+            for voice in voices:
+                for text in messages:
+                    if synthesized >= TTS_PREWARM_MAX_CLIPS:
+                        logger.info("TTS pre-warm stopped at clip limit (%d)", TTS_PREWARM_MAX_CLIPS)
+                        return synthesized
+                    if cache.get(service_name, voice, text) is not None:
+                        continue
+                    try:
+                        with tts_lock():
+                            clip = synthesize(text, voice)
+                        if clip is None:
+                            break  # Backend unavailable for this voice; don't hammer it.
+                        cache.put(service_name, voice, text, clip)
+                    except Exception as e:
+                        logger.debug("TTS pre-warm failed for %s/%s: %s", service_name, voice, e)
+                        break
+                    synthesized += 1
+        logger.info("TTS pre-warm synthesized %d clips", synthesized)
+        return synthesized
+
     async def shutdown(self) -> None:
         """Stop the background worker and restore background audio state."""
         self._ensure_runtime_state()
+        prewarm = self._prewarm_task
+        self._prewarm_task = None
+        if prewarm is not None:
+            prewarm.cancel()
+            try:
+                await prewarm
+            except (asyncio.CancelledError, Exception):
+                pass
         worker = self._worker_task
         self._worker_task = None
         if worker is not None:
@@ -34,3 +34,11 @@ class TTSConfig:
     enabled: bool
     events: dict[str, EventConfig] = field(default_factory=dict)
     services: dict[str, ServiceConfig] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SynthesizedAudio:
+    """Encoded speech produced by a backend without playing it."""
+
+    data: bytes
+    suffix: str  # File extension including the dot, e.g. ".mp3"
@@ -3,14 +3,69 @@
 import asyncio
 import fcntl
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from instrukt_ai_logging import get_logger
 
 from teleclaude.tts import backends
+from teleclaude.tts.audio_cache import TTSAudioCache, cache_voice, play_audio_file
 
 logger = get_logger(__name__)
 
+_audio_cache = TTSAudioCache()
+
+
+def get_audio_cache() -> TTSAudioCache:
+    """Return the process-wide synthesized audio cache."""
+    return _audio_cache
+
+
+@contextmanager
+def tts_lock() -> Iterator[None]:
+    """Hold the cross-process TTS lock; playback and synthesis never overlap."""
+    # Use system /tmp for playback lock
+    lock_dir = Path(tempfile.gettempdir()) / "teleclaude_tts"
+    lock_dir.mkdir(exist_ok=True, parents=True)
+    with open(lock_dir / ".playback.lock", "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _speak_with_cache(
+    backend: backends.TTSBackend,
+    service_name: str,
+    text: str,
+    voice_param: str | None,
+    cache: TTSAudioCache,
+) -> bool:
+    """Play a cached clip, synthesizing and storing it on a miss.
+
+    Backends without ``synthesize`` (system voices) speak directly. A cached
+    clip that fails to play falls back to the backend's own playback path.
+    """
+    synthesize = getattr(backend, "synthesize", None)
+    if synthesize is None:
+        return backend.speak(text, voice_param)
+
+    clip_path = cache.get(service_name, voice_param, text)
+    if clip_path is None:
+        clip = synthesize(text, cache_voice(service_name, voice_param))
+        if clip is None:
+            return False
+        try:
+            clip_path = cache.put(service_name, voice_param, text, clip)
+        except OSError as e:
+            logger.debug(f"TTS cache write failed: {e}")
+            return backend.speak(text, voice_param)
+    else:
+        logger.debug(f"TTS cache hit: {service_name} voice={voice_param}")
+
+    if play_audio_file(clip_path):
+        return True
+    return backend.speak(text, voice_param)
+
 
 def run_tts_with_lock(
     text: str,
@@ -30,15 +85,8 @@ def run_tts_with_lock(
     Returns:
         Tuple of (success, service_name, voice_param) for the first successful service.
     """
-    # Use system /tmp for playback lock
-    lock_dir = Path(tempfile.gettempdir()) / "teleclaude_tts"
-    lock_dir.mkdir(exist_ok=True, parents=True)
-    playback_lock = lock_dir / ".playback.lock"
-
     try:
-        with open(playback_lock, "a") as lock:
-            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
-
+        with tts_lock():
             for service_name, voice_param in service_chain:
                 logger.debug(
                     f"Trying TTS service: {service_name}",
@@ -54,7 +102,7 @@ def run_tts_with_lock(
                     continue
 
                 try:
-                    if backend.speak(text, voice_param):
+                    if _speak_with_cache(backend, service_name, text, voice_param, _audio_cache):
                         logger.debug(
                             f"TTS succeeded: {service_name} voice={voice_param}",
                             extra={"session_id": session_id},
@@ -0,0 +1,244 @@
+"""Shared git queries for repositories and their worktrees.
+
+Ref lookups are batched through a single ``git cat-file --batch-check`` process
+and cached per working directory. A cached answer is reused while the files git
+would read to produce it (``HEAD``, the loose ref, ``packed-refs``) keep the
+same stat, so repeated decisions over one worktree cost a few ``stat`` calls
+instead of a fork each. Anything that depends on working-tree contents, such as
+``git diff``, goes through ``GitQuery.run`` and is never cached.
+
+Every call blocks; async callers wrap them in ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+__all__ = ["GitQuery", "clear_git_query_cache", "git_query"]
+
+GIT_QUERY_TIMEOUT_S = 10
+
+_FULL_SHA = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+# Plain ref names resolve from ref files alone. Revision expressions
+# (HEAD~1, main@{u}, main:path) are still answered, just never cached.
+_REF_NAME = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_./-]*")
+_REF_SEARCH = ("{}", "refs/{}", "refs/tags/{}", "refs/heads/{}", "refs/remotes/{}")
+
+_StatKey = tuple[int, int, int] | None
+_CacheKey = tuple[object, ...]
+
+
+def _stat_key(path: str) -> _StatKey:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _find_git_dirs(cwd: str) -> tuple[str, str] | None:
+    """Return ``(git_dir, common_dir)`` for cwd without running git, or None.
+
+    None means refs cannot be watched through plain files (no repository
+    found, ``GIT_DIR`` override, reftable backend); queries then always fork.
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+    start = Path(cwd)
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = (candidate / content[len("gitdir:") :].strip()).resolve()
+        else:
+            continue
+        common_dir = git_dir
+        try:
+            common_dir = (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+        except OSError:
+            pass
+        if (common_dir / "reftable").is_dir():
+            return None
+        return str(git_dir), str(common_dir)
+    return None
+
+
+class GitQuery:
+    """Batched, cached git lookups for one working directory."""
+
+    def __init__(self, cwd: str) -> None:
+        self.cwd = cwd
+        self._lock = threading.Lock()
+        self._dirs: tuple[str, str] | None = None
+        self._refs: dict[str, tuple[_CacheKey, str]] = {}
+        self._counts: dict[tuple[str, str], int] = {}
+        self._stash: tuple[_CacheKey, list[str]] | None = None
+
+    def run(self, args: list[str], *, input: str | None = None) -> subprocess.CompletedProcess[str]:
+        """Run ``git <args>`` in this directory; raises OSError or TimeoutExpired."""
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.cwd or None,
+            input=input,
+            capture_output=True,
+            text=True,
+            timeout=GIT_QUERY_TIMEOUT_S,
+        )
+
+    def rev_parse(self, name: str) -> str:
+        """Return the object name ``name`` resolves to, or "" when it does not resolve."""
+        return self.rev_parse_many([name])[0]
+
+    def rev_parse_many(self, names: Iterable[str]) -> list[str]:
+        """Resolve several names with at most one git process.
+
+        Unresolvable names map to "". Raises OSError or TimeoutExpired when git
+        cannot be run; a failing git process yields "" for every uncached name.
+        """
+        names = list(names)
+        dirs = self._git_dirs()
+        keys = [self._ref_key(name, dirs) if dirs else None for name in names]
+        results: list[str | None] = [None] * len(names)
+        with self._lock:
+            for i, (name, key) in enumerate(zip(names, keys)):
+                cached = self._refs.get(name) if key is not None else None
+                if cached is not None and cached[0] == key:
+                    results[i] = cached[1]
+        missing = [i for i, value in enumerate(results) if value is None]
+        if missing:
+            resolved = self._batch_check([names[i] for i in missing])
+            with self._lock:
+                for i, sha in zip(missing, resolved or [""] * len(missing)):
+                    results[i] = sha
+                    key = keys[i]
+                    if resolved is not None and key is not None:
+                        self._refs[names[i]] = (key, sha)
+        return [value or "" for value in results]
+
+    def count_commits(self, include: str, exclude: str) -> int | None:
+        """Count commits reachable from ``include`` but not ``exclude``; None on failure.
+
+        Counts between two full object names never change and are memoized.
+        """
+        memo_key = (include, exclude)
+        cacheable = bool(_FULL_SHA.fullmatch(include) and _FULL_SHA.fullmatch(exclude))
+        if cacheable:
+            with self._lock:
+                if memo_key in self._counts:
+                    return self._counts[memo_key]
+        result = self.run(["rev-list", "--count", include, f"^{exclude}"])
+        if result.returncode != 0:
+            return None
+        try:
+            count = int(result.stdout.strip())
+        except ValueError:
+            return None
+        if cacheable:
+            with self._lock:
+                self._counts[memo_key] = count
+        return count
+
+    def stash_entries(self) -> list[str] | None:
+        """Return ``git stash list`` lines, or None when git fails.
+
+        The stash is read from its reflog, so without that file the answer is
+        empty and no process is started.
+        """
+        dirs = self._git_dirs()
+        key: _CacheKey | None = None
+        if dirs is not None:
+            common_dir = dirs[1]
+            reflog = _stat_key(os.path.join(common_dir, "logs", "refs", "stash"))
+            if reflog is None:
+                return []
+            key = (reflog, _stat_key(os.path.join(common_dir, "refs", "stash")))
+            with self._lock:
+                if self._stash is not None and self._stash[0] == key:
+                    return list(self._stash[1])
+        result = self.run(["stash", "list"])
+        if result.returncode != 0:
+            return None
+        entries = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        if key is not None:
+            with self._lock:
+                self._stash = (key, entries)
+        return list(entries)
+
+    def _git_dirs(self) -> tuple[str, str] | None:
+        dirs = self._dirs
+        if dirs is None or not os.path.exists(os.path.join(dirs[0], "HEAD")):
+            dirs = self._dirs = _find_git_dirs(os.path.abspath(self.cwd or os.curdir))
+        return dirs
+
+    @staticmethod
+    def _ref_key(name: str, dirs: tuple[str, str]) -> _CacheKey | None:
+        """Return the file-state key that pins what ``name`` resolves to, or None."""
+        if _FULL_SHA.fullmatch(name):
+            return ("object",)
+        if not _REF_NAME.fullmatch(name) or ".." in name or name.endswith(".lock"):
+            return None
+        git_dir, common_dir = dirs
+        packed = _stat_key(os.path.join(common_dir, "packed-refs"))
+        if name == "HEAD":
+            try:
+                head = Path(git_dir, "HEAD").read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not head.startswith("ref: "):
+                return (head,)
+            return (head, _stat_key(os.path.join(common_dir, head[len("ref: ") :])), packed)
+        if os.path.exists(os.path.join(common_dir, "refs", "remotes", name, "HEAD")):
+            # Symbolic remote HEAD; its target can move without touching it.
+            return None
+        loose = tuple(_stat_key(os.path.join(root, pattern.format(name))) for root in dirs for pattern in _REF_SEARCH)
+        return (packed, *loose)
+
+    def _batch_check(self, names: list[str]) -> list[str] | None:
+        if any("\n" in name for name in names):
+            return [self._rev_parse_one(name) for name in names]
+        payload = "".join(f"{name}\n" for name in names)
+        result = self.run(["cat-file", "--batch-check=%(objectname)"], input=payload)
+        if result.returncode != 0:
+            return None
+        lines = result.stdout.splitlines()
+        if len(lines) != len(names):
+            return None
+        return [
+            "" if line in (f"{name} missing", f"{name} ambiguous") else line.strip() for name, line in zip(names, lines)
+        ]
+
+    def _rev_parse_one(self, name: str) -> str:
+        result = self.run(["rev-parse", "--verify", "--quiet", name])
+        return result.stdout.strip() if result.returncode == 0 else ""
+
+
+_queries: dict[str, GitQuery] = {}
+_queries_lock = threading.Lock()
+
+
+def git_query(cwd: str) -> GitQuery:
+    """Return the shared query object for a working directory."""
+    key = os.path.abspath(cwd or os.curdir)
+    with _queries_lock:
+        query = _queries.get(key)
+        if query is None:
+            query = _queries[key] = GitQuery(key)
+        return query
+
+
+def clear_git_query_cache() -> None:
+    """Forget every cached query object (tests, repository relocation)."""
+    with _queries_lock:
+        _queries.clear()
@@ -0,0 +1,218 @@
+"""One JSON codec for the hot serialization paths.
+
+Transcript parsing, WebSocket frames, Redis transport payloads and cache
+fingerprints all encode and decode through this module. It uses orjson when
+installed, then msgspec, then the stdlib ``json`` module; ``TELECLAUDE_JSON_CODEC``
+(``orjson``, ``msgspec`` or ``json``) pins a backend.
+
+Every backend produces the same wire shape: compact separators, UTF-8 text
+without ASCII escaping. Decode failures raise ``json.JSONDecodeError`` (orjson's
+error subclasses it; msgspec's is translated), so callers keep catching the
+stdlib exception.
+
+Where the shape is known, prefer the typed entry points: ``loads_object`` for
+values that must be a JSON object (transcript entries, Redis envelopes) and
+``typed_decoder`` for pydantic DTOs, which validates straight from JSON text.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Any, TypeVar, cast
+
+from pydantic import TypeAdapter
+
+from teleclaude.core.models import JsonDict
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CODEC_ENV_VAR",
+    "JsonCodec",
+    "available_codecs",
+    "codec",
+    "dumpb",
+    "dumps",
+    "get_codec",
+    "loads",
+    "loads_object",
+    "typed_decoder",
+]
+
+CODEC_ENV_VAR = "TELECLAUDE_JSON_CODEC"
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+T = TypeVar("T")
+
+_Default = Callable[[Any], object] | None
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Encode/decode functions of one JSON backend."""
+
+    name: str
+    # (obj, sort_keys, default) -> encoded
+    dumps: Callable[[object, bool, _Default], str]
+    dumpb: Callable[[object, bool, _Default], bytes]
+    loads: Callable[[str | bytes], object]
+    # Decode a value that must be a JSON object; None when it is something else.
+    loads_object: Callable[[str | bytes], JsonDict | None]
+
+
+def _stdlib_codec() -> JsonCodec:
+    def _dumps(obj: object, sort_keys: bool, default: _Default) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, default=default)
+
+    def _dumpb(obj: object, sort_keys: bool, default: _Default) -> bytes:
+        return _dumps(obj, sort_keys, default).encode("utf-8")
+
+    def _loads_object(data: str | bytes) -> JsonDict | None:
+        value: object = json.loads(data)
+        return cast(JsonDict, value) if isinstance(value, dict) else None
+
+    return JsonCodec("json", _dumps, _dumpb, json.loads, _loads_object)
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = importlib.import_module("orjson")
+    # Non-string keys are stringified, as the stdlib does.
+    base_option = orjson.OPT_NON_STR_KEYS
+    sorted_option = base_option | orjson.OPT_SORT_KEYS
+
+    def _dumpb(obj: object, sort_keys: bool, default: _Default) -> bytes:
+        return cast(bytes, orjson.dumps(obj, default=default, option=sorted_option if sort_keys else base_option))
+
+    def _dumps(obj: object, sort_keys: bool, default: _Default) -> str:
+        return _dumpb(obj, sort_keys, default).decode("utf-8")
+
+    loads = cast(Callable[[str | bytes], object], orjson.loads)
+
+    def _loads_object(data: str | bytes) -> JsonDict | None:
+        value = loads(data)
+        return cast(JsonDict, value) if isinstance(value, dict) else None
+
+    return JsonCodec("orjson", _dumps, _dumpb, loads, _loads_object)
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec = importlib.import_module("msgspec")
+    encoders: dict[tuple[bool, _Default], Any] = {}
+    any_decoder = msgspec.json.Decoder()
+    # Typed decoder: rejects non-objects while parsing instead of after.
+    object_decoder = msgspec.json.Decoder(dict)
+
+    def _encoder(sort_keys: bool, default: _Default) -> Any:
+        key = (sort_keys, default)
+        encoder = encoders.get(key)
+        if encoder is None:
+            encoder = msgspec.json.Encoder(enc_hook=default, order="sorted" if sort_keys else None)
+            if len(encoders) < 16:
+                encoders[key] = encoder
+        return encoder
+
+    def _dumpb(obj: object, sort_keys: bool, default: _Default) -> bytes:
+        try:
+            return cast(bytes, _encoder(sort_keys, default).encode(obj))
+        except msgspec.EncodeError as exc:
+            raise TypeError(str(exc)) from exc
+
+    def _dumps(obj: object, sort_keys: bool, default: _Default) -> str:
+        return _dumpb(obj, sort_keys, default).decode("utf-8")
+
+    def _decode(decoder: Any, data: str | bytes) -> object:
+        try:
+            return cast(object, decoder.decode(data))
+        except msgspec.DecodeError as exc:
+            doc = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+            raise json.JSONDecodeError(str(exc), doc, 0) from exc
+
+    def _loads(data: str | bytes) -> object:
+        return _decode(any_decoder, data)
+
+    def _loads_object(data: str | bytes) -> JsonDict | None:
+        try:
+            return cast(JsonDict, _decode(object_decoder, data))
+        except json.JSONDecodeError:
+            # Valid JSON of another type is None; anything else stays an error.
+            _loads(data)
+            return None
+
+    return JsonCodec("msgspec", _dumps, _dumpb, _loads, _loads_object)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+@cache
+def get_codec(name: str) -> JsonCodec:
+    """Return the named backend; raises ImportError when it is not installed."""
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    return factory()
+
+
+def available_codecs() -> list[JsonCodec]:
+    """Installed backends in preference order."""
+    codecs: list[JsonCodec] = []
+    for name in _PREFERENCE:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+
+def _select_codec() -> JsonCodec:
+    requested = os.environ.get(CODEC_ENV_VAR, "").strip().lower()
+    if requested:
+        try:
+            return get_codec(requested)
+        except (ImportError, ValueError) as exc:
+            logger.warning("%s=%s unavailable (%s); using the best installed codec", CODEC_ENV_VAR, requested, exc)
+    return available_codecs()[0]
+
+
+codec = _select_codec()
+
+
+def dumps(obj: object, *, sort_keys: bool = False, default: _Default = None) -> str:
+    """Serialize to compact JSON text."""
+    return codec.dumps(obj, sort_keys, default)
+
+
+def dumpb(obj: object, *, sort_keys: bool = False, default: _Default = None) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    return codec.dumpb(obj, sort_keys, default)
+
+
+def loads(data: str | bytes) -> object:
+    """Parse JSON text or UTF-8 bytes; raises ``json.JSONDecodeError``."""
+    return codec.loads(data)
+
+
+def loads_object(data: str | bytes) -> JsonDict | None:
+    """Parse a value that must be a JSON object; None for valid JSON of another type."""
+    return codec.loads_object(data)
+
+
+@lru_cache(maxsize=128)
+def typed_decoder(tp: type[T]) -> Callable[[str | bytes], T]:
+    """Return a cached decoder that validates JSON straight into ``tp``.
+
+    ``tp`` is anything pydantic's ``TypeAdapter`` accepts (DTO models,
+    ``list[Model]``, ...). Building the adapter is the expensive part, so it
+    happens once per type rather than per response.
+    """
+    return TypeAdapter(tp).validate_json
@@ -1,6 +1,8 @@
 """Markdown formatting utilities for Telegram MarkdownV2."""
 
 import re
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -264,40 +266,76 @@ def _consume_markdown_format_marker(text: str, index: int, stack: list[str]) ->
     return None
 
 
+def _consume_markdown_token(
+    text: str,
+    index: int,
+    stack: list[str],
+    *,
+    in_link_text: bool,
+    link_url_depth: int,
+) -> tuple[int, bool, int]:
+    """Consume one token at ``index`` and return (next index, in_link_text, link_url_depth)."""
+    escaped_index = _consume_escaped_markdown_char(text, index)
+    if escaped_index is not None:
+        return escaped_index, in_link_text, link_url_depth
+
+    link_state = _consume_markdown_link_state(
+        text,
+        index,
+        in_link_text=in_link_text,
+        link_url_depth=link_url_depth,
+    )
+    if link_state is not None:
+        return link_state
+
+    code_index = _consume_markdown_code_state(text, index, stack)
+    if code_index is not None:
+        return code_index, in_link_text, link_url_depth
+
+    format_index = _consume_markdown_format_marker(text, index, stack)
+    if format_index is None:
+        return index + 1, in_link_text, link_url_depth
+    if text[index] == "[":
+        in_link_text = True
+    return format_index, in_link_text, link_url_depth
+
+
+# Characters that can change parser state in each scanning context. Anything
+# else is consumed one char at a time without effect, so whole runs of it are
+# skipped with a single regex search.
+_SPECIAL_IN_LINK_URL = re.compile(r"[\\()]")
+_SPECIAL_IN_LINK_TEXT = re.compile(r"[\\\]]")
+_SPECIAL_IN_CODE = re.compile(r"[\\`]")
+_SPECIAL_IN_TEXT = re.compile(r"[\\\[|_`*~]")
+
+
+def _next_markdown_token(text: str, index: int, stack: list[str], *, in_link_text: bool, link_url_depth: int) -> int:
+    """Return the index of the next char that may change state, or ``len(text)``."""
+    if link_url_depth > 0:
+        pattern = _SPECIAL_IN_LINK_URL
+    elif in_link_text:
+        pattern = _SPECIAL_IN_LINK_TEXT
+    elif stack and stack[-1] in (_STATE_CODE_BLOCK, _STATE_INLINE_CODE):
+        pattern = _SPECIAL_IN_CODE
+    else:
+        pattern = _SPECIAL_IN_TEXT
+    match = pattern.search(text, index)
+    return match.start() if match else len(text)
+
+
 def scan_markdown_v2_state(text: str, initial_state: MarkdownV2State = MARKDOWN_V2_INITIAL_STATE) -> MarkdownV2State:
     """Scan text and return MarkdownV2 parser state after consuming it."""
     stack = list(initial_state.stack)
     in_link_text = initial_state.in_link_text
     link_url_depth = initial_state.link_url_depth
     i = 0
-    while i < len(text):
-        escaped_index = _consume_escaped_markdown_char(text, i)
-        if escaped_index is not None:
-            i = escaped_index
-            continue
-
-        link_state = _consume_markdown_link_state(
-            text,
-            i,
-            in_link_text=in_link_text,
-            link_url_depth=link_url_depth,
+    while True:
+        i = _next_markdown_token(text, i, stack, in_link_text=in_link_text, link_url_depth=link_url_depth)
+        if i >= len(text):
+            break
+        i, in_link_text, link_url_depth = _consume_markdown_token(
+            text, i, stack, in_link_text=in_link_text, link_url_depth=link_url_depth
         )
-        if link_state is not None:
-            i, in_link_text, link_url_depth = link_state
-            continue
-
-        code_index = _consume_markdown_code_state(text, i, stack)
-        if code_index is not None:
-            i = code_index
-            continue
-
-        format_index = _consume_markdown_format_marker(text, i, stack)
-        if format_index is None:
-            i += 1
-            continue
-        if text[i] == "[":
-            in_link_text = True
-        i = format_index
 
     return MarkdownV2State(
         stack=tuple(stack),
@@ -306,6 +344,101 @@ def scan_markdown_v2_state(text: str, initial_state: MarkdownV2State = MARKDOWN_
     )
 
 
+class MarkdownV2Checkpoints:
+    """Parser state at every cut point of one text, from a single scan.
+
+    The text is split into segments: plain runs, where state cannot change,
+    and tokens (escapes, fences, markers). State is recorded at the start of
+    each segment, so ``state_at(k)`` equals ``scan_markdown_v2_state(text[:k])``
+    without rescanning the prefix. Cuts inside a multi-char token rescan only
+    that token. Cumulative UTF-8 byte offsets are tracked the same way.
+
+    Lookups walking in one direction reuse the previous segment position, so a
+    full forward or backward sweep over all cut points is linear.
+    """
+
+    __slots__ = ("_ascii", "_byte_starts", "_cursor", "_plain", "_starts", "_states", "final_state", "text")
+
+    def __init__(self, text: str, initial_state: MarkdownV2State = MARKDOWN_V2_INITIAL_STATE) -> None:
+        self.text = text
+        self._ascii = text.isascii()
+        self._starts: list[int] = []
+        self._states: list[MarkdownV2State] = []
+        self._plain: list[bool] = []
+        self._byte_starts: list[int] = []
+        self._cursor = 0
+
+        stack = list(initial_state.stack)
+        in_link_text = initial_state.in_link_text
+        link_url_depth = initial_state.link_url_depth
+        state = initial_state
+        byte_offset = 0
+        i = 0
+        while i < len(text):
+            token = _next_markdown_token(text, i, stack, in_link_text=in_link_text, link_url_depth=link_url_depth)
+            if token > i:
+                byte_offset = self._record(i, token, state, True, byte_offset)
+                i = token
+                if i >= len(text):
+                    break
+            i, in_link_text, link_url_depth = _consume_markdown_token(
+                text, token, stack, in_link_text=in_link_text, link_url_depth=link_url_depth
+            )
+            byte_offset = self._record(token, i, state, False, byte_offset)
+            if (
+                in_link_text != state.in_link_text
+                or link_url_depth != state.link_url_depth
+                or len(stack) != len(state.stack)
+                or tuple(stack) != state.stack
+            ):
+                state = MarkdownV2State(stack=tuple(stack), in_link_text=in_link_text, link_url_depth=link_url_depth)
+        self.final_state = state
+
+    def _record(self, start: int, end: int, state: MarkdownV2State, plain: bool, byte_offset: int) -> int:
+        self._starts.append(start)
+        self._states.append(state)
+        self._plain.append(plain)
+        if self._ascii:
+            return byte_offset
+        self._byte_starts.append(byte_offset)
+        return byte_offset + len(self.text[start:end].encode("utf-8"))
+
+    def _segment(self, k: int) -> int:
+        """Index of the segment containing ``k`` (``0 <= k < len(text)``)."""
+        starts = self._starts
+        j = self._cursor
+        if starts[j] <= k and (j + 1 == len(starts) or starts[j + 1] > k):
+            return j
+        if j > 0 and starts[j - 1] <= k < starts[j]:
+            j -= 1
+        elif j + 1 < len(starts) and starts[j + 1] <= k and (j + 2 == len(starts) or starts[j + 2] > k):
+            j += 1
+        else:
+            j = bisect_right(starts, k) - 1
+        self._cursor = j
+        return j
+
+    def state_at(self, k: int) -> MarkdownV2State:
+        """Return ``scan_markdown_v2_state(text[:k])`` relative to the initial state."""
+        if k >= len(self.text):
+            return self.final_state
+        j = self._segment(k)
+        start = self._starts[j]
+        if k == start or self._plain[j]:
+            return self._states[j]
+        return scan_markdown_v2_state(self.text[start:k], self._states[j])
+
+    def byte_offset(self, k: int) -> int:
+        """Return ``len(text[:k].encode("utf-8"))``."""
+        if self._ascii or k <= 0:
+            return max(k, 0)
+        if k >= len(self.text):
+            return self._byte_starts[-1] + len(self.text[self._starts[-1] :].encode("utf-8"))
+        j = self._segment(k)
+        start = self._starts[j]
+        return self._byte_starts[j] + len(self.text[start:k].encode("utf-8"))
+
+
 def continuation_prefix_for_markdown_v2_state(state: MarkdownV2State) -> str:
     """Build opening markers needed to continue a previously closed chunk."""
     parts: list[str] = []
@@ -323,36 +456,32 @@ def truncate_markdown_v2(text: str, max_chars: int, suffix: str) -> str:
 def truncate_markdown_v2_by_bytes(text: str, max_bytes: int, suffix: str) -> str:
     """Truncate MarkdownV2 text to a UTF-8 byte budget.
 
-    Uses binary search over character budgets and the balanced-char truncator
-    to preserve MarkdownV2 entity integrity while honoring a byte ceiling.
+    Scans the candidate prefix once and walks back from the longest prefix
+    that fits the byte budget to the first cut whose balancing closers still
+    fit, preserving MarkdownV2 entity integrity while honoring a byte ceiling.
     """
     if max_bytes <= 0:
         return ""
     if len(text.encode("utf-8")) <= max_bytes:
         return text
 
-    low = 0
-    high = len(text)
-    best = ""
-    while low <= high:
-        mid = (low + high) // 2
-        candidate = truncate_markdown_v2(text, max_chars=mid, suffix=suffix)
-        candidate_bytes = len(candidate.encode("utf-8"))
-        if candidate_bytes <= max_bytes:
-            best = candidate
-            low = mid + 1
-        else:
-            high = mid - 1
-
-    if best:
-        return best
+    budget = max_bytes - len(suffix.encode("utf-8"))
+    if budget >= 0:
+        # Every char takes at least one byte, so nothing past max_bytes chars can fit.
+        checkpoints = MarkdownV2Checkpoints(text[:max_bytes])
+        end = len(checkpoints.text.encode("utf-8")[:budget].decode("utf-8", errors="ignore"))
+        cut, closers = _balanced_cut(
+            checkpoints,
+            end,
+            lambda k, closers: checkpoints.byte_offset(k) + len(closers) <= budget,
+        )
+        best = f"{text[:cut]}{closers}{suffix}"
+        if best and len(best.encode("utf-8")) <= max_bytes:
+            return best
 
     # Fallback for extreme tiny budgets where even balanced truncation cannot fit.
     raw = suffix if suffix else text
-    clipped = raw
-    while clipped and len(clipped.encode("utf-8")) > max_bytes:
-        clipped = clipped[:-1]
-    return clipped
+    return raw.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
 
 
 def truncate_markdown_v2_with_consumed(text: str, max_chars: int, suffix: str) -> tuple[str, int]:
@@ -392,13 +521,13 @@ def leading_balanced_markdown_v2_entity_span(text: str, max_scan_chars: int = 51
 
     saw_marker = False
     limit = min(len(text), max_scan_chars)
+    checkpoints = MarkdownV2Checkpoints(text[:limit])
     for idx in range(1, limit + 1):
         if text[idx - 1] in opening_chars:
             saw_marker = True
         if not saw_marker:
             continue
-        state = scan_markdown_v2_state(text[:idx])
-        if state == MARKDOWN_V2_INITIAL_STATE:
+        if checkpoints.state_at(idx) == MARKDOWN_V2_INITIAL_STATE:
             # If we just closed `[text]` and the next char starts a URL
             # section (`(`), keep scanning so links are treated atomically.
             if idx < len(text) and text[idx] == "(" and idx > 0 and text[idx - 1] == "]":
@@ -411,25 +540,46 @@ def leading_balanced_markdown_v2_entity_span(text: str, max_scan_chars: int = 51
 def _trim_with_balanced_markdown_with_consumed(text: str, budget: int) -> tuple[str, int]:
     """Trim text and return balanced output plus consumed source chars."""
     current = text[:budget]
+    cut, closers = _balanced_cut(
+        MarkdownV2Checkpoints(current),
+        len(current),
+        lambda k, closers: k + len(closers) <= budget,
+    )
+    if cut + len(closers) > budget:
+        return closers[:budget], 0
+    return f"{current[:cut]}{closers}", cut
+
+
+def _balanced_cut(
+    checkpoints: MarkdownV2Checkpoints,
+    end: int,
+    fits: Callable[[int, str], bool],
+) -> tuple[int, str]:
+    """Walk back from ``end`` to the first cut that ``fits`` with its closers.
+
+    Returns the cut index into ``checkpoints.text`` and the closers to append.
+    Stops at 0 even if the (empty) closers there do not fit.
+    """
+    text = checkpoints.text
+    k = end
     while True:
-        if current.endswith("\\"):
-            current = current[:-1]
+        if k > 0 and text[k - 1] == "\\":
+            k -= 1
 
-        state = scan_markdown_v2_state(current)
+        state = checkpoints.state_at(k)
         # Splitting inside link entities is fragile in MarkdownV2; backtrack
         # until the boundary is outside any link text/url context.
         if state.in_link_text or state.link_url_depth > 0:
-            if not current:
-                return "", 0
-            current = current[:-1]
+            if k == 0:
+                return 0, ""
+            k -= 1
             continue
 
-        closers = _required_markdown_closers(current, state=state)
-        if len(current) + len(closers) <= budget:
-            return f"{current}{closers}", len(current)
-        if not current:
-            return closers[:budget], 0
-        current = current[:-1]
+        # Only the last consumed char matters for the code-fence closer.
+        closers = _required_markdown_closers_from_state(text[k - 1 : k] if k else "", state)
+        if k == 0 or fits(k, closers):
+            return k, closers
+        k -= 1
 
 
 def _required_markdown_closers(text: str, state: MarkdownV2State | None = None) -> str:
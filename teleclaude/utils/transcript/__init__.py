@@ -14,7 +14,6 @@ from teleclaude.utils.transcript._block_renderers import (
 )
 from teleclaude.utils.transcript._extraction import (
     _extract_last_message_by_role,
-    _extract_text_from_content,
     _find_workdir_in_obj,
     collect_transcript_messages,
     count_renderable_assistant_blocks,
@@ -26,8 +25,17 @@ from teleclaude.utils.transcript._extraction import (
     get_assistant_messages_since,
     parse_session_transcript,
 )
+from teleclaude.utils.transcript._index import (
+    TRANSCRIPT_INDEX_MAX_ENTRIES,
+    TranscriptIndex,
+    clear_transcript_index_cache,
+    get_transcript_index,
+)
 from teleclaude.utils.transcript._iterators import (
+    JSONL_FINGERPRINT_BYTES,
+    JsonlChunk,
     _entry_role,
+    _get_appended_entries_for_agent,
     _get_entries_for_agent,
     _is_rotation_fallback_candidate,
     _iter_claude_entries,
@@ -35,10 +43,20 @@ from teleclaude.utils.transcript._iterators import (
     _iter_gemini_entries,
     _iter_jsonl_entries,
     _iter_jsonl_entries_tail,
+    _parse_jsonl_line,
+    _read_jsonl_from_offset,
+    _skip_codex_session_meta,
     _start_index_after_timestamp_or_rotation,
 )
+from teleclaude.utils.transcript._offsets import (
+    TRANSCRIPT_OFFSETS_MAX_ENTRIES,
+    TranscriptOffsets,
+    clear_transcript_offsets_cache,
+    get_transcript_offsets,
+)
 from teleclaude.utils.transcript._parsers import (
     _extract_codex_reasoning_text,
+    _extract_text_from_content,
     normalize_transcript_entry_message,
 )
 from teleclaude.utils.transcript._rendering import (
@@ -62,6 +80,7 @@ from teleclaude.utils.transcript._tool_calls import (
     extract_messages_from_chain,
     extract_structured_messages,
     extract_tool_calls_current_turn,
+    structured_messages_from_entries,
 )
 from teleclaude.utils.transcript._utils import (
     CHECKPOINT_JSONL_TAIL_ENTRIES,
@@ -82,9 +101,18 @@ __all__ = [
     # _utils
     "CHECKPOINT_JSONL_TAIL_ENTRIES",
     "CHECKPOINT_JSONL_TAIL_READ_BYTES",
+    # _iterators
+    "JSONL_FINGERPRINT_BYTES",
+    # _index
+    "TRANSCRIPT_INDEX_MAX_ENTRIES",
+    # _offsets
+    "TRANSCRIPT_OFFSETS_MAX_ENTRIES",
+    "JsonlChunk",
     # _tool_calls
     "StructuredMessage",
     "ToolCallRecord",
+    "TranscriptIndex",
+    "TranscriptOffsets",
     "TranscriptParserInfo",
     "TurnTimeline",
     "_apply_tail_limit",
@@ -102,6 +130,7 @@ __all__ = [
     "_find_workdir_in_obj",
     "_format_thinking",
     "_format_timestamp_prefix",
+    "_get_appended_entries_for_agent",
     "_get_entries_for_agent",
     "_is_compaction_entry",
     "_is_rotation_fallback_candidate",
@@ -113,6 +142,7 @@ __all__ = [
     "_iter_jsonl_entries",
     "_iter_jsonl_entries_tail",
     "_parse_function_call_arguments",
+    "_parse_jsonl_line",
     "_parse_timestamp",
     "_process_entry",
     "_process_list_content",
@@ -121,10 +151,14 @@ __all__ = [
     "_process_thinking_block",
     "_process_tool_result_block",
     "_process_tool_use_block",
+    "_read_jsonl_from_offset",
     "_render_transcript_from_entries",
     "_should_skip_entry",
+    "_skip_codex_session_meta",
     "_start_index_after_timestamp_or_rotation",
     "_wrap_thinking_emphasis",
+    "clear_transcript_index_cache",
+    "clear_transcript_offsets_cache",
     "collect_transcript_messages",
     "count_renderable_assistant_blocks",
     "extract_last_agent_message",
@@ -136,6 +170,8 @@ __all__ = [
     "extract_tool_calls_current_turn",
     "extract_workdir_from_transcript",
     "get_assistant_messages_since",
+    "get_transcript_index",
+    "get_transcript_offsets",
     "get_transcript_parser_info",
     "iter_assistant_blocks",
     "normalize_transcript_entry_message",
@@ -145,4 +181,5 @@ __all__ = [
     "parse_session_transcript",
     "render_agent_output",
     "render_clean_agent_output",
+    "structured_messages_from_entries",
 ]
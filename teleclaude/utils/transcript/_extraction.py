@@ -9,16 +9,16 @@ from pathlib import Path
 
 from teleclaude.core.agents import AgentName
 
+from ._index import get_transcript_index
 from ._iterators import (
     _get_entries_for_agent,
     _iter_claude_entries,
     _iter_codex_entries,
     _iter_gemini_entries,
-    _start_index_after_timestamp_or_rotation,
 )
-from ._parsers import normalize_transcript_entry_message
+from ._parsers import _extract_text_from_content, normalize_transcript_entry_message
 from ._rendering import _render_transcript_from_entries
-from ._utils import _apply_tail_limit, _apply_tail_limit_codex, _escape_triple_backticks, _parse_timestamp
+from ._utils import _apply_tail_limit, _apply_tail_limit_codex, _escape_triple_backticks
 
 
 def get_assistant_messages_since(
@@ -28,48 +28,23 @@ def get_assistant_messages_since(
 ) -> list[dict[str, object]]:  # guard: loose-dict - External transcript messages
     """Retrieve assistant message objects from transcript since a timestamp.
 
+    Served from the shared transcript index, so repeated calls only parse
+    lines appended since the previous one. The returned messages are shared
+    and must not be mutated.
+
     Args:
         transcript_path: Path to transcript file
         agent_name: Agent name for iterator selection
-        since_timestamp: Optional UTC datetime boundary.
+        since_timestamp: Optional UTC datetime boundary. Without it, messages
+            after the last user message are returned.
 
     Returns:
         List of assistant message objects (with role and content).
     """
-    entries = _get_entries_for_agent(transcript_path, agent_name)
-    if not entries:
+    index = get_transcript_index(transcript_path, agent_name)
+    if index is None:
         return []
-
-    # Find activity AFTER since_timestamp
-    start_idx = 0
-    if since_timestamp:
-        start_idx = _start_index_after_timestamp_or_rotation(
-            entries,
-            since_timestamp,
-            transcript_path=transcript_path,
-            agent_name=agent_name,
-            mode="messages",
-        )
-        if start_idx is None:
-            return []
-    else:
-        # If no since_timestamp, find the last user boundary
-        last_user_idx = -1
-        for i in range(len(entries) - 1, -1, -1):
-            entry = entries[i]
-            message = normalize_transcript_entry_message(entry)
-            if isinstance(message, dict) and message.get("role") == "user":
-                last_user_idx = i
-                break
-        start_idx = last_user_idx + 1
-
-    assistant_messages = []
-    for entry in entries[start_idx:]:
-        msg = normalize_transcript_entry_message(entry)
-        if isinstance(msg, dict) and msg.get("role") == "assistant":
-            assistant_messages.append(msg)
-
-    return assistant_messages
+    return index.assistant_messages_since(since_timestamp)
 
 
 def count_renderable_assistant_blocks(
@@ -81,49 +56,14 @@ def count_renderable_assistant_blocks(
     include_tool_results: bool = False,
 ) -> int:
     """Count assistant content blocks renderable by incremental output."""
-    assistant_messages = get_assistant_messages_since(
-        transcript_path,
-        agent_name,
-        since_timestamp=since_timestamp,
+    index = get_transcript_index(transcript_path, agent_name)
+    if index is None:
+        return 0
+    return index.count_renderable_blocks(
+        since_timestamp,
+        include_tools=include_tools,
+        include_tool_results=include_tool_results,
     )
-    block_count = 0
-    for message in assistant_messages:
-        content = message.get("content")
-        if not isinstance(content, list):
-            continue
-        for block in content:
-            if not isinstance(block, dict):
-                continue
-            block_type = block.get("type")
-            if block_type in ("text", "output_text", "thinking"):
-                block_count += 1
-            elif block_type == "tool_use" and include_tools:
-                block_count += 1
-            elif block_type == "tool_result" and include_tool_results:
-                block_count += 1
-    return block_count
-
-
-def _extract_text_from_content(content: object, role: str) -> str | None:
-    """Extract text from message content based on role.
-
-    guard: allow-string-compare
-    """
-    if isinstance(content, str):
-        normalized = content.strip()
-        return content if normalized else None
-
-    if isinstance(content, list):
-        # User messages use "input_text" or "text", assistant uses "text" or "output_text"
-        valid_types = ("input_text", "text") if role == "user" else ("text", "output_text")
-
-        for block in content:
-            if isinstance(block, dict) and block.get("type") in valid_types:
-                text = str(block.get("text", ""))
-                normalized = text.strip()
-                return text if normalized else None
-
-    return None
 
 
 def _extract_last_message_by_role(
@@ -201,31 +141,12 @@ def extract_last_user_message_with_timestamp(
         Tuple of (message text, parsed timestamp) when found, otherwise None.
     """
     try:
-        entries = _get_entries_for_agent(transcript_path, agent_name)
-        if entries is None:
-            return None
-
-        for entry in reversed(entries):
-            message = normalize_transcript_entry_message(entry)
-
-            if not isinstance(message, dict):
-                continue
-            role = message.get("role")
-            if not isinstance(role, str) or role != "user":
-                continue
-
-            content = message.get("content")
-            text = _extract_text_from_content(content, "user")
-            if text is None:
-                continue
-
-            entry_ts = entry.get("timestamp")
-            parsed_ts = _parse_timestamp(entry_ts) if isinstance(entry_ts, str) else None
-            return text, parsed_ts
+        index = get_transcript_index(transcript_path, agent_name)
     except Exception:
         return None
-
-    return None
+    if index is None:
+        return None
+    return index.last_user_message()
 
 
 def extract_last_agent_message(
@@ -0,0 +1,312 @@
+"""Incremental transcript index: tail a transcript once, answer turn queries from memory.
+
+The incremental output path asks three questions about the same transcript on
+every tool completion: the last user message, the assistant messages since a
+turn cursor, and how many renderable blocks those contain. Re-reading and
+re-parsing a multi-MB JSONL for each question is what made long sessions slow,
+so this module keeps one index per (path, agent) that only parses the bytes
+appended since the previous refresh.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from teleclaude.core.agents import AgentName
+from teleclaude.core.models import JsonDict
+
+from ._iterators import JsonlChunk, _iter_gemini_entries, _read_jsonl_from_offset, _skip_codex_session_meta
+from ._parsers import _extract_text_from_content, normalize_transcript_entry_message
+from ._utils import _parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "TRANSCRIPT_INDEX_MAX_ENTRIES",
+    "TranscriptIndex",
+    "clear_transcript_index_cache",
+    "get_transcript_index",
+]
+
+TRANSCRIPT_INDEX_MAX_ENTRIES = 64
+_NO_TIMESTAMP = float("-inf")
+
+
+class _TailingTranscript:
+    """Per-transcript state that parses only the bytes appended since the last refresh.
+
+    Subclasses hold whatever they derive from the entries: ``_clear`` drops it,
+    ``_load_gemini`` replaces it from a freshly parsed Gemini document and
+    ``_append`` extends it with a chunk of newly appended JSONL entries.
+    """
+
+    kind = "index"
+    # Parse a trailing line that has no newline yet, if it is already valid JSON.
+    include_unterminated = True
+
+    def __init__(self, path: Path, agent_name: AgentName) -> None:
+        self.path = path
+        self.agent_name = agent_name
+        # Serializes refreshes of this transcript; other transcripts refresh in parallel.
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._file_id: tuple[int, int] | None = None
+        self._gemini_signature: tuple[int, int] | None = None
+        self._offset = 0
+        self._tail = b""
+        # Set when a reader finds the file no longer matches; the next refresh rebuilds.
+        self._stale = False
+        self._clear()
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    def _load_gemini(self, entries: list[JsonDict]) -> None:
+        raise NotImplementedError
+
+    def _append(self, chunk: JsonlChunk) -> None:
+        raise NotImplementedError
+
+    def refresh(self) -> bool:
+        """Bring the view up to date with the file; False if it no longer exists."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            self._reset()
+            return False
+
+        if self.agent_name == AgentName.GEMINI:
+            # Gemini rewrites one JSON document per turn; re-parse only when it changed.
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != self._gemini_signature:
+                self._reset()
+                self._load_gemini(list(_iter_gemini_entries(self.path)))
+                self._gemini_signature = signature
+            return True
+
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._offset or self._stale:
+            self._reset()
+            self._file_id = file_id
+        if stat.st_size == self._offset:
+            return True
+
+        chunk = _read_jsonl_from_offset(self.path, self._offset, include_unterminated=self.include_unterminated)
+        if chunk.prefix != self._tail:
+            logger.debug("Transcript rewritten in place, rebuilding %s: %s", self.kind, self.path)
+            self._reset()
+            self._file_id = file_id
+            chunk = _read_jsonl_from_offset(self.path, 0, include_unterminated=self.include_unterminated)
+        if self.agent_name == AgentName.CODEX:
+            chunk = _skip_codex_session_meta(chunk)
+        self._append(chunk)
+        self._offset = chunk.end_offset
+        self._tail = chunk.suffix
+        return True
+
+
+_T = TypeVar("_T", bound=_TailingTranscript)
+
+
+class _TranscriptCache(Generic[_T]):
+    """LRU of shared per-transcript views keyed by (path, agent)."""
+
+    def __init__(self, factory: Callable[[Path, AgentName], _T], max_entries: int) -> None:
+        self._factory = factory
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, AgentName], _T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, transcript_path: str, agent_name: AgentName) -> _T | None:
+        """Return the refreshed view for a transcript, or None if it doesn't exist."""
+        path = Path(transcript_path).expanduser()
+        key = (os.fspath(path), agent_name)
+        with self._lock:
+            view = self._entries.get(key)
+            if view is None:
+                view = self._factory(path, agent_name)
+                self._entries[key] = view
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        # File I/O and parsing happen under the per-transcript lock only, so a
+        # large transcript does not block lookups of unrelated ones.
+        with view.lock:
+            try:
+                exists = view.refresh()
+            except Exception:
+                self._discard(key, view)
+                raise
+        if not exists:
+            self._discard(key, view)
+            return None
+        return view
+
+    def _discard(self, key: tuple[str, AgentName], view: _T) -> None:
+        with self._lock:
+            if self._entries.get(key) is view:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TranscriptIndex(_TailingTranscript):
+    """Parsed view of one transcript, extended in place as the file grows.
+
+    Only what the turn queries need is retained: normalized assistant
+    messages, the most recent user message, per-entry timestamps (as a running
+    maximum so the "first entry after cursor" lookup is a bisect) and prefix
+    sums of renderable block counts over assistant messages.
+
+    guard: allow-string-compare
+    """
+
+    def _clear(self) -> None:
+        self._entry_count = 0
+        self._max_ts = array("d")
+        self._last_user_idx = -1
+        self._last_user: tuple[str, datetime | None] | None = None
+        self._assistant_idx = array("q")
+        self._assistant_messages: list[dict[str, object]] = []  # guard: loose-dict - External message
+        self._text_blocks = array("q", [0])
+        self._tool_use_blocks = array("q", [0])
+        self._tool_result_blocks = array("q", [0])
+
+    def _load_gemini(self, entries: list[JsonDict]) -> None:
+        self._extend(entries)
+
+    def _append(self, chunk: JsonlChunk) -> None:
+        self._extend(chunk.entries)
+
+    def _extend(self, entries: Iterable[JsonDict]) -> None:
+        running_max = self._max_ts[-1] if self._max_ts else _NO_TIMESTAMP
+        for entry in entries:
+            idx = self._entry_count
+            self._entry_count += 1
+
+            entry_ts = entry.get("timestamp")
+            parsed_ts = _parse_timestamp(entry_ts) if isinstance(entry_ts, str) else None
+            if parsed_ts is not None:
+                running_max = max(running_max, parsed_ts.timestamp())
+            self._max_ts.append(running_max)
+
+            message = normalize_transcript_entry_message(entry)
+            if not isinstance(message, dict):
+                continue
+            role = message.get("role")
+            if role == "user":
+                self._last_user_idx = idx
+                text = _extract_text_from_content(message.get("content"), "user")
+                if text is not None:
+                    self._last_user = (text, parsed_ts)
+            elif role == "assistant":
+                self._add_assistant(idx, message)
+
+    def _add_assistant(self, idx: int, message: dict[str, object]) -> None:  # guard: loose-dict - External message
+        text_blocks = tool_use_blocks = tool_result_blocks = 0
+        content = message.get("content")
+        if isinstance(content, list):
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                block_type = block.get("type")
+                if block_type in ("text", "output_text", "thinking"):
+                    text_blocks += 1
+                elif block_type == "tool_use":
+                    tool_use_blocks += 1
+                elif block_type == "tool_result":
+                    tool_result_blocks += 1
+        self._assistant_idx.append(idx)
+        self._assistant_messages.append(message)
+        self._text_blocks.append(self._text_blocks[-1] + text_blocks)
+        self._tool_use_blocks.append(self._tool_use_blocks[-1] + tool_use_blocks)
+        self._tool_result_blocks.append(self._tool_result_blocks[-1] + tool_result_blocks)
+
+    def last_user_message(self) -> tuple[str, datetime | None] | None:
+        """Return the most recent user message with text, and its timestamp."""
+        return self._last_user
+
+    def _assistant_start(self, since_timestamp: datetime | None, *, mode: str) -> int | None:
+        """Return the first assistant position in the window, or None if the window is empty.
+
+        Mirrors ``_start_index_after_timestamp_or_rotation``: the window starts
+        at the first entry stamped after the cursor, falling back to the whole
+        file when it shows assistant output but no user boundary (rotation).
+        """
+        if since_timestamp is None:
+            start_entry = self._last_user_idx + 1
+        else:
+            if since_timestamp.tzinfo is None:
+                since_timestamp = since_timestamp.replace(tzinfo=UTC)
+            start_entry = bisect_right(self._max_ts, since_timestamp.timestamp())
+            if start_entry >= self._entry_count:
+                if not self._assistant_messages or self._last_user_idx >= 0:
+                    return None
+                logger.info(
+                    "Rotation fallback in transcript extraction: mode=%s agent=%s path=%s entries=%d since=%s",
+                    mode,
+                    self.agent_name.value,
+                    self.path,
+                    self._entry_count,
+                    since_timestamp.isoformat(),
+                )
+                start_entry = 0
+        return bisect_left(self._assistant_idx, start_entry)
+
+    def assistant_messages_since(
+        self, since_timestamp: datetime | None = None
+    ) -> list[dict[str, object]]:  # guard: loose-dict - External transcript messages
+        """Assistant messages after the cursor, or after the last user message if no cursor."""
+        start = self._assistant_start(since_timestamp, mode="messages")
+        if start is None:
+            return []
+        return self._assistant_messages[start:]
+
+    def count_renderable_blocks(
+        self,
+        since_timestamp: datetime | None = None,
+        *,
+        include_tools: bool = False,
+        include_tool_results: bool = False,
+    ) -> int:
+        """Count renderable assistant blocks in the same window as ``assistant_messages_since``."""
+        start = self._assistant_start(since_timestamp, mode="messages")
+        if start is None:
+            return 0
+        count = self._text_blocks[-1] - self._text_blocks[start]
+        if include_tools:
+            count += self._tool_use_blocks[-1] - self._tool_use_blocks[start]
+        if include_tool_results:
+            count += self._tool_result_blocks[-1] - self._tool_result_blocks[start]
+        return count
+
+
+_indexes: _TranscriptCache[TranscriptIndex] = _TranscriptCache(TranscriptIndex, TRANSCRIPT_INDEX_MAX_ENTRIES)
+
+
+def get_transcript_index(transcript_path: str, agent_name: AgentName) -> TranscriptIndex | None:
+    """Return the refreshed shared index for a transcript, or None if it doesn't exist.
+
+    Indexes are kept for the most recently used ``TRANSCRIPT_INDEX_MAX_ENTRIES``
+    transcripts. Callers must treat returned messages as read-only: they are
+    shared with every other caller of the same transcript.
+    """
+    return _indexes.get(transcript_path, agent_name)
+
+
+def clear_transcript_index_cache() -> None:
+    """Drop all cached transcript indexes."""
+    _indexes.clear()
@@ -9,10 +9,11 @@ from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import cast
+from typing import NamedTuple, cast
 
 from teleclaude.core.agents import AgentName
 from teleclaude.core.models import JsonDict
+from teleclaude.utils import json_codec
 
 from ._parsers import normalize_transcript_entry_message
 from ._utils import CHECKPOINT_JSONL_TAIL_READ_BYTES, _parse_timestamp
@@ -20,7 +21,10 @@ from ._utils import CHECKPOINT_JSONL_TAIL_READ_BYTES, _parse_timestamp
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "JSONL_FINGERPRINT_BYTES",
+    "JsonlChunk",
     "_entry_role",
+    "_get_appended_entries_for_agent",
     "_get_entries_for_agent",
     "_is_rotation_fallback_candidate",
     "_iter_claude_entries",
@@ -28,6 +32,9 @@ __all__ = [
     "_iter_gemini_entries",
     "_iter_jsonl_entries",
     "_iter_jsonl_entries_tail",
+    "_parse_jsonl_line",
+    "_read_jsonl_from_offset",
+    "_skip_codex_session_meta",
     "_start_index_after_timestamp_or_rotation",
 ]
 
@@ -37,17 +44,16 @@ def _iter_jsonl_entries(
 ) -> Iterable[JsonDict]:
     """Yield JSON objects for each line in a transcript file."""
 
-    with open(path, encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             if not line.strip():
                 continue
             try:
-                entry_value: object = json.loads(line)
-            except json.JSONDecodeError:
+                entry = json_codec.loads_object(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
-
-            if isinstance(entry_value, dict):
-                yield cast(JsonDict, entry_value)
+            if entry is not None:
+                yield entry
 
 
 def _iter_jsonl_entries_tail(
@@ -93,15 +99,83 @@ def _iter_jsonl_entries_tail(
         if not line.strip():
             continue
         try:
-            entry_value: object = json.loads(line)
+            entry = json_codec.loads_object(line)
         except json.JSONDecodeError:
             continue
-        if isinstance(entry_value, dict):
-            tail.append(cast(JsonDict, entry_value))
+        if entry is not None:
+            tail.append(entry)
 
     yield from tail
 
 
+# Bytes just before a stored offset that must be unchanged for an append to be
+# trusted; a mismatch means the file was rewritten rather than appended to.
+JSONL_FINGERPRINT_BYTES = 256
+
+
+class JsonlChunk(NamedTuple):
+    """Entries appended to a JSONL transcript after a byte offset."""
+
+    entries: list[JsonDict]
+    end_offset: int
+    # Up to JSONL_FINGERPRINT_BYTES bytes ending at the start and end offsets.
+    prefix: bytes
+    suffix: bytes
+    # Byte offset of the line each entry was parsed from.
+    starts: list[int]
+
+
+def _parse_jsonl_line(line: bytes) -> JsonDict | None:
+    """Parse one raw JSONL line; None for blanks, invalid JSON and non-objects."""
+    if not line.strip():
+        return None
+    try:
+        return json_codec.loads_object(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _read_jsonl_from_offset(path: Path, offset: int, *, include_unterminated: bool = False) -> JsonlChunk:
+    """Parse JSONL lines appended after ``offset``.
+
+    A trailing line without its newline is left for the next read unless
+    ``include_unterminated`` is set and it already parses. Callers detect
+    rewrites by comparing ``prefix`` with the ``suffix`` of their previous read.
+    """
+    start = max(0, offset - JSONL_FINGERPRINT_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read()
+
+    split = min(offset - start, len(raw))
+    prefix, appended = raw[:split], raw[split:]
+    end = appended.rfind(b"\n") + 1
+    entries: list[JsonDict] = []
+    starts: list[int] = []
+    position = offset
+    for line in appended[:end].splitlines(keepends=True):
+        entry = _parse_jsonl_line(line)
+        if entry is not None:
+            entries.append(entry)
+            starts.append(position)
+        position += len(line)
+    remainder = appended[end:]
+    if include_unterminated and remainder.strip() and (trailing := _parse_jsonl_line(remainder)) is not None:
+        entries.append(trailing)
+        starts.append(position)
+        end = len(appended)
+    consumed = raw[: split + end]
+    return JsonlChunk(entries, offset + end, prefix, consumed[-JSONL_FINGERPRINT_BYTES:], starts)
+
+
+def _skip_codex_session_meta(chunk: JsonlChunk) -> JsonlChunk:
+    """Drop Codex ``session_meta`` entries, which carry no conversation content."""
+    kept = [(entry, start) for entry, start in zip(chunk.entries, chunk.starts) if entry.get("type") != "session_meta"]
+    if len(kept) == len(chunk.entries):
+        return chunk
+    return chunk._replace(entries=[entry for entry, _ in kept], starts=[start for _, start in kept])
+
+
 def _iter_claude_entries(
     path: Path,
     *,
@@ -141,11 +215,7 @@ def _coerce_dict_list(raw_items: object) -> list[JsonDict]:
 
 def _load_gemini_document(path: Path) -> JsonDict:
     """Load Gemini session JSON as a dict when possible."""
-    with open(path, encoding="utf-8") as f:
-        raw_document: object = json.load(f)
-    if isinstance(raw_document, dict):
-        return cast(JsonDict, raw_document)
-    return {}
+    return json_codec.loads_object(path.read_bytes()) or {}
 
 
 def _normalize_gemini_user_entry(message: JsonDict) -> JsonDict:
@@ -330,3 +400,25 @@ def _get_entries_for_agent(
     if agent_name == AgentName.CODEX:
         return list(_iter_codex_entries(path, tail_entries=tail_entries))
     return None  # type: ignore[unreachable]  # Defensive fallback
+
+
+def _get_appended_entries_for_agent(
+    transcript_path: str,
+    agent_name: AgentName,
+    offset: int,
+) -> JsonlChunk | None:
+    """Load entries appended after ``offset`` for append-only (JSONL) transcripts.
+
+    Returns None if the path doesn't exist or the agent rewrites its transcript
+    as a whole document (Gemini), in which case callers must re-read it fully.
+
+    guard: allow-string-compare
+    """
+    path = Path(transcript_path).expanduser()
+    if agent_name not in (AgentName.CLAUDE, AgentName.CODEX) or not path.exists():
+        return None
+
+    chunk = _read_jsonl_from_offset(path, offset)
+    if agent_name == AgentName.CODEX:
+        chunk = _skip_codex_session_meta(chunk)
+    return chunk
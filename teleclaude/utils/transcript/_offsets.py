@@ -0,0 +1,115 @@
+"""Seekable transcript view: entry byte offsets and message ids, extended as the file grows.
+
+History replay used to parse the whole transcript chain for every stream
+connection. This index records where each entry starts, so a reader can load
+any range of entries by ordinal (a resumed stream's missing tail, one page of
+history) by seeking instead of re-parsing everything before it. Message ids
+(Claude ``uuid``, other agents' ``id``) map back to ordinals so a client can
+also resume from the last message it rendered.
+
+Gemini rewrites one JSON document per turn, so its entries are kept parsed
+and re-read only when the file changes.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+
+from teleclaude.core.agents import AgentName
+from teleclaude.core.models import JsonDict
+
+from ._index import _TailingTranscript, _TranscriptCache
+from ._iterators import JsonlChunk, _parse_jsonl_line
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "TRANSCRIPT_OFFSETS_MAX_ENTRIES",
+    "TranscriptOffsets",
+    "clear_transcript_offsets_cache",
+    "get_transcript_offsets",
+]
+
+TRANSCRIPT_OFFSETS_MAX_ENTRIES = 64
+
+
+def _entry_message_id(entry: JsonDict) -> str | None:
+    for key in ("uuid", "id"):
+        value = entry.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+class TranscriptOffsets(_TailingTranscript):
+    """Entry ordinal → byte offset (and message id → ordinal) for one transcript."""
+
+    kind = "offsets"
+    # A trailing line without its newline may still be mid-write; leave it for the next refresh.
+    include_unterminated = False
+
+    def _clear(self) -> None:
+        self._gemini_entries: list[JsonDict] = []
+        self._starts = array("q")
+        self._message_ids: dict[str, int] = {}
+
+    def _load_gemini(self, entries: list[JsonDict]) -> None:
+        self._gemini_entries = entries
+
+    def _append(self, chunk: JsonlChunk) -> None:
+        for entry, start in zip(chunk.entries, chunk.starts):
+            message_id = _entry_message_id(entry)
+            if message_id is not None:
+                self._message_ids[message_id] = len(self._starts)
+            self._starts.append(start)
+
+    @property
+    def entry_count(self) -> int:
+        if self.agent_name == AgentName.GEMINI:
+            return len(self._gemini_entries)
+        return len(self._starts)
+
+    def ordinal_of(self, message_id: str) -> int | None:
+        """Return the ordinal of the entry carrying ``message_id``, or None."""
+        return self._message_ids.get(message_id)
+
+    def entries(self, start: int, stop: int | None = None) -> list[JsonDict]:
+        """Return entries ``start`` up to ``stop`` (exclusive) as of the last refresh."""
+        count = self.entry_count
+        stop = count if stop is None else min(stop, count)
+        if start >= stop:
+            return []
+        if self.agent_name == AgentName.GEMINI:
+            return self._gemini_entries[start:stop]
+
+        begin = self._starts[start]
+        end = self._starts[stop] if stop < count else self._offset
+        with open(self.path, "rb") as f:
+            f.seek(begin)
+            raw = f.read(end - begin)
+        entries = [entry for line in raw.splitlines() if (entry := _parse_jsonl_line(line)) is not None]
+        if self.agent_name == AgentName.CODEX:
+            entries = [entry for entry in entries if entry.get("type") != "session_meta"]
+        if len(entries) != stop - start:
+            # The bytes changed under the index; the next refresh rebuilds it.
+            logger.debug("Transcript changed since indexing: %s", self.path)
+            self._stale = True
+        return entries
+
+
+_offsets: _TranscriptCache[TranscriptOffsets] = _TranscriptCache(TranscriptOffsets, TRANSCRIPT_OFFSETS_MAX_ENTRIES)
+
+
+def get_transcript_offsets(transcript_path: str, agent_name: AgentName) -> TranscriptOffsets | None:
+    """Return the refreshed shared offsets index for a transcript, or None if it doesn't exist.
+
+    Callers reading entries should hold ``index.lock`` so a concurrent refresh
+    cannot move the offsets between ``entry_count`` and ``entries()``.
+    """
+    return _offsets.get(transcript_path, agent_name)
+
+
+def clear_transcript_offsets_cache() -> None:
+    """Drop all cached transcript offsets."""
+    _offsets.clear()
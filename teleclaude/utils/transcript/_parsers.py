@@ -84,3 +84,25 @@ def normalize_transcript_entry_message(
         return cast(dict[str, object], payload)  # guard: loose-dict - External payload message
 
     return None
+
+
+def _extract_text_from_content(content: object, role: str) -> str | None:
+    """Extract text from message content based on role.
+
+    guard: allow-string-compare
+    """
+    if isinstance(content, str):
+        normalized = content.strip()
+        return content if normalized else None
+
+    if isinstance(content, list):
+        # User messages use "input_text" or "text", assistant uses "text" or "output_text"
+        valid_types = ("input_text", "text") if role == "user" else ("text", "output_text")
+
+        for block in content:
+            if isinstance(block, dict) and block.get("type") in valid_types:
+                text = str(block.get("text", ""))
+                normalized = text.strip()
+                return text if normalized else None
+
+    return None
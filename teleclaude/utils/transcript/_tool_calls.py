@@ -604,10 +604,31 @@ def extract_structured_messages(
     if entries is None:
         return []
 
+    return structured_messages_from_entries(
+        entries,
+        since=since,
+        include_tools=include_tools,
+        include_thinking=include_thinking,
+    )
+
+
+def structured_messages_from_entries(
+    entries: list[JsonDict],
+    *,
+    since: str | None = None,
+    include_tools: bool = False,
+    include_thinking: bool = False,
+    start_index: int = 0,
+) -> list[StructuredMessage]:
+    """Convert already-loaded transcript entries into structured messages.
+
+    ``start_index`` offsets entry indices so callers parsing a transcript in
+    appended chunks keep the same indices a full parse would assign.
+    """
     since_dt = _parse_timestamp(since) if since else None
     messages: list[StructuredMessage] = []
 
-    for idx, entry in enumerate(entries):
+    for idx, entry in enumerate(entries, start=start_index):
         entry_ts, include_entry = _resolve_entry_timestamp(entry, since_dt)
         if not include_entry:
             continue
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 from teleclaude.constants import AGENT_PROTOCOL
 from teleclaude.core.agents import AgentName
@@ -12,12 +13,17 @@ from teleclaude.core.agents import AgentName
 __all__ = [
     "TranscriptCandidate",
     "build_source_identity",
+    "candidate_for_path",
     "discover_transcripts",
+    "extract_native_session_id",
     "extract_project",
     "extract_session_id",
     "in_session_root",
+    "session_roots",
 ]
 
+_UUID_SUFFIX = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class TranscriptCandidate:
@@ -65,6 +71,34 @@ def discover_transcripts(agents: Sequence[AgentName] | None = None) -> list[Tran
     return candidates
 
 
+def session_roots(agents: Sequence[AgentName] | None = None) -> list[tuple[AgentName, Path]]:
+    """Return existing transcript session roots, one per agent."""
+    return [(agent, root) for agent in agents or AgentName if (root := _session_root(agent)).is_dir()]
+
+
+def _matches_session_pattern(relative: PurePosixPath, pattern: str) -> bool:
+    if pattern.startswith("**/"):
+        return relative.match(pattern[3:])
+    return len(relative.parts) == len(PurePosixPath(pattern).parts) and relative.match(pattern)
+
+
+def candidate_for_path(path: Path | str) -> TranscriptCandidate | None:
+    """Map a filesystem path to the transcript candidate discovery would yield for it."""
+    expanded = Path(path).expanduser()
+    for agent in AgentName:
+        try:
+            relative = expanded.relative_to(_session_root(agent))
+        except ValueError:
+            continue
+        pattern = str(AGENT_PROTOCOL[agent.value]["session_pattern"])
+        if not _matches_session_pattern(PurePosixPath(relative.as_posix()), pattern):
+            continue
+        if not expanded.is_file():
+            return None
+        return TranscriptCandidate(path=expanded, agent=agent, mtime=expanded.stat().st_mtime)
+    return None
+
+
 def extract_session_id(path: Path, agent: AgentName) -> str:
     """Derive a session identifier from an agent transcript path."""
     stem = path.stem
@@ -77,6 +111,17 @@ def extract_session_id(path: Path, agent: AgentName) -> str:
     return stem
 
 
+def extract_native_session_id(path: Path, agent: AgentName) -> str:
+    """Derive the agent's own session id from a transcript path.
+
+    Codex names transcripts ``rollout-<timestamp>-<session id>.jsonl``; the
+    other agents use the session identifier from ``extract_session_id``.
+    """
+    if agent == AgentName.CODEX and (match := _UUID_SUFFIX.search(path.stem)):
+        return match.group(0)
+    return extract_session_id(path, agent)
+
+
 def extract_project(path: Path, agent: AgentName) -> str:
     """Derive a project name from a transcript path."""
     if agent == AgentName.CLAUDE:
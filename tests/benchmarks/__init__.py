@@ -0,0 +1,4 @@
+"""Standalone microbenchmarks (not collected by pytest).
+
+Run one with ``python -m tests.benchmarks.<module>``.
+"""
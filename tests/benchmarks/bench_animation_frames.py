@@ -0,0 +1,85 @@
+"""Frame time of ``AnimationEngine`` across every banner and header animation.
+
+Each frame is one ``update()`` plus a widget-style read pass: every cell of the
+target is composited with ``get_color`` and scanned per Z level with
+``get_layer_color``, which is what ``Banner``/``BoxTabBar`` do on repaint.
+
+Usage: python -m tests.benchmarks.bench_animation_frames [--frames N] [--width W]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from teleclaude.cli.tui.animation_colors import palette_registry
+from teleclaude.cli.tui.animation_engine import AnimationEngine
+from teleclaude.cli.tui.animations.agent import AGENT_ANIMATIONS
+from teleclaude.cli.tui.animations.base import Animation
+from teleclaude.cli.tui.animations.general import GENERAL_ANIMATIONS, GlobalSky
+
+_HEADER_ROWS = 10
+
+
+def _read_pass(engine: AnimationEngine, target: str, width: int, height: int) -> None:
+    z_levels = engine.get_entity_z_levels(target)
+    for y in range(height):
+        for x in range(width):
+            engine.get_color(x, y, target=target)
+            for z in z_levels:
+                engine.get_layer_color(z, x, y, target=target)
+
+
+def _bench(animation: Animation, target: str, frames: int, width: int, height: int) -> tuple[list[float], int]:
+    engine = AnimationEngine()
+    engine.play(animation, target=target)
+    engine.invalidate_term_width(width)
+    slot = engine._targets[target]
+    samples: list[float] = []
+    dirty_cells = 0
+    for _ in range(frames):
+        if slot.animation is None:
+            break
+        slot.last_update_ms = 0  # force a frame on every tick
+        began = time.perf_counter()
+        engine.update()
+        _read_pass(engine, target, width, height)
+        samples.append((time.perf_counter() - began) * 1000)
+        for _x, _y, w, h in engine.get_dirty_regions().values():
+            dirty_cells += w * h
+    return samples, dirty_cells
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--width", type=int, default=120)
+    args = parser.parse_args()
+
+    palette = palette_registry.get("spectrum")
+    cases: list[tuple[str, Animation, str, int]] = [
+        ("GlobalSky", GlobalSky(palette=palette, is_big=True, duration_seconds=3600), "header", _HEADER_ROWS)
+    ]
+    for cls in (*GENERAL_ANIMATIONS, *AGENT_ANIMATIONS):
+        cases.append((cls.__name__, cls(palette=palette, is_big=True, duration_seconds=60), "banner", 6))
+
+    all_samples: list[float] = []
+    print(f"{'animation':<24} {'p50_ms':>8} {'p95_ms':>8} {'dirty_cells':>12}")
+    for name, animation, target, height in cases:
+        samples, dirty_cells = _bench(animation, target, args.frames, args.width, height)
+        if not samples:
+            continue
+        all_samples.extend(samples)
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{name:<24} {statistics.median(ordered):>8.2f} {p95:>8.2f} {dirty_cells / len(samples):>12.0f}")
+    ordered = sorted(all_samples)
+    print(
+        f"overall frames={len(ordered)} p50_ms={statistics.median(ordered):.2f} "
+        f"p95_ms={ordered[int(len(ordered) * 0.95)]:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Push envelopes through ``Pipeline.execute`` with the correlation cartridge.
+
+Usage: python -m tests.benchmarks.bench_correlation_pipeline [--events N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from teleclaude.events.cartridges.correlation import CorrelationCartridge, CorrelationConfig
+from teleclaude.events.db import EventDB
+from teleclaude.events.envelope import EventEnvelope, EventLevel
+from teleclaude.events.pipeline import Pipeline, PipelineContext
+
+_EVENT_TYPES = ("deploy.started", "job.failed", "system.worker.crashed", "todo.updated")
+_ENTITIES = tuple(f"entity-{i}" for i in range(50))
+
+
+async def _run(events: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EventDB(Path(tmp) / "events.db")
+        await db.init()
+        start = datetime.now(UTC)
+        tick = {"n": 0}
+
+        def clock() -> datetime:
+            # Spread events over simulated time so windows slide and checkpoints fire.
+            return start + timedelta(milliseconds=tick["n"])
+
+        catalog = MagicMock()
+        catalog.get.return_value = None
+        producer = MagicMock()
+        producer.emit = AsyncMock()
+        context = PipelineContext(
+            catalog=catalog,
+            db=db,
+            correlation_config=CorrelationConfig(clock=clock),
+            producer=producer,
+        )
+        pipeline = Pipeline([CorrelationCartridge()], context)
+        envelopes = [
+            EventEnvelope(
+                event=_EVENT_TYPES[i % len(_EVENT_TYPES)],
+                source="daemon",
+                level=EventLevel.OPERATIONAL,
+                entity=_ENTITIES[i % len(_ENTITIES)],
+            )
+            for i in range(events)
+        ]
+
+        began = time.perf_counter()
+        for envelope in envelopes:
+            tick["n"] += 1
+            await pipeline.execute(envelope)
+        elapsed = time.perf_counter() - began
+        await db.close()
+
+    print(f"events={events} elapsed_s={elapsed:.3f} events_per_s={events / elapsed:,.0f}")
+    print(f"per_event_us={elapsed / events * 1e6:.1f} synthetic_emits={producer.emit.await_count}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Ref lookups through the shared git query layer versus one fork per lookup.
+
+Each round resolves the refs a build-gate and finalize decision needs (HEAD,
+the branch, the base commit) and counts commits ahead of the base, first with a
+``git rev-parse`` process per ref and then through ``GitQuery``, whose warm
+path answers from ref-file stats alone.
+
+Usage: python -m tests.benchmarks.bench_git_query [--repo PATH] [--base REV] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import time
+
+from teleclaude.utils.git_query import GitQuery
+
+
+def _forking(repo: str, refs: list[str]) -> None:
+    shas = [
+        subprocess.run(["git", "-C", repo, "rev-parse", ref], capture_output=True, text=True, check=True).stdout.strip()
+        for ref in refs
+    ]
+    subprocess.run(["git", "-C", repo, "rev-list", "--count", shas[0], f"^{shas[2]}"], capture_output=True, check=True)
+
+
+def _queried(query: GitQuery, refs: list[str]) -> None:
+    shas = query.rev_parse_many(refs)
+    query.count_commits(shas[0], shas[2])
+
+
+def _per_round_ms(rounds: int, fn) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repo", default=".")
+    parser.add_argument("--base", default="HEAD~10", help="commit to count ahead of")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    def _rev_parse(*rev_args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", args.repo, "rev-parse", *rev_args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    refs = ["HEAD", _rev_parse("--abbrev-ref", "HEAD"), _rev_parse(args.base)]
+
+    forking_ms = _per_round_ms(args.rounds, lambda: _forking(args.repo, refs))
+    cold_ms = _per_round_ms(args.rounds, lambda: _queried(GitQuery(args.repo), refs))
+    query = GitQuery(args.repo)
+    _queried(query, refs)
+    warm_ms = _per_round_ms(args.rounds, lambda: _queried(query, refs))
+    print(
+        f"refs={len(refs)} fork_per_ref_ms={forking_ms:7.2f} query_cold_ms={cold_ms:7.2f} query_warm_ms={warm_ms:7.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""JSON codec throughput on the payloads the daemon actually moves.
+
+Times every installed backend of ``teleclaude.utils.json_codec`` on three
+real-shaped workloads: decoding Claude transcript JSONL lines (tool use, tool
+results, long text), encoding a ``session_updated`` WebSocket frame, and a
+Redis response envelope round trip carrying a session list. A fourth row
+compares building a pydantic ``TypeAdapter`` per response, as the API client
+did, with the cached ``typed_decoder``.
+
+Usage: python -m tests.benchmarks.bench_json_codec [--rounds N] [--sessions N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from pydantic import TypeAdapter
+
+from teleclaude.api_models import SessionDTO
+from teleclaude.utils.json_codec import available_codecs, typed_decoder
+
+
+def _transcript_lines(count: int) -> list[bytes]:
+    lines: list[bytes] = []
+    for n in range(count):
+        if n % 3 == 0:
+            content: list[object] = [
+                {"type": "text", "text": "Looking at the failing test now. " * 8},
+                {"type": "tool_use", "id": f"toolu_{n}", "name": "Bash", "input": {"command": "pytest -q tests/unit"}},
+            ]
+            role = "assistant"
+        elif n % 3 == 1:
+            content = [{"type": "tool_result", "tool_use_id": f"toolu_{n - 1}", "content": "ok\n" * 60}]
+            role = "user"
+        else:
+            content = [{"type": "thinking", "thinking": "Consider the offsets cache. " * 20}]
+            role = "assistant"
+        entry = {
+            "uuid": f"0b6c9f2e-{n:04d}-4c1a-9d0e-5f7a3b2c1d0e",
+            "parentUuid": f"0b6c9f2e-{n - 1:04d}-4c1a-9d0e-5f7a3b2c1d0e",
+            "sessionId": "5e1f0c3a-2b4d-4e6f-8a9b-0c1d2e3f4a5b",
+            "timestamp": "2026-10-17T09:12:44.512Z",
+            "type": role,
+            "cwd": "/home/dev/projects/teleclaude",
+            "message": {"role": role, "model": "claude", "content": content},
+        }
+        lines.append(available_codecs()[-1].dumpb(entry, False, None) + b"\n")
+    return lines
+
+
+def _session(n: int) -> dict[str, object]:
+    return SessionDTO(
+        session_id=f"sess-{n:05d}",
+        title=f"Refactor streaming replay ({n}) — résumé cursors",
+        project_path="/home/dev/projects/teleclaude",
+        active_agent="claude",
+        thinking_mode="slow",
+        status="active",
+        created_at="2026-10-17T08:00:00+00:00",
+        last_activity="2026-10-17T09:12:44+00:00",
+        last_input="run the unit tests and fix what breaks",
+        last_output_summary="Fixed the cursor parser; all streaming tests pass.",
+        native_session_id="5e1f0c3a-2b4d-4e6f-8a9b-0c1d2e3f4a5b",
+        tmux_session_name=f"tc_{n:05d}",
+        computer="workstation",
+        session_metadata={"labels": ["backend", "perf"], "budget": {"tokens": 200000}},
+    ).model_dump()
+
+
+def _per_op_us(rounds: int, ops: int, fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) * 1_000_000 / (rounds * ops)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=50, help="sessions per list payload")
+    args = parser.parse_args()
+
+    lines = _transcript_lines(300)
+    frame = {"event": "session_updated", "data": _session(0)}
+    envelope = {"status": "success", "data": [_session(n) for n in range(args.sessions)]}
+
+    print(f"{'codec':<8} {'transcript_line_us':>19} {'ws_frame_us':>12} {'envelope_rt_us':>15}")
+    for codec in available_codecs():
+
+        def _decode_lines(codec=codec) -> None:
+            for line in lines:
+                codec.loads_object(line)
+
+        def _envelope_round_trip(codec=codec) -> None:
+            codec.loads(codec.dumpb(envelope, False, None))
+
+        line_us = _per_op_us(args.rounds, len(lines), _decode_lines)
+        frame_us = _per_op_us(args.rounds * 10, 1, lambda codec=codec: codec.dumps(frame, False, None))
+        envelope_us = _per_op_us(args.rounds, 1, _envelope_round_trip)
+        print(f"{codec.name:<8} {line_us:>19.2f} {frame_us:>12.2f} {envelope_us:>15.1f}")
+
+    body = available_codecs()[0].dumps(envelope["data"], False, None)
+    adhoc_us = _per_op_us(args.rounds, 1, lambda: TypeAdapter(list[SessionDTO]).validate_json(body))
+    cached_us = _per_op_us(args.rounds, 1, lambda: typed_decoder(list[SessionDTO])(body))
+    print(f"list[SessionDTO] x{args.sessions}: adapter_per_call_us={adhoc_us:.1f} typed_decoder_us={cached_us:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""MarkdownV2 truncation and threaded chunking over large agent outputs.
+
+For each output size this measures the Telegram byte-limit truncation and a
+full threaded split of the text into message-sized chunks, carrying the
+parser state across chunks the way the threaded output path does.
+
+Usage: python -m tests.benchmarks.bench_markdown_truncation [--sizes 4096,65536,1048576] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from teleclaude.constants import TELEGRAM_MAX_MESSAGE_BYTES
+from teleclaude.utils.markdown import (
+    MARKDOWN_V2_INITIAL_STATE,
+    continuation_prefix_for_markdown_v2_state,
+    scan_markdown_v2_state,
+    truncate_markdown_v2_by_bytes,
+    truncate_markdown_v2_with_consumed,
+)
+
+_BLOCKS = (
+    "*Summary*: updated the parser and reran the suite\\. All green ✅\n\n",
+    "Changed files: `teleclaude/utils/markdown\\.py`, see [the docs](https://example\\.com/docs/(v2)) for details\\.\n",
+    "```python\ndef handler(event):\n    return {'ok': True, 'name': event.name}\n```\n",
+    "_Note_: the __cache__ is ~invalidated~ refreshed on every write — größere Ausgaben sind üblich\\.\n",
+    "||spoiler: 12 tests were skipped|| and the rest passed in 3\\.2s\n\n",
+)
+
+
+def _agent_output(size: int) -> str:
+    parts: list[str] = []
+    total = 0
+    i = 0
+    while total < size:
+        block = _BLOCKS[i % len(_BLOCKS)]
+        parts.append(block)
+        total += len(block)
+        i += 1
+    return "".join(parts)[:size]
+
+
+def _split_threaded(text: str, limit: int) -> int:
+    chunks = 0
+    state = MARKDOWN_V2_INITIAL_STATE
+    offset = 0
+    while offset < len(text):
+        prefix = continuation_prefix_for_markdown_v2_state(state)
+        body = f"{prefix}{text[offset:]}"
+        _chunk, consumed = truncate_markdown_v2_with_consumed(body, max_chars=limit, suffix="")
+        split = max(consumed - min(consumed, len(prefix)), 1)
+        state = scan_markdown_v2_state(text[offset : offset + split], initial_state=state)
+        offset += split
+        chunks += 1
+    return chunks
+
+
+def _best_of(rounds: int, fn) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="4096,16384,65536,262144,1048576")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=4086, help="threaded chunk size in chars")
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = _agent_output(size)
+        truncate_s = _best_of(
+            args.rounds, lambda text=text: truncate_markdown_v2_by_bytes(text, TELEGRAM_MAX_MESSAGE_BYTES, suffix="…")
+        )
+        chunks = _split_threaded(text, args.limit)
+        split_s = _best_of(args.rounds, lambda text=text: _split_threaded(text, args.limit))
+        print(
+            f"size={size:>8} truncate_by_bytes_ms={truncate_s * 1000:8.2f} "
+            f"threaded_split_ms={split_s * 1000:9.2f} chunks={chunks:>4} "
+            f"split_mb_per_s={size / split_s / 1e6:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Cost of a ``next`` work decision over a roadmap of todos with state files.
+
+One decision resolves the next ready slug from roadmap.yaml (only the last
+todo is ready, so every state file is consulted) and then runs the phase
+predicates a work step evaluates for each slug. ``--cold`` clears the state
+cache before every decision to show the parse-every-time cost.
+
+Usage: python -m tests.benchmarks.bench_next_state [--todos N] [--decisions D] [--cold]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from teleclaude.core.next_machine.slug_resolution import resolve_slug
+from teleclaude.core.next_machine.state_io import (
+    clear_phase_state_cache,
+    has_pending_deferrals,
+    is_build_complete,
+    is_review_approved,
+    is_review_changes_requested,
+    read_breakdown_state,
+)
+
+
+def _make_project(root: Path, todos: int) -> list[str]:
+    slugs = [f"todo-{i:03d}" for i in range(todos)]
+    todos_dir = root / "todos"
+    todos_dir.mkdir()
+    (todos_dir / "roadmap.yaml").write_text(yaml.safe_dump([{"slug": slug} for slug in slugs]))
+    for i, slug in enumerate(slugs):
+        ready = i == todos - 1
+        state = {
+            "phase": "pending" if ready else "in_progress",
+            "build": "pending" if ready else "started",
+            "review": "pending",
+            "dor": {"score": 9 if ready else 5, "status": "pass"},
+            "artifacts": {"requirements": {"digest": "0" * 64}},
+            "unresolved_findings": [],
+        }
+        (todos_dir / slug).mkdir()
+        (todos_dir / slug / "state.yaml").write_text(yaml.safe_dump(state))
+        (todos_dir / slug / "deferrals.md").write_text("- none\n")
+    return slugs
+
+
+def _decide(cwd: str, slugs: list[str]) -> str | None:
+    slug, _ready, _description = resolve_slug(cwd, None, ready_only=True, dependencies={})
+    for item in slugs:
+        is_build_complete(cwd, item)
+        is_review_approved(cwd, item)
+        is_review_changes_requested(cwd, item)
+        has_pending_deferrals(cwd, item)
+        read_breakdown_state(cwd, item)
+    return slug
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--todos", type=int, default=100)
+    parser.add_argument("--decisions", type=int, default=20)
+    parser.add_argument("--cold", action="store_true", help="clear the state cache before each decision")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        slugs = _make_project(Path(tmp), args.todos)
+        clear_phase_state_cache()
+        assert _decide(tmp, slugs) == slugs[-1]
+
+        started = time.perf_counter()
+        for _ in range(args.decisions):
+            if args.cold:
+                clear_phase_state_cache()
+            _decide(tmp, slugs)
+        elapsed = time.perf_counter() - started
+
+    print(f"todos={args.todos} decisions={args.decisions} cold={args.cold}")
+    print(f"ms_per_decision={elapsed / args.decisions * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
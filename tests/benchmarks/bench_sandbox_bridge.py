@@ -0,0 +1,86 @@
+"""Throughput of ``SandboxBridgeCartridge`` against an in-process ``SandboxRunner``.
+
+Events are processed with up to ``--concurrency`` in flight, each fanned out
+to every cartridge in a temporary directory, over the bridge's single
+multiplexed connection.
+
+Usage: python -m tests.benchmarks.bench_sandbox_bridge [--events N] [--cartridges C] [--concurrency K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from teleclaude.events.catalog import build_default_catalog
+from teleclaude.events.envelope import EventEnvelope, EventLevel
+from teleclaude.events.pipeline import PipelineContext
+from teleclaude.events.sandbox.bridge import SandboxBridgeCartridge
+from teleclaude.events.sandbox.container import SandboxContainerManager
+from teleclaude.events.sandbox.runner import SandboxRunner
+
+_CARTRIDGE = "async def process(envelope, ctx):\n    return envelope\n"
+
+
+async def _run(events: int, cartridges: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cartridges_dir = Path(tmp) / "carts"
+        cartridges_dir.mkdir()
+        for i in range(cartridges):
+            (cartridges_dir / f"cart_{i}.py").write_text(_CARTRIDGE)
+        socket_path = str(Path(tmp) / "sandbox.sock")
+        shutdown = asyncio.Event()
+        server = asyncio.create_task(SandboxRunner(socket_path, str(cartridges_dir)).start(shutdown))
+        while not Path(socket_path).exists():
+            await asyncio.sleep(0.01)
+
+        manager = MagicMock(spec=SandboxContainerManager)
+        manager.has_cartridges = True
+        manager.permanently_failed = False
+        manager.docker_unavailable = False
+        manager.cartridges_dir = str(cartridges_dir)
+        manager.socket_path = socket_path
+        bridge = SandboxBridgeCartridge(manager=manager)
+        context = PipelineContext(catalog=build_default_catalog(), db=None)
+        slots = asyncio.Semaphore(concurrency)
+        errors = 0
+
+        async def _one(n: int) -> None:
+            nonlocal errors
+            async with slots:
+                event = EventEnvelope(event="bench.event", source="bench", level=EventLevel.OPERATIONAL, entity=str(n))
+                result = await bridge.process(event, context)
+                assert result is not None
+                errors += sum(1 for entry in result.payload["_sandbox_results"] if entry.get("error"))
+
+        await _one(-1)  # connect and send the catalog once
+        started = time.perf_counter()
+        await asyncio.gather(*(_one(n) for n in range(events)))
+        elapsed = time.perf_counter() - started
+
+        await bridge.close()
+        shutdown.set()
+        await server
+
+    print(f"events={events} cartridges={cartridges} concurrency={concurrency}")
+    print(
+        f"elapsed_s={elapsed:.3f} events_per_s={events / elapsed:,.0f} cartridge_calls_per_s={events * cartridges / elapsed:,.0f}"
+    )
+    print(f"errors={errors}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--cartridges", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(_run(args.events, args.cartridges, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare ``Db.get_session`` reads with and without the session identity map.
+
+Creates N active sessions and issues round-robin reads, as poll ticks and hook
+dispatch do. The uncached path is the pre-cache implementation: one ORM
+``get`` plus ``_to_core_session`` per call.
+
+Usage: python -m tests.benchmarks.bench_session_cache [--sessions N] [--reads N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from teleclaude.core import db_models
+from teleclaude.core.db import Db
+from teleclaude.core.models import Session, SessionAdapterMetadata, TelegramAdapterMetadata
+
+
+async def _uncached_get(db: Db, session_id: str) -> Session | None:
+    async with db._session() as db_session:
+        row = await db_session.get(db_models.Session, session_id)
+        return db._to_core_session(row) if row else None
+
+
+async def _run(sessions: int, reads: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Db(str(Path(tmp) / "teleclaude.db"))
+        await db.initialize()
+        session_ids = []
+        for i in range(sessions):
+            created = await db.create_session(
+                computer_name="bench",
+                tmux_session_name=f"tmux-{i}",
+                last_input_origin="telegram",
+                title=f"Session {i}",
+                adapter_metadata=SessionAdapterMetadata(telegram=TelegramAdapterMetadata(topic_id=1000 + i)),
+                project_path="/repo",
+                active_agent="claude",
+                emit_session_started=False,
+            )
+            session_ids.append(created.session_id)
+
+        began = time.perf_counter()
+        for i in range(reads):
+            await _uncached_get(db, session_ids[i % sessions])
+        uncached = time.perf_counter() - began
+
+        began = time.perf_counter()
+        for i in range(reads):
+            await db.get_session(session_ids[i % sessions])
+        cached = time.perf_counter() - began
+
+        # Interleave a write every 10 reads to show write-through keeps hits hot.
+        began = time.perf_counter()
+        for i in range(reads):
+            session_id = session_ids[i % sessions]
+            if i % 10 == 0:
+                await db.update_session(session_id, last_message_sent=f"msg {i}")
+            await db.get_session(session_id)
+        mixed = time.perf_counter() - began
+        await db.close()
+
+    print(f"sessions={sessions} reads={reads}")
+    print(
+        f"uncached_us={uncached / reads * 1e6:.1f} cached_us={cached / reads * 1e6:.1f} speedup={uncached / cached:.0f}x"
+    )
+    print(f"mixed_10pct_writes_us={mixed / reads * 1e6:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.sessions, args.reads))
+
+
+if __name__ == "__main__":
+    main()
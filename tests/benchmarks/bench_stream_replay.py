@@ -0,0 +1,65 @@
+"""Chat stream reconnect cost: full history replay versus resuming from a cursor.
+
+Writes a Claude transcript of N entries and replays it through the SSE history
+path twice per round: from the start, as every reconnect did before resume
+cursors, and from a cursor ``--new`` entries before the end, as a reconnecting
+client now does. The offsets index is warm after the first connection.
+
+Usage: python -m tests.benchmarks.bench_stream_replay [--entries N] [--new N] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from teleclaude.api.streaming import ReplayPosition, _replay_history
+from teleclaude.core.agents import AgentName
+
+
+def _write_transcript(path: Path, entries: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(entries):
+            text = f"entry {n} " + "lorem ipsum " * 40
+            entry = {"uuid": f"m{n}", "message": {"role": "assistant", "content": [{"type": "text", "text": text}]}}
+            f.write(json.dumps(entry) + "\n")
+
+
+async def _replay_ms(chain: list[str], position: ReplayPosition, rounds: int) -> tuple[float, int]:
+    events = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        events = 0
+        async for _event in _replay_history(chain, AgentName.CLAUDE, None, ReplayPosition(**vars(position))):
+            events += 1
+    return (time.perf_counter() - started) * 1000 / rounds, events
+
+
+async def _run(entries: int, new: int, rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        _write_transcript(path, entries)
+        chain = [str(path)]
+        full_ms, full_events = await _replay_ms(chain, ReplayPosition(), rounds)
+        resume_ms, resume_events = await _replay_ms(chain, ReplayPosition(0, entries - new), rounds)
+    print(
+        f"entries={entries} full_ms={full_ms:8.2f} ({full_events} events) "
+        f"resume_ms={resume_ms:6.3f} ({resume_events} events) speedup={full_ms / resume_ms:6.0f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--new", type=int, default=10, help="entries appended since the client's cursor")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.entries, args.new, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
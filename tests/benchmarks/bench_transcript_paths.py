@@ -0,0 +1,79 @@
+"""Transcript lookup by native session id: directory scan versus the path index.
+
+Builds a synthetic Codex session tree of N transcripts spread over date folders
+older than the 7-day fast path, then resolves random session ids through
+``discover_codex_transcript_path`` with no index (``rglob`` over the tree) and
+with the ``transcript_paths`` index populated as the mirror worker would.
+
+Usage: python -m tests.benchmarks.bench_transcript_paths [--files N] [--lookups N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from teleclaude.core.codex_transcript import discover_codex_transcript_path
+from teleclaude.core.db import Db
+from teleclaude.core.transcript_paths import record_transcript_paths
+from teleclaude.utils.transcript_discovery import discover_transcripts
+
+_FILES_PER_DAY = 200
+
+
+def _build_tree(home: Path, files: int) -> list[str]:
+    session_ids: list[str] = []
+    for i in range(files):
+        day = i // _FILES_PER_DAY
+        date_dir = home / ".codex" / "sessions" / "2020" / f"{day // 28 % 12 + 1:02d}" / f"{day % 28 + 1:02d}"
+        if i % _FILES_PER_DAY == 0:
+            date_dir.mkdir(parents=True, exist_ok=True)
+        session_id = str(uuid.UUID(int=random.getrandbits(128)))
+        (date_dir / f"rollout-2020-01-01T00-00-{i:05d}-{session_id}.jsonl").touch()
+        session_ids.append(session_id)
+    return session_ids
+
+
+def _per_lookup_ms(session_ids: list[str], db_path: str) -> float:
+    started = time.perf_counter()
+    for session_id in session_ids:
+        if discover_codex_transcript_path(session_id, db_path=db_path) is None:
+            raise RuntimeError(f"transcript for {session_id} not found")
+    return (time.perf_counter() - started) * 1000 / len(session_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        os.environ["HOME"] = str(home)
+        session_ids = random.sample(_build_tree(home, args.files), args.lookups)
+        db = Db(str(home / "teleclaude.db"))
+        asyncio.run(db.initialize())
+        asyncio.run(db.close())
+
+        scan_ms = _per_lookup_ms(session_ids, str(home / "absent.db"))
+
+        started = time.perf_counter()
+        record_transcript_paths(discover_transcripts(), db_path=db.db_path)
+        build_s = time.perf_counter() - started
+        index_ms = _per_lookup_ms(session_ids, db.db_path)
+
+    print(
+        f"files={args.files} scan_ms={scan_ms:9.2f} index_ms={index_ms:7.3f} "
+        f"speedup={scan_ms / index_ms:8.0f}x index_build_s={build_s:5.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Webhook delivery: one-at-a-time versus the concurrent delivery pool.
+
+Starts a local aiohttp server with injected latency per target: one slow
+subscriber and several fast ones. The outbox is filled with rows for all of
+them and drained twice. The first run uses a worker limited to one delivery at
+a time, which is how the worker used to behave. The second run uses the pool
+defaults. For each run it reports when the fast subscribers were fully served,
+the total drain time, and how many TCP connections the server saw. Keep-alive
+shows up as far fewer connections than requests.
+
+Usage: python -m tests.benchmarks.bench_webhook_delivery [--fast-targets N] [--rows N] [--slow-ms MS] [--fast-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from aiohttp import web
+
+import teleclaude.hooks.delivery as delivery_module
+from teleclaude.hooks.delivery import WebhookDeliveryWorker
+
+
+class _Outbox:
+    """In-memory stand-in for the outbox table."""
+
+    def __init__(self, targets: list[str], rows_per_target: int) -> None:
+        self.rows: list[SimpleNamespace] = []
+        for n in range(rows_per_target):
+            for target in targets:
+                self.rows.append(
+                    SimpleNamespace(
+                        id=len(self.rows) + 1,
+                        target_url=target,
+                        event_json=f'{{"n":{n}}}',
+                        target_secret="secret",
+                        attempt_count=0,
+                        status="pending",
+                        locked=False,
+                        delivered_at=None,
+                    )
+                )
+        self._by_id = {row.id: row for row in self.rows}
+
+    async def claim_webhook_batch(
+        self, limit, now_iso, *, per_target=None, target_room=None, exclude_targets=(), locked_before=None
+    ):
+        claimed, per_url = [], {}
+        for row in self.rows:
+            if row.status != "pending" or row.locked or row.target_url in exclude_targets:
+                continue
+            per_url[row.target_url] = per_url.get(row.target_url, 0) + 1
+            cap = (target_room or {}).get(row.target_url, per_target)
+            if cap is not None and per_url[row.target_url] > cap:
+                continue
+            row.locked = True
+            claimed.append(row)
+            if len(claimed) == limit:
+                break
+        return claimed
+
+    async def mark_webhook_delivered(self, row_id):
+        row = self._by_id[row_id]
+        row.status, row.locked, row.delivered_at = "delivered", False, time.perf_counter()
+
+    async def mark_webhook_failed(self, row_id, error, attempt_count, next_attempt_at, status="pending"):
+        row = self._by_id[row_id]
+        row.status, row.locked, row.attempt_count = status, False, attempt_count
+
+
+async def _drain(worker: WebhookDeliveryWorker, outbox: _Outbox, slow_target: str) -> tuple[float, float]:
+    delivery_module.db = outbox  # type: ignore[assignment]
+    shutdown = asyncio.Event()
+    started = time.perf_counter()
+    runner = asyncio.create_task(worker.run(shutdown))
+    while any(row.status == "pending" for row in outbox.rows):
+        await asyncio.sleep(0.005)
+    shutdown.set()
+    await runner
+    fast_done = max(row.delivered_at for row in outbox.rows if row.target_url != slow_target)
+    all_done = max(row.delivered_at for row in outbox.rows)
+    return (fast_done - started) * 1000, (all_done - started) * 1000
+
+
+async def _main(args: argparse.Namespace) -> None:
+    latency = {"slow": args.slow_ms / 1000}
+    connections: set[object] = set()
+
+    async def _hook(request: web.Request) -> web.Response:
+        connections.add(request.transport)
+        await asyncio.sleep(latency.get(request.match_info["name"], args.fast_ms / 1000))
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/{name}", _hook)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    base = f"http://127.0.0.1:{port}"
+    slow_target = f"{base}/slow"
+    targets = [slow_target, *(f"{base}/fast{n}" for n in range(args.fast_targets))]
+    requests = len(targets) * args.rows
+
+    try:
+        for label, worker in (
+            ("one_at_a_time", WebhookDeliveryWorker(concurrency=1, target_concurrency=1)),
+            ("pool", WebhookDeliveryWorker()),
+        ):
+            connections.clear()
+            fast_ms, total_ms = await _drain(worker, _Outbox(targets, args.rows), slow_target)
+            print(
+                f"{label:<14} fast_targets_done_ms={fast_ms:8.0f} all_done_ms={total_ms:8.0f} "
+                f"requests={requests} connections={len(connections)}"
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fast-targets", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=20, help="rows per target")
+    parser.add_argument("--slow-ms", type=float, default=250.0)
+    parser.add_argument("--fast-ms", type=float, default=5.0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
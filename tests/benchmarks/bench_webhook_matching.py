@@ -0,0 +1,93 @@
+"""Webhook contract matching: linear scan versus the compiled contract index.
+
+Builds registries of increasing size shaped like real subscriptions: most
+contracts name an exact source and event type (often with a property filter),
+a tenth use wildcard type patterns, and a few have no source/type criterion.
+Each round matches a fixed stream of events, first with the per-contract
+``match_event`` scan the registry used to do and then through ``ContractIndex``.
+
+Usage: python -m tests.benchmarks.bench_webhook_matching [--sizes N,N,...] [--events N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from teleclaude.hooks.matcher import ContractIndex, match_event
+from teleclaude.hooks.webhook_models import Contract, HookEvent, PropertyCriterion, Target
+
+_SOURCES = ["github", "agent", "whatsapp", "system", "gitlab", "stripe", "linear", "sentry"]
+_TYPES = [
+    f"{area}.{verb}" for area in ("session", "tool", "issue", "deploy", "payment") for verb in ("started", "done")
+]
+
+
+def _contracts(count: int) -> list[Contract]:
+    contracts: list[Contract] = []
+    for n in range(count):
+        source = _SOURCES[n % len(_SOURCES)]
+        properties = {"repo": PropertyCriterion(match=f"owner/repo-{n % 50}")} if n % 2 else {}
+        if n % 10 == 0:
+            type_criterion = PropertyCriterion(pattern=f"{_TYPES[n % len(_TYPES)].split('.')[0]}.*")
+        else:
+            type_criterion = PropertyCriterion(match=_TYPES[(n // len(_SOURCES)) % len(_TYPES)])
+        source_criterion = None if n % 97 == 0 else PropertyCriterion(match=source)
+        contracts.append(
+            Contract(
+                id=f"contract-{n}",
+                target=Target(url=f"https://hooks.example.test/{n}"),
+                source_criterion=source_criterion,
+                type_criterion=type_criterion,
+                properties=properties,
+                expires_at="2099-01-01T00:00:00+00:00" if n % 5 == 0 else None,
+            )
+        )
+    return contracts
+
+
+def _events(count: int) -> list[HookEvent]:
+    return [
+        HookEvent(
+            source=_SOURCES[n % len(_SOURCES)],
+            type=_TYPES[(n * 7) % len(_TYPES)],
+            timestamp="2026-10-17T09:00:00+00:00",
+            properties={"repo": f"owner/repo-{n % 50}", "action": "opened"},
+        )
+        for n in range(count)
+    ]
+
+
+def _linear(contracts: list[Contract], event: HookEvent) -> list[Contract]:
+    return [c for c in contracts if c.active and not c.is_expired and match_event(event, c)]
+
+
+def _per_event_us(events: list[HookEvent], match) -> tuple[float, int]:
+    started = time.perf_counter()
+    hits = sum(len(match(event)) for event in events)
+    return (time.perf_counter() - started) * 1_000_000 / len(events), hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,100,1000,5000")
+    parser.add_argument("--events", type=int, default=500)
+    args = parser.parse_args()
+
+    events = _events(args.events)
+    for size in (int(part) for part in args.sizes.split(",")):
+        contracts = _contracts(size)
+        started = time.perf_counter()
+        index = ContractIndex(contracts)
+        build_ms = (time.perf_counter() - started) * 1000
+        linear_us, linear_hits = _per_event_us(events, lambda event, contracts=contracts: _linear(contracts, event))
+        index_us, index_hits = _per_event_us(events, index.match)
+        assert linear_hits == index_hits
+        print(
+            f"contracts={size:5d} linear_us={linear_us:9.1f} index_us={index_us:7.1f} "
+            f"build_ms={build_ms:6.1f} matches_per_event={index_hits / len(events):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Import budget for the hook receiver.
+
+Agent CLIs spawn the receiver for every hook event, so whatever it imports is
+paid on each tool call. A fresh interpreter handles one TOOL_USE event for a
+session whose native metadata is already recorded, then reports which heavy
+modules ended up in ``sys.modules``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HEAVY_MODULES = (
+    "httpx",
+    "pydantic",
+    "sqlalchemy",
+    "sqlmodel",
+    "teleclaude.config",
+    "teleclaude.core.db_models",
+    "yaml",
+)
+
+_HANDLE_EVENT = """
+import json
+import sys
+from pathlib import Path
+
+import teleclaude.hooks.receiver as receiver
+import teleclaude.hooks.receiver._session as session_module
+
+state_dir = Path(sys.argv[1])
+heavy_modules = json.loads(sys.argv[2])
+session_module._get_session_map_path = lambda: state_dir / "session_map.json"
+session_module._get_native_metadata_path = lambda: state_dir / "native_metadata.json"
+posted = []
+receiver._post_hook_event = lambda *args, **kwargs: posted.append(args) or True
+
+sys.argv = ["receiver", "--agent", "claude", "PreToolUse"]
+receiver.main()
+
+loaded = sorted(
+    name for name in sys.modules if any(name == heavy or name.startswith(heavy + ".") for heavy in heavy_modules)
+)
+print(json.dumps({"posted": [list(args[:2]) for args in posted], "loaded": loaded}))
+"""
+
+
+@pytest.mark.integration
+def test_tool_use_event_with_known_native_metadata_skips_heavy_modules(tmp_path: Path) -> None:
+    transcript = str(tmp_path / "transcript.jsonl")
+    (tmp_path / "teleclaude_session_id").write_text("session-1\n", encoding="utf-8")
+    (tmp_path / "session_map.json").write_text(json.dumps({"claude:native-1": "session-1"}), encoding="utf-8")
+    (tmp_path / "native_metadata.json").write_text(
+        json.dumps({"session-1:native_session_id": "native-1", "session-1:native_log_file": transcript}),
+        encoding="utf-8",
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    env["TMUX"] = "/tmp/tmux-test/default,1,0"
+    env["TMPDIR"] = str(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, "-c", _HANDLE_EVENT, str(tmp_path), json.dumps(HEAVY_MODULES)],
+        input=json.dumps({"session_id": "native-1", "transcript_path": transcript, "tool_name": "Bash"}),
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report["posted"] == [["session-1", "tool_use"]]
+    assert report["loaded"] == []
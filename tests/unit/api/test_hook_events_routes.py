@@ -0,0 +1,51 @@
+"""Tests for teleclaude.api.hook_events_routes."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from teleclaude.api import hook_events_routes
+
+
+@pytest.mark.unit
+async def test_enqueue_hook_event_persists_to_outbox_and_wakes_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    enqueue = AsyncMock(return_value=42)
+    monkeypatch.setattr(hook_events_routes.db, "enqueue_hook_event", enqueue)
+    wake = Mock()
+    hook_events_routes.configure(on_enqueued=wake)
+    try:
+        response = await hook_events_routes.enqueue_hook_event(
+            hook_events_routes.HookEventRequest(session_id="sess-1", event_type="tool_use", payload={"tool": "Bash"})
+        )
+    finally:
+        hook_events_routes.configure(on_enqueued=None)
+
+    assert response.id == 42
+    enqueue.assert_awaited_once_with("sess-1", "tool_use", {"tool": "Bash"}, created_at=None)
+    wake.assert_called_once_with()
+
+
+@pytest.mark.unit
+async def test_enqueue_hook_event_without_worker_still_persists(monkeypatch: pytest.MonkeyPatch) -> None:
+    enqueue = AsyncMock(return_value=7)
+    monkeypatch.setattr(hook_events_routes.db, "enqueue_hook_event", enqueue)
+    hook_events_routes.configure(on_enqueued=None)
+
+    response = await hook_events_routes.enqueue_hook_event(
+        hook_events_routes.HookEventRequest(session_id="sess-2", event_type="agent_stop", payload={})
+    )
+
+    assert response.id == 7
+    enqueue.assert_awaited_once()
+
+
+@pytest.mark.unit
+async def test_invalidate_session_drops_cached_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    invalidate = Mock()
+    monkeypatch.setattr(hook_events_routes.db, "invalidate_session_cache", invalidate)
+
+    await hook_events_routes.invalidate_session("sess-3")
+
+    invalidate.assert_called_once_with("sess-3")
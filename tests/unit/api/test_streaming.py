@@ -16,8 +16,8 @@ from teleclaude.core.db_models import Session
 from teleclaude.core.models import JsonDict
 
 
-def _make_request() -> SimpleNamespace:
-    return SimpleNamespace(headers={})
+def _make_request(headers: dict[str, str] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(headers=headers or {})
 
 
 def _make_session(
@@ -38,6 +38,11 @@ def _make_session(
     )
 
 
+def _text_entry(n: int) -> str:
+    entry = {"uuid": f"m{n}", "message": {"role": "assistant", "content": [{"type": "text", "text": f"t{n}"}]}}
+    return json.dumps(entry) + "\n"
+
+
 async def _collect_stream(response: object) -> list[str]:
     chunks: list[str] = []
     body_iterator = response.body_iterator
@@ -47,6 +52,8 @@ async def _collect_stream(response: object) -> list[str]:
 
 
 def _parse_sse_event(chunk: str) -> JsonDict | str:
+    if chunk.startswith("id: "):
+        chunk = chunk.split("\n", 1)[1]
     prefix = "data: "
     assert chunk.startswith(prefix)
     payload = chunk.removeprefix(prefix).strip()
@@ -201,4 +208,66 @@ class TestStreamingRoute:
             session_id=session.session_id,
             since_timestamp="2025-03-15T12:00:00Z",
             user_message="latest-user",
+            cursor=None,
+            page_size=None,
+        )
+
+
+def _event_ids(chunks: list[str]) -> list[str]:
+    return [chunk.split("\n", 1)[0].removeprefix("id: ") for chunk in chunks if chunk.startswith("id: ")]
+
+
+def _deltas(chunks: list[str]) -> list[str]:
+    events = [_parse_sse_event(chunk) for chunk in chunks]
+    return [str(event["delta"]) for event in events if isinstance(event, dict) and event["type"] == "text-delta"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamingResume:
+    @pytest.fixture(autouse=True)
+    def _fresh_offsets(self):
+        from teleclaude.utils.transcript import clear_transcript_offsets_cache
+
+        clear_transcript_offsets_cache()
+        yield
+        clear_transcript_offsets_cache()
+
+    async def _stream(self, session: Session, request: ChatStreamRequest, headers: dict[str, str] | None = None):
+        with patch("teleclaude.api.streaming.db.get_session", new=AsyncMock(return_value=session)):
+            response = await streaming.chat_stream(_make_request(headers), request)
+            return await _collect_stream(response)
+
+    async def test_resume_cursor_replays_only_the_missing_tail_across_the_chain(self, tmp_path: Path) -> None:
+        first = tmp_path / "first.jsonl"
+        first.write_text(_text_entry(0) + _text_entry(1), encoding="utf-8")
+        second = tmp_path / "second.jsonl"
+        second.write_text(_text_entry(2), encoding="utf-8")
+        session = _make_session(lifecycle_status="closed", transcript_files=json.dumps([str(first), str(second)]))
+        request = ChatStreamRequest(sessionId=session.session_id)
+        # A missing live file ends the stream right after replay.
+        session.native_log_file = str(tmp_path / "gone.jsonl")
+
+        chunks = await self._stream(session, request)
+        assert _deltas(chunks) == ["t0", "t1", "t2"]
+        assert _event_ids(chunks) == ["0:1", "0:2", "1:1", "2:0"]
+
+        resumed = await self._stream(session, request, headers={"last-event-id": "0:1"})
+        assert _deltas(resumed) == ["t1", "t2"]
+
+        by_message_id = await self._stream(session, request.model_copy(update={"cursor": "m1"}))
+        assert _deltas(by_message_id) == ["t2"]
+
+    async def test_page_size_streams_one_page_and_finishes_with_the_next_cursor(self, tmp_path: Path) -> None:
+        live = tmp_path / "live.jsonl"
+        live.write_text("".join(_text_entry(n) for n in range(5)), encoding="utf-8")
+        session = _make_session(native_log_file=str(live))
+
+        page = await self._stream(session, ChatStreamRequest(sessionId=session.session_id, pageSize=2))
+        assert _deltas(page) == ["t0", "t1"]
+        assert _event_ids(page)[-1] == "0:2"
+
+        next_page = await self._stream(
+            session, ChatStreamRequest(sessionId=session.session_id, pageSize=2, cursor=_event_ids(page)[-1])
         )
+        assert _deltas(next_page) == ["t2", "t3"]
@@ -7,6 +7,7 @@ import importlib
 import pytest
 
 from teleclaude.api import ws_constants
+from teleclaude.api.ws_outbox import WsFrame
 
 
 class TestWsConstants:
@@ -29,12 +30,13 @@ class TestWsConstants:
         first = ws_constants._WsClientState()
         second = ws_constants._WsClientState()
 
-        first.queue.put_nowait(("refresh", {"event": "refresh"}))
+        first.queue.put_nowait(WsFrame("refresh", {"event": "refresh"}))
 
         assert first.queue.qsize() == 1
         assert second.queue.qsize() == 0
         assert first.sender_task is None
         assert second.sender_task is None
+        assert first.queue.maxsize == ws_constants.API_WS_CLIENT_QUEUE_MAX
 
     @pytest.mark.unit
     def test_control_and_replaceable_events_are_kept_disjoint(self) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock
@@ -48,6 +50,10 @@ class _WebSocketMixinHarness(_WebSocketMixin):
     async def _drop_ws_client(self, websocket: WebSocket, *, reason: str) -> None:
         self.dropped_clients.append((websocket, reason))
 
+    async def stop_senders(self) -> None:
+        for state in list(self._ws_client_states.values()):
+            await self._stop_ws_sender(state)  # type: ignore[arg-type]
+
 
 class _SerializablePayload:
     def to_dict(self) -> JsonDict:
@@ -55,7 +61,7 @@ class _SerializablePayload:
 
 
 class _DisconnectingWebSocket:
-    async def send_json(self, payload: object) -> None:
+    async def send_text(self, data: str) -> None:
         try:
             raise OSError("broken-pipe")
         except OSError as exc:
@@ -143,3 +149,82 @@ class TestWsMixin:
 
         assert delivered is False
         assert server.dropped_clients == [(websocket, "send-disconnect:refresh")]
+
+
+class _GatedWebSocket:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.sent: list[str] = []
+
+    async def send_text(self, data: str) -> None:
+        await self.release.wait()
+        self.sent.append(data)
+
+
+def _session_updated(session_id: str, title: str) -> JsonDict:
+    return {"event": "session_updated", "data": {"session_id": session_id, "title": title}}
+
+
+class TestWsBroadcast:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once_and_coalesces_session_updates_per_client(self) -> None:
+        """Clients receive the same encoded frame, and only the newest update per session."""
+        server = _WebSocketMixinHarness()
+        first, second = _GatedWebSocket(), _GatedWebSocket()
+        server._ws_clients = {cast(WebSocket, first), cast(WebSocket, second)}
+        try:
+            _WebSocketMixin._broadcast_payload(server, "session_updated", _session_updated("s1", "old"))
+            _WebSocketMixin._broadcast_payload(server, "session_updated", _session_updated("s2", "other"))
+            _WebSocketMixin._broadcast_payload(server, "session_updated", _session_updated("s1", "new"))
+            first.release.set()
+            second.release.set()
+            for state in server._ws_client_states.values():
+                await asyncio.wait_for(state.queue.join(), timeout=0.5)  # type: ignore[attr-defined]
+
+            assert [json.loads(text)["data"]["title"] for text in first.sent] == ["new", "other"]
+            assert all(a is b for a, b in zip(first.sent, second.sent, strict=True))
+            metrics = {snapshot.client_id: snapshot for snapshot in server._ws_client_metrics()}
+            assert metrics[id(first)].coalesced == 1
+            assert metrics[id(first)].sent == 2
+            assert metrics[id(first)].depth == 0
+        finally:
+            await server.stop_senders()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_full_backlog_of_control_events_drops_the_client(self) -> None:
+        """A client that cannot keep up with undroppable events is disconnected."""
+        server = _WebSocketMixinHarness()
+        slow = _GatedWebSocket()
+        websocket = cast(WebSocket, slow)
+        server._ws_clients = {websocket}
+        state = server._ensure_ws_client_state(websocket)
+        state.queue.maxsize = 2
+        try:
+            for index in range(4):
+                _WebSocketMixin._broadcast_payload(server, "session_started", {"event": "session_started", "n": index})
+            await asyncio.sleep(0)
+
+            assert websocket not in server._ws_clients
+            assert server.dropped_clients == [(websocket, "queue-overflow:session_started")]
+            assert state.queue.metrics.overflowed == 1
+        finally:
+            await server.stop_senders()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_drop_ws_client_cancels_and_awaits_sender_task(self) -> None:
+        """Disconnect cleanup never leaves a sender task running."""
+        server = _WebSocketMixinHarness()
+        websocket = cast(WebSocket, _GatedWebSocket())
+        server._ws_clients = {websocket}
+        server._client_subscriptions = {websocket: {}}
+        state = server._ensure_ws_client_state(websocket)
+        _WebSocketMixin._broadcast_payload(server, "session_started", {"event": "session_started"})
+        await asyncio.sleep(0)
+
+        await _WebSocketMixin._drop_ws_client(server, websocket, reason="connection-end")
+
+        assert state.sender_task is not None and state.sender_task.done()
+        assert server._ws_client_states == {}
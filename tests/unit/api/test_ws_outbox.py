@@ -0,0 +1,120 @@
+"""Unit tests for teleclaude.api.ws_outbox."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from teleclaude.api.ws_outbox import WsClientQueue, WsFrame, ws_coalesce_key
+
+
+def _refresh(kind: str, computer: str | None, project_path: str | None = None) -> WsFrame:
+    return WsFrame("refresh", {"event": kind, "data": {"computer": computer, "project_path": project_path}})
+
+
+@pytest.mark.unit
+def test_frame_text_matches_compact_json_and_is_cached() -> None:
+    frame = WsFrame("error", {"event": "error", "data": {"message": "né"}})
+
+    assert frame.text == json.dumps(frame.payload, separators=(",", ":"), ensure_ascii=False)
+    assert frame.text is frame.text
+
+
+@pytest.mark.unit
+def test_coalesce_keys_cover_state_events_only() -> None:
+    assert ws_coalesce_key(WsFrame("session_updated", {"data": {"session_id": "s1"}})) == ("session_updated", "s1")
+    assert ws_coalesce_key(_refresh("todos_updated", "raspi", "/repo")) == (
+        "refresh",
+        "todos_updated",
+        "raspi",
+        "/repo",
+    )
+    assert ws_coalesce_key(WsFrame("chiptunes_track", {"event": "chiptunes_track"})) == ("chiptunes_track",)
+    assert ws_coalesce_key(WsFrame("session_started", {"data": {"session_id": "s1"}})) is None
+    assert ws_coalesce_key(WsFrame("session_updated", {"data": {}})) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_superseded_frame_is_replaced_in_its_original_position() -> None:
+    queue = WsClientQueue(maxsize=10)
+    queue.put_nowait(WsFrame("session_updated", {"data": {"session_id": "s1", "v": 1}}))
+    queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s2"}}))
+    queue.put_nowait(WsFrame("session_updated", {"data": {"session_id": "s1", "v": 2}}))
+
+    first = await queue.get()
+    second = await queue.get()
+
+    assert first.payload["data"] == {"session_id": "s1", "v": 2}
+    assert second.event == "session_started"
+    assert queue.metrics.enqueued == 2
+    assert queue.metrics.coalesced == 1
+
+
+@pytest.mark.unit
+def test_full_queue_evicts_oldest_replaceable_frame_before_refusing() -> None:
+    queue = WsClientQueue(maxsize=2, evictable=frozenset({"chiptunes_state"}))
+    assert queue.put_nowait(WsFrame("chiptunes_state", {"data": {"playing": True}}))
+    assert queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s1"}}))
+
+    assert queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s2"}}))
+    assert queue.metrics.evicted == 1
+    assert queue.qsize() == 2
+
+    assert queue.put_nowait(WsFrame("session_closed", {"data": {"session_id": "s1"}})) is False
+    assert queue.metrics.overflowed == 1
+    assert queue.metrics.max_depth == 2
+
+
+@pytest.mark.unit
+def test_full_queue_never_evicts_refresh_frames() -> None:
+    queue = WsClientQueue(maxsize=2, evictable=frozenset({"refresh"}))
+    assert queue.put_nowait(_refresh("projects_updated", "a"))
+    assert queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s1"}}))
+
+    assert queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s2"}})) is False
+    assert queue.metrics.evicted == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_full_queue_merges_refreshes_into_the_scope_they_share() -> None:
+    queue = WsClientQueue(maxsize=2, evictable=frozenset({"refresh"}))
+    assert queue.put_nowait(_refresh("todos_updated", "a", "/p1"))
+    assert queue.put_nowait(WsFrame("session_started", {"data": {"session_id": "s1"}}))
+
+    assert queue.put_nowait(_refresh("todos_updated", "a", "/p2"))
+    # The widened refresh now covers the computer, so another project folds into it too.
+    assert queue.put_nowait(_refresh("todos_updated", "a", "/p3"))
+    assert queue.put_nowait(_refresh("projects_updated", "a")) is False
+    # The widened frame is keyed by its new scope, so a computer-wide refresh replaces it.
+    assert queue.put_nowait(_refresh("todos_updated", "a"))
+    assert queue.qsize() == 2
+
+    merged = await queue.get()
+    assert merged.payload["event"] == "todos_updated"
+    assert merged.payload["data"] == {"computer": "a", "project_path": None}
+    assert (await queue.get()).event == "session_started"
+    assert queue.metrics.coalesced == 3
+    assert queue.metrics.evicted == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_waits_for_a_frame_and_records_lag() -> None:
+    queue = WsClientQueue()
+    waiter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    frame = WsFrame("notification", {"type": "notification_created"})
+    queue.put_nowait(frame)
+    assert await waiter is frame
+
+    queue.record_sent(frame, 0.002)
+    assert queue.metrics.sent == 1
+    assert queue.metrics.last_send_s == 0.002
+    assert queue.metrics.max_lag_s >= queue.metrics.last_lag_s >= 0.0
+    assert queue.oldest_age_s() == 0.0
@@ -0,0 +1,70 @@
+"""Tests for teleclaude.channels.publisher."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from teleclaude.channels.publisher import list_channels
+
+
+class _Pipeline:
+    def __init__(self, lengths: dict[str, int]) -> None:
+        self._lengths = lengths
+        self.queued: list[str] = []
+
+    async def __aenter__(self) -> _Pipeline:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def xlen(self, key: str) -> _Pipeline:
+        self.queued.append(key)
+        return self
+
+    async def execute(self) -> list[int]:
+        return [self._lengths[key] for key in self.queued]
+
+
+class _FakeRedis:
+    def __init__(self, lengths: dict[str, int]) -> None:
+        self.lengths = lengths
+        self.pipelines: list[_Pipeline] = []
+
+    async def scan_iter(self, match: str, _type: str) -> AsyncIterator[bytes]:
+        prefix = match.rstrip("*")
+        for key in self.lengths:
+            if key.startswith(prefix):
+                yield key.encode()
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        assert transaction is False
+        pipe = _Pipeline(self.lengths)
+        self.pipelines.append(pipe)
+        return pipe
+
+    async def xlen(self, key: str) -> int:
+        raise AssertionError("XLEN must be pipelined")
+
+
+@pytest.mark.unit
+async def test_list_channels_pipelines_xlen_in_one_round_trip() -> None:
+    redis = _FakeRedis({"channel:proj:events": 3, "channel:proj:alerts": 0, "channel:bad": 9, "channel:other:x": 1})
+
+    channels = await list_channels(redis, "proj")  # type: ignore[arg-type]
+
+    assert channels == [
+        {"key": "channel:proj:events", "project": "proj", "topic": "events", "length": 3},
+        {"key": "channel:proj:alerts", "project": "proj", "topic": "alerts", "length": 0},
+    ]
+    assert len(redis.pipelines) == 1
+
+
+@pytest.mark.unit
+async def test_list_channels_skips_pipeline_when_nothing_matches() -> None:
+    redis = _FakeRedis({"channel:bad": 9})
+
+    assert await list_channels(redis) == []  # type: ignore[arg-type]
+    assert redis.pipelines == []
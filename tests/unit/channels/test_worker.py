@@ -0,0 +1,265 @@
+"""Tests for teleclaude.channels.worker."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from teleclaude.channels import worker
+from teleclaude.config.schema import ChannelSubscription
+
+
+class FakeStreamRedis:
+    """Consumer-group stream store: blocking multi-stream XREADGROUP, pending list, XACK."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, list[tuple[str, dict[bytes, bytes]]]] = {}
+        self.delivered: dict[str, int] = {}
+        self.pending: dict[str, list[str]] = {}
+        self.acked: dict[str, list[str]] = {}
+        self.read_calls: list[dict[str, str]] = []
+        self._changed = asyncio.Event()
+
+    def add(self, channel: str, payload: dict[str, object]) -> None:
+        entries = self.entries.setdefault(channel, [])
+        entries.append((f"{len(entries) + 1}-0", {b"payload": json.dumps(payload).encode()}))
+        self._changed.set()
+
+    async def xgroup_create(self, channel: str, group: str, id: str, mkstream: bool) -> None:
+        self.entries.setdefault(channel, [])
+
+    async def xack(self, channel: str, group: str, *ids: str) -> int:
+        for msg_id in ids:
+            self.pending.setdefault(channel, []).remove(msg_id)
+            self.acked.setdefault(channel, []).append(msg_id)
+        return len(ids)
+
+    async def xreadgroup(
+        self, group: str, consumer: str, streams: dict[str, str], count: int, block: int | None
+    ) -> list[tuple[bytes, list[tuple[str, dict[bytes, bytes]]]]]:
+        self.read_calls.append(dict(streams))
+        deadline = asyncio.get_running_loop().time() + (block or 0) / 1000
+        woken = False
+        while True:
+            result = []
+            for channel, position in streams.items():
+                if position == ">":
+                    start = self.delivered.get(channel, 0)
+                    batch = self.entries.get(channel, [])[start : start + count]
+                    self.delivered[channel] = start + len(batch)
+                    self.pending.setdefault(channel, []).extend(msg_id for msg_id, _ in batch)
+                else:
+                    pending = [p for p in self.pending.get(channel, []) if p > position][:count]
+                    batch = [entry for entry in self.entries[channel] if entry[0] in pending]
+                    # Reading pending entries always names the stream, even once drained.
+                    result.append((channel.encode(), batch))
+                    continue
+                if batch:
+                    result.append((channel.encode(), batch))
+            remaining = deadline - asyncio.get_running_loop().time()
+            # A wakeup without new entries returns early so shutdown is noticed promptly.
+            if result or woken or remaining <= 0 or any(p != ">" for p in streams.values()):
+                return result
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except TimeoutError:
+                return []
+            woken = True
+
+
+async def _run_until(redis: FakeStreamRedis, subscriptions: list[ChannelSubscription], done: asyncio.Event) -> None:
+    shutdown = asyncio.Event()
+    task = asyncio.create_task(worker.run_subscription_worker(redis, subscriptions, shutdown_event=shutdown))
+    await asyncio.wait_for(done.wait(), timeout=0.5)
+    shutdown.set()
+    redis._changed.set()
+    await asyncio.wait_for(task, timeout=0.5)
+
+
+@pytest.mark.unit
+async def test_one_blocking_read_covers_all_channels_and_acks_after_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    dispatched: list[tuple[str, object]] = []
+    done = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        dispatched.append((str(target["channel"]), payload["n"]))
+        if len(dispatched) == 2:
+            done.set()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+    subscriptions = [
+        ChannelSubscription(channel="channel:a:events", target={"type": "notification", "channel": "a"}),
+        ChannelSubscription(
+            channel="channel:b:events", filter={"kind": "deploy"}, target={"type": "notification", "channel": "b"}
+        ),
+    ]
+    redis.add("channel:b:events", {"kind": "noise", "n": 0})
+
+    async def _publish_later() -> None:
+        await asyncio.sleep(0.02)
+        redis.add("channel:a:events", {"n": 1})
+        redis.add("channel:b:events", {"kind": "deploy", "n": 2})
+
+    publisher = asyncio.create_task(_publish_later())
+    await _run_until(redis, subscriptions, done)
+    await publisher
+
+    assert sorted(dispatched) == [("a", 1), ("b", 2)]
+    assert any(set(call) == {"channel:a:events", "channel:b:events"} for call in redis.read_calls)
+    assert redis.acked == {"channel:b:events": ["1-0", "2-0"], "channel:a:events": ["1-0"]}
+    assert all(not ids for ids in redis.pending.values())
+
+
+@pytest.mark.unit
+async def test_slow_target_does_not_stall_other_channels(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    release_slow = asyncio.Event()
+    fast_done = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        if target["channel"] == "slow":
+            await release_slow.wait()
+        else:
+            fast_done.set()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+    subscriptions = [
+        ChannelSubscription(channel="channel:slow:events", target={"channel": "slow"}),
+        ChannelSubscription(channel="channel:fast:events", target={"channel": "fast"}),
+    ]
+    redis.add("channel:slow:events", {"n": 1})
+    redis.add("channel:fast:events", {"n": 2})
+
+    shutdown = asyncio.Event()
+    task = asyncio.create_task(worker.run_subscription_worker(redis, subscriptions, shutdown_event=shutdown))
+    await asyncio.wait_for(fast_done.wait(), timeout=0.5)
+    await asyncio.sleep(0)
+
+    assert redis.acked.get("channel:fast:events") == ["1-0"]
+    assert redis.pending["channel:slow:events"] == ["1-0"]
+
+    release_slow.set()
+    shutdown.set()
+    redis._changed.set()
+    await asyncio.wait_for(task, timeout=0.5)
+    assert redis.acked["channel:slow:events"] == ["1-0"]
+
+
+@pytest.mark.unit
+async def test_unacked_messages_from_previous_run_are_redispatched(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    redis.add("channel:a:events", {"n": 1})
+    redis.delivered["channel:a:events"] = 1
+    redis.pending["channel:a:events"] = ["1-0"]
+    done = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        done.set()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+
+    await _run_until(redis, [ChannelSubscription(channel="channel:a:events", target={})], done)
+
+    assert redis.read_calls[0] == {"channel:a:events": "0"}
+    assert redis.acked == {"channel:a:events": ["1-0"]}
+
+
+@pytest.mark.unit
+def test_saturated_channel_is_left_out_of_the_next_read() -> None:
+    dispatcher = worker._SubscriptionDispatcher(
+        FakeStreamRedis(),  # type: ignore[arg-type]
+        [ChannelSubscription(channel="channel:a:x", target={}), ChannelSubscription(channel="channel:b:x", target={})],
+    )
+    dispatcher._in_flight["channel:a:x"] = worker._CHANNEL_MAX_IN_FLIGHT - worker._READ_COUNT + 1
+
+    assert dispatcher.ready_channels() == ["channel:b:x"]
+
+
+@pytest.mark.unit
+async def test_messages_on_one_channel_are_dispatched_in_stream_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    for n in range(5):
+        redis.add("channel:a:events", {"n": n})
+    seen: list[object] = []
+    done = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        # Earlier messages take longer; a per-message task would finish them last.
+        await asyncio.sleep(0.001 * (5 - int(str(payload["n"]))))
+        seen.append(payload["n"])
+        if len(seen) == 5:
+            done.set()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+
+    await _run_until(redis, [ChannelSubscription(channel="channel:a:events", target={})], done)
+
+    assert seen == [0, 1, 2, 3, 4]
+    assert redis.acked == {"channel:a:events": ["1-0", "2-0", "3-0", "4-0", "5-0"]}
+
+
+@pytest.mark.unit
+async def test_pending_recovery_ends_on_a_drained_pending_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    channel = "channel:a:events"
+    redis.add(channel, {"n": 1})
+    redis.delivered[channel] = 1
+    redis.pending[channel] = ["1-0"]
+    redis.add(channel, {"n": 2})
+    seen: list[object] = []
+    done = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        seen.append(payload["n"])
+        if len(seen) == 2:
+            done.set()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+
+    await _run_until(redis, [ChannelSubscription(channel=channel, target={})], done)
+
+    assert seen == [1, 2]
+    assert redis.read_calls[:3] == [{channel: "0"}, {channel: "1-0"}, {channel: ">"}]
+
+
+@pytest.mark.unit
+async def test_pending_recovery_stops_at_a_batch_without_payloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    channel = "channel:a:events"
+    redis.entries[channel] = [(f"{n}-0", {}) for n in range(1, 4)]
+    redis.add(channel, {"n": 4})
+    redis.delivered[channel] = 4
+    redis.pending[channel] = ["1-0", "2-0", "3-0", "4-0"]
+    monkeypatch.setattr(worker, "_READ_COUNT", 3)
+    dispatcher = worker._SubscriptionDispatcher(redis, [ChannelSubscription(channel=channel, target={})])
+
+    await asyncio.wait_for(worker._recover_pending(redis, dispatcher), timeout=0.5)
+
+    assert redis.acked == {channel: ["1-0", "2-0", "3-0"]}
+    assert redis.read_calls == [{channel: "0"}]
+
+
+@pytest.mark.unit
+async def test_cancellation_propagates_after_abandoning_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeStreamRedis()
+    redis.add("channel:a:events", {"n": 1})
+    started = asyncio.Event()
+
+    async def _dispatch(target: dict[str, object], payload: dict[str, object]) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(worker, "_dispatch_to_target", _dispatch)
+    task = asyncio.create_task(
+        worker.run_subscription_worker(redis, [ChannelSubscription(channel="channel:a:events", target={})])
+    )
+    await asyncio.wait_for(started.wait(), timeout=0.5)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert redis.pending["channel:a:events"] == ["1-0"]
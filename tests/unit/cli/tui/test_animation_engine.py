@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+
+from teleclaude.cli.tui.animation_engine import AnimationEngine
+from teleclaude.cli.tui.animations.base import Z0, Z50, RenderBuffer
+
+
+class _ScriptedAnimation:
+    """Minimal stand-in for Animation that replays scripted frames."""
+
+    speed_ms = 0
+    is_external_light = False
+
+    def __init__(self, frames: list[RenderBuffer | dict[tuple[int, int], str | int]]) -> None:
+        self._frames = frames
+
+    def update(self, frame: int) -> RenderBuffer | dict[tuple[int, int], str | int]:
+        return self._frames[frame]
+
+    def is_complete(self, frame: int) -> bool:
+        return frame >= len(self._frames)
+
+
+def _buffer(layers: dict[int, dict[tuple[int, int], str | int]]) -> RenderBuffer:
+    buffer = RenderBuffer()
+    for z, pixels in layers.items():
+        for (x, y), value in pixels.items():
+            buffer.add_pixel(z, x, y, value)
+    return buffer
+
+
+def _engine_with(
+    frames: list[RenderBuffer | dict[tuple[int, int], str | int]], target: str = "banner"
+) -> AnimationEngine:
+    engine = AnimationEngine()
+    slot = engine._ensure_target(target)
+    slot.animation = _ScriptedAnimation(frames)  # type: ignore[assignment]
+    return engine
+
+
+@pytest.mark.unit
+def test_get_color_composites_front_to_back_and_skips_entity_markers() -> None:
+    frame = _buffer({Z0: {(1, 1): "#000011"}, Z50: {(1, 1): "*"}, 70: {(2, 1): "#ff0000"}})
+    engine = _engine_with([frame, frame])
+
+    assert engine.update() is True
+    assert engine.get_color(1, 1) == "#000011"
+    assert engine.get_color(2, 1) == "#ff0000"
+    assert engine.get_color(0, 0) is None
+    assert engine.get_color(-1, 0) is None
+    assert engine.get_layer_color(Z50, 1, 1) == "*"
+    assert engine.get_entity_z_levels("banner") == [70, Z50]
+
+
+@pytest.mark.unit
+def test_legacy_dict_frames_land_on_billboard_layer() -> None:
+    engine = _engine_with([{(0, 0): "#123456"}, {(0, 0): "#123456"}])
+
+    engine.update()
+
+    assert engine.get_layer_color(Z50, 0, 0) == "#123456"
+
+
+@pytest.mark.unit
+def test_dirty_region_covers_only_changed_cells() -> None:
+    engine = _engine_with(
+        [
+            _buffer({Z50: {(x, y): "#111111" for x in range(10) for y in range(4)}}),
+            _buffer({Z50: {**{(x, y): "#111111" for x in range(10) for y in range(4)}, (6, 2): "#222222"}}),
+            _buffer({Z50: {**{(x, y): "#111111" for x in range(10) for y in range(4)}, (6, 2): "#222222"}}),
+            _buffer({Z50: {}}),
+        ]
+    )
+
+    assert engine.update() is True
+    assert engine.get_dirty_regions() == {"banner": (0, 0, 10, 4)}
+
+    assert engine.update() is True
+    assert engine.get_dirty_regions() == {"banner": (6, 2, 1, 1)}
+    assert engine.get_color(6, 2) == "#222222"
+
+    # Identical frame: nothing to repaint.
+    assert engine.update() is False
+    assert engine.get_dirty_regions() == {}
+
+    assert engine.update() is True
+    assert engine.get_dirty_regions() == {"banner": (0, 0, 10, 4)}
+    assert engine.get_color(6, 2) is None
+
+
+@pytest.mark.unit
+def test_grid_grows_to_fit_pixels_beyond_previous_frame() -> None:
+    grown = _buffer({Z50: {(1, 0): "#111111", (5, 3): "#222222"}})
+    engine = _engine_with([_buffer({Z50: {(1, 0): "#111111"}}), grown, grown])
+
+    engine.update()
+    engine.update()
+
+    assert engine.get_color(1, 0) == "#111111"
+    assert engine.get_color(5, 3) == "#222222"
+    assert engine.get_dirty_regions() == {"banner": (0, 0, 6, 4)}
+
+
+@pytest.mark.unit
+def test_completed_animation_clears_target_and_reports_dirty() -> None:
+    engine = _engine_with([_buffer({Z50: {(3, 1): "#111111"}})])
+
+    assert engine.update() is True
+
+    assert engine.get_color(3, 1) is None
+    assert engine.get_entity_z_levels("banner") == []
+    assert engine._targets["banner"].animation is None
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from teleclaude.core.db._group_commit import GroupCommitter
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_concurrent_submissions_share_a_flush() -> None:
+    flushed: list[list[int]] = []
+
+    async def _flush(items: list[int]) -> list[int]:
+        flushed.append(items)
+        return [item * 10 for item in items]
+
+    committer = GroupCommitter(_flush)
+
+    assert await asyncio.gather(*(committer.submit(i) for i in range(5))) == [0, 10, 20, 30, 40]
+    assert committer.items == 5
+    assert len(flushed) < 5
+
+
+async def test_result_count_mismatch_fails_every_submitter_in_the_batch() -> None:
+    async def _flush(items: list[int]) -> list[int]:
+        return items[:-1]
+
+    committer = GroupCommitter(_flush)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(committer.submit(i) for i in range(3)), return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert committer.items == 0
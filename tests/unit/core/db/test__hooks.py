@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import UTC, datetime, timedelta
 
@@ -133,3 +134,55 @@ async def test_hook_outbox_batch_claim_retry_and_delivery_follow_persisted_state
     assert delivered.delivered_at is not None
     assert delivered.last_error == "prior-failure"
     assert DbHooksMixin._parse_iso_datetime("not-an-iso-string") is None
+
+
+async def test_concurrent_hook_enqueues_are_group_committed(db: Db) -> None:
+    row_ids = await asyncio.gather(*(db.enqueue_hook_event(f"sess-{i % 3}", "tool_use", {"n": i}) for i in range(20)))
+    committer = db._hook_insert_committer
+
+    batch = await db.fetch_hook_outbox_batch(
+        now_iso=datetime.now(UTC).isoformat(),
+        limit=50,
+        lock_cutoff_iso=(datetime.now(UTC) - timedelta(minutes=1)).isoformat(),
+    )
+
+    assert len(set(row_ids)) == 20
+    assert [row["id"] for row in batch] == row_ids
+    assert committer.items == 20
+    assert committer.batches < 20
+
+
+async def test_claim_due_hook_outbox_batch_locks_rows_and_skips_excluded_sessions(db: Db) -> None:
+    first = await db.enqueue_hook_event("sess-001", "tool_use", {"n": 1})
+    await db.enqueue_hook_event("sess-paused", "tool_use", {"n": 2})
+    third = await db.enqueue_hook_event("sess-002", "tool_use", {"n": 3}, created_at="2020-01-01T00:00:00+00:00")
+    now_iso = datetime.now(UTC).isoformat()
+    lock_cutoff_iso = (datetime.now(UTC) - timedelta(minutes=1)).isoformat()
+
+    claimed = await db.claim_due_hook_outbox_batch(now_iso, 10, lock_cutoff_iso, exclude_session_ids={"sess-paused"})
+    again = await db.claim_due_hook_outbox_batch(
+        (datetime.now(UTC) + timedelta(seconds=1)).isoformat(), 10, lock_cutoff_iso, exclude_session_ids={"sess-paused"}
+    )
+
+    assert [row["id"] for row in claimed] == [third, first]
+    assert claimed[0]["created_at"] == "2020-01-01T00:00:00+00:00"
+    assert again == []
+
+
+async def test_group_committed_deliveries_and_bulk_prune(db: Db) -> None:
+    ok_id = await db.enqueue_hook_event("sess-001", "tool_use", {"n": 1})
+    err_id = await db.enqueue_hook_event("sess-001", "tool_use", {"n": 2})
+    pending_id = await db.enqueue_hook_event("sess-001", "tool_use", {"n": 3})
+
+    await asyncio.gather(db.mark_hook_outbox_delivered(ok_id), db.mark_hook_outbox_delivered(err_id, error="boom"))
+    async with db._session() as session:
+        errored = await session.get(db_models.HookOutbox, err_id)
+    assert errored is not None and errored.last_error == "boom"
+
+    future_cutoff = (datetime.now(UTC) + timedelta(minutes=1)).isoformat()
+    assert await db.prune_delivered_hook_outbox((datetime.now(UTC) - timedelta(hours=1)).isoformat()) == 0
+    assert await db.prune_delivered_hook_outbox(future_cutoff, chunk_size=1) == 2
+
+    async with db._session() as session:
+        assert await session.get(db_models.HookOutbox, ok_id) is None
+        assert await session.get(db_models.HookOutbox, pending_id) is not None
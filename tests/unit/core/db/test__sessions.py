@@ -296,3 +296,80 @@ async def test_adapter_metadata_and_title_pattern_queries_apply_current_filters(
 
     assert [session.session_id for session in adapter_matches] == ["sess-active"]
     assert [session.session_id for session in title_matches] == ["sess-active"]
+
+
+async def test_get_session_serves_isolated_copies_from_cache(db: Db) -> None:
+    await db.create_session(
+        computer_name="builder-mac",
+        tmux_session_name="tmux-cache",
+        last_input_origin="telegram",
+        title="Cached",
+        session_id="sess-cache",
+        adapter_metadata=SessionAdapterMetadata(telegram=TelegramAdapterMetadata(topic_id=7)),
+        emit_session_started=False,
+    )
+    first = await db.get_session("sess-cache")
+    assert first is not None
+    first.title = "mutated locally"
+    first.adapter_metadata.get_ui().get_telegram().topic_id = 99
+
+    with patch.object(db, "_session", side_effect=AssertionError("cache miss")):
+        second = await db.get_session("sess-cache")
+
+    assert second is not None
+    assert second.title == "Cached"
+    assert second.adapter_metadata.get_ui().get_telegram().topic_id == 7
+
+
+async def test_update_session_writes_through_and_bumps_version(db: Db) -> None:
+    await db.create_session(
+        computer_name="builder-mac",
+        tmux_session_name="tmux-wt",
+        last_input_origin="telegram",
+        title="Before",
+        session_id="sess-wt",
+        emit_session_started=False,
+    )
+    await db.get_session("sess-wt")
+    version = db.get_session_version("sess-wt")
+
+    await db.update_session("sess-wt", title="After")
+
+    assert db.get_session_version("sess-wt") == version + 1
+    with patch.object(db, "_session", side_effect=AssertionError("cache miss")):
+        cached = await db.get_session("sess-wt")
+    assert cached is not None and cached.title == "After"
+
+    await db.close_session("sess-wt")
+    closed = await db.get_session("sess-wt")
+    assert closed is not None and closed.lifecycle_status == "closed"
+
+
+async def test_invalidate_session_cache_rereads_external_writes(db: Db) -> None:
+    from teleclaude.core import db_models
+
+    await db.create_session(
+        computer_name="builder-mac",
+        tmux_session_name="tmux-ext",
+        last_input_origin="telegram",
+        title="Example",
+        session_id="sess-ext",
+        emit_session_started=False,
+    )
+    await db.get_session("sess-ext")
+
+    # Simulate the hook receiver writing the row from its own connection.
+    async with db._session() as db_session:
+        row = await db_session.get(db_models.Session, "sess-ext")
+        assert row is not None
+        row.native_log_file = "/tmp/new.jsonl"
+        db_session.add(row)
+        await db_session.commit()
+
+    stale = await db.get_session("sess-ext")
+    assert stale is not None and stale.native_log_file is None
+
+    db.invalidate_session_cache("sess-ext")
+
+    fresh = await db.get_session("sess-ext")
+    assert fresh is not None and fresh.native_log_file == "/tmp/new.jsonl"
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from teleclaude.core.db import Db
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_cached_summary_round_trips_per_kind(db: Db) -> None:
+    assert await db.get_cached_summary("summary", "abc") is None
+
+    await db.store_cached_summary("summary", "abc", "first")
+    await db.store_cached_summary("summary", "abc", "second")
+    await db.store_cached_summary("title", "abc", "Fix the bug")
+
+    assert await db.get_cached_summary("summary", "abc") == "second"
+    assert await db.get_cached_summary("title", "abc") == "Fix the bug"
+
+
+async def test_prune_summary_cache_deletes_entries_before_cutoff(db: Db) -> None:
+    await db.store_cached_summary("summary", "abc", "kept")
+
+    assert await db.prune_summary_cache((datetime.now(UTC) - timedelta(days=1)).isoformat()) == 0
+    assert await db.prune_summary_cache((datetime.now(UTC) + timedelta(days=1)).isoformat()) == 1
+    assert await db.get_cached_summary("summary", "abc") is None
@@ -96,3 +96,46 @@ async def test_mark_webhook_failed_schedules_retry_without_making_non_pending_ro
     assert terminal is not None
     assert terminal.status == "failed"
     assert terminal.last_error == "permanent"
+
+
+async def test_claim_webhook_batch_locks_due_rows_atomically_with_per_target_caps(db: Db) -> None:
+    slow_ids = [
+        await db.enqueue_webhook("contract-1", event_json=f'{{"n":{n}}}', target_url="https://slow.test/hook")
+        for n in range(3)
+    ]
+    fast_id = await db.enqueue_webhook("contract-2", event_json='{"n":3}', target_url="https://fast.test/hook")
+    dead_id = await db.enqueue_webhook("contract-3", event_json='{"n":4}', target_url="https://dead.test/hook")
+    now_iso = (datetime.now(UTC) + timedelta(seconds=1)).isoformat()
+
+    first = await db.claim_webhook_batch(10, now_iso, per_target=2, exclude_targets={"https://dead.test/hook"})
+    second = await db.claim_webhook_batch(10, now_iso)
+
+    assert [row.id for row in first] == [slow_ids[0], slow_ids[1], fast_id]
+    assert all(row.locked_at == now_iso for row in first)
+    assert [row.id for row in second] == [slow_ids[2], dead_id]
+    assert await db.claim_webhook_batch(10, now_iso) == []
+
+
+async def test_claim_webhook_batch_honours_target_room_and_reclaims_expired_locks(db: Db) -> None:
+    busy_ids = [
+        await db.enqueue_webhook("contract-1", event_json=f'{{"n":{n}}}', target_url="https://busy.test/hook")
+        for n in range(3)
+    ]
+    other_ids = [
+        await db.enqueue_webhook("contract-2", event_json=f'{{"n":{n}}}', target_url="https://other.test/hook")
+        for n in range(3)
+    ]
+    now = datetime.now(UTC) + timedelta(seconds=1)
+
+    first = await db.claim_webhook_batch(10, now.isoformat(), per_target=2, target_room={"https://busy.test/hook": 1})
+    assert [row.id for row in first] == [busy_ids[0], other_ids[0], other_ids[1]]
+
+    later = now + timedelta(minutes=5)
+    reclaimed = await db.claim_webhook_batch(
+        10, later.isoformat(), per_target=1, locked_before=(later - timedelta(minutes=1)).isoformat()
+    )
+    assert [row.id for row in reclaimed] == [busy_ids[0], other_ids[0]]
+
+    await db.release_webhook_claims([busy_ids[0], other_ids[0]])
+    released = await db.claim_webhook_batch(10, later.isoformat())
+    assert {row.id for row in released} == {busy_ids[0], busy_ids[1], busy_ids[2], other_ids[0], other_ids[2]}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import patch
 
+from teleclaude.core.next_machine._types import GateMode, GateSelection
 from teleclaude.core.next_machine.build_gates import (
     _count_test_failures,
     check_file_has_content,
@@ -43,6 +44,10 @@ def test_run_build_gates_retries_last_failed_tests_before_failing_the_gate(tmp_p
 
     with (
         patch("subprocess.run") as run,
+        patch(
+            "teleclaude.core.next_machine.build_gates.select_gate_tests",
+            return_value=GateSelection(GateMode.FULL, "no previous green gate"),
+        ),
         patch("teleclaude.cli.demo_validation.validate_demo", return_value=(True, False, "demo ok")),
     ):
         run.side_effect = [
@@ -54,9 +59,55 @@ def test_run_build_gates_retries_last_failed_tests_before_failing_the_gate(tmp_p
 
     assert passed is True
     assert "retry passed after 1 flaky failure(s)" in output
+    assert run.call_args_list[0].args[0] == ["make", "test"]
     assert run.call_args_list[1].args[0] == [str(pytest_path), "--lf", "-q"]
 
 
+def test_run_build_gates_skips_the_suite_when_nothing_changed_since_the_last_green_gate(tmp_path: Path) -> None:
+    selection = GateSelection(GateMode.CACHED, "no test-relevant changes since green gate at abc", head_commit="abc")
+
+    with (
+        patch("subprocess.run") as run,
+        patch("teleclaude.core.next_machine.build_gates.select_gate_tests", return_value=selection),
+        patch("teleclaude.cli.demo_validation.validate_demo", return_value=(True, False, "demo ok")),
+    ):
+        passed, output = run_build_gates(str(tmp_path), "slug")
+
+    assert passed is True
+    assert "GATE PASSED: make test (skipped — no test-relevant changes" in output
+    run.assert_not_called()
+
+
+def test_run_build_gates_runs_only_impacted_tests_without_recording_green(tmp_path: Path) -> None:
+    selection = GateSelection(
+        GateMode.IMPACT,
+        "1 changed file(s) since green gate at abc",
+        head_commit="def",
+        base_commit="abc",
+        test_files=("tests/unit/test_a.py", "tests/unit/test_b.py"),
+    )
+
+    with (
+        patch("subprocess.run", return_value=_Result(returncode=0, stdout="2 passed")) as run,
+        patch("teleclaude.core.next_machine.build_gates.select_gate_tests", return_value=selection),
+        patch("teleclaude.core.next_machine.build_gates.record_green_gate") as record,
+        patch("teleclaude.cli.demo_validation.validate_demo", return_value=(True, False, "demo ok")),
+    ):
+        passed, output = run_build_gates(str(tmp_path), "slug")
+
+    assert passed is True
+    assert "GATE PASSED: impacted tests (2 modules" in output
+    assert run.call_args.args[0] == [
+        "pytest",
+        "-q",
+        "-m",
+        "not expensive",
+        "tests/unit/test_a.py",
+        "tests/unit/test_b.py",
+    ]
+    record.assert_not_called()
+
+
 def test_format_build_gate_failure_keeps_gate_output_and_next_call() -> None:
     message = format_build_gate_failure("slug", "GATE FAILED: make test", "telec todo work slug")
 
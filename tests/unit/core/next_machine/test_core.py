@@ -208,8 +208,8 @@ def test_bug_build_passes_without_implementation_plan_or_checklist(tmp_path: Pat
 
     with patch("subprocess.run") as mock_run:
         mock_run.side_effect = [
-            _git_result(0, "abc123"),
-            _git_result(0, "abc123 fix the crash"),
+            _git_result(0, f"{'a' * 40}\n{'b' * 40}\n"),
+            _git_result(0, "1\n"),
         ]
         passed, _ = verify_artifacts(str(tmp_path), "fix-crash", "build", is_bug=True)
 
@@ -0,0 +1,106 @@
+"""Tests for build-gate test-impact selection."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from teleclaude.core.next_machine import gate_impact
+from teleclaude.core.next_machine._types import _BUILD_GATE_STATE_REL, GateMode
+from teleclaude.core.next_machine.gate_impact import (
+    read_green_commit,
+    record_green_gate,
+    select_gate_tests,
+    select_impacted_tests,
+)
+
+
+def _write(root: Path, rel: str, content: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    _write(tmp_path, "pkg/__init__.py")
+    _write(tmp_path, "pkg/a.py", "VALUE = 1\n")
+    _write(tmp_path, "pkg/b.py", "from . import a\n")
+    _write(tmp_path, "pkg/c.py", "def thing():\n    return 1\n")
+    _write(tmp_path, "pyproject.toml", "[project]\n")
+    _write(tmp_path, "tests/__init__.py")
+    _write(tmp_path, "tests/test_b.py", "from pkg.b import a\n")
+    _write(tmp_path, "tests/test_other.py", "from unittest.mock import patch\npatch('pkg.c.thing')\n")
+    _write(tmp_path, "tests/helpers.py", "import pkg.a\n")
+    return tmp_path
+
+
+@pytest.fixture
+def green(project: Path) -> Path:
+    _write(project, _BUILD_GATE_STATE_REL, json.dumps({"version": 1, "green_commit": "a" * 40}))
+    return project
+
+
+def _select(project: Path, changed: list[str] | None, *, impact: bool = True):
+    query = SimpleNamespace(rev_parse=lambda _name: "b" * 40)
+    with (
+        patch.object(gate_impact, "git_query", return_value=query),
+        patch.object(gate_impact, "_changed_files", return_value=changed),
+    ):
+        return select_gate_tests(str(project), impact=impact)
+
+
+@pytest.mark.unit
+def test_impacted_tests_follow_relative_transitive_and_patch_string_imports(project: Path) -> None:
+    gate_impact.clear_gate_impact_cache()
+
+    assert select_impacted_tests(project, ["pkg/a.py"]) == ["tests/test_b.py"]
+    assert select_impacted_tests(project, ["pkg/c.py"]) == ["tests/test_other.py"]
+    assert select_impacted_tests(project, ["tests/test_other.py"]) == ["tests/test_other.py"]
+
+
+@pytest.mark.unit
+def test_deleted_module_still_selects_its_importers(project: Path) -> None:
+    (project / "pkg" / "a.py").unlink()
+
+    assert select_impacted_tests(project, ["pkg/a.py"]) == ["tests/test_b.py"]
+
+
+@pytest.mark.unit
+def test_selection_modes(green: Path) -> None:
+    assert _select(green, ["todos/slug/state.yaml", "README.md"]).mode == GateMode.CACHED
+    assert _select(green, ["pkg/a.py"], impact=False).mode == GateMode.FULL
+    assert _select(green, ["todos/slug/state.yaml"], impact=False).mode == GateMode.FULL
+
+    impacted = _select(green, ["pkg/a.py", "todos/slug/state.yaml"])
+    assert impacted.mode == GateMode.IMPACT
+    assert impacted.test_files == ("tests/test_b.py",)
+    assert impacted.base_commit == "a" * 40
+
+    assert _select(green, ["pkg/a.py", "pyproject.toml"]).reason == "non-Python change: pyproject.toml"
+    assert _select(green, ["tests/conftest.py"]).mode == GateMode.FULL
+    assert _select(green, ["tools/lint.py"]).mode == GateMode.FULL
+    assert _select(green, None).mode == GateMode.FULL
+
+
+@pytest.mark.unit
+def test_without_a_green_record_the_full_suite_runs(project: Path) -> None:
+    selection = _select(project, [])
+
+    assert selection.mode == GateMode.FULL
+    assert selection.reason == "no previous green gate"
+
+
+@pytest.mark.unit
+def test_green_gate_is_recorded_only_for_a_clean_worktree(project: Path) -> None:
+    with patch.object(gate_impact, "_changed_files", return_value=["pkg/a.py"]):
+        assert record_green_gate(str(project), "c" * 40) is False
+    assert read_green_commit(str(project)) == ""
+
+    with patch.object(gate_impact, "_changed_files", return_value=["todos/slug/state.yaml"]):
+        assert record_green_gate(str(project), "c" * 40) is True
+    assert read_green_commit(str(project)) == "c" * 40
@@ -6,8 +6,6 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-from git.exc import GitCommandError
-
 from teleclaude.core.next_machine.git_ops import (
     _has_meaningful_diff,
     build_git_hook_env,
@@ -54,9 +52,9 @@ def test_has_uncommitted_changes_flags_unrelated_worktree_paths(tmp_path: Path)
 
 
 def test_get_stash_entries_returns_empty_on_git_command_error(tmp_path: Path) -> None:
-    repo = SimpleNamespace(git=SimpleNamespace(stash=lambda *_args: (_ for _ in ()).throw(GitCommandError("stash", 1))))
+    failed = SimpleNamespace(returncode=128, stdout="", stderr="fatal: not a git repository")
 
-    with patch("teleclaude.core.next_machine.git_ops.Repo", return_value=repo):
+    with patch("subprocess.run", return_value=failed):
         entries = get_stash_entries(str(tmp_path))
 
     assert entries == []
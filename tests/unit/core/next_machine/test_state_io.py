@@ -7,13 +7,19 @@ from pathlib import Path
 from typing import TypedDict
 from unittest.mock import patch
 
+import pytest
 import yaml
 
 from teleclaude.core.next_machine.state_io import (
+    is_build_complete,
+    is_review_approved,
     mark_phase,
     mark_prepare_phase,
     mark_ready,
+    read_breakdown_state,
+    read_many,
     read_phase_state,
+    write_phase_state,
 )
 
 
@@ -113,3 +119,44 @@ def test_mark_ready_generates_quality_checklist_and_ready_state(tmp_path: Path)
     assert state["dor"]["score"] == 8  # type: ignore[index]
     assert grounding["base_sha"] == "headsha"
     assert (todo_dir / "quality-checklist.md").exists()
+
+
+def test_unchanged_state_file_is_parsed_once_and_external_edits_are_seen(tmp_path: Path) -> None:
+    todo_dir = tmp_path / "todos" / "slug-c"
+    _write_state(todo_dir, {"build": "complete", "review": "pending"})
+
+    with patch("teleclaude.core.next_machine.state_io.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+        assert is_build_complete(str(tmp_path), "slug-c")
+        assert not is_review_approved(str(tmp_path), "slug-c")
+        assert read_phase_state(str(tmp_path), "slug-c")["build"] == "complete"
+        assert safe_load.call_count == 1
+
+        _write_state(todo_dir, {"build": "complete", "review": "approved", "extra": True})
+        assert is_review_approved(str(tmp_path), "slug-c")
+        assert safe_load.call_count == 2
+
+
+def test_write_phase_state_writes_through_to_cache(tmp_path: Path) -> None:
+    _write_state(tmp_path / "todos" / "slug-d", {})
+    state = read_phase_state(str(tmp_path), "slug-d")
+    state["build"] = "complete"
+
+    with patch("teleclaude.core.next_machine.state_io.yaml.safe_load") as safe_load:
+        write_phase_state(str(tmp_path), "slug-d", state)
+        state["build"] = "mutated after write"
+        assert is_build_complete(str(tmp_path), "slug-d")
+        safe_load.assert_not_called()
+
+
+def test_snapshots_are_read_only_and_copies_are_private(tmp_path: Path) -> None:
+    _write_state(tmp_path / "todos" / "slug-e", {"breakdown": {"assessed": True, "todos": ["child"]}})
+
+    snapshots = read_many(str(tmp_path), ["slug-e", "missing"])
+    with pytest.raises(TypeError):
+        snapshots["slug-e"]["phase"] = "done"  # type: ignore[index]
+    assert snapshots["slug-e"]["breakdown"]["todos"] == ("child",)  # type: ignore[index]
+    assert snapshots["missing"]["phase"] == "pending"
+
+    copy = read_phase_state(str(tmp_path), "slug-e")
+    copy["breakdown"]["todos"].append("other")  # type: ignore[index,union-attr]
+    assert read_breakdown_state(str(tmp_path), "slug-e") == {"assessed": True, "todos": ["child"]}
@@ -0,0 +1,108 @@
+"""Tests for teleclaude.core.pane_activity."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from teleclaude.core.pane_activity import PaneActivityStream, get_activity_fifo
+
+
+@pytest.mark.unit
+def test_activity_fifo_lives_next_to_output_file(tmp_path: Path) -> None:
+    assert get_activity_fifo(tmp_path / "sess" / "tmux.txt") == tmp_path / "sess" / "tmux.fifo"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_wakes_on_fifo_bytes_and_detaches_pipe(tmp_path: Path) -> None:
+    fifo = tmp_path / "tmux.fifo"
+    stream = PaneActivityStream("tc_alpha", fifo)
+
+    with (
+        patch("teleclaude.core.pane_activity.tmux_bridge.get_pane_pipe_state", new=AsyncMock(return_value=(False, ""))),
+        patch("teleclaude.core.pane_activity.tmux_bridge.start_pipe_pane", new=AsyncMock(return_value=True)) as start,
+        patch("teleclaude.core.pane_activity.tmux_bridge.stop_pipe_pane", new=AsyncMock(return_value=True)) as stop,
+    ):
+        assert await stream.start() is True
+        assert await stream.wait_for_activity(0.01) is False
+        assert stream.consume_activity() is False
+
+        writer = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+        os.write(writer, b"hello\r\n")
+        os.close(writer)
+
+        assert await stream.wait_for_activity(0.5) is True
+        assert stream.consume_activity() is True
+        assert stream.consume_activity() is False
+        assert stream.bytes_received == 7
+        await stream.stop()
+
+    assert start.await_args.args == ("tc_alpha", f"cat > {fifo}")
+    assert start.await_args.kwargs == {"owner": str(fifo)}
+    assert stop.await_count == 1
+    assert not fifo.exists()
+    assert stream.active is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_falls_back_when_pipe_pane_fails(tmp_path: Path) -> None:
+    fifo = tmp_path / "tmux.fifo"
+    stream = PaneActivityStream("tc_alpha", fifo)
+
+    with (
+        patch("teleclaude.core.pane_activity.tmux_bridge.get_pane_pipe_state", new=AsyncMock(return_value=(False, ""))),
+        patch("teleclaude.core.pane_activity.tmux_bridge.start_pipe_pane", new=AsyncMock(return_value=False)),
+        patch("teleclaude.core.pane_activity.tmux_bridge.stop_pipe_pane", new=AsyncMock(return_value=True)),
+    ):
+        assert await stream.start() is False
+
+    assert stream.active is False
+    assert not fifo.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_leaves_an_existing_pipe_alone(tmp_path: Path) -> None:
+    fifo = tmp_path / "tmux.fifo"
+    stream = PaneActivityStream("tc_alpha", fifo)
+
+    with (
+        patch(
+            "teleclaude.core.pane_activity.tmux_bridge.get_pane_pipe_state",
+            new=AsyncMock(return_value=(True, "/elsewhere/log.fifo")),
+        ),
+        patch("teleclaude.core.pane_activity.tmux_bridge.start_pipe_pane", new=AsyncMock()) as start,
+        patch("teleclaude.core.pane_activity.tmux_bridge.stop_pipe_pane", new=AsyncMock()) as stop,
+    ):
+        assert await stream.start() is False
+
+    start.assert_not_awaited()
+    stop.assert_not_awaited()
+    assert not fifo.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_reattaches_its_own_pipe_left_by_a_previous_daemon(tmp_path: Path) -> None:
+    fifo = tmp_path / "tmux.fifo"
+    stream = PaneActivityStream("tc_alpha", fifo)
+
+    with (
+        patch(
+            "teleclaude.core.pane_activity.tmux_bridge.get_pane_pipe_state",
+            new=AsyncMock(return_value=(True, str(fifo))),
+        ),
+        patch("teleclaude.core.pane_activity.tmux_bridge.start_pipe_pane", new=AsyncMock(return_value=True)) as start,
+        patch("teleclaude.core.pane_activity.tmux_bridge.stop_pipe_pane", new=AsyncMock(return_value=True)) as stop,
+    ):
+        assert await stream.start() is True
+        assert stop.await_count == 1
+        assert start.await_count == 1
+        await stream.stop()
+
+    assert stream.active is False
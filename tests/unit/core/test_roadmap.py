@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from teleclaude.core import roadmap
 from teleclaude.core.models import TodoInfo
 
 # _slugify_heading: pure slug normalization logic; tested directly since it has
@@ -67,3 +68,71 @@ class TestSlugifyHeading:
     def test_multiple_spaces_collapsed(self):
         result = _slugify_heading("hello   world")
         assert result == "hello-world"
+
+
+class TestRoadmapIndex:
+    @pytest.fixture(autouse=True)
+    def _fresh_index(self):
+        roadmap.clear_roadmap_index_cache()
+        yield
+        roadmap.clear_roadmap_index_cache()
+
+    @staticmethod
+    def _project(tmp_path):
+        todos = tmp_path / "todos"
+        todos.mkdir()
+        (todos / "roadmap.yaml").write_text("- slug: parent\n- slug: child\n")
+        (todos / "parent").mkdir()
+        (todos / "parent" / "state.yaml").write_text("build: pending\nbreakdown:\n  todos: [child]\n")
+        (todos / "child").mkdir()
+        (todos / "child" / "state.yaml").write_text("build: started\n")
+        return todos
+
+    @pytest.mark.unit
+    def test_unchanged_files_are_parsed_once(self, tmp_path, monkeypatch):
+        todos = self._project(tmp_path)
+        calls = []
+        real_load = roadmap.load_roadmap
+        monkeypatch.setattr(roadmap, "load_roadmap", lambda cwd: calls.append(cwd) or real_load(cwd))
+
+        first = assemble_roadmap(str(tmp_path))
+        second = assemble_roadmap(str(tmp_path))
+        assert len(calls) == 1
+        assert first == second
+        # Breakdown injection must not leak into the cached roadmap entries.
+        assert second[1].after == ["parent"]
+
+        (todos / "roadmap.yaml").write_text("- slug: parent\n- slug: child\n- slug: extra\n")
+        assert [t.slug for t in assemble_roadmap(str(tmp_path))] == ["parent", "child", "extra"]
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_state_changes_are_picked_up_without_watcher(self, tmp_path):
+        todos = self._project(tmp_path)
+        assert assemble_roadmap(str(tmp_path))[1].build_status == "started"
+
+        (todos / "child" / "state.yaml").write_text("build: complete\nreview: approved\n")
+        (todos / "child" / "requirements.md").write_text("# reqs\n")
+
+        child = assemble_roadmap(str(tmp_path))[1]
+        assert (child.build_status, child.review_status, child.has_requirements) == ("complete", "approved", True)
+        assert child.files == ["requirements.md", "state.yaml"]
+
+    @pytest.mark.unit
+    def test_watched_project_is_served_from_memory_until_invalidated(self, tmp_path):
+        todos = self._project(tmp_path)
+        roadmap.watch_roadmap_index(str(tmp_path), trees=False)
+        first = assemble_roadmap(str(tmp_path))
+        first[0].after.append("mutated")
+
+        (todos / "child" / "state.yaml").write_text("build: complete\n")
+        cached = assemble_roadmap(str(tmp_path))
+        assert cached[1].build_status == "started"
+        assert "mutated" not in cached[0].after
+
+        roadmap.invalidate_roadmap_index(str(tmp_path), str(todos / "child" / "state.yaml"))
+        assert assemble_roadmap(str(tmp_path))[1].build_status == "complete"
+
+        roadmap.unwatch_roadmap_index(str(tmp_path))
+        (todos / "child" / "state.yaml").write_text("build: started\n")
+        assert assemble_roadmap(str(tmp_path))[1].build_status == "started"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
@@ -11,18 +12,25 @@ import pytest
 # require a live LLM API call with API keys. Testing helpers pins the prompt
 # structure and parsing contracts without infrastructure.
 from teleclaude.core.summarizer import (
+    KIND_SUMMARY,
     SUMMARY_MODEL_ANTHROPIC,
     SUMMARY_MODEL_OPENAI,
     SUMMARY_SCHEMA,
     TITLE_SCHEMA,
+    TITLES_SCHEMA,
+    SummaryCache,
     _build_agent_output_summary_prompt,
     _build_session_title_prompt,
     _parse_summary_response,
     _parse_title_response,
     generate_session_title,
+    local_summary,
+    output_digest,
     summarize_agent_output,
 )
 
+_LONG_OUTPUT = " ".join(f"word{i}" for i in range(40))
+
 
 class TestSummaryConstants:
     @pytest.mark.unit
@@ -125,3 +133,128 @@ class TestSummarizeAgentOutput:
     async def test_whitespace_output_raises(self):
         with pytest.raises(ValueError, match="Empty agent output"):
             await summarize_agent_output("   ")
+
+
+class _StubBackend:
+    """Local stand-in for the LLM: answers from the prompt and counts calls."""
+
+    def __init__(self, *, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.prompts: list[str] = []
+        self.fail = False
+
+    async def __call__(self, prompt, schema, parser, **_kwargs):
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("backend down")
+        if schema is SUMMARY_SCHEMA:
+            return parser(json.dumps({"summary": f"summary #{len(self.prompts)}"}))
+        if schema is TITLE_SCHEMA:
+            return parser(json.dumps({"title": f"title #{len(self.prompts)}"}))
+        assert schema is TITLES_SCHEMA
+        count = prompt.count("## Session ")
+        return parser(json.dumps({"titles": [{"session": i, "title": f"batch {i}"} for i in range(1, count + 1)]}))
+
+
+class _MemoryStore:
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], str] = {}
+
+    async def get_cached_summary(self, kind: str, digest: str) -> str | None:
+        return self.rows.get((kind, digest))
+
+    async def store_cached_summary(self, kind: str, digest: str, value: str) -> None:
+        self.rows[(kind, digest)] = value
+
+
+class TestSummaryCache:
+    @pytest.mark.unit
+    def test_digest_ignores_whitespace_only_differences(self):
+        assert output_digest("Waiting on  build\nresults ") == output_digest("Waiting on build results")
+        assert output_digest("Waiting on build results") != output_digest("Waiting on test results")
+
+    @pytest.mark.unit
+    async def test_short_output_is_returned_without_the_backend(self):
+        backend = _StubBackend()
+        cache = SummaryCache(backend, _MemoryStore())
+
+        assert await cache.summarize("  Monitoring\n workers  ") == "Monitoring workers"
+        assert local_summary(_LONG_OUTPUT) is None
+        assert backend.prompts == []
+
+    @pytest.mark.unit
+    async def test_repeated_output_is_served_from_memory_then_store(self):
+        backend = _StubBackend()
+        store = _MemoryStore()
+
+        assert await SummaryCache(backend, store).summarize(_LONG_OUTPUT) == "summary #1"
+        assert store.rows == {(KIND_SUMMARY, output_digest(_LONG_OUTPUT)): "summary #1"}
+
+        # A fresh process (empty memory) still reuses the stored summary.
+        cache = SummaryCache(backend, store)
+        assert await cache.summarize(_LONG_OUTPUT + "\n") == "summary #1"
+        assert await cache.summarize(_LONG_OUTPUT) == "summary #1"
+        assert len(backend.prompts) == 1
+
+    @pytest.mark.unit
+    async def test_concurrent_requests_for_one_digest_share_a_call(self):
+        backend = _StubBackend(delay_s=0.01)
+        cache = SummaryCache(backend, _MemoryStore())
+
+        results = await asyncio.gather(*(cache.summarize(_LONG_OUTPUT) for _ in range(5)))
+
+        assert results == ["summary #1"] * 5
+        assert len(backend.prompts) == 1
+
+    @pytest.mark.unit
+    async def test_failures_reach_every_waiter_and_are_not_cached(self):
+        backend = _StubBackend(delay_s=0.01)
+        backend.fail = True
+        store = _MemoryStore()
+        cache = SummaryCache(backend, store)
+
+        results = await asyncio.gather(*(cache.summarize(_LONG_OUTPUT) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert store.rows == {}
+        backend.fail = False
+        assert await cache.summarize(_LONG_OUTPUT) == "summary #2"
+
+    @pytest.mark.unit
+    async def test_cancelling_the_first_caller_leaves_other_waiters_served(self):
+        backend = _StubBackend(delay_s=0.01)
+        store = _MemoryStore()
+        cache = SummaryCache(backend, store)
+
+        first = asyncio.create_task(cache.summarize(_LONG_OUTPUT))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.summarize(_LONG_OUTPUT))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "summary #1"
+        assert first.cancelled()
+        assert len(backend.prompts) == 1
+        assert store.rows == {(KIND_SUMMARY, output_digest(_LONG_OUTPUT)): "summary #1"}
+
+    @pytest.mark.unit
+    async def test_titles_across_sessions_share_one_batched_call(self):
+        backend = _StubBackend()
+        cache = SummaryCache(backend, _MemoryStore(), title_batch_window_s=0.01)
+        batch = [[("user", f"task {i}")] for i in range(3)]
+
+        titles = await cache.titles([*batch, batch[0]])
+
+        assert titles == ["batch 1", "batch 2", "batch 3", "batch 1"]
+        assert len(backend.prompts) == 1
+        assert await cache.title(batch[1]) == "batch 2"
+        assert len(backend.prompts) == 1
+
+    @pytest.mark.unit
+    async def test_lone_title_uses_the_single_title_prompt(self):
+        backend = _StubBackend()
+        cache = SummaryCache(backend, _MemoryStore(), title_batch_window_s=0.0)
+
+        assert await cache.title([("user", "fix the bug")]) == "title #1"
+        assert "Generate a concise title for this session." in backend.prompts[0]
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import pytest
 
 # Public API (TodoWatcher) requires a live watchdog Observer; testing pure
 # helper functions _classify_event and _is_relevant pins the filtering logic
 # without infrastructure.
-from teleclaude.core.todo_watcher import _classify_event, _is_relevant
+from teleclaude.core.todo_watcher import _classify_event, _is_relevant, _TodoHandler
 
 
 class _FakeEvent:
@@ -62,3 +64,27 @@ class TestClassifyEvent:
     def test_moved_returns_todo_updated(self):
         event = _FakeEvent("moved")
         assert _classify_event(event) == "todo_updated"
+
+
+class TestTodoHandler:
+    @pytest.mark.unit
+    def test_every_event_invalidates_roadmap_index(self, monkeypatch):
+        invalidated: list[tuple[str, str]] = []
+        monkeypatch.setattr(
+            "teleclaude.core.todo_watcher.invalidate_roadmap_index",
+            lambda project, path: invalidated.append((project, path)),
+        )
+        loop = MagicMock()
+        handler = _TodoHandler("/project", loop, MagicMock())
+
+        moved = _FakeEvent("moved")
+        moved.src_path = "/project/todos/a/state.yaml.tmp"
+        moved.dest_path = "/project/todos/a/state.yaml"
+        handler.on_moved(moved)
+
+        assert invalidated == [
+            ("/project", "/project/todos/a/state.yaml.tmp"),
+            ("/project", "/project/todos/a/state.yaml"),
+        ]
+        # The temp source path is still filtered out of cache refreshes.
+        loop.call_soon_threadsafe.assert_not_called()
@@ -0,0 +1,86 @@
+"""Tests for the native session id to transcript path index."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from teleclaude.core.agents import AgentName
+from teleclaude.core.codex_transcript import discover_codex_transcript_path
+from teleclaude.core.db import Db
+from teleclaude.core.transcript_paths import (
+    lookup_transcript,
+    lookup_transcript_prefix,
+    record_transcript_paths,
+)
+from teleclaude.utils.transcript_discovery import TranscriptCandidate, extract_native_session_id
+
+_CODEX_ID = "0199a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b"
+
+
+@pytest.fixture
+async def db_path(tmp_path: Path) -> AsyncIterator[str]:
+    database = Db(str(tmp_path / "index.db"))
+    await database.initialize()
+    await database.close()
+    yield database.db_path
+
+
+def _touch(path: Path, mtime: float = 1_700_000_000.0) -> TranscriptCandidate:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}\n", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return TranscriptCandidate(path=path, agent=AgentName.CLAUDE, mtime=mtime)
+
+
+@pytest.mark.unit
+def test_codex_native_id_is_the_uuid_suffix() -> None:
+    codex = Path(f"rollout-2025-01-02T03-04-05-{_CODEX_ID}.jsonl")
+
+    assert extract_native_session_id(codex, AgentName.CODEX) == _CODEX_ID
+    assert extract_native_session_id(Path("abc-123.jsonl"), AgentName.CLAUDE) == "abc-123"
+
+
+@pytest.mark.unit
+async def test_exact_and_prefix_lookups_return_newest_existing_transcript(tmp_path: Path, db_path: str) -> None:
+    older = _touch(tmp_path / "a" / "ABC-123.jsonl", mtime=1_000.0)
+    newer = _touch(tmp_path / "b" / "abc-123.jsonl", mtime=2_000.0)
+    other = _touch(tmp_path / "a" / "abd-999.jsonl")
+    assert record_transcript_paths([older, newer, other], db_path=db_path) == 3
+
+    assert lookup_transcript("abc-123", db_path=db_path).path == newer.path
+    assert lookup_transcript("abc-123", [AgentName.CODEX], db_path=db_path) is None
+    assert lookup_transcript_prefix("AB", db_path=db_path).path == other.path
+    assert lookup_transcript_prefix("abc", [AgentName.CLAUDE], db_path=db_path).path == newer.path
+
+    newer.path.unlink()
+    assert lookup_transcript("abc-123", db_path=db_path).path == older.path
+    older.path.unlink()
+    assert lookup_transcript("abc-123", db_path=db_path) is None
+
+
+@pytest.mark.unit
+def test_missing_database_is_a_miss_and_is_never_created(tmp_path: Path) -> None:
+    missing = tmp_path / "absent.db"
+    candidate = _touch(tmp_path / "abc.jsonl")
+
+    assert record_transcript_paths([candidate], db_path=str(missing)) == 0
+    assert lookup_transcript("abc", db_path=str(missing)) is None
+    assert not missing.exists()
+
+
+@pytest.mark.unit
+async def test_codex_discovery_scans_once_then_answers_from_the_index(tmp_path: Path, db_path: str) -> None:
+    transcript = (
+        tmp_path / ".codex" / "sessions" / "2020" / "01" / "02" / f"rollout-2020-01-02T03-04-05-{_CODEX_ID}.jsonl"
+    )
+    _touch(transcript)
+
+    with patch("teleclaude.core.codex_transcript.Path.home", return_value=tmp_path):
+        assert discover_codex_transcript_path(_CODEX_ID, db_path=db_path) == str(transcript)
+        with patch.object(Path, "rglob", side_effect=AssertionError("scanned")):
+            assert discover_codex_transcript_path(_CODEX_ID, db_path=db_path) == str(transcript)
@@ -0,0 +1,157 @@
+"""Tests for the tmux control-mode client."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from teleclaude.core.tmux_bridge import _control, _pane
+
+
+class FakeStdin:
+    def __init__(self) -> None:
+        self.lines: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.lines.append(data)
+
+    async def drain(self) -> None:
+        return None
+
+
+class FakeControlProcess:
+    def __init__(self) -> None:
+        self.pid = 4242
+        self.returncode: int | None = None
+        self.stdin = FakeStdin()
+        self.stdout = asyncio.StreamReader()
+
+    def feed(self, *lines: str) -> None:
+        for line in lines:
+            self.stdout.feed_data(line.encode() + b"\n")
+
+    def kill(self) -> None:
+        self.returncode = -9
+        self.stdout.feed_eof()
+
+    async def wait(self) -> int:
+        self.kill()
+        return -9
+
+
+async def _started_client(process: FakeControlProcess) -> _control.TmuxControlClient:
+    client = _control.TmuxControlClient("tmux")
+    with patch(
+        "teleclaude.core.tmux_bridge._control.asyncio.create_subprocess_exec",
+        new=AsyncMock(return_value=process),
+    ):
+        await client.start()
+    return client
+
+
+class TestControlProtocolHelpers:
+    @pytest.mark.unit
+    def test_quote_tmux_arg_escapes_parser_metacharacters(self) -> None:
+        assert _control.quote_tmux_arg("#{pane_pid}") == '"#{pane_pid}"'
+        assert _control.quote_tmux_arg('say "hi" $HOME \\') == '"say \\"hi\\" \\$HOME \\\\"'
+
+    @pytest.mark.unit
+    def test_decode_control_output_unescapes_octal_sequences(self) -> None:
+        assert _control.decode_control_output("hi\\015\\012\\134x") == b"hi\r\n\\x"
+
+
+class TestControlClient:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_replies_resolve_commands_in_order_and_skip_unsolicited_blocks(self) -> None:
+        process = FakeControlProcess()
+        client = await _started_client(process)
+        process.feed("%begin 1 10 0", "%end 1 10 0")
+
+        first = asyncio.create_task(client.run(["has-session", "-t", "tc_a"]))
+        second = asyncio.create_task(client.run(["display-message", "-p", "#{pane_pid}"]))
+        await asyncio.sleep(0)
+        process.feed("%begin 1 11 1", "can't find session: tc_a", "%error 1 11 1")
+        process.feed("%begin 1 12 1", "321", "%end 1 12 1")
+
+        assert await first == _control.TmuxCommandResult(1, b"", b"can't find session: tc_a\n")
+        assert await second == _control.TmuxCommandResult(0, b"321\n", b"")
+        assert process.stdin.lines[1] == b'"display-message" "-p" "#{pane_pid}"\n'
+        await client.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_notifications_reach_listeners_and_exit_fails_pending(self) -> None:
+        process = FakeControlProcess()
+        client = await _started_client(process)
+        received: list[tuple[str, bytes]] = []
+        client.add_output_listener(lambda pane, data: received.append((pane, data)))
+
+        pending = asyncio.create_task(client.run(["list-sessions"]))
+        await asyncio.sleep(0)
+        process.feed("%output %3 ok\\015\\012", "%session-changed $1 teleclaude-control", "%exit")
+
+        with pytest.raises(_control.TmuxControlError):
+            await pending
+        assert received == [("%3", b"ok\r\n")]
+        assert client.attached_session == "teleclaude-control"
+        assert client.connected is False
+        await client.close()
+
+
+class TestControlDelivery:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_raises_not_sent_when_disconnected(self) -> None:
+        client = _control.TmuxControlClient("tmux")
+
+        with pytest.raises(_control.TmuxControlNotSentError):
+            await client.run(["send-keys", "-t", "tc_a", "C-m"])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lost_reply_after_write_is_a_failure_not_a_subprocess_retry(self) -> None:
+        process = FakeControlProcess()
+        client = await _started_client(process)
+        process.feed("%begin 1 10 0", "%end 1 10 0")
+        with (
+            patch.object(_control, "_enabled", True),
+            patch.object(_control, "_client", client),
+            patch("teleclaude.core.tmux_bridge._control.asyncio.create_subprocess_exec", new=AsyncMock()) as mock_exec,
+        ):
+            # tmux exits after reading the command but before replying.
+            asyncio.get_running_loop().call_soon(process.feed, "%exit")
+            result = await _control.run_tmux_command(["tmux", "send-keys", "-t", "tc_a", "-l", "--", "hello"])
+
+            assert result.returncode == -1
+            assert process.stdin.lines == [b'"send-keys" "-t" "tc_a" "-l" "--" "hello"\n']
+            mock_exec.assert_not_awaited()
+        await client.close()
+
+
+class TestControlFallback:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_pane_queries_use_control_result_without_spawning_tmux(self) -> None:
+        control_result = _control.TmuxCommandResult(0, b"/tmp/work\n", b"")
+        with (
+            patch(
+                "teleclaude.core.tmux_bridge._control.run_control_command",
+                new=AsyncMock(return_value=control_result),
+            ) as mock_control,
+            patch("teleclaude.core.tmux_bridge._pane.asyncio.create_subprocess_exec", new=AsyncMock()) as mock_exec,
+        ):
+            result = await _pane.get_current_directory("tmux-alpha")
+
+        assert result == "/tmp/work"
+        mock_control.assert_awaited_once_with(["display", "-p", "-t", "tmux-alpha", "#{pane_current_path}"])
+        mock_exec.assert_not_awaited()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_control_command_returns_none_when_disabled(self) -> None:
+        await _control.stop_control_client()
+
+        assert await _control.run_control_command(["list-sessions"]) is None
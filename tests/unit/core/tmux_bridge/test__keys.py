@@ -92,7 +92,7 @@ class TestSendKeys:
                 new=AsyncMock(side_effect=processes),
             ) as mock_exec,
             patch(
-                "teleclaude.core.tmux_bridge._keys.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(side_effect=[(b"", b""), (b"", b"")]),
             ),
             patch("teleclaude.core.tmux_bridge._keys.asyncio.sleep", new=AsyncMock()) as mock_sleep,
@@ -165,9 +165,13 @@ class TestSendSignal:
                 "teleclaude.core.tmux_bridge._keys.asyncio.create_subprocess_exec",
                 new=AsyncMock(side_effect=processes),
             ) as mock_exec,
+            patch(
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
+                new=AsyncMock(return_value=(b"321\n", b"")),
+            ),
             patch(
                 "teleclaude.core.tmux_bridge._keys.communicate_with_timeout",
-                new=AsyncMock(side_effect=[(b"321\n", b""), (b"654\n987\n", b""), (b"", b"")]),
+                new=AsyncMock(side_effect=[(b"654\n987\n", b""), (b"", b"")]),
             ),
         ):
             result = await _keys.send_signal("tmux-alpha", SIGKILL)
@@ -194,7 +198,7 @@ class TestSendSignal:
                 new=AsyncMock(return_value=_completed_process()),
             ) as mock_exec,
             patch(
-                "teleclaude.core.tmux_bridge._keys.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(b"", b"")),
             ),
         ):
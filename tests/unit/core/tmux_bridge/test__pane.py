@@ -28,7 +28,7 @@ class TestPaneIdentityLookups:
                 new=AsyncMock(return_value=_completed_process()),
             ) as mock_exec,
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"")),
             ),
         ):
@@ -54,7 +54,7 @@ class TestPaneIdentityLookups:
                 new=AsyncMock(return_value=_completed_process()),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"")),
             ),
         ):
@@ -73,7 +73,7 @@ class TestCaptureAndSessionListing:
                 new=AsyncMock(return_value=_completed_process()),
             ) as mock_exec,
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(b"pane-output-\xff", b"")),
             ),
         ):
@@ -101,7 +101,7 @@ class TestCaptureAndSessionListing:
                 new=AsyncMock(return_value=_completed_process(returncode=1)),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(b"", b"missing pane")),
             ),
         ):
@@ -136,8 +136,8 @@ class TestCaptureAndSessionListing:
                 new=AsyncMock(return_value=_completed_process()),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
-                new=AsyncMock(return_value=(b"alpha\n\nbeta\n", b"")),
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
+                new=AsyncMock(return_value=(b"alpha\n\nteleclaude-control\nbeta\n", b"")),
             ),
         ):
             result = await _pane.list_tmux_sessions()
@@ -155,7 +155,7 @@ class TestSessionExistence:
                 new=AsyncMock(return_value=_completed_process(returncode=1)),
             ) as mock_exec,
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(b"", b"no session")),
             ),
         ):
@@ -178,9 +178,13 @@ class TestSessionExistence:
                 "teleclaude.core.tmux_bridge._pane.asyncio.create_subprocess_exec",
                 new=AsyncMock(side_effect=[_completed_process(returncode=1), _completed_process()]),
             ) as mock_exec,
+            patch(
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
+                new=AsyncMock(return_value=(b"", b"missing")),
+            ),
             patch(
                 "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
-                new=AsyncMock(side_effect=[(b"", b"missing"), (b"alpha\nbeta\n", b"")]),
+                new=AsyncMock(return_value=(b"alpha\nbeta\n", b"")),
             ),
             patch(
                 "teleclaude.core.tmux_bridge._pane.asyncio.to_thread",
@@ -210,7 +214,7 @@ class TestForegroundCommandTracking:
                 new=AsyncMock(return_value=_completed_process(returncode=returncode)),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"stderr")),
             ),
         ):
@@ -275,7 +279,7 @@ class TestPaneStateAndPiping:
                 new=AsyncMock(return_value=_completed_process()),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"")),
             ),
         ):
@@ -293,7 +297,7 @@ class TestPaneStateAndPiping:
                 new=AsyncMock(return_value=_completed_process()),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"")),
             ),
         ):
@@ -307,7 +311,22 @@ class TestPaneStateAndPiping:
         ("helper_name", "helper_args", "expected_call"),
         [
             ("start_pipe_pane", ("printf ready",), ("pipe-pane", "-t", "tmux-alpha", "-o", "printf ready")),
-            ("stop_pipe_pane", (), ("pipe-pane", "-t", "tmux-alpha")),
+            (
+                "stop_pipe_pane",
+                (),
+                (
+                    "pipe-pane",
+                    "-t",
+                    "tmux-alpha",
+                    ";",
+                    "set-option",
+                    "-q",
+                    "-u",
+                    "-t",
+                    "tmux-alpha",
+                    "@teleclaude_pipe",
+                ),
+            ),
         ],
     )
     async def test_pipe_helpers_forward_tmux_pipe_commands(
@@ -329,6 +348,60 @@ class TestPaneStateAndPiping:
         assert mock_exec.await_args.args == (_pane.config.computer.tmux_binary, *expected_call)
         mock_wait.assert_awaited_once_with(process, _pane.SUBPROCESS_TIMEOUT_QUICK, "tmux operation")
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_start_pipe_pane_records_the_owner_in_the_same_tmux_call(self) -> None:
+        with (
+            patch(
+                "teleclaude.core.tmux_bridge._pane.asyncio.create_subprocess_exec",
+                new=AsyncMock(return_value=_completed_process()),
+            ) as mock_exec,
+            patch("teleclaude.core.tmux_bridge._pane.wait_with_timeout", new=AsyncMock()),
+        ):
+            assert await _pane.start_pipe_pane("tmux-alpha", "cat > /tmp/a b", owner="/tmp/a b") is True
+
+        assert mock_exec.await_args.args[1:] == (
+            "pipe-pane",
+            "-t",
+            "tmux-alpha",
+            "-o",
+            "cat > /tmp/a b",
+            ";",
+            "set-option",
+            "-t",
+            "tmux-alpha",
+            "@teleclaude_pipe",
+            "/tmp/a b",
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("returncode", "stdout", "expected"),
+        [
+            (0, b"1 /tmp/a b/tmux.fifo\n", (True, "/tmp/a b/tmux.fifo")),
+            (0, b"1 \n", (True, "")),
+            (0, b"0 \n", (False, "")),
+            (1, b"", None),
+        ],
+    )
+    async def test_get_pane_pipe_state_reports_piped_flag_and_owner(
+        self, returncode: int, stdout: bytes, expected: tuple[bool, str] | None
+    ) -> None:
+        with (
+            patch(
+                "teleclaude.core.tmux_bridge._pane.asyncio.create_subprocess_exec",
+                new=AsyncMock(return_value=_completed_process(returncode=returncode)),
+            ),
+            patch(
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
+                new=AsyncMock(return_value=(stdout, b"")),
+            ),
+        ):
+            result = await _pane.get_pane_pipe_state("tmux-alpha")
+
+        assert result == expected
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_get_pane_title_strips_tmux_output(self) -> None:
@@ -338,7 +411,7 @@ class TestPaneStateAndPiping:
                 new=AsyncMock(return_value=_completed_process()),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(b"Agent Pane\n", b"")),
             ),
         ):
@@ -358,7 +431,7 @@ class TestPaneStateAndPiping:
                 new=AsyncMock(return_value=_completed_process(returncode=returncode)),
             ),
             patch(
-                "teleclaude.core.tmux_bridge._pane.communicate_with_timeout",
+                "teleclaude.core.tmux_bridge._control.communicate_with_timeout",
                 new=AsyncMock(return_value=(stdout, b"missing path")),
             ),
         ):
@@ -0,0 +1,156 @@
+"""Tests for teleclaude.events.cartridges.correlation."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from teleclaude.events.cartridges.correlation import CorrelationCartridge, CorrelationConfig, CorrelationWindows
+from teleclaude.events.db import EventDB
+from teleclaude.events.envelope import EventEnvelope, EventLevel
+from teleclaude.events.pipeline import PipelineContext
+
+_T0 = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _envelope(event: str, entity: str | None = None) -> EventEnvelope:
+    return EventEnvelope(event=event, source="daemon", level=EventLevel.OPERATIONAL, entity=entity)
+
+
+def _context(db: EventDB, clock: _Clock, **overrides: int) -> PipelineContext:
+    catalog = MagicMock()
+    catalog.get.return_value = None
+    producer = MagicMock()
+    producer.emit = AsyncMock()
+    return PipelineContext(
+        catalog=catalog,
+        db=db,
+        correlation_config=CorrelationConfig(clock=clock, **overrides),
+        producer=producer,
+    )
+
+
+async def _persisted_count(db: EventDB, event_type: str, since: datetime) -> int:
+    rows = await db.load_correlation_windows(since=since)
+    return sum(count for row_type, _, _, count in rows if row_type == event_type)
+
+
+@pytest.mark.unit
+def test_windows_count_slides_and_tracks_entities_separately() -> None:
+    windows = CorrelationWindows(window_seconds=10)
+    windows.increment("job.failed", "a", _T0)
+    windows.increment("job.failed", "b", _T0 + timedelta(seconds=5))
+    windows.increment("job.failed", "a", _T0 + timedelta(seconds=8))
+
+    assert windows.count("job.failed", None, _T0 + timedelta(seconds=8)) == 3
+    assert windows.count("job.failed", "a", _T0 + timedelta(seconds=8)) == 2
+    assert windows.count("job.failed", None, _T0 + timedelta(seconds=12)) == 2
+    assert windows.count("job.failed", "a", _T0 + timedelta(seconds=19)) == 0
+    assert windows.snapshot(_T0 + timedelta(seconds=30)) == []
+
+
+@pytest.mark.unit
+async def test_burst_is_detected_without_per_event_queries_and_survives_restart(tmp_path: Path) -> None:
+    db = EventDB(tmp_path / "events.db")
+    await db.init()
+    clock = _Clock(_T0)
+    context = _context(db, clock, burst_threshold=3, checkpoint_interval_seconds=60)
+    cartridge = CorrelationCartridge()
+
+    for _ in range(3):
+        await cartridge.process(_envelope("deploy.started"), context)
+
+    producer = context.producer
+    assert producer is not None
+    emitted = [call.args[0] for call in producer.emit.await_args_list]
+    assert [envelope.event for envelope in emitted] == ["system.burst.detected"]
+    assert emitted[0].payload["count"] == 3
+    assert await _persisted_count(db, "deploy.started", _T0 - timedelta(minutes=5)) == 0
+
+    await cartridge.checkpoint(db, clock.now)
+    assert await _persisted_count(db, "deploy.started", _T0 - timedelta(minutes=5)) == 3
+
+    restarted = CorrelationCartridge()
+    clock.now = _T0 + timedelta(seconds=1)
+    await restarted.process(_envelope("deploy.started"), _context(db, clock, burst_threshold=100))
+    assert restarted._windows is not None
+    assert restarted._windows.count("deploy.started", None, clock.now) == 4
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_periodic_flush_prunes_persisted_windows_without_new_events(tmp_path: Path) -> None:
+    db = EventDB(tmp_path / "events.db")
+    await db.init()
+    clock = _Clock(_T0)
+    context = _context(db, clock, window_seconds=60, checkpoint_interval_seconds=1)
+    cartridge = CorrelationCartridge()
+
+    await cartridge.process(_envelope("deploy.started"), context)
+    await cartridge.flush(db, context.correlation_config, clock.now)
+    assert await db.load_correlation_windows(since=_T0 - timedelta(minutes=5)) != []
+
+    clock.now = _T0 + timedelta(minutes=2)
+    await cartridge.flush(db, context.correlation_config, clock.now)
+    assert await db.load_correlation_windows(since=_T0 - timedelta(minutes=5)) == []
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_loop_flushes_on_shutdown(tmp_path: Path) -> None:
+    db = EventDB(tmp_path / "events.db")
+    await db.init()
+    clock = _Clock(_T0)
+    context = _context(db, clock, checkpoint_interval_seconds=3600)
+    cartridge = CorrelationCartridge()
+    await cartridge.process(_envelope("deploy.started"), context)
+    await cartridge.process(_envelope("deploy.started"), context)
+
+    shutdown = asyncio.Event()
+    task = asyncio.create_task(cartridge.run_checkpoints(db, context.correlation_config, shutdown))
+    shutdown.set()
+    await task
+
+    assert await _persisted_count(db, "deploy.started", _T0 - timedelta(minutes=5)) == 2
+    await db.close()
+
+
+@pytest.mark.unit
+async def test_concurrent_first_flush_and_events_share_one_window_load() -> None:
+    release = asyncio.Event()
+
+    async def _load(since: datetime) -> list[tuple[str, str | None, datetime, int]]:
+        await release.wait()
+        return []
+
+    db = MagicMock()
+    db.load_correlation_windows = AsyncMock(side_effect=_load)
+    db.replace_correlation_windows = AsyncMock()
+    clock = _Clock(_T0)
+    context = _context(db, clock, burst_threshold=100)
+    cartridge = CorrelationCartridge()
+
+    tasks = [
+        asyncio.create_task(cartridge.flush(db, context.correlation_config, clock.now)),
+        asyncio.create_task(cartridge.process(_envelope("deploy.started"), context)),
+        asyncio.create_task(cartridge.process(_envelope("deploy.started"), context)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert db.load_correlation_windows.await_count == 1
+    assert cartridge._windows is not None
+    assert cartridge._windows.count("deploy.started", None, clock.now) == 2
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from teleclaude.events.catalog import EventCatalog, EventSchema
 from teleclaude.events.envelope import EventEnvelope, EventLevel, EventVisibility
+from teleclaude.events.sandbox import bridge as bridge_module
 from teleclaude.events.sandbox.bridge import SandboxBridgeCartridge
 from teleclaude.events.sandbox.container import SandboxContainerManager
+from teleclaude.events.sandbox.runner import SandboxRunner
+
+_ECHO = "async def process(envelope, ctx):\n    return envelope\n"
 
 
 def _make_event() -> EventEnvelope:
@@ -58,35 +66,122 @@ async def test_fast_path_permanently_failed():
     assert "_sandbox_results" not in event.payload
 
 
-@pytest.mark.asyncio
-async def test_attaches_sandbox_results_on_success():
-    """Bridge attaches cartridge results to event payload on successful invocation."""
+@contextlib.asynccontextmanager
+async def _running_sandbox(tmp_path: Path, cartridges: dict[str, str]) -> AsyncIterator[SandboxContainerManager]:
+    """Serve *cartridges* from a real SandboxRunner on a temporary socket."""
+    cartridges_dir = tmp_path / "carts"
+    cartridges_dir.mkdir()
+    for name, source in cartridges.items():
+        (cartridges_dir / f"{name}.py").write_text(source)
+    socket_path = str(tmp_path / "sandbox.sock")
+    shutdown = asyncio.Event()
+    server = asyncio.create_task(SandboxRunner(socket_path, str(cartridges_dir)).start(shutdown))
+    for _ in range(100):
+        if Path(socket_path).exists():
+            break
+        await asyncio.sleep(0.01)
     manager = _make_manager(has_cartridges=True)
-    bridge = SandboxBridgeCartridge(manager=manager)
-    event = _make_event()
-
-    response_dict = {"envelope": None, "error": None, "duration_ms": 5.0}
-
+    manager.cartridges_dir = str(cartridges_dir)
+    manager.socket_path = socket_path
+    try:
+        yield manager
+    finally:
+        shutdown.set()
+        await asyncio.wait_for(server, timeout=2.0)
+
+
+def _catalog_context() -> MagicMock:
+    catalog = EventCatalog()
+    catalog.register(EventSchema(event_type="test.event", description="t", default_level=1, domain="test"))
     context = MagicMock()
-    context.catalog.list_all.return_value = []
+    context.catalog = catalog
+    return context
 
-    with (
-        patch("teleclaude.events.sandbox.bridge.scan_cartridges", return_value=["echo_cart"]),
-        patch("asyncio.open_unix_connection", new=AsyncMock()) as mock_conn,
-        patch("teleclaude.events.sandbox.bridge.write_frame", new=AsyncMock()),
-        patch("teleclaude.events.sandbox.bridge.read_frame", new=AsyncMock(return_value=response_dict)),
-    ):
-        mock_writer = AsyncMock()
-        mock_writer.close = MagicMock()
-        mock_writer.wait_closed = AsyncMock()
-        mock_conn.return_value = (AsyncMock(), mock_writer)
 
-        result = await bridge.process(event, context)
+@pytest.mark.asyncio
+async def test_attaches_sandbox_results_on_success(tmp_path: Path):
+    """Bridge attaches cartridge results to event payload on successful invocation."""
+    async with _running_sandbox(tmp_path, {"echo_cart": _ECHO}) as manager:
+        bridge = SandboxBridgeCartridge(manager=manager)
+        event = _make_event()
+        try:
+            result = await bridge.process(event, _catalog_context())
+        finally:
+            await bridge.close()
 
     assert result is event
-    assert "_sandbox_results" in result.payload
     assert len(result.payload["_sandbox_results"]) == 1
     assert result.payload["_sandbox_results"][0]["cartridge"] == "echo_cart"
+    assert result.payload["_sandbox_results"][0]["result"]["event"] == "test.event"
+
+
+@pytest.mark.asyncio
+async def test_cartridges_share_one_connection_and_run_concurrently(tmp_path: Path):
+    """Slow cartridges overlap, and one connection carries every request."""
+    slow = "import asyncio\nasync def process(envelope, ctx):\n    await asyncio.sleep(0.2)\n    return envelope\n"
+    async with _running_sandbox(tmp_path, {f"slow_{i}": slow for i in range(4)}) as manager:
+        bridge = SandboxBridgeCartridge(manager=manager)
+        connect = AsyncMock(wraps=asyncio.open_unix_connection)
+        try:
+            with patch("asyncio.open_unix_connection", new=connect):
+                started = asyncio.get_running_loop().time()
+                first = await bridge.process(_make_event(), _catalog_context())
+                elapsed = asyncio.get_running_loop().time() - started
+                await bridge.process(_make_event(), _catalog_context())
+        finally:
+            await bridge.close()
+
+    assert [entry.get("error") for entry in first.payload["_sandbox_results"]] == [None] * 4
+    assert elapsed < 0.6
+    assert connect.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_snapshot_is_sent_only_when_the_version_changes(tmp_path: Path):
+    async with _running_sandbox(tmp_path, {"echo_cart": _ECHO}) as manager:
+        bridge = SandboxBridgeCartridge(manager=manager)
+        context = _catalog_context()
+        sent: list[dict] = []
+        original = bridge_module.request_to_dict
+
+        def _record(request):
+            data = original(request)
+            sent.append(data)
+            return data
+
+        try:
+            with patch.object(bridge_module, "request_to_dict", side_effect=_record):
+                await bridge.process(_make_event(), context)
+                await bridge.process(_make_event(), context)
+                context.catalog.register(
+                    EventSchema(event_type="test.other", description="t", default_level=1, domain="test")
+                )
+                await bridge.process(_make_event(), context)
+        finally:
+            await bridge.close()
+
+    assert ["catalog_snapshot" in data for data in sent] == [True, False, True]
+    assert sent[0]["catalog_version"] == sent[1]["catalog_version"] != sent[2]["catalog_version"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_catalog_version_is_resent_once(tmp_path: Path):
+    async with _running_sandbox(tmp_path, {"echo_cart": _ECHO}) as manager:
+        bridge = SandboxBridgeCartridge(manager=manager)
+        context = _catalog_context()
+        try:
+            await bridge.process(_make_event(), context)
+            # Pretend the runner already holds a different version than it does.
+            bridge._refresh_catalog(context.catalog)
+            bridge._catalog_version = "not-sent-yet"
+            assert bridge._channel is not None
+            bridge._channel.catalog_version = "not-sent-yet"
+            event = _make_event()
+            await bridge._process(event, context)
+        finally:
+            await bridge.close()
+
+    assert event.payload["_sandbox_results"][0].get("error") is None
 
 
 @pytest.mark.asyncio
@@ -21,6 +21,7 @@ from teleclaude.events.sandbox.protocol import (
 from teleclaude.events.sandbox.runner import (
     SandboxRunner,
     _build_catalog_from_snapshot,
+    _CartridgeModuleCache,
     _load_cartridge_module,
 )
 
@@ -66,6 +67,24 @@ def test_load_cartridge_module_returns_fresh_object_each_call():
         assert mod2.VALUE == 1
 
 
+def test_module_cache_reuses_module_until_the_file_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "cart_obj.py")
+        path.write_text("VALUE = 1\n")
+        cache = _CartridgeModuleCache(tmpdir)
+        first = cache.get("cart_obj")
+        assert cache.get("cart_obj") is first
+
+        path.write_text("VALUE = 22\n")
+        reloaded = cache.get("cart_obj")
+        assert reloaded is not first
+        assert reloaded.VALUE == 22
+
+        path.unlink()
+        with pytest.raises(FileNotFoundError, match="Cartridge not found"):
+            cache.get("cart_obj")
+
+
 # ---------------------------------------------------------------------------
 # _build_catalog_from_snapshot
 # ---------------------------------------------------------------------------
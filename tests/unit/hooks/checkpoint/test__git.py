@@ -40,8 +40,6 @@ class TestGitDiffHelpers:
     ) -> None:
         responses = iter(
             [
-                _completed_process(stdout="true\n"),
-                _completed_process(),
                 _completed_process(returncode=128, stderr="fatal: this operation must be run in a work tree"),
                 _completed_process(stdout="true\n"),
                 _completed_process(),
@@ -52,13 +50,42 @@ class TestGitDiffHelpers:
         def _run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
             return next(responses)
 
-        monkeypatch.setattr(_git.subprocess, "run", _run)
+        monkeypatch.setattr(subprocess, "run", _run)
 
         assert _git._get_uncommitted_files("/repo") == [
             "teleclaude/hooks/inbound.py",
             "tests/unit/hooks/test_inbound.py",
         ]
 
+    @pytest.mark.unit
+    def test_get_uncommitted_files_is_one_fork_limited_to_touched_paths(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        calls: list[list[str]] = []
+
+        def _run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            calls.append(cmd)
+            return _completed_process(stdout="teleclaude/hooks/inbound.py\n")
+
+        monkeypatch.setattr(subprocess, "run", _run)
+
+        files = _git._get_uncommitted_files("/repo", {"teleclaude/hooks/inbound.py", "README.md"})
+
+        assert files == ["teleclaude/hooks/inbound.py"]
+        assert calls == [
+            [
+                "git",
+                "--literal-pathspecs",
+                "diff",
+                "--name-only",
+                "HEAD",
+                "--",
+                "README.md",
+                "teleclaude/hooks/inbound.py",
+            ]
+        ]
+
     @pytest.mark.unit
     def test_extract_shell_and_apply_patch_paths_normalize_project_relative_files(self) -> None:
         command_paths = _git._extract_shell_touched_paths(
@@ -0,0 +1,117 @@
+"""Tests for teleclaude.hooks.receiver._daemon_socket."""
+
+from __future__ import annotations
+
+import json
+import socketserver
+import tempfile
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from teleclaude.hooks.receiver._daemon_socket import HOOK_EVENTS_ENDPOINT, _post_hook_event, _post_session_invalidation
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _serve(status: int, received: list[tuple[str, dict[str, object]]]) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = self.rfile.read(length)
+            received.append((self.path, json.loads(body) if body else {}))
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def address_string(self) -> str:
+            return "unix"
+
+        def log_message(self, format: str, *args: object) -> None:
+            return None
+
+    return _Handler
+
+
+@pytest.fixture
+def socket_dir() -> Iterator[Path]:
+    # AF_UNIX paths are length-limited; pytest's tmp_path can exceed that.
+    with tempfile.TemporaryDirectory(prefix="tc-hook-", dir="/tmp") as path:
+        yield Path(path)
+
+
+def _start_server(socket_path: Path, status: int) -> tuple[_UnixHTTPServer, list[tuple[str, dict[str, object]]]]:
+    received: list[tuple[str, dict[str, object]]] = []
+    server = _UnixHTTPServer(str(socket_path), _serve(status, received))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, received
+
+
+@pytest.mark.unit
+def test_post_hook_event_delivers_payload_to_daemon(socket_dir: Path) -> None:
+    socket_path = socket_dir / "api.sock"
+    server, received = _start_server(socket_path, 202)
+    try:
+        assert (
+            _post_hook_event(
+                "sess-1",
+                "tool_use",
+                {"tool": "Bash"},
+                created_at="2026-01-01T00:00:00+00:00",
+                socket_path=str(socket_path),
+            )
+            is True
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [
+        (
+            HOOK_EVENTS_ENDPOINT,
+            {
+                "session_id": "sess-1",
+                "event_type": "tool_use",
+                "payload": {"tool": "Bash"},
+                "created_at": "2026-01-01T00:00:00+00:00",
+            },
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_post_hook_event_reports_failure_on_error_status(socket_dir: Path) -> None:
+    socket_path = socket_dir / "api.sock"
+    server, _received = _start_server(socket_path, 503)
+    try:
+        assert _post_hook_event("sess-1", "agent_stop", {}, socket_path=str(socket_path)) is False
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_post_hook_event_reports_failure_when_daemon_is_down(socket_dir: Path) -> None:
+    assert _post_hook_event("sess-1", "tool_done", {}, socket_path=str(socket_dir / "missing.sock")) is False
+
+    stale = socket_dir / "stale.sock"
+    stale.touch()
+    assert _post_hook_event("sess-1", "tool_done", {}, socket_path=str(stale)) is False
+
+
+@pytest.mark.unit
+def test_post_session_invalidation_targets_session_endpoint(socket_dir: Path) -> None:
+    socket_path = socket_dir / "api.sock"
+    server, received = _start_server(socket_path, 204)
+    try:
+        assert _post_session_invalidation("sess-9", socket_path=str(socket_path)) is True
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [("/hooks/sessions/sess-9/invalidate", {})]
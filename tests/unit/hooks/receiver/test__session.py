@@ -6,9 +6,11 @@ import sys
 import types
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+import teleclaude.core
 import teleclaude.hooks.receiver._session as session_module
 
 
@@ -60,6 +62,12 @@ def _install_sqlmodel_stub(
     module.Session = lambda _engine: session_stub
     module.select = lambda _model: _SelectStub()
     monkeypatch.setitem(sys.modules, "sqlmodel", module)
+    # The real models subclass sqlmodel; with the stub above they cannot be
+    # imported, and an earlier import would bind the real ones instead.
+    models = types.ModuleType("teleclaude.core.db_models")
+    models.Session = MagicMock()
+    monkeypatch.setitem(sys.modules, "teleclaude.core.db_models", models)
+    monkeypatch.setattr(teleclaude.core, "db_models", models, raising=False)
     monkeypatch.setattr(session_module, "_create_sync_engine", lambda: object())
     return session_stub
 
@@ -76,7 +84,7 @@ class TestMemoryAndSessionMap:
         )
         monkeypatch.setitem(sys.modules, "teleclaude.memory.context", memory_context)
         monkeypatch.setattr(
-            session_module, "config", SimpleNamespace(database=SimpleNamespace(path=Path("/tmp/db.sqlite")))
+            "teleclaude.config.config", SimpleNamespace(database=SimpleNamespace(path=Path("/tmp/db.sqlite")))
         )
 
         assert session_module._get_memory_context("teleclaude", "user-1") == "teleclaude|/tmp/db.sqlite|user-1"
@@ -99,6 +107,23 @@ class TestMemoryAndSessionMap:
         assert session_module._load_session_map(session_map_path) == {"claude:native-1": "session-1"}
         assert session_module._get_cached_session_id("claude", "native-1") == "session-1"
 
+    @pytest.mark.unit
+    def test_native_metadata_is_known_only_for_values_already_recorded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        monkeypatch.setattr(session_module, "_get_native_metadata_path", lambda: tmp_path / "native.json")
+
+        assert session_module._is_native_metadata_known("session-1", "native-1", "/t/1.jsonl") is False
+
+        session_module._remember_native_metadata("session-1", "native-1", "/t/1.jsonl")
+
+        assert session_module._is_native_metadata_known("session-1", "native-1", "/t/1.jsonl") is True
+        assert session_module._is_native_metadata_known("session-1", None, "/t/1.jsonl") is True
+        assert session_module._is_native_metadata_known("session-1", "native-1", "/t/2.jsonl") is False
+        assert session_module._is_native_metadata_known("session-2", "native-1", None) is False
+
 
 class TestTmuxContractResolution:
     @pytest.mark.unit
@@ -199,6 +224,7 @@ class TestSessionRefreshAndResolution:
     ) -> None:
         persisted: list[tuple[str, str | None, str]] = []
         monkeypatch.setattr(session_module, "_get_tmux_contract_session_id", lambda: "marker-session")
+        monkeypatch.setattr(session_module, "_get_cached_session_id", lambda agent, native: None)
         monkeypatch.setattr(
             session_module,
             "_is_tmux_contract_session_compatible",
@@ -220,3 +246,24 @@ class TestSessionRefreshAndResolution:
 
         assert resolved == ("db-session", None, "marker-session")
         assert persisted == [("claude", "native-1", "db-session")]
+
+    @pytest.mark.unit
+    def test_resolve_hook_session_id_trusts_an_already_mapped_tmux_binding_without_the_db(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(session_module, "_get_tmux_contract_session_id", lambda: "marker-session")
+        monkeypatch.setattr(session_module, "_get_cached_session_id", lambda agent, native: "marker-session")
+        db_lookup = MagicMock(side_effect=AssertionError("DB lookup on a known binding"))
+        monkeypatch.setattr(session_module, "_is_tmux_contract_session_compatible", db_lookup)
+        monkeypatch.setattr(session_module, "_persist_session_map", db_lookup)
+
+        resolved = session_module._resolve_hook_session_id(
+            agent="claude",
+            event_type="tool_use",
+            native_session_id="native-1",
+            headless=False,
+        )
+
+        assert resolved == ("marker-session", None, None)
+        db_lookup.assert_not_called()
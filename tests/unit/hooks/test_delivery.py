@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -11,13 +12,19 @@ import pytest
 
 import teleclaude.hooks.delivery as delivery_module
 from teleclaude.hooks.delivery import (
-    WEBHOOK_POLL_INTERVAL_S,
+    CircuitBreaker,
     WebhookDeliveryWorker,
     compute_backoff,
     compute_signature,
 )
 
 
+def _claims(*batches: list[SimpleNamespace]) -> AsyncMock:
+    """A claim_webhook_batch stub returning each batch once, then nothing."""
+    queue = list(batches)
+    return AsyncMock(side_effect=lambda *_args, **_kwargs: queue.pop(0) if queue else [])
+
+
 def _make_row(**overrides: object) -> SimpleNamespace:
     data = {
         "id": 1,
@@ -55,8 +62,7 @@ class TestWebhookDeliveryWorker:
         shutdown_event = asyncio.Event()
         row = _make_row(target_secret="top-secret")
         db_stub = SimpleNamespace(
-            fetch_webhook_batch=AsyncMock(return_value=[row]),
-            claim_webhook=AsyncMock(return_value=True),
+            claim_webhook_batch=_claims([row]),
             mark_webhook_delivered=AsyncMock(side_effect=lambda _row_id: shutdown_event.set()),
             mark_webhook_failed=AsyncMock(),
         )
@@ -85,8 +91,7 @@ class TestWebhookDeliveryWorker:
         shutdown_event = asyncio.Event()
         row = _make_row(id=2, attempt_count=1)
         db_stub = SimpleNamespace(
-            fetch_webhook_batch=AsyncMock(return_value=[row]),
-            claim_webhook=AsyncMock(return_value=True),
+            claim_webhook_batch=_claims([row]),
             mark_webhook_delivered=AsyncMock(),
             mark_webhook_failed=AsyncMock(side_effect=lambda *_args, **_kwargs: shutdown_event.set()),
         )
@@ -112,8 +117,7 @@ class TestWebhookDeliveryWorker:
         shutdown_event = asyncio.Event()
         row = _make_row(id=3)
         db_stub = SimpleNamespace(
-            fetch_webhook_batch=AsyncMock(return_value=[row]),
-            claim_webhook=AsyncMock(return_value=True),
+            claim_webhook_batch=_claims([row]),
             mark_webhook_delivered=AsyncMock(),
             mark_webhook_failed=AsyncMock(side_effect=lambda *_args, **_kwargs: shutdown_event.set()),
         )
@@ -135,25 +139,26 @@ class TestWebhookDeliveryWorker:
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_run_sleeps_for_the_poll_interval_when_the_outbox_is_empty(
+    async def test_run_polls_at_the_poll_interval_when_the_outbox_is_empty(
         self,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         shutdown_event = asyncio.Event()
+        claim_times: list[float] = []
+
+        async def _claim(*_args: object, **_kwargs: object) -> list[SimpleNamespace]:
+            claim_times.append(time.monotonic())
+            if len(claim_times) == 2:
+                shutdown_event.set()
+            return []
+
         db_stub = SimpleNamespace(
-            fetch_webhook_batch=AsyncMock(return_value=[]),
-            claim_webhook=AsyncMock(),
+            claim_webhook_batch=AsyncMock(side_effect=_claim),
             mark_webhook_delivered=AsyncMock(),
             mark_webhook_failed=AsyncMock(),
         )
-        sleep_calls: list[float] = []
-
-        async def _sleep(delay: float) -> None:
-            sleep_calls.append(delay)
-            shutdown_event.set()
-
         monkeypatch.setattr(delivery_module, "db", db_stub)
-        monkeypatch.setattr(delivery_module.asyncio, "sleep", _sleep)
+        monkeypatch.setattr(delivery_module, "WEBHOOK_POLL_INTERVAL_S", 0.05)
 
         worker = WebhookDeliveryWorker()
         client = SimpleNamespace(aclose=AsyncMock())
@@ -161,5 +166,236 @@ class TestWebhookDeliveryWorker:
 
         await worker.run(shutdown_event)
 
-        assert sleep_calls == [WEBHOOK_POLL_INTERVAL_S]
+        assert claim_times[1] - claim_times[0] >= 0.05
         client.aclose.assert_awaited_once()
+
+
+class _Outbox:
+    """In-memory outbox honouring the claim_webhook_batch contract."""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, SimpleNamespace] = {}
+
+    def add(self, row_id: int, target_url: str) -> None:
+        self.rows[row_id] = _make_row(
+            id=row_id, target_url=target_url, status="pending", next_attempt_at="", locked_at=None
+        )
+
+    async def claim_webhook_batch(
+        self,
+        limit: int,
+        now_iso: str,
+        *,
+        per_target: int | None = None,
+        target_room: dict[str, int] | None = None,
+        exclude_targets: object = (),
+        locked_before: str | None = None,
+    ) -> list[SimpleNamespace]:
+        claimed: list[SimpleNamespace] = []
+        per_url: dict[str, int] = {}
+        for row in self.rows.values():
+            stale = locked_before is not None and row.locked_at is not None and row.locked_at < locked_before
+            if row.status != "pending" or (row.locked_at and not stale) or row.next_attempt_at > now_iso:
+                continue
+            if row.target_url in exclude_targets:  # type: ignore[operator]
+                continue
+            per_url[row.target_url] = per_url.get(row.target_url, 0) + 1
+            cap = (target_room or {}).get(row.target_url, per_target)
+            if cap is not None and per_url[row.target_url] > cap:
+                continue
+            row.locked_at = now_iso
+            claimed.append(row)
+            if len(claimed) == limit:
+                break
+        return claimed
+
+    async def mark_webhook_delivered(self, row_id: int) -> None:
+        self.rows[row_id].status = "delivered"
+        self.rows[row_id].locked_at = None
+
+    async def mark_webhook_failed(
+        self, row_id: int, error: str, attempt_count: int, next_attempt_at: str | None, status: str = "pending"
+    ) -> None:
+        row = self.rows[row_id]
+        row.status, row.attempt_count, row.locked_at = status, attempt_count, None
+        row.next_attempt_at = next_attempt_at or ""
+        row.last_error = error
+
+    async def release_webhook_claims(self, row_ids: list[int]) -> None:
+        for row_id in row_ids:
+            if self.rows[row_id].status == "pending":
+                self.rows[row_id].locked_at = None
+
+
+async def _until(condition, timeout: float = 0.8) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+class TestDeliveryPool:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_a_slow_target_does_not_hold_up_other_subscribers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        outbox = _Outbox()
+        for row_id in range(1, 4):
+            outbox.add(row_id, "https://slow.test/hook")
+        for row_id in range(4, 7):
+            outbox.add(row_id, "https://fast.test/hook")
+        monkeypatch.setattr(delivery_module, "db", outbox)
+        release_slow = asyncio.Event()
+        slow_in_flight: list[int] = []
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "slow.test":
+                slow_in_flight.append(1)
+                await release_slow.wait()
+            return httpx.Response(204)
+
+        worker = WebhookDeliveryWorker(concurrency=4, target_concurrency=1)
+        worker._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        shutdown_event = asyncio.Event()
+        runner = asyncio.create_task(worker.run(shutdown_event))
+
+        await _until(lambda: all(outbox.rows[row_id].status == "delivered" for row_id in range(4, 7)))
+        assert [outbox.rows[row_id].status for row_id in range(1, 4)] == ["pending"] * 3
+        assert len(slow_in_flight) == 1
+
+        release_slow.set()
+        await _until(lambda: all(row.status == "delivered" for row in outbox.rows.values()))
+        shutdown_event.set()
+        await runner
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_a_dead_target_trips_its_breaker_and_stops_being_claimed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        outbox = _Outbox()
+        for row_id in range(1, 6):
+            outbox.add(row_id, "https://dead.test/hook")
+        outbox.add(6, "https://fast.test/hook")
+        monkeypatch.setattr(delivery_module, "db", outbox)
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "dead.test":
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200)
+
+        worker = WebhookDeliveryWorker(concurrency=4, target_concurrency=1, breaker_threshold=2)
+        worker._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        shutdown_event = asyncio.Event()
+        runner = asyncio.create_task(worker.run(shutdown_event))
+
+        await _until(lambda: "https://dead.test/hook" in worker._breakers)
+        await _until(lambda: not worker._breakers["https://dead.test/hook"].is_closed)
+        shutdown_event.set()
+        await runner
+
+        dead = [outbox.rows[row_id] for row_id in range(1, 6)]
+        assert [row.attempt_count for row in dead] == [1, 1, 0, 0, 0]
+        assert all(row.locked_at is None for row in dead)
+        assert outbox.rows[6].status == "delivered"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_a_target_with_rows_in_flight_is_only_claimed_up_to_its_remaining_room(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        outbox = _Outbox()
+        outbox.add(1, "https://slow.test/hook")
+        monkeypatch.setattr(delivery_module, "db", outbox)
+        monkeypatch.setattr(delivery_module, "WEBHOOK_POLL_INTERVAL_S", 0.01)
+        release = asyncio.Event()
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(204)
+
+        worker = WebhookDeliveryWorker(concurrency=8, target_concurrency=2)
+        worker._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        shutdown_event = asyncio.Event()
+        runner = asyncio.create_task(worker.run(shutdown_event))
+        await _until(lambda: outbox.rows[1].locked_at is not None)
+
+        for row_id in range(2, 5):
+            outbox.add(row_id, "https://slow.test/hook")
+        await asyncio.sleep(0.05)
+
+        assert [row_id for row_id, row in outbox.rows.items() if row.locked_at] == [1, 2]
+
+        release.set()
+        await _until(lambda: all(row.status == "delivered" for row in outbox.rows.values()))
+        shutdown_event.set()
+        await runner
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelling_the_worker_unlocks_rows_it_had_not_delivered(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        outbox = _Outbox()
+        for row_id in range(1, 4):
+            outbox.add(row_id, "https://hang.test/hook")
+        outbox.add(4, "https://fast.test/hook")
+        monkeypatch.setattr(delivery_module, "db", outbox)
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "hang.test":
+                await asyncio.Event().wait()
+            return httpx.Response(204)
+
+        worker = WebhookDeliveryWorker(concurrency=4, target_concurrency=1)
+        worker._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        runner = asyncio.create_task(worker.run(asyncio.Event()))
+        await _until(lambda: outbox.rows[4].status == "delivered" and outbox.rows[1].locked_at is not None)
+
+        runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+
+        assert [row.locked_at for row in outbox.rows.values()] == [None] * 4
+        assert [row.status for row in outbox.rows.values()] == ["pending", "pending", "pending", "delivered"]
+        assert worker._client is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rows_whose_lock_expired_are_claimed_again(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        outbox = _Outbox()
+        outbox.add(1, "https://fast.test/hook")
+        outbox.rows[1].locked_at = "2000-01-01T00:00:00+00:00"
+        monkeypatch.setattr(delivery_module, "db", outbox)
+        worker = WebhookDeliveryWorker()
+        worker._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+        shutdown_event = asyncio.Event()
+        runner = asyncio.create_task(worker.run(shutdown_event))
+
+        await _until(lambda: outbox.rows[1].status == "delivered")
+        shutdown_event.set()
+        await runner
+
+
+class TestCircuitBreaker:
+    @pytest.mark.unit
+    def test_opens_after_consecutive_failures_and_allows_one_trial_after_reset(self) -> None:
+        now = [0.0]
+        breaker = CircuitBreaker(threshold=2, reset_s=10.0, clock=lambda: now[0])
+
+        assert breaker.record_failure() is False
+        breaker.record_success()
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+        assert breaker.accepting() is False
+        assert breaker.retry_in() == 10.0
+
+        now[0] = 10.0
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+        breaker.record_failure()
+        assert breaker.accepting() is False
+
+        now[0] = 20.0
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.is_closed and breaker.accepting()
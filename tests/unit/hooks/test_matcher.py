@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from teleclaude.hooks.matcher import match_criterion, match_event
+from teleclaude.hooks.matcher import ContractIndex, match_criterion, match_event
 from teleclaude.hooks.webhook_models import Contract, HookEvent, PropertyCriterion, Target
 
 
@@ -72,3 +72,43 @@ class TestMatchEvent:
         )
 
         assert match_event(event, contract) is False
+
+
+class TestContractIndex:
+    @pytest.mark.unit
+    def test_index_matches_exactly_what_match_event_accepts_in_registration_order(self) -> None:
+        criteria = [
+            None,
+            PropertyCriterion(),
+            PropertyCriterion(required=False, match="never"),
+            PropertyCriterion(match="github"),
+            PropertyCriterion(match=["github", "agent"]),
+            PropertyCriterion(match=[]),
+            PropertyCriterion(pattern="git*"),
+            PropertyCriterion(match="pull_request"),
+            PropertyCriterion(match=["session.started", "pull_request"]),
+            PropertyCriterion(pattern="session.*"),
+        ]
+        contracts = [
+            Contract(
+                id=f"c{i}-{j}",
+                target=Target(handler="handler"),
+                source_criterion=source,
+                type_criterion=type_,
+                properties={"repo": PropertyCriterion(match=["owner/repo", "1"])} if (i + j) % 3 == 0 else {},
+            )
+            for i, source in enumerate(criteria)
+            for j, type_ in enumerate(criteria)
+        ]
+        contracts.append(Contract(id="inactive", target=Target(handler="handler"), active=False))
+        contracts.append(
+            Contract(id="expired", target=Target(handler="handler"), expires_at="2000-01-01T00:00:00+00:00")
+        )
+        index = ContractIndex(contracts)
+
+        for source in ("github", "agent", "gitlab", "never"):
+            for type_ in ("pull_request", "session.started", "session.closed", "push"):
+                for properties in ({}, {"repo": "owner/repo"}, {"repo": 1}):
+                    event = HookEvent(source=source, type=type_, timestamp="", properties=properties)
+                    expected = [c.id for c in contracts if c.active and not c.is_expired and match_event(event, c)]
+                    assert [c.id for c in index.match(event)] == expected
@@ -64,7 +64,6 @@ class TestContractRegistry:
             deactivate_webhook_contract=AsyncMock(return_value=True),
         )
         monkeypatch.setattr(registry_module, "db", db_stub)
-        monkeypatch.setattr(registry_module, "match_event", lambda event, current: current.id == "contract-2")
 
         registry = ContractRegistry()
         await registry.register(contract)
@@ -79,6 +78,30 @@ class TestContractRegistry:
         db_stub.upsert_webhook_contract.assert_awaited_once_with("contract-2", contract.to_json(), "api")
         assert [matched.id for matched in matches] == ["contract-2"]
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_contract_changes_rebuild_the_match_index(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        db_stub = _DbStub(
+            list_webhook_contracts=AsyncMock(return_value=[]),
+            upsert_webhook_contract=AsyncMock(),
+            deactivate_webhook_contract=AsyncMock(return_value=True),
+        )
+        monkeypatch.setattr(registry_module, "db", db_stub)
+        event = HookEvent(source="github", type="push", timestamp="2025-01-01T00:00:00+00:00")
+
+        registry = ContractRegistry()
+        await registry.register(_make_contract("pull", type_criterion=PropertyCriterion(match="pull_request")))
+        assert registry.match(event) == []
+
+        await registry.register(_make_contract("push", type_criterion=PropertyCriterion(match="push")))
+        assert [matched.id for matched in registry.match(event)] == ["push"]
+
+        await registry.deactivate("push")
+        assert registry.match(event) == []
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_list_contracts_filters_properties_and_source_type_criteria(
@@ -0,0 +1,101 @@
+"""Tests for incremental mirror generation in teleclaude.mirrors.generator."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+
+from teleclaude.core.agents import AgentName
+from teleclaude.core.migrations.runner import MIGRATIONS_DIR
+from teleclaude.mirrors.generator import generate_mirror_sync
+from teleclaude.mirrors.store import get_mirror, get_mirror_offset, search_mirrors
+
+_MIRROR_MIGRATIONS = (
+    "026_add_mirrors_table",
+    "028_add_mirror_source_identity",
+    "029_add_mirror_tombstones",
+    "033_add_mirror_offsets",
+)
+_SOURCE_IDENTITY = "claude:proj/session.jsonl"
+
+
+async def _create_mirror_db(path: Path) -> str:
+    async with aiosqlite.connect(path) as db:
+        for version in _MIRROR_MIGRATIONS:
+            spec = importlib.util.spec_from_file_location(version, MIGRATIONS_DIR / f"{version}.py")
+            assert spec is not None and spec.loader is not None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            await module.up(db)
+    return str(path)
+
+
+def _line(role: str, text: str, timestamp: str) -> str:
+    content = [{"type": "text", "text": text}]
+    return json.dumps({"type": role, "timestamp": timestamp, "message": {"role": role, "content": content}}) + "\n"
+
+
+def _generate(transcript: Path, db_path: str) -> bool:
+    return generate_mirror_sync(
+        session_id="session",
+        source_identity=_SOURCE_IDENTITY,
+        transcript_path=str(transcript),
+        agent_name=AgentName.CLAUDE,
+        computer="local",
+        project="proj",
+        db=db_path,
+    )
+
+
+@pytest.mark.unit
+async def test_appended_lines_are_parsed_without_rereading_transcript(tmp_path: Path) -> None:
+    db_path = await _create_mirror_db(tmp_path / "mirrors.db")
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(
+        _line("user", "first question", "2025-01-01T00:00:00Z")
+        + _line("assistant", "first answer", "2025-01-01T00:00:01Z")
+    )
+    assert _generate(transcript, db_path) is True
+    assert get_mirror_offset(_SOURCE_IDENTITY, db=db_path).byte_offset == transcript.stat().st_size
+
+    with transcript.open("a", encoding="utf-8") as f:
+        f.write(_line("user", "needle follow-up", "2025-01-01T00:00:02Z"))
+        f.write('{"type": "assistant", "partial')
+
+    with patch("teleclaude.mirrors.generator._get_entries_for_agent", side_effect=AssertionError("full re-parse")):
+        assert _generate(transcript, db_path) is True
+
+    mirror = get_mirror(source_identity=_SOURCE_IDENTITY, db=db_path)
+    assert mirror is not None
+    assert mirror.conversation_text == "User: first question\n\nAssistant: first answer\n\nUser: needle follow-up"
+    assert mirror.message_count == 3
+    assert mirror.title == "first question"
+    assert mirror.timestamp_end == "2025-01-01T00:00:02Z"
+    assert [result.session_id for result in search_mirrors("needle", [], db=db_path)] == ["session"]
+    # The partial trailing line stays unconsumed until it is completed.
+    offset = get_mirror_offset(_SOURCE_IDENTITY, db=db_path)
+    assert offset is not None and offset.byte_offset < transcript.stat().st_size
+
+
+@pytest.mark.unit
+async def test_rewritten_transcript_falls_back_to_full_rebuild(tmp_path: Path) -> None:
+    db_path = await _create_mirror_db(tmp_path / "mirrors.db")
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(
+        _line("user", "needle original", "2025-01-01T00:00:00Z") + _line("assistant", "reply", "2025-01-01T00:00:01Z")
+    )
+    assert _generate(transcript, db_path) is True
+
+    transcript.write_text(_line("user", "replacement", "2025-01-02T00:00:00Z"))
+    assert _generate(transcript, db_path) is True
+
+    mirror = get_mirror(source_identity=_SOURCE_IDENTITY, db=db_path)
+    assert mirror is not None
+    assert mirror.conversation_text == "User: replacement"
+    assert mirror.message_count == 1
+    assert search_mirrors("needle", [], db=db_path) == []
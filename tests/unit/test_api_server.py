@@ -77,6 +77,30 @@ class TestApiServerHttpRoutes:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    @pytest.mark.unit
+    def test_ws_clients_endpoint_requires_an_authenticated_caller(self, tmp_path):
+        with (
+            _api_server_harness(tmp_path, cache=None) as (server, _),
+            patch("teleclaude.api.auth._resolve_terminal_role", return_value=None),
+            patch("teleclaude.api.auth._requires_terminal_login", return_value=True),
+        ):
+            client = TestClient(server.app)
+            denied = client.get("/ws/clients")
+
+            from teleclaude.api_server import verify_caller
+
+            server.app.dependency_overrides[verify_caller] = lambda: CallerIdentity(
+                session_id="",
+                system_role=None,
+                human_role="admin",
+                tmux_session_name=None,
+            )
+            allowed = client.get("/ws/clients")
+
+        assert denied.status_code == 401
+        assert allowed.status_code == 200
+        assert allowed.json() == []
+
     @pytest.mark.unit
     def test_auth_whoami_returns_token_principal_when_present(self, tmp_path):
         with _api_server_harness(tmp_path, cache=None) as (server, _):
@@ -0,0 +1,70 @@
+"""Tests for the hook outbox worker's wakeup logic."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from teleclaude import daemon_hook_outbox
+from teleclaude.daemon_hook_outbox import _DaemonHookOutboxMixin, _HookOutboxSessionQueue
+
+
+class _Worker(_DaemonHookOutboxMixin):
+    def __init__(self) -> None:
+        self.shutdown_event = asyncio.Event()
+        self._hook_outbox_wakeup = asyncio.Event()
+        self._hook_outbox_high_water = 5
+        self._hook_outbox_recheck_at = time.monotonic() + 60
+        self._session_outbox_queues: dict[str, _HookOutboxSessionQueue] = {}
+        self._hook_outbox_claim_paused_sessions: set[str] = set()
+
+
+@pytest.mark.unit
+async def test_wait_returns_when_receiver_wrote_rows_directly(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(daemon_hook_outbox, "HOOK_OUTBOX_POLL_INTERVAL_S", 0.01)
+    probe = AsyncMock(side_effect=[5, 5, 6])
+    monkeypatch.setattr(daemon_hook_outbox.db, "get_hook_outbox_high_water", probe)
+    worker = _Worker()
+
+    await asyncio.wait_for(worker._wait_for_hook_outbox_work(), timeout=0.5)
+
+    assert probe.await_count == 3
+    assert worker._hook_outbox_high_water == 6
+
+
+@pytest.mark.unit
+async def test_wait_returns_at_scheduled_retry_without_probing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(daemon_hook_outbox, "HOOK_OUTBOX_POLL_INTERVAL_S", 10.0)
+    probe = AsyncMock(return_value=5)
+    monkeypatch.setattr(daemon_hook_outbox.db, "get_hook_outbox_high_water", probe)
+    worker = _Worker()
+    worker._schedule_hook_outbox_recheck(0.02)
+
+    await asyncio.wait_for(worker._wait_for_hook_outbox_work(), timeout=0.5)
+
+    probe.assert_not_awaited()
+
+
+@pytest.mark.unit
+async def test_wakeup_interrupts_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(daemon_hook_outbox, "HOOK_OUTBOX_POLL_INTERVAL_S", 10.0)
+    worker = _Worker()
+    asyncio.get_running_loop().call_later(0.01, worker._wake_hook_outbox)
+
+    await asyncio.wait_for(worker._wait_for_hook_outbox_work(), timeout=0.5)
+
+
+@pytest.mark.unit
+async def test_paused_sessions_follow_watermark_hysteresis(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(daemon_hook_outbox, "HOOK_OUTBOX_SESSION_CLAIM_HIGH_WATERMARK", 2)
+    monkeypatch.setattr(daemon_hook_outbox, "HOOK_OUTBOX_SESSION_CLAIM_LOW_WATERMARK", 0)
+    worker = _Worker()
+    busy = _HookOutboxSessionQueue(claimed_row_ids={1, 2, 3})
+    worker._session_outbox_queues = {"busy": busy, "idle": _HookOutboxSessionQueue()}
+    worker._hook_outbox_claim_paused_sessions = {"drained"}
+
+    assert await worker._paused_hook_outbox_sessions() == {"busy"}
+    assert worker._hook_outbox_claim_paused_sessions == {"busy"}
@@ -0,0 +1,96 @@
+"""Tests for teleclaude.transport.redis_transport._response_mux."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from teleclaude.transport.redis_transport._response_mux import _ResponseMultiplexer
+
+
+class FakeBlockingRedis:
+    """Minimal stream store whose XREAD blocks until a requested stream has entries."""
+
+    def __init__(self) -> None:
+        self.entries: dict[bytes, list[tuple[bytes, dict[bytes, bytes]]]] = {}
+        self.xread_calls: list[dict[bytes, bytes]] = []
+        self._changed = asyncio.Event()
+        self.delete = AsyncMock()
+
+    async def xadd(self, stream: bytes | str, data: dict[bytes, bytes], maxlen: int | None = None) -> bytes:
+        key = stream if isinstance(stream, bytes) else stream.encode()
+        entries = self.entries.setdefault(key, [])
+        entry_id = f"{len(entries) + 1}-0".encode()
+        entries.append((entry_id, data))
+        self._changed.set()
+        return entry_id
+
+    async def xread(
+        self, streams: dict[bytes, bytes], block: int
+    ) -> list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]:
+        self.xread_calls.append(dict(streams))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + block / 1000
+        while True:
+            result = [
+                (key, [entry for entry in self.entries.get(key, []) if entry[0] > last_id])
+                for key, last_id in streams.items()
+            ]
+            result = [(key, entries) for key, entries in result if entries]
+            if result:
+                return result
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return []
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except TimeoutError:
+                return []
+
+
+@pytest.mark.unit
+async def test_concurrent_waiters_share_one_reader_and_wake_on_arrival() -> None:
+    redis = FakeBlockingRedis()
+    mux = _ResponseMultiplexer(AsyncMock(return_value=redis), "local")
+
+    first = asyncio.create_task(mux.wait("output:peer-a:1", timeout=1.0))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(mux.wait("output:peer-b:2", timeout=1.0))
+    await asyncio.sleep(0.01)
+
+    await redis.xadd(b"output:peer-b:2", {b"chunk": b"beta"})
+    await redis.xadd(b"output:peer-a:1", {b"chunk": b"alpha"})
+
+    assert await asyncio.wait_for(asyncio.gather(first, second), timeout=0.5) == ["alpha", "beta"]
+    assert any(b"output:peer-a:1" in call and b"output:peer-b:2" in call for call in redis.xread_calls)
+    assert mux.pending_count == 0
+    await mux.close()
+
+
+@pytest.mark.unit
+async def test_empty_chunks_are_skipped_until_payload_arrives() -> None:
+    redis = FakeBlockingRedis()
+    mux = _ResponseMultiplexer(AsyncMock(return_value=redis), "local")
+    await redis.xadd(b"output:peer:3", {b"chunk": b""})
+
+    waiter = asyncio.create_task(mux.wait("output:peer:3", timeout=1.0))
+    await asyncio.sleep(0.01)
+    await redis.xadd(b"output:peer:3", {b"chunk": b"payload"})
+
+    assert await asyncio.wait_for(waiter, timeout=0.5) == "payload"
+    await mux.close()
+
+
+@pytest.mark.unit
+async def test_timeout_releases_the_waiter() -> None:
+    redis = FakeBlockingRedis()
+    mux = _ResponseMultiplexer(AsyncMock(return_value=redis), "local")
+
+    with pytest.raises(TimeoutError):
+        await mux.wait("output:peer:4", timeout=0.05)
+
+    assert mux.pending_count == 0
+    await mux.close()
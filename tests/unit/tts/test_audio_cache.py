@@ -0,0 +1,117 @@
+"""Tests for teleclaude.tts.audio_cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from teleclaude.tts import queue_runner
+from teleclaude.tts.audio_cache import TTSAudioCache, cache_voice, normalize_text
+from teleclaude.tts.models import SynthesizedAudio
+
+
+def _clip(size: int = 10) -> SynthesizedAudio:
+    return SynthesizedAudio(data=b"x" * size, suffix=".mp3")
+
+
+@pytest.mark.unit
+def test_normalized_text_shares_one_clip(tmp_path: Path) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=1024)
+    stored = cache.put("openai", "nova", "Ready  to\nship!", _clip())
+
+    assert normalize_text(" Ready to ship! ") == "Ready to ship!"
+    assert cache.get("openai", "nova", "Ready to ship!") == stored
+    assert stored.read_bytes() == b"x" * 10
+
+
+@pytest.mark.unit
+def test_key_includes_service_and_voice(tmp_path: Path) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=1024)
+    cache.put("openai", "nova", "hello", _clip())
+
+    assert cache.get("openai", "onyx", "hello") is None
+    assert cache.get("elevenlabs", "nova", "hello") is None
+
+
+@pytest.mark.unit
+def test_eviction_drops_least_recently_played(tmp_path: Path) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=25)
+    old = cache.put("openai", "nova", "old", _clip())
+    recent = cache.put("openai", "nova", "recent", _clip())
+    os.utime(old, (1_000, 1_000))
+    os.utime(recent, (2_000, 2_000))
+    # Playing "old" refreshes its recency, so "recent" becomes the eviction candidate.
+    assert cache.get("openai", "nova", "old") == old
+
+    cache.put("openai", "nova", "new", _clip())
+
+    assert cache.get("openai", "nova", "old") is not None
+    assert cache.get("openai", "nova", "recent") is None
+    assert cache.get("openai", "nova", "new") is not None
+
+
+class _FakeBackend:
+    def __init__(self) -> None:
+        self.synthesized: list[str] = []
+        self.spoken: list[str] = []
+
+    def speak(self, text: str, voice: str | None = None) -> bool:
+        self.spoken.append(text)
+        return True
+
+    def synthesize(self, text: str, voice: str | None = None) -> SynthesizedAudio | None:
+        self.synthesized.append(text)
+        return _clip()
+
+
+@pytest.mark.unit
+def test_queue_runner_plays_cached_clip_without_resynthesis(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=1024)
+    backend = _FakeBackend()
+    played: list[Path] = []
+    monkeypatch.setattr(queue_runner, "play_audio_file", lambda path: played.append(path) or True)
+
+    assert queue_runner._speak_with_cache(backend, "openai", "hi there", "nova", cache)
+    assert queue_runner._speak_with_cache(backend, "openai", "hi  there", "nova", cache)
+
+    assert backend.synthesized == ["hi there"]
+    assert backend.spoken == []
+    assert len(played) == 2 and played[0] == played[1]
+
+
+@pytest.mark.unit
+def test_queue_runner_falls_back_to_speak_when_playback_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=1024)
+    backend = _FakeBackend()
+    monkeypatch.setattr(queue_runner, "play_audio_file", lambda path: False)
+
+    assert queue_runner._speak_with_cache(backend, "openai", "hello", "nova", cache)
+    assert backend.spoken == ["hello"]
+
+
+@pytest.mark.unit
+def test_provider_default_voice_shares_a_key_with_no_voice() -> None:
+    assert cache_voice("openai", "openai") is None
+    assert cache_voice("openai", "nova") == "nova"
+    assert TTSAudioCache.cache_key("openai", "openai", "hi") == TTSAudioCache.cache_key("openai", None, "hi")
+
+
+@pytest.mark.unit
+def test_put_tracks_size_in_memory_and_rescans_only_over_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = TTSAudioCache(root=tmp_path, max_bytes=25)
+    scans: list[None] = []
+    rescan = cache._rescan_locked
+    monkeypatch.setattr(cache, "_rescan_locked", lambda: scans.append(None) or rescan())
+
+    cache.put("openai", "nova", "one", _clip())
+    cache.put("openai", "nova", "two", _clip())
+    assert len(scans) == 1
+
+    cache.put("openai", "nova", "three", _clip())
+    assert len(scans) == 2
+    assert cache._total == 20
+    assert cache.get("openai", "nova", "three") is not None
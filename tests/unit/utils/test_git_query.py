@@ -0,0 +1,146 @@
+"""Tests for the shared, cached git query layer."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from teleclaude.utils.git_query import GitQuery
+
+_SHA_A = "a" * 40
+_SHA_B = "b" * 40
+
+
+class _FakeGit:
+    """Answers cat-file/rev-list/stash from a dict and records every fork."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, str] = {}
+        self.calls: list[list[str]] = []
+
+    def __call__(self, cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        self.calls.append(cmd)
+        if cmd[1] == "cat-file":
+            names = str(kwargs["input"]).splitlines()
+            out = "".join(f"{self.objects.get(name, f'{name} missing')}\n" for name in names)
+            return subprocess.CompletedProcess(cmd, 0, out, "")
+        if cmd[1] == "rev-list":
+            return subprocess.CompletedProcess(cmd, 0, "3\n", "")
+        if cmd[1:3] == ["stash", "list"]:
+            return subprocess.CompletedProcess(cmd, 0, "stash@{0}: WIP on main\n", "")
+        raise AssertionError(cmd)
+
+
+def _write_bumped(path: Path, content: str) -> None:
+    """Write and force a distinct mtime even on coarse-grained filesystems."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git_dir = tmp_path / ".git"
+    _write_bumped(git_dir / "HEAD", "ref: refs/heads/feature\n")
+    _write_bumped(git_dir / "refs" / "heads" / "feature", f"{_SHA_A}\n")
+    return tmp_path
+
+
+@pytest.fixture
+def fake_git(monkeypatch: pytest.MonkeyPatch) -> _FakeGit:
+    fake = _FakeGit()
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
+
+
+@pytest.mark.unit
+def test_rev_parse_many_batches_and_caches_until_ref_files_change(repo: Path, fake_git: _FakeGit) -> None:
+    fake_git.objects = {"HEAD": _SHA_A, "main": _SHA_B}
+    query = GitQuery(str(repo))
+
+    assert query.rev_parse_many(["HEAD", "main", "gone"]) == [_SHA_A, _SHA_B, ""]
+    assert query.rev_parse_many(["HEAD", "main", "gone"]) == [_SHA_A, _SHA_B, ""]
+    assert len(fake_git.calls) == 1
+
+    fake_git.objects["HEAD"] = _SHA_B
+    _write_bumped(repo / ".git" / "refs" / "heads" / "feature", f"{_SHA_B}\n")
+
+    assert query.rev_parse_many(["HEAD", "main"]) == [_SHA_B, _SHA_B]
+    assert len(fake_git.calls) == 2
+    # Only the changed ref is asked for again.
+    assert fake_git.calls[-1][1] == "cat-file"
+
+
+@pytest.mark.unit
+def test_head_switch_and_packed_refs_invalidate(repo: Path, fake_git: _FakeGit) -> None:
+    fake_git.objects = {"HEAD": _SHA_A}
+    query = GitQuery(str(repo))
+    query.rev_parse("HEAD")
+
+    _write_bumped(repo / ".git" / "HEAD", "ref: refs/heads/other\n")
+    query.rev_parse("HEAD")
+    _write_bumped(repo / ".git" / "packed-refs", f"{_SHA_B} refs/heads/other\n")
+    query.rev_parse("HEAD")
+
+    assert len(fake_git.calls) == 3
+
+
+@pytest.mark.unit
+def test_linked_worktree_reads_refs_from_the_common_dir(tmp_path: Path, fake_git: _FakeGit) -> None:
+    main_git = tmp_path / "main" / ".git"
+    worktree_git = main_git / "worktrees" / "slug"
+    _write_bumped(main_git / "refs" / "heads" / "slug", f"{_SHA_A}\n")
+    _write_bumped(worktree_git / "HEAD", "ref: refs/heads/slug\n")
+    _write_bumped(worktree_git / "commondir", "../..\n")
+    worktree = tmp_path / "main" / "trees" / "slug"
+    _write_bumped(worktree / ".git", f"gitdir: {worktree_git}\n")
+    fake_git.objects = {"HEAD": _SHA_A}
+    query = GitQuery(str(worktree))
+
+    query.rev_parse("HEAD")
+    query.rev_parse("HEAD")
+    _write_bumped(main_git / "refs" / "heads" / "slug", f"{_SHA_B}\n")
+    query.rev_parse("HEAD")
+
+    assert len(fake_git.calls) == 2
+
+
+@pytest.mark.unit
+def test_expressions_and_unknown_repositories_are_never_cached(tmp_path: Path, fake_git: _FakeGit) -> None:
+    fake_git.objects = {"HEAD~1": _SHA_A}
+    query = GitQuery(str(tmp_path / "not-a-repo"))
+
+    query.rev_parse("HEAD~1")
+    query.rev_parse("HEAD~1")
+
+    assert len(fake_git.calls) == 2
+
+
+@pytest.mark.unit
+def test_count_commits_memoizes_object_pairs_only(repo: Path, fake_git: _FakeGit) -> None:
+    query = GitQuery(str(repo))
+
+    assert query.count_commits(_SHA_A, _SHA_B) == 3
+    assert query.count_commits(_SHA_A, _SHA_B) == 3
+    assert query.count_commits("HEAD", "main") == 3
+    assert query.count_commits("HEAD", "main") == 3
+
+    assert len(fake_git.calls) == 3
+
+
+@pytest.mark.unit
+def test_stash_entries_skip_git_without_a_stash_reflog(repo: Path, fake_git: _FakeGit) -> None:
+    query = GitQuery(str(repo))
+
+    assert query.stash_entries() == []
+    assert fake_git.calls == []
+
+    _write_bumped(repo / ".git" / "logs" / "refs" / "stash", "entry\n")
+    assert query.stash_entries() == ["stash@{0}: WIP on main"]
+    assert query.stash_entries() == ["stash@{0}: WIP on main"]
+    assert len(fake_git.calls) == 1
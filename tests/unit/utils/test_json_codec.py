@@ -0,0 +1,72 @@
+"""Tests for the shared JSON codec."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel
+
+from teleclaude.utils import json_codec
+from teleclaude.utils.json_codec import JsonCodec, available_codecs, get_codec
+
+_CODECS = available_codecs()
+
+
+class _Item(BaseModel):
+    name: str
+    count: int = 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", _CODECS, ids=[c.name for c in _CODECS])
+def test_every_codec_produces_the_compact_utf8_wire_shape(codec: JsonCodec) -> None:
+    payload = {"event": "session_updated", "data": {"title": "héllo ✓", "n": [1, 2.5, None, True]}}
+    expected = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+    assert codec.dumps(payload, False, None) == expected
+    assert codec.dumpb(payload, False, None) == expected.encode("utf-8")
+    assert codec.loads(expected) == payload
+    assert codec.loads(expected.encode("utf-8")) == payload
+    assert codec.dumps({"b": 1, "a": 2}, True, None) == '{"a":2,"b":1}'
+    assert json.loads(codec.dumps({"at": datetime(2024, 1, 1, tzinfo=UTC)}, False, str))["at"].startswith("2024-01-01")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", _CODECS, ids=[c.name for c in _CODECS])
+def test_every_codec_raises_stdlib_decode_errors(codec: JsonCodec) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads('{"truncated": ')
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads_object(b"not json")
+    with pytest.raises(TypeError):
+        codec.dumps({"x": object()}, False, None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", _CODECS, ids=[c.name for c in _CODECS])
+def test_loads_object_returns_none_for_other_json_values(codec: JsonCodec) -> None:
+    assert codec.loads_object(b'{"type":"user"}') == {"type": "user"}
+    assert codec.loads_object("[1, 2]") is None
+    assert codec.loads_object("42") is None
+
+
+@pytest.mark.unit
+def test_environment_pins_a_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(json_codec.CODEC_ENV_VAR, "json")
+    assert json_codec._select_codec().name == "json"
+
+    monkeypatch.setenv(json_codec.CODEC_ENV_VAR, "no-such-codec")
+    assert json_codec._select_codec() is _CODECS[0]
+
+    with pytest.raises(ValueError):
+        get_codec("no-such-codec")
+
+
+@pytest.mark.unit
+def test_typed_decoder_is_built_once_per_type() -> None:
+    decode = json_codec.typed_decoder(list[_Item])
+
+    assert decode is json_codec.typed_decoder(list[_Item])
+    assert decode(b'[{"name":"a","count":2},{"name":"b"}]') == [_Item(name="a", count=2), _Item(name="b")]
@@ -0,0 +1,160 @@
+"""Tests for MarkdownV2 state checkpoints and balanced truncation."""
+
+from __future__ import annotations
+
+import functools
+import random
+
+import pytest
+
+from teleclaude.utils.markdown import (
+    MARKDOWN_V2_INITIAL_STATE,
+    MarkdownV2Checkpoints,
+    MarkdownV2State,
+    _required_markdown_closers_from_state,
+    leading_balanced_markdown_v2_entity_span,
+    scan_markdown_v2_state,
+    truncate_markdown_v2_by_bytes,
+    truncate_markdown_v2_with_consumed,
+)
+
+_PIECES = [
+    "a",
+    "bc ",
+    "\n",
+    "é",
+    "🙂",
+    "\\",
+    "\\*",
+    "*",
+    "_",
+    "__",
+    "~",
+    "||",
+    "`",
+    "```",
+    "```py\n",
+    "[",
+    "]",
+    "](",
+    "(",
+    ")",
+    "|",
+]
+
+
+def _random_markdown(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(_PIECES) for _ in range(length))
+
+
+def _samples() -> list[str]:
+    rng = random.Random(1234)
+    return [_random_markdown(rng, rng.randint(0, 24)) for _ in range(120)]
+
+
+@functools.cache
+def _reference_closers(current: str) -> str | None:
+    """Closers the previous implementation computed for a prefix; None inside a link.
+
+    Memoized because the reference rescans the same prefixes for every budget,
+    which would otherwise make the equivalence tests cubic in the sample length.
+    """
+    state = scan_markdown_v2_state(current)
+    if state.in_link_text or state.link_url_depth > 0:
+        return None
+    return _required_markdown_closers_from_state(current, state)
+
+
+def _reference_trim(text: str, budget: int, measure=len) -> tuple[str, int]:
+    """Previous char-at-a-time implementation, rescanning the whole prefix each step."""
+    current = text
+    while True:
+        if current.endswith("\\"):
+            current = current[:-1]
+        closers = _reference_closers(current)
+        if closers is None:
+            if not current:
+                return "", 0
+            current = current[:-1]
+            continue
+        if measure(current) + len(closers) <= budget:
+            return f"{current}{closers}", len(current)
+        if not current:
+            return closers[:budget], 0
+        current = current[:-1]
+
+
+def _utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(5)  # sweeps every budget of 120 random samples
+def test_checkpoints_match_prefix_scans() -> None:
+    initial = MarkdownV2State(stack=("bold",))
+    for text in _samples():
+        checkpoints = MarkdownV2Checkpoints(text, initial)
+        for k in range(len(text) + 1):
+            assert checkpoints.state_at(k) == scan_markdown_v2_state(text[:k], initial), (text, k)
+            assert checkpoints.byte_offset(k) == _utf8_len(text[:k])
+        # Random-order lookups must not depend on the walk cursor.
+        for k in random.Random(len(text)).sample(range(len(text) + 1), len(text) + 1):
+            assert checkpoints.state_at(k) == scan_markdown_v2_state(text[:k], initial), (text, k)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(5)  # sweeps every budget of 120 random samples
+def test_char_truncation_matches_previous_algorithm() -> None:
+    for text in _samples():
+        for max_chars in range(1, len(text) + 2):
+            for suffix in ("", "…"):
+                expected: tuple[str, int]
+                if len(text) <= max_chars and not suffix:
+                    expected = _reference_trim(text, max_chars)
+                elif len(text) <= max_chars:
+                    expected = (text, len(text))
+                elif len(suffix) >= max_chars:
+                    expected = (suffix[:max_chars], 0)
+                else:
+                    trimmed, consumed = _reference_trim(text[: max_chars - len(suffix)], max_chars - len(suffix))
+                    expected = (f"{trimmed}{suffix}", consumed)
+                assert truncate_markdown_v2_with_consumed(text, max_chars, suffix) == expected, (text, max_chars)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(5)  # sweeps every budget of 120 random samples
+def test_byte_truncation_is_balanced_and_maximal() -> None:
+    for text in _samples():
+        total = _utf8_len(text)
+        for max_bytes in range(1, total + 2):
+            suffix = "…"
+            result = truncate_markdown_v2_by_bytes(text, max_bytes, suffix)
+            assert _utf8_len(result) <= max_bytes
+            if total <= max_bytes:
+                assert result == text
+                continue
+            budget = max_bytes - _utf8_len(suffix)
+            if budget < 0:
+                continue
+            prefix = text.encode("utf-8")[:budget].decode("utf-8", errors="ignore")
+            expected, _ = _reference_trim(prefix, budget, measure=_utf8_len)
+            assert result == f"{expected}{suffix}", (text, max_bytes)
+
+
+@pytest.mark.unit
+def test_byte_truncation_closes_open_entities() -> None:
+    text = "*bold " + "é" * 50 + "* tail"
+
+    result = truncate_markdown_v2_by_bytes(text, 40, "…")
+
+    assert result.endswith("*…")
+    assert _utf8_len(result) <= 40
+    assert scan_markdown_v2_state(result[:-1]) == MARKDOWN_V2_INITIAL_STATE
+
+
+@pytest.mark.unit
+def test_leading_entity_span_keeps_links_atomic() -> None:
+    assert leading_balanced_markdown_v2_entity_span("[docs](https://x.y/(a)) rest") == len("[docs](https://x.y/(a))")
+    assert leading_balanced_markdown_v2_entity_span("*bold* rest") == len("*bold*")
+    assert leading_balanced_markdown_v2_entity_span("*never closed", max_scan_chars=8) == 0
+    assert leading_balanced_markdown_v2_entity_span("plain *x*") == 0
@@ -0,0 +1,216 @@
+"""Tests for the incremental transcript index."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from teleclaude.core.agents import AgentName
+from teleclaude.utils.transcript import (
+    _index,
+    clear_transcript_index_cache,
+    count_renderable_assistant_blocks,
+    extract_last_user_message_with_timestamp,
+    get_assistant_messages_since,
+    get_transcript_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_cache():
+    clear_transcript_index_cache()
+    yield
+    clear_transcript_index_cache()
+
+
+def _user(text: str, ts: str) -> dict[str, object]:
+    return {"type": "user", "timestamp": ts, "message": {"role": "user", "content": [{"type": "text", "text": text}]}}
+
+
+def _assistant(ts: str, *blocks: dict[str, object]) -> dict[str, object]:
+    return {"type": "assistant", "timestamp": ts, "message": {"role": "assistant", "content": list(blocks)}}
+
+
+def _append(path: Path, *entries: dict[str, object]) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+_TEXT = {"type": "text", "text": "done"}
+_TOOL = {"type": "tool_use", "name": "Bash", "input": {}}
+
+
+@pytest.mark.unit
+def test_queries_follow_appended_lines(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, _user("first", "2025-01-01T00:00:00Z"), _assistant("2025-01-01T00:00:01Z", _TEXT, _TOOL))
+    transcript = str(path)
+
+    assert extract_last_user_message_with_timestamp(transcript, AgentName.CLAUDE) == (
+        "first",
+        datetime(2025, 1, 1, tzinfo=UTC),
+    )
+    assert len(get_assistant_messages_since(transcript, AgentName.CLAUDE)) == 1
+    assert count_renderable_assistant_blocks(transcript, AgentName.CLAUDE) == 1
+    assert count_renderable_assistant_blocks(transcript, AgentName.CLAUDE, include_tools=True) == 2
+
+    _append(path, _user("second", "2025-01-01T00:01:00Z"), _assistant("2025-01-01T00:01:01Z", _TEXT))
+
+    user_msg = extract_last_user_message_with_timestamp(transcript, AgentName.CLAUDE)
+    assert user_msg is not None and user_msg[0] == "second"
+    # Without a cursor the window starts after the last user message.
+    assert count_renderable_assistant_blocks(transcript, AgentName.CLAUDE, include_tools=True) == 1
+    cursor = datetime(2025, 1, 1, 0, 0, 0, 500000, tzinfo=UTC)
+    assert len(get_assistant_messages_since(transcript, AgentName.CLAUDE, since_timestamp=cursor)) == 2
+    assert count_renderable_assistant_blocks(transcript, AgentName.CLAUDE, cursor, include_tools=True) == 3
+
+
+@pytest.mark.unit
+def test_cursor_past_all_entries_returns_nothing_unless_rotated(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, _user("hi", "2025-01-01T00:00:00Z"), _assistant("2025-01-01T00:00:01Z", _TEXT))
+    late = datetime(2025, 1, 2, tzinfo=UTC)
+
+    assert get_assistant_messages_since(str(path), AgentName.CLAUDE, since_timestamp=late) == []
+
+    rotated = tmp_path / "rotated.jsonl"
+    _append(rotated, _assistant("2025-01-01T00:00:01Z", _TEXT))
+    assert len(get_assistant_messages_since(str(rotated), AgentName.CLAUDE, since_timestamp=late)) == 1
+
+
+@pytest.mark.unit
+def test_only_new_bytes_are_parsed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, _user("hi", "2025-01-01T00:00:00Z"), _assistant("2025-01-01T00:00:01Z", _TEXT))
+    get_assistant_messages_since(str(path), AgentName.CLAUDE)
+
+    from teleclaude.utils.transcript import _iterators
+
+    parsed: list[bytes] = []
+    real_parse = _iterators._parse_jsonl_line
+    monkeypatch.setattr(_iterators, "_parse_jsonl_line", lambda line: parsed.append(line) or real_parse(line))
+
+    get_assistant_messages_since(str(path), AgentName.CLAUDE)
+    assert parsed == []
+
+    _append(path, _assistant("2025-01-01T00:00:02Z", _TEXT))
+    assert len(get_assistant_messages_since(str(path), AgentName.CLAUDE)) == 2
+    assert len(parsed) == 1
+
+
+@pytest.mark.unit
+def test_partial_trailing_line_waits_for_completion(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, _user("hi", "2025-01-01T00:00:00Z"))
+    line = json.dumps(_assistant("2025-01-01T00:00:01Z", _TEXT))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line[:20])
+
+    assert get_assistant_messages_since(str(path), AgentName.CLAUDE) == []
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line[20:] + "\n")
+    assert len(get_assistant_messages_since(str(path), AgentName.CLAUDE)) == 1
+
+
+@pytest.mark.unit
+def test_truncation_and_in_place_rewrite_rebuild_the_index(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, _user("old", "2025-01-01T00:00:00Z"), _assistant("2025-01-01T00:00:01Z", _TEXT))
+    assert extract_last_user_message_with_timestamp(str(path), AgentName.CLAUDE) is not None
+
+    path.write_text("")
+    assert extract_last_user_message_with_timestamp(str(path), AgentName.CLAUDE) is None
+
+    _append(path, _user("old", "2025-01-01T00:00:00Z"), _assistant("2025-01-01T00:00:01Z", _TEXT))
+    extract_last_user_message_with_timestamp(str(path), AgentName.CLAUDE)
+    # Rewrite with different, longer content on the same inode.
+    path.write_text("")
+    _append(
+        path,
+        _user("replacement", "2025-02-01T00:00:00Z"),
+        _assistant("2025-02-01T00:00:01Z", _TEXT),
+        _assistant("2025-02-01T00:00:02Z", _TEXT),
+    )
+
+    user_msg = extract_last_user_message_with_timestamp(str(path), AgentName.CLAUDE)
+    assert user_msg is not None and user_msg[0] == "replacement"
+    assert len(get_assistant_messages_since(str(path), AgentName.CLAUDE)) == 2
+
+
+@pytest.mark.unit
+def test_codex_session_meta_is_skipped_and_reasoning_counts(tmp_path: Path) -> None:
+    path = tmp_path / "rollout.jsonl"
+    _append(
+        path,
+        {"type": "session_meta", "timestamp": "2025-01-01T00:00:05Z", "payload": {}},
+        {
+            "type": "response_item",
+            "timestamp": "2025-01-01T00:00:01Z",
+            "payload": {"type": "reasoning", "summary": [{"type": "summary_text", "text": "thinking"}]},
+        },
+    )
+
+    since = datetime(2025, 1, 1, tzinfo=UTC)
+    assert count_renderable_assistant_blocks(str(path), AgentName.CODEX, since) == 1
+
+
+@pytest.mark.unit
+def test_gemini_document_reparsed_only_when_changed(tmp_path: Path) -> None:
+    path = tmp_path / "session.json"
+    document = {
+        "messages": [
+            {"type": "user", "timestamp": "2025-01-01T00:00:00Z", "content": "hello"},
+            {"type": "gemini", "timestamp": "2025-01-01T00:00:01Z", "content": "hi", "thoughts": [{"text": "t"}]},
+        ]
+    }
+    path.write_text(json.dumps(document))
+
+    assert count_renderable_assistant_blocks(str(path), AgentName.GEMINI) == 2
+    index = get_transcript_index(str(path), AgentName.GEMINI)
+    assert index is get_transcript_index(str(path), AgentName.GEMINI)
+    user_msg = extract_last_user_message_with_timestamp(str(path), AgentName.GEMINI)
+    assert user_msg is not None and user_msg[0] == "hello"
+
+
+@pytest.mark.unit
+def test_missing_transcript_is_empty(tmp_path: Path) -> None:
+    missing = str(tmp_path / "missing.jsonl")
+
+    assert get_transcript_index(missing, AgentName.CLAUDE) is None
+    assert get_assistant_messages_since(missing, AgentName.CLAUDE) == []
+    assert count_renderable_assistant_blocks(missing, AgentName.CLAUDE) == 0
+    assert extract_last_user_message_with_timestamp(missing, AgentName.CLAUDE) is None
+
+
+@pytest.mark.unit
+def test_slow_refresh_does_not_block_other_transcripts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    slow_path = tmp_path / "slow.jsonl"
+    fast_path = tmp_path / "fast.jsonl"
+    for path in (slow_path, fast_path):
+        path.write_text(json.dumps(_user("hi", "2025-01-01T00:00:00Z")) + "\n", encoding="utf-8")
+    entered = threading.Event()
+    release = threading.Event()
+    original_refresh = _index.TranscriptIndex.refresh
+
+    def _refresh(self: _index.TranscriptIndex) -> bool:
+        if self.path == slow_path:
+            entered.set()
+            release.wait(timeout=1)
+        return original_refresh(self)
+
+    monkeypatch.setattr(_index.TranscriptIndex, "refresh", _refresh)
+    slow = threading.Thread(target=get_transcript_index, args=(str(slow_path), AgentName.CLAUDE))
+    slow.start()
+    try:
+        assert entered.wait(timeout=1)
+        assert get_transcript_index(str(fast_path), AgentName.CLAUDE) is not None
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join(timeout=1)
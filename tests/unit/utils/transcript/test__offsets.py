@@ -0,0 +1,73 @@
+"""Tests for the seekable transcript offsets index."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from teleclaude.core.agents import AgentName
+from teleclaude.utils.transcript import clear_transcript_offsets_cache, get_transcript_offsets
+
+
+@pytest.fixture(autouse=True)
+def _fresh_offsets_cache():
+    clear_transcript_offsets_cache()
+    yield
+    clear_transcript_offsets_cache()
+
+
+def _entry(n: int) -> dict[str, object]:
+    return {"uuid": f"m{n}", "message": {"role": "assistant", "content": [{"type": "text", "text": f"t{n}"}]}}
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.mark.unit
+def test_entries_are_read_by_ordinal_and_follow_appends(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, "".join(json.dumps(_entry(n)) + "\n" for n in range(3)) + "not json\n\n")
+
+    index = get_transcript_offsets(str(path), AgentName.CLAUDE)
+    assert index is not None
+    assert index.entry_count == 3
+    assert [entry["uuid"] for entry in index.entries(1)] == ["m1", "m2"]
+    assert index.ordinal_of("m2") == 2
+
+    # A half-written line is not indexed until its newline arrives.
+    _append(path, json.dumps(_entry(3))[:10])
+    assert get_transcript_offsets(str(path), AgentName.CLAUDE).entry_count == 3
+    _append(path, json.dumps(_entry(3))[10:] + "\n")
+    index = get_transcript_offsets(str(path), AgentName.CLAUDE)
+    assert index.entry_count == 4
+    assert [entry["uuid"] for entry in index.entries(2, 3)] == ["m2"]
+    assert [entry["uuid"] for entry in index.entries(3)] == ["m3"]
+
+
+@pytest.mark.unit
+def test_rewritten_transcript_is_reindexed(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    path.write_text(json.dumps(_entry(0)) + "\n", encoding="utf-8")
+    assert get_transcript_offsets(str(path), AgentName.CLAUDE).entry_count == 1
+
+    path.write_text(json.dumps(_entry(5)) + "\n" + json.dumps(_entry(6)) + "\n", encoding="utf-8")
+    index = get_transcript_offsets(str(path), AgentName.CLAUDE)
+
+    assert [entry["uuid"] for entry in index.entries(0)] == ["m5", "m6"]
+    assert index.ordinal_of("m0") is None
+
+
+@pytest.mark.unit
+def test_codex_session_meta_is_not_an_entry(tmp_path: Path) -> None:
+    path = tmp_path / "rollout.jsonl"
+    path.write_text(json.dumps({"type": "session_meta"}) + "\n" + json.dumps(_entry(0)) + "\n", encoding="utf-8")
+
+    index = get_transcript_offsets(str(path), AgentName.CODEX)
+
+    assert index.entry_count == 1
+    assert index.entries(0)[0]["uuid"] == "m0"
+    assert get_transcript_offsets(str(tmp_path / "missing.jsonl"), AgentName.CODEX) is None